@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks de Cryptic.
+
+Ejecuta los benchmarks del harness (``cryptic.core.benchmark``) sobre el
+corpus de ``test_data.csv`` y sobre un corpus sintético de mayor tamaño
+(``cryptic.utils.corpus``), mide el tiempo de importación del paquete y
+del CLI contra sus objetivos, y guarda los reportes JSON en
+``benchmarks/results/``.
+
+Uso:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --baseline-dir benchmarks/baseline
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from cryptic.core.benchmark import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    build_report,
+    compare_with_baseline,
+    load_corpus,
+    measure_backends,
+    measure_hooks_overhead,
+    measure_memory_per_cell,
+    measure_pool_startup,
+    measure_prefilter,
+    measure_thread_scaling,
+    run_benchmarks,
+    run_import_benchmarks,
+    save_report,
+)
+from cryptic.utils.corpus import generate_values
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Tamaño del corpus sintético (valores)
+GENERATED_CORPUS_SIZE = 50_000
+
+
+def main() -> int:
+    """Ejecutar la suite y comparar contra la línea base si se indica."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=3, help="Pasadas sobre cada corpus")
+    parser.add_argument("--baseline-dir", type=Path, help="Directorio con reportes previos de la suite")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="Caída tolerada")
+    args = parser.parse_args()
+
+    base_values = load_corpus(ROOT / "test_data.csv")
+    corpora = {
+        "test_data": base_values,
+        "generated": generate_values(GENERATED_CORPUS_SIZE, seed=0),
+    }
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    failed = False
+
+    for name, values in corpora.items():
+        print(f"\n🔄 Corpus {name} ({len(values)} valores)...")
+        # El batch de extremo a extremo solo se mide sobre el corpus base
+        results = run_benchmarks(values, iterations=args.iterations, include_batch=name == "test_data")
+        report = build_report(results, len(values))
+        report["memory"] = measure_memory_per_cell(values)
+        report["prefilter"] = measure_prefilter(values, iterations=args.iterations)
+        report["hooks"] = measure_hooks_overhead(values, iterations=args.iterations)
+        report["threads"] = measure_thread_scaling(values, iterations=args.iterations)
+        report["backends"] = measure_backends(values, iterations=args.iterations)
+        report["pool_startup"] = measure_pool_startup(values)
+        save_report(report, RESULTS_DIR / f"{name}.json")
+
+        for result in results.values():
+            print(
+                f"   {result.name:<20} {result.throughput:>10.0f} ops/s  p50={result.p50_ms:.3f} ms  p99={result.p99_ms:.3f} ms"
+            )
+        memory = report["memory"]
+        print(
+            f"   {'memoria':<20} {memory['full_bytes_per_cell']:>10.0f} B/celda completo, "
+            f"{memory['compact_bytes_per_cell']:.0f} B/celda compacto"
+        )
+        regex = report["prefilter"]["regex_per_value"]["total"]
+        print(
+            f"   {'prefiltro':<20} {regex['executed']:>10.1f} regex/valor ejecutadas, {regex['avoided']:.1f} evitadas "
+            f"({report['prefilter']['speedup']:.2f}x)"
+        )
+        hooks = report["hooks"]
+        print(
+            f"   {'hooks':<20} {hooks['noop_hooks_overhead']:>+10.1%} con hooks vacíos, "
+            f"{hooks['stage_timings_overhead']:+.1%} con desglose de tiempos"
+        )
+        scaling = report["threads"]
+        speedups = ", ".join(f"{count}: {result['speedup']:.2f}x" for count, result in scaling["threads"].items())
+        gil = "con GIL" if scaling["gil_enabled"] else "sin GIL"
+        print(f"   {'hilos':<20} {speedups} ({gil}, {scaling['cpus']} CPUs)")
+        backends = report["backends"]
+        speedups = ", ".join(
+            f"{name}: {result['speedup']:.2f}x" if result["available"] else f"{name}: no disponible"
+            for name, result in backends["backends"].items()
+            if name != "sequential"
+        )
+        print(f"   {'backends':<20} {speedups} ({backends['workers']} workers)")
+        pool = report["pool_startup"]
+        timings = ", ".join(f"{name}: {timing['job_ms']:.0f} ms" for name, timing in pool["start_methods"].items())
+        result_bytes = pool["result_bytes_per_value"]
+        print(
+            f"   {'pool por lote':<20} {timings} "
+            f"({result_bytes['compact']:.0f} B/resultado compacto, {result_bytes['pickle']:.0f} con pickle)"
+        )
+
+        baseline_path = args.baseline_dir / f"{name}.json" if args.baseline_dir else None
+        if baseline_path and baseline_path.exists():
+            with open(baseline_path, encoding="utf-8") as f:
+                regressions = compare_with_baseline(report, json.load(f), args.threshold)
+            for regression in regressions:
+                print(f"   ❌ Regresión: {regression}")
+            failed = failed or bool(regressions)
+
+    print("\n🔄 Tiempo de importación...")
+    import_results = run_import_benchmarks()
+    import_report_path = RESULTS_DIR / "import_time.json"
+    with open(import_report_path, "w", encoding="utf-8") as f:
+        json.dump(import_results, f, indent=2)
+
+    for module, timing in import_results.items():
+        status = "✅" if timing["within_target"] else "❌"
+        print(f"   {status} {module:<20} {timing['import_ms']:>8.1f} ms (objetivo {timing['target_ms']:.0f} ms)")
+        failed = failed or not timing["within_target"]
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
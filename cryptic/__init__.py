@@ -21,10 +21,14 @@ Ejemplo de uso básico:
 Para más información, consulta la documentación completa.
 """
 
-# Importar API pública
-from cryptic.core.analyzer import CrypticAnalyzer, DataAnalysis, DataSensitivity, ProtectionStatus
-from cryptic.core.hash_identifier import HashAnalysis, HashIdentifier, HashType
-from cryptic.core.sensitive_detector import SensitiveAnalysis, SensitiveDataDetector, SensitiveDataType
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer, DataAnalysis, DataSensitivity, ProtectionStatus
+    from cryptic.core.compact import CompactAnalysis
+    from cryptic.core.hash_identifier import HashAnalysis, HashIdentifier, HashType
+    from cryptic.core.sensitive_detector import SensitiveAnalysis, SensitiveDataDetector, SensitiveDataType
 
 # Metadatos del paquete
 __version__ = "0.1.0"
@@ -41,8 +45,41 @@ __all__ = [
     "DataSensitivity",
     "ProtectionStatus",
     "DataAnalysis",
+    "CompactAnalysis",
     # Sensitive data detection
     "SensitiveDataDetector",
     "SensitiveDataType",
     "SensitiveAnalysis",
 ]
+
+# Módulo que define cada nombre de la API pública. Se importan en el primer
+# acceso para que ``import cryptic`` no cargue analizador ni patrones.
+_LAZY_EXPORTS = {
+    "HashIdentifier": "cryptic.core.hash_identifier",
+    "HashType": "cryptic.core.hash_identifier",
+    "HashAnalysis": "cryptic.core.hash_identifier",
+    "CrypticAnalyzer": "cryptic.core.analyzer",
+    "DataSensitivity": "cryptic.core.analyzer",
+    "ProtectionStatus": "cryptic.core.analyzer",
+    "DataAnalysis": "cryptic.core.analyzer",
+    "CompactAnalysis": "cryptic.core.compact",
+    "SensitiveDataDetector": "cryptic.core.sensitive_detector",
+    "SensitiveDataType": "cryptic.core.sensitive_detector",
+    "SensitiveAnalysis": "cryptic.core.sensitive_detector",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Importa bajo demanda los nombres de la API pública"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Incluye la API pública diferida en dir(cryptic)"""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,28 @@
+"""
+Punto de entrada del ejecutable ``cryptic``.
+
+Antes de importar la CLI (Click y los módulos de análisis), reenvía
+``cryptic analyze`` y ``cryptic verify`` al daemon si está en ejecución
+(ver ``cryptic.server.client``). Solo si no lo está se carga la CLI y el
+comando se ejecuta localmente.
+"""
+
+import sys
+
+from cryptic.server.client import FORWARDED_COMMANDS, forward
+
+
+def main() -> None:
+    """Ejecuta el comando en el daemon o, si no está disponible, localmente"""
+    if len(sys.argv) > 1 and sys.argv[1] in FORWARDED_COMMANDS:
+        exit_code = forward(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from cryptic.cli.main import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,16 +9,25 @@ Este módulo proporciona comandos de línea de comandos para:
 """
 
 import csv
-import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import click
-import yaml
 
-from cryptic import CrypticAnalyzer, DataAnalysis
-from cryptic.core.sensitive_detector import SensitiveDataDetector
+from cryptic.core.streaming import DEFAULT_MAX_LINE_LENGTH
+
+# Los módulos de análisis, yaml y json se importan dentro de cada comando para
+# que ``cryptic --version`` y ``cryptic analyze`` arranquen lo más rápido posible
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer, DataAnalysis
+    from cryptic.core.column_memo import ColumnTypeMemo
+    from cryptic.core.headers import HeaderAwareAnalyzer
+    from cryptic.core.hooks import AnalysisHooks
+    from cryptic.core.metrics import MetricsRegistry
+    from cryptic.core.result_table import ResultTable
+    from cryptic.core.slowlog import SlowLog
+    from cryptic.utils.profiling import RunProfiler
 
 
 class Colors:
@@ -42,7 +51,7 @@ def print_colored(text: str, color: str = Colors.WHITE, bold: bool = False) -> N
     click.echo(f"{style}{text}{Colors.END}")
 
 
-def format_analysis_for_terminal(analysis: DataAnalysis, detailed: bool = False) -> str:
+def format_analysis_for_terminal(analysis: "DataAnalysis", detailed: bool = False) -> str:
     """Formatea un análisis para mostrar en terminal con colores"""
 
     # Determinar color según estado de protección
@@ -115,11 +124,45 @@ def cli(ctx: click.Context, version: bool) -> None:
         click.echo(ctx.get_help())
 
 
+METRICS_HELP = "Guardar métricas del analizador al terminar (JSON si termina en .json; si no, formato Prometheus)"
+SLOWLOG_HELP = (
+    "Guardar al terminar, en JSON, los valores cuyo análisis superó --slowlog-threshold, con el tiempo de cada etapa"
+)
+SLOWLOG_THRESHOLD_HELP = "Milisegundos de análisis a partir de los cuales --slowlog registra un valor"
+PROFILE_HELP = "Perfilar la ejecución con cProfile: guarda el perfil (.pstats) y muestra las funciones de cryptic más costosas"
+MEMORY_PROFILE_HELP = (
+    "Perfilar la memoria con tracemalloc: guarda la instantánea cercana al pico y muestra los sitios de asignación de cryptic"
+)
+HOOKS_HELP = (
+    "Hooks de instrumentación (módulo:objeto, ver cryptic.core.hooks) invocados por etapa, valor, archivo y bloque de filas"
+)
+
+
 @cli.command()
 @click.argument("data", type=str)
 @click.option("--detailed", "-d", is_flag=True, help="Mostrar análisis detallado")
 @click.option("--format", "-f", type=click.Choice(["text", "json", "yaml"]), default="text", help="Formato de salida")
-def analyze(data: str, detailed: bool, format: str) -> None:
+@click.option("--metrics", type=click.Path(dir_okay=False, path_type=Path), help=METRICS_HELP)
+@click.option("--slowlog", type=click.Path(dir_okay=False, path_type=Path), help=SLOWLOG_HELP)
+@click.option(
+    "--slowlog-threshold", type=click.FloatRange(min=0), default=25.0, show_default=True, help=SLOWLOG_THRESHOLD_HELP
+)
+@click.option("--profile", "profile_path", type=click.Path(dir_okay=False, path_type=Path), help=PROFILE_HELP)
+@click.option("--memory-profile", type=click.Path(dir_okay=False, path_type=Path), help=MEMORY_PROFILE_HELP)
+@click.option("--hooks", "hooks_spec", metavar="MÓDULO:OBJETO", help=HOOKS_HELP)
+@click.option("--timings", is_flag=True, help="Mostrar el tiempo de cada etapa del análisis")
+def analyze(
+    data: str,
+    detailed: bool,
+    format: str,
+    metrics: Optional[Path],
+    slowlog: Optional[Path],
+    slowlog_threshold: float,
+    profile_path: Optional[Path],
+    memory_profile: Optional[Path],
+    hooks_spec: Optional[str],
+    timings: bool,
+) -> None:
     """
     Analizar una entrada individual de datos.
 
@@ -130,15 +173,28 @@ def analyze(data: str, detailed: bool, format: str) -> None:
         $ cryptic analyze "12.345.678-5" --detailed
 
         $ cryptic analyze "4111-1111-1111-1111" --format json
+
+        $ cryptic analyze "RUT 12.345.678-5, hash 5d41402abc4b2a76b9719d911017c592" --timings
     """
     print_colored(f"\n🔍 Analizando: {data}", Colors.CYAN, bold=True)
     print_colored("=" * 60, Colors.CYAN)
 
+    start_profiling(profile_path, memory_profile)
+
     try:
-        analyzer = CrypticAnalyzer()
+        analyzer = build_analyzer(
+            metrics_path=metrics,
+            timings=timings,
+            slowlog_path=slowlog,
+            slowlog_threshold=slowlog_threshold,
+            hooks_spec=hooks_spec,
+        )
         analysis = analyzer.analyze_data(data)
+        stage_timings = analyzer.timings.report() if timings and analyzer.timings is not None else None
 
         if format == "json":
+            import json
+
             # Convertir análisis a diccionario serializable
             result: Dict[str, Any] = {
                 "original_data": analysis.original_data,
@@ -164,9 +220,14 @@ def analyze(data: str, detailed: bool, format: str) -> None:
                     ],
                 )
 
+            if stage_timings is not None:
+                result["stage_timings"] = stage_timings
+
             click.echo(json.dumps(result, indent=2, ensure_ascii=False))
 
         elif format == "yaml":
+            import yaml
+
             result = {
                 "original_data": analysis.original_data,
                 "sensitivity_level": analysis.sensitivity_level.value,
@@ -174,6 +235,8 @@ def analyze(data: str, detailed: bool, format: str) -> None:
                 "confidence": analysis.confidence,
                 "recommendations": analysis.recommendations,
             }
+            if stage_timings is not None:
+                result["stage_timings"] = stage_timings
             click.echo(yaml.dump(result, default_flow_style=False, allow_unicode=True))
 
         else:  # text format
@@ -186,22 +249,343 @@ def analyze(data: str, detailed: bool, format: str) -> None:
 
             print_colored(f"\n⏱️  Tiempo de análisis: {analysis.analysis_time_ms:.1f}ms", Colors.GREEN)
 
+            if stage_timings is not None:
+                print_stage_timings(stage_timings)
+
     except Exception as e:
         print_colored(f"\n❌ Error durante el análisis: {str(e)}", Colors.RED, bold=True)
         sys.exit(1)
 
 
+def build_analyzer(
+    cache_path: Optional[Path] = None,
+    metrics_path: Optional[Path] = None,
+    timings: bool = False,
+    slowlog_path: Optional[Path] = None,
+    slowlog_threshold: float = 25.0,
+    hooks_spec: Optional[str] = None,
+    file_path: Optional[Path] = None,
+) -> "CrypticAnalyzer":
+    """
+    Construye el analizador, con caché, métricas, desglose de tiempos, registro de
+    valores lentos y hooks si se solicitan.
+
+    Con hooks y file_path, la etapa STAGE_FILE del archivo se abre aquí y se
+    cierra al terminar el comando.
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+    cache = None
+    if cache_path is not None:
+        from cryptic.core.cache import AnalysisCache
+
+        cache = AnalysisCache(cache_path)
+        click.get_current_context().call_on_close(cache.close)
+
+    metrics = None
+    if metrics_path is not None:
+        from cryptic.core.metrics import MetricsRegistry
+
+        metrics = MetricsRegistry()
+        click.get_current_context().call_on_close(lambda: save_metrics(metrics, metrics_path))
+
+    stage_timings = None
+    if timings:
+        from cryptic.core.timings import StageTimings
+
+        stage_timings = StageTimings()
+
+    slowlog = None
+    if slowlog_path is not None:
+        from cryptic.core.slowlog import SlowLog
+
+        slowlog = SlowLog(threshold_ms=slowlog_threshold)
+        click.get_current_context().call_on_close(lambda: save_slowlog(slowlog, slowlog_path))
+
+    hooks = None
+    if hooks_spec is not None:
+        from cryptic.core.hooks import load_hooks
+
+        hooks = load_hooks(hooks_spec)
+
+    analyzer = CrypticAnalyzer(cache=cache, metrics=metrics, timings=stage_timings, slowlog=slowlog, hooks=hooks)
+    if hooks is not None and file_path is not None:
+        start_file_stage(hooks, file_path)
+    return analyzer
+
+
+def start_file_stage(hooks: "AnalysisHooks", file_path: Path) -> None:
+    """Abre la etapa STAGE_FILE del archivo y la cierra al terminar el comando"""
+    import time
+
+    from cryptic.core.hooks import STAGE_FILE
+
+    ctx = click.get_current_context()
+    token = hooks.on_stage_start(STAGE_FILE, {"path": str(file_path), "command": ctx.info_name})
+    stage_start = time.perf_counter_ns()
+    ctx.call_on_close(lambda: hooks.on_stage_end(STAGE_FILE, token, time.perf_counter_ns() - stage_start))
+
+
+def start_profiling(profile_path: Optional[Path], memory_path: Optional[Path]) -> None:
+    """Perfila el resto del comando con cProfile y/o tracemalloc, y muestra los resúmenes al terminar"""
+    if profile_path is None and memory_path is None:
+        return
+    from cryptic.utils.profiling import RunProfiler
+
+    profiler = RunProfiler(profile_path, memory_path)
+    profiler.start()
+    click.get_current_context().call_on_close(lambda: print_profile(profiler))
+
+
+def print_profile(profiler: "RunProfiler") -> None:
+    """Detiene el perfilador, muestra las funciones y asignaciones de cryptic e indica los archivos crudos"""
+    profiler.stop()
+    if profiler.profile_path is not None:
+        print_colored("\n🔬 Funciones de cryptic con más tiempo propio:", Colors.YELLOW, bold=True)
+        click.echo(f"   {'propio':>10} {'acumulado':>10} {'llamadas':>9}  función")
+        for row in profiler.functions:
+            click.echo(
+                f"   {row['total_s'] * 1000:>8.1f}ms {row['cumulative_s'] * 1000:>8.1f}ms {row['calls']:>9}  {row['function']}"
+            )
+        print_colored(f"   Perfil completo guardado en: {profiler.profile_path}", Colors.GREEN)
+    if profiler.memory_path is not None:
+        print_colored(
+            f"\n🧠 Sitios de asignación de cryptic (pico trazado: {profiler.peak_bytes / 1024 / 1024:.1f} MiB):",
+            Colors.YELLOW,
+            bold=True,
+        )
+        click.echo(f"   {'KiB':>10} {'bloques':>9}  ubicación")
+        for row in profiler.allocations:
+            click.echo(f"   {row['size_kib']:>10.1f} {row['count']:>9}  {row['location']}")
+        print_colored(f"   Instantánea de tracemalloc guardada en: {profiler.memory_path}", Colors.GREEN)
+
+
+def save_metrics(metrics: "MetricsRegistry", output_path: Path) -> None:
+    """Guarda las métricas en JSON (extensión .json) o en formato de texto de Prometheus"""
+    with open(output_path, "w", encoding="utf-8") as f:
+        if output_path.suffix.lower() == ".json":
+            import json
+
+            json.dump(metrics.snapshot(), f, indent=2, ensure_ascii=False)
+        else:
+            f.write(metrics.to_prometheus())
+    print_colored(f"📈 Métricas guardadas en: {output_path}", Colors.GREEN)
+
+
+def save_slowlog(slowlog: "SlowLog", output_path: Path) -> None:
+    """Guarda el registro de valores lentos en JSON"""
+    import json
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(slowlog.to_dict(), f, indent=2, ensure_ascii=False)
+    print_colored(f"🐢 Valores lentos ({slowlog.logged}) guardados en: {output_path}", Colors.GREEN)
+
+
+def print_stage_timings(report: List[Dict[str, Any]]) -> None:
+    """Muestra el desglose de tiempos por etapa (ver StageTimings.report)"""
+    print_colored("\n⏱️  Tiempos por etapa:", Colors.YELLOW, bold=True)
+    for row in report:
+        click.echo(f"   {row['stage']:<40} {row['total_ms'] * 1000:>10.1f}µs {row['share']:>7.1%}")
+
+
+def print_cache_statistics(analyzer: "CrypticAnalyzer") -> None:
+    """Muestra las estadísticas de la caché persistente si está activa"""
+    if analyzer.cache is not None:
+        stats = analyzer.cache.get_statistics()
+        click.echo(f"   Caché: {stats['hits']} aciertos, {stats['misses']} fallos ({stats['hit_rate']:.1%})")
+
+
+CACHE_OPTION_HELP = "Caché SQLite persistente de análisis entre ejecuciones"
+SUMMARY_ONLY_HELP = "Conservar solo conteos agregados y una muestra de hallazgos por columna y tipo"
+SAMPLE_HELP = (
+    "Clasificar cada columna por muestreo uniforme de filas (random: acceso aleatorio; reservoir: una lectura secuencial)"
+)
+SAMPLE_CONFIDENCE_HELP = "Proporción de las últimas muestras que debe coincidir para detener una columna"
+SAMPLE_WINDOW_HELP = "Cantidad de muestras recientes consideradas para la detención"
+COLUMN_MEMO_HELP = "Memorizar el tipo de columnas homogéneas y analizarlas solo con sus patrones"
+HEADER_HINTS_HELP = "Elegir los patrones de cada columna CSV según su nombre (email, rut, password_hash, ...)"
+HEADER_RULES_HELP = "Archivo YAML o JSON con reglas propias de nombre de columna (implica --header-hints)"
+THREADS_HELP = "Workers en paralelo: hilos, procesos o subintérpretes según --backend"
+BACKEND_HELP = (
+    "Backend de --threads: thread (analizador compartido, solo acelera sin GIL, como python3.13t), "
+    "process o subinterpreter (un GIL por subintérprete, Python 3.13+)"
+)
+SCAN_BACKEND_HELP = "Backend de --workers: process, thread (solo acelera sin GIL) o subinterpreter (Python 3.13+)"
+
+# Celdas leídas antes de repartirlas entre los hilos de --threads
+THREADED_BLOCK_CELLS = 4096
+
+
+def run_summary_only(
+    analyzer: "CrypticAnalyzer",
+    file_path: Path,
+    column: Optional[str],
+    analyze: Optional[Callable[[str, str], "DataAnalysis"]] = None,
+) -> Dict[str, Any]:
+    """Analiza un archivo en modo solo-resumen, informando el progreso por filas"""
+    from cryptic.core.aggregate import summarize_file
+
+    return summarize_file(
+        analyzer,
+        file_path,
+        column,
+        progress=lambda row: print_colored(f"   Procesadas {row} filas...", Colors.BLUE),
+        analyze=analyze,
+    )
+
+
+def build_cell_analyzer(
+    analyzer: "CrypticAnalyzer", column_memo: bool = False, header_hints: bool = False, header_rules: Optional[Path] = None
+) -> Tuple[Callable[[str, str], "DataAnalysis"], Optional["ColumnTypeMemo"], Optional["HeaderAwareAnalyzer"]]:
+    """
+    Construye la función (columna, valor) -> análisis según las opciones de la CLI.
+
+    Returns:
+        Tupla (función de análisis, memo de columnas o None, analizador por encabezados o None)
+    """
+    from cryptic.core.column_memo import ColumnTypeMemo
+    from cryptic.core.headers import HeaderAwareAnalyzer, load_header_rules
+
+    memo = ColumnTypeMemo(analyzer) if column_memo else None
+    cell_analyzer = memo.analyze if memo else lambda _column, value: analyzer.analyze_data(value)
+
+    hints = None
+    if header_hints or header_rules:
+        rules = load_header_rules(header_rules) if header_rules else None
+        hints = HeaderAwareAnalyzer(analyzer, rules, fallback=cell_analyzer)
+        cell_analyzer = hints.analyze
+
+    return cell_analyzer, memo, hints
+
+
+def print_cell_statistics(memo: Optional["ColumnTypeMemo"], hints: Optional["HeaderAwareAnalyzer"]) -> None:
+    """Muestra las estadísticas del memo de columnas y de las reglas de encabezados si están activos"""
+    if memo is not None:
+        stats = memo.statistics()
+        click.echo(
+            f"   Memo de columnas: {stats['fast']} rápidos, {stats['full']} completos, "
+            f"{stats['fallbacks']} respaldos ({stats['fallback_rate']:.1%}), "
+            f"{stats['audit_failures']}/{stats['audits']} verificaciones fallidas"
+        )
+        for name, label in stats["active_columns"].items():
+            click.echo(f"      {name}: {label}")
+
+    if hints is not None:
+        columns = hints.statistics()
+        click.echo(f"   Columnas con tipo por encabezado: {len(columns)}")
+        for name, stats in columns.items():
+            expected = ", ".join(stats["types"]) or "hash"
+            click.echo(f"      {name}: {expected} ({stats['mode']}, {stats['mismatches']}/{stats['verified']} discrepancias)")
+            if stats["mislabeled"]:
+                print_colored(f"      ⚠️  '{name}' parece mal etiquetada: se analizó con todos los patrones", Colors.YELLOW)
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    """Muestra un resumen agregado con los hallazgos y muestras por columna"""
+    print_colored("\n📊 Resumen del análisis:", Colors.GREEN, bold=True)
+    click.echo(f"   Total de elementos analizados: {summary['total_analyzed']}")
+    click.echo(f"   Elementos protegidos: {summary['protected']} ({summary['protection_rate']:.1%})")
+    click.echo(f"   Elementos sin protección: {summary['unprotected']}")
+    if summary["sensitive_elements"]:
+        print_colored(f"   ⚠️  Datos sensibles detectados: {summary['sensitive_elements']}", Colors.RED, bold=True)
+
+    for name, column_summary in summary["columns"].items():
+        findings = {**column_summary["sensitive_by_type"], **column_summary["hash_types_detected"]}
+        if not findings:
+            continue
+
+        print_colored(f"\n   📄 {name}:", Colors.YELLOW, bold=True)
+        for label, count in findings.items():
+            examples = ", ".join(str(sample["value"]) for sample in column_summary["samples"].get(label, [])[:3])
+            click.echo(f"      {label}: {count} (ej: {examples})")
+
+
+def save_summary(summary: Dict[str, Any], output_path: Path, format: str, key: str = "summary") -> None:
+    """Guarda un resumen agregado (o de muestreo) en YAML o, por defecto, en JSON"""
+    with open(output_path, "w", encoding="utf-8") as f:
+        if format == "yaml":
+            import yaml
+
+            yaml.dump({key: summary}, f, default_flow_style=False, allow_unicode=True)
+        else:
+            import json
+
+            json.dump({key: summary}, f, indent=2, ensure_ascii=False)
+
+
+def run_sampling(
+    analyzer: "CrypticAnalyzer", file_path: Path, column: Optional[str], strategy: str, confidence: float, window: int
+) -> Dict[str, Any]:
+    """Clasifica las columnas de un archivo por muestreo y muestra el resultado"""
+    from cryptic.core.sampling import sample_file
+
+    report = sample_file(analyzer, file_path, column, strategy=strategy, confidence=confidence, window=window)
+
+    print_colored(f"\n🎲 Clasificación por muestreo ({report['strategy']}):", Colors.GREEN, bold=True)
+    click.echo(f"   Selección de filas: {report['row_selection']}")
+    for name, result in report["columns"].items():
+        status = "✓" if result["converged"] else "⚠"
+        color = Colors.GREEN if result["converged"] else Colors.YELLOW
+        click.echo(f"   {status} {name}: {color}{result['classification']}{Colors.END}")
+        click.echo(
+            f"      {result['sample_size']} muestras, acuerdo {result['agreement']:.1%} "
+            f"(objetivo {confidence:.1%} en {window}), proporción ≥ {result['proportion_lower_bound']:.1%}"
+        )
+    return report
+
+
 @cli.command()
 @click.argument("file_path", type=click.Path(exists=True, path_type=Path))
 @click.option("--column", "-c", type=str, help="Columna específica a analizar (para CSV)")
 @click.option("--detailed", "-d", is_flag=True, help="Mostrar análisis detallado")
 @click.option("--output", "-o", type=click.Path(path_type=Path), help="Archivo de salida para reporte")
 @click.option("--format", "-f", type=click.Choice(["text", "json", "yaml"]), default="text", help="Formato de salida")
-def verify(file_path: Path, column: Optional[str], detailed: bool, output: Optional[Path], format: str) -> None:
+@click.option("--cache", type=click.Path(dir_okay=False, path_type=Path), help=CACHE_OPTION_HELP)
+@click.option("--summary-only", is_flag=True, help=SUMMARY_ONLY_HELP)
+@click.option("--sample", type=click.Choice(["random", "reservoir"]), help=SAMPLE_HELP)
+@click.option(
+    "--sample-confidence",
+    type=click.FloatRange(0, 1, min_open=True),
+    default=0.99,
+    show_default=True,
+    help=SAMPLE_CONFIDENCE_HELP,
+)
+@click.option("--sample-window", type=click.IntRange(min=1), default=100, show_default=True, help=SAMPLE_WINDOW_HELP)
+@click.option("--header-hints", is_flag=True, help=HEADER_HINTS_HELP)
+@click.option("--header-rules", type=click.Path(exists=True, dir_okay=False, path_type=Path), help=HEADER_RULES_HELP)
+@click.option("--metrics", type=click.Path(dir_okay=False, path_type=Path), help=METRICS_HELP)
+@click.option("--slowlog", type=click.Path(dir_okay=False, path_type=Path), help=SLOWLOG_HELP)
+@click.option(
+    "--slowlog-threshold", type=click.FloatRange(min=0), default=25.0, show_default=True, help=SLOWLOG_THRESHOLD_HELP
+)
+@click.option("--profile", "profile_path", type=click.Path(dir_okay=False, path_type=Path), help=PROFILE_HELP)
+@click.option("--memory-profile", type=click.Path(dir_okay=False, path_type=Path), help=MEMORY_PROFILE_HELP)
+@click.option("--hooks", "hooks_spec", metavar="MÓDULO:OBJETO", help=HOOKS_HELP)
+def verify(
+    file_path: Path,
+    column: Optional[str],
+    detailed: bool,
+    output: Optional[Path],
+    format: str,
+    cache: Optional[Path],
+    summary_only: bool,
+    sample: Optional[str],
+    sample_confidence: float,
+    sample_window: int,
+    header_hints: bool,
+    header_rules: Optional[Path],
+    metrics: Optional[Path],
+    slowlog: Optional[Path],
+    slowlog_threshold: float,
+    profile_path: Optional[Path],
+    memory_profile: Optional[Path],
+    hooks_spec: Optional[str],
+) -> None:
     """
     Verificar un archivo en busca de datos sensibles.
 
-    Soporta archivos de texto plano y CSV.
+    Soporta archivos de texto plano y CSV, también comprimidos
+    (gzip, bzip2, xz o zip), que se descomprimen en streaming.
 
     Ejemplos:
 
@@ -210,32 +594,76 @@ def verify(file_path: Path, column: Optional[str], detailed: bool, output: Optio
         $ cryptic verify usuarios.csv --output=reporte.json --format json
 
         $ cryptic verify passwords.txt --detailed
+
+        $ cryptic verify export.csv --cache=~/.cache/cryptic.db
+
+        $ cryptic verify auditoria.csv --summary-only --output=resumen.json
+
+        $ cryptic verify lago.csv --sample random --sample-confidence 0.99
+
+        $ cryptic verify clientes.csv --header-hints
     """
     print_colored(f"\n🔍 Verificando archivo: {file_path.name}", Colors.CYAN, bold=True)
     print_colored("=" * 60, Colors.CYAN)
 
+    if sample and summary_only:
+        print_colored("❌ --sample y --summary-only no se pueden combinar", Colors.RED, bold=True)
+        sys.exit(1)
+
+    start_profiling(profile_path, memory_profile)
+
     try:
-        analyzer = CrypticAnalyzer()
+        from cryptic.core.hooks import instrument_chunks
+        from cryptic.utils.files import input_suffix, open_input
+
+        analyzer = build_analyzer(
+            cache,
+            metrics,
+            slowlog_path=slowlog,
+            slowlog_threshold=slowlog_threshold,
+            hooks_spec=hooks_spec,
+            file_path=file_path,
+        )
+
+        if sample:
+            report = run_sampling(analyzer, file_path, column, sample, sample_confidence, sample_window)
+            if output:
+                save_summary(report, output, format, key="sampling")
+                print_colored(f"\n💾 Clasificación guardada en: {output}", Colors.GREEN, bold=True)
+            return
+
+        analyze, _, hints = build_cell_analyzer(analyzer, header_hints=header_hints, header_rules=header_rules)
+
+        if summary_only:
+            summary = run_summary_only(analyzer, file_path, column, analyze)
+            print_summary(summary)
+            print_cache_statistics(analyzer)
+            print_cell_statistics(None, hints)
+            if output:
+                save_summary(summary, output, format)
+                print_colored(f"\n💾 Resumen guardado en: {output}", Colors.GREEN, bold=True)
+            return
+
         results = []
 
-        if file_path.suffix.lower() == ".csv":
-            # Procesar archivo CSV
-            with open(file_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+        if input_suffix(file_path) == ".csv":
+            # Procesar archivo CSV (descomprimiendo en streaming si corresponde)
+            with open_input(file_path) as input_file:
+                reader = csv.DictReader(input_file.text)
                 rows_processed = 0
 
-                for row in reader:
+                for row in instrument_chunks(reader, analyzer.hooks, attributes={"path": str(file_path)}):
                     if column:
                         # Analizar solo la columna especificada
                         if column in row and row[column]:
-                            analysis = analyzer.analyze_data(row[column])
+                            analysis = analyze(column, row[column])
                             analysis.original_data = f"Fila {rows_processed + 1}, {column}: {row[column]}"
                             results.append(analysis)
                     else:
                         # Analizar todas las columnas
                         for col_name, value in row.items():
                             if value and value.strip():
-                                analysis = analyzer.analyze_data(value)
+                                analysis = analyze(col_name, value)
                                 analysis.original_data = f"Fila {rows_processed + 1}, {col_name}: {value}"
                                 results.append(analysis)
 
@@ -247,9 +675,9 @@ def verify(file_path: Path, column: Optional[str], detailed: bool, output: Optio
 
         else:
             # Procesar archivo de texto plano
-            with open(file_path, encoding="utf-8") as f:
+            with open_input(file_path) as input_file:
                 line_number = 0
-                for line in f:
+                for line in instrument_chunks(input_file.text, analyzer.hooks, attributes={"path": str(file_path)}):
                     line = line.strip()
                     if line:
                         line_number += 1
@@ -265,6 +693,8 @@ def verify(file_path: Path, column: Optional[str], detailed: bool, output: Optio
         click.echo(f"   Total de elementos analizados: {report['total_analyzed']}")
         click.echo(f"   Elementos protegidos: {report['protected']} ({report['protection_rate']:.1%})")
         click.echo(f"   Elementos sin protección: {report['unprotected']}")
+        print_cache_statistics(analyzer)
+        print_cell_statistics(None, hints)
 
         # Mostrar datos sensibles encontrados
         sensitive_count = sum(1 for r in results if r.sensitive_analysis and r.sensitive_analysis.matches)
@@ -295,13 +725,67 @@ def verify(file_path: Path, column: Optional[str], detailed: bool, output: Optio
 @click.option(
     "--output", "-o", type=click.Path(path_type=Path), required=True, help="Archivo de salida para reporte (requerido)"
 )
-@click.option("--format", "-f", type=click.Choice(["json", "yaml", "csv"]), default="json", help="Formato del reporte")
+@click.option(
+    "--format", "-f", type=click.Choice(["json", "yaml", "csv", "jsonl"]), default="json", help="Formato del reporte"
+)
 @click.option("--column", "-c", type=str, help="Columna específica a analizar (para CSV)")
-def batch(file_path: Path, output: Path, format: str, column: Optional[str]) -> None:
+@click.option("--cache", type=click.Path(dir_okay=False, path_type=Path), help=CACHE_OPTION_HELP)
+@click.option("--summary-only", is_flag=True, help=SUMMARY_ONLY_HELP)
+@click.option("--sample", type=click.Choice(["random", "reservoir"]), help=SAMPLE_HELP)
+@click.option(
+    "--sample-confidence",
+    type=click.FloatRange(0, 1, min_open=True),
+    default=0.99,
+    show_default=True,
+    help=SAMPLE_CONFIDENCE_HELP,
+)
+@click.option("--sample-window", type=click.IntRange(min=1), default=100, show_default=True, help=SAMPLE_WINDOW_HELP)
+@click.option("--column-memo", is_flag=True, help=COLUMN_MEMO_HELP)
+@click.option("--header-hints", is_flag=True, help=HEADER_HINTS_HELP)
+@click.option("--header-rules", type=click.Path(exists=True, dir_okay=False, path_type=Path), help=HEADER_RULES_HELP)
+@click.option("--metrics", type=click.Path(dir_okay=False, path_type=Path), help=METRICS_HELP)
+@click.option("--slowlog", type=click.Path(dir_okay=False, path_type=Path), help=SLOWLOG_HELP)
+@click.option(
+    "--slowlog-threshold", type=click.FloatRange(min=0), default=25.0, show_default=True, help=SLOWLOG_THRESHOLD_HELP
+)
+@click.option("--profile", "profile_path", type=click.Path(dir_okay=False, path_type=Path), help=PROFILE_HELP)
+@click.option("--memory-profile", type=click.Path(dir_okay=False, path_type=Path), help=MEMORY_PROFILE_HELP)
+@click.option("--hooks", "hooks_spec", metavar="MÓDULO:OBJETO", help=HOOKS_HELP)
+@click.option("--threads", type=click.IntRange(min=1), default=1, show_default=True, help=THREADS_HELP)
+@click.option(
+    "--backend",
+    type=click.Choice(["thread", "process", "subinterpreter"]),
+    default="thread",
+    show_default=True,
+    help=BACKEND_HELP,
+)
+def batch(
+    file_path: Path,
+    output: Path,
+    format: str,
+    column: Optional[str],
+    cache: Optional[Path],
+    summary_only: bool,
+    sample: Optional[str],
+    sample_confidence: float,
+    sample_window: int,
+    column_memo: bool,
+    header_hints: bool,
+    header_rules: Optional[Path],
+    metrics: Optional[Path],
+    slowlog: Optional[Path],
+    slowlog_threshold: float,
+    profile_path: Optional[Path],
+    memory_profile: Optional[Path],
+    hooks_spec: Optional[str],
+    threads: int,
+    backend: str,
+) -> None:
     """
     Procesar un archivo en lote y generar reporte completo.
 
-    Optimizado para archivos grandes con reporte detallado.
+    Optimizado para archivos grandes con reporte detallado. Acepta
+    archivos comprimidos (gzip, bzip2, xz o zip) sin descomprimirlos a disco.
 
     Ejemplos:
 
@@ -310,71 +794,202 @@ def batch(file_path: Path, output: Path, format: str, column: Optional[str]) ->
         $ cryptic batch usuarios.csv --output=analisis.yaml --format yaml
 
         $ cryptic batch passwords.csv --column=password --output=resultados.csv --format csv
+
+        $ cryptic batch logs.csv --output=celdas.jsonl --format jsonl
+
+        $ cryptic batch export.csv --output=reporte.json --cache=~/.cache/cryptic.db
+
+        $ cryptic batch lago.csv.gz --summary-only --output=resumen.yaml --format yaml
+
+        $ cryptic batch lago.csv --sample random --output=catalogo.json
+
+        $ cryptic batch usuarios.csv --output=reporte.json --column-memo
+
+        $ cryptic batch clientes.csv --output=reporte.json --header-rules=reglas.yaml
+
+        $ python3.13t -m cryptic.cli.main batch lago.csv --output=reporte.json --threads 8
+
+        $ python3.13 -m cryptic.cli.main batch lago.csv --output=reporte.json --threads 8 --backend subinterpreter
     """
     print_colored(f"\n🚀 Procesando en lote: {file_path.name}", Colors.CYAN, bold=True)
     print_colored("=" * 60, Colors.CYAN)
 
+    if sample and summary_only:
+        print_colored("❌ --sample y --summary-only no se pueden combinar", Colors.RED, bold=True)
+        sys.exit(1)
+    if (summary_only or sample) and format not in ("json", "yaml"):
+        option = "--sample" if sample else "--summary-only"
+        print_colored(f"❌ {option} solo admite los formatos json y yaml", Colors.RED, bold=True)
+        sys.exit(1)
+    if threads > 1:
+        # La memo de columnas y las pistas de encabezado acumulan estado por columna en orden
+        conflicts = [
+            option
+            for option, enabled in (
+                ("--summary-only", summary_only),
+                ("--sample", sample),
+                ("--column-memo", column_memo),
+                ("--header-hints", header_hints or header_rules),
+            )
+            if enabled
+        ]
+        if conflicts:
+            print_colored(f"❌ --threads no se puede combinar con {', '.join(conflicts)}", Colors.RED, bold=True)
+            sys.exit(1)
+    isolated = threads > 1 and backend != "thread"
+    if isolated:
+        # Las métricas, los valores lentos y los hooks observan el analizador de este proceso
+        conflicts = [
+            option for option, enabled in (("--metrics", metrics), ("--slowlog", slowlog), ("--hooks", hooks_spec)) if enabled
+        ]
+        if conflicts:
+            print_colored(f"❌ --backend {backend} no se puede combinar con {', '.join(conflicts)}", Colors.RED, bold=True)
+            sys.exit(1)
+        if backend == "subinterpreter":
+            from cryptic.core.backends import subinterpreters_available
+
+            if not subinterpreters_available():
+                print_colored("❌ --backend subinterpreter requiere Python 3.13 o posterior", Colors.RED, bold=True)
+                sys.exit(1)
+
+    start_profiling(profile_path, memory_profile)
+
     try:
-        analyzer = CrypticAnalyzer()
-        SensitiveDataDetector()
-        results = []
+        if sample:
+            analyzer = build_analyzer(
+                cache,
+                metrics,
+                slowlog_path=slowlog,
+                slowlog_threshold=slowlog_threshold,
+                hooks_spec=hooks_spec,
+                file_path=file_path,
+            )
+            report = run_sampling(analyzer, file_path, column, sample, sample_confidence, sample_window)
+            save_summary(report, output, format, key="sampling")
+            print_colored(f"\n💾 Clasificación guardada en: {output}", Colors.GREEN, bold=True)
+            return
+
+        if summary_only:
+            analyzer = build_analyzer(
+                cache,
+                metrics,
+                slowlog_path=slowlog,
+                slowlog_threshold=slowlog_threshold,
+                hooks_spec=hooks_spec,
+                file_path=file_path,
+            )
+            analyze, memo, hints = build_cell_analyzer(analyzer, column_memo, header_hints, header_rules)
+            summary = run_summary_only(analyzer, file_path, column, analyze)
+            print_summary(summary)
+            print_cache_statistics(analyzer)
+            print_cell_statistics(memo, hints)
+            save_summary(summary, output, format)
+            print_colored(f"\n💾 Resumen guardado en: {output}", Colors.GREEN, bold=True)
+            return
+
+        from cryptic.core.backends import IsolatedAnalysisPool
+        from cryptic.core.hooks import instrument_chunks
+        from cryptic.core.parallel import AnalysisThreadPool, gil_enabled
+        from cryptic.core.result_table import ResultTable
+        from cryptic.utils.files import file_compression, input_suffix, open_input
+
+        if threads > 1 and backend == "thread" and gil_enabled():
+            print_colored("⚠️  El intérprete tiene el GIL activo: --threads no acelerará el análisis", Colors.YELLOW)
+
+        analyzer = build_analyzer(
+            # Con workers aislados cada uno abre la caché; este proceso no analiza
+            None if isolated else cache,
+            metrics,
+            slowlog_path=slowlog,
+            slowlog_threshold=slowlog_threshold,
+            hooks_spec=hooks_spec,
+            file_path=file_path,
+        )
+        results = ResultTable()
+        analyze, memo, hints = build_cell_analyzer(analyzer, column_memo, header_hints, header_rules)
 
         total_rows = 0
+        is_csv = input_suffix(file_path) == ".csv"
+        compression = file_compression(file_path)
+
+        if compression:
+            # En archivos comprimidos el progreso se informa por bytes leídos del
+            # archivo original, evitando descomprimirlo dos veces
+            size_mb = file_path.stat().st_size / 1_000_000
+            print_colored(f"📈 Iniciando procesamiento de archivo {compression} ({size_mb:.1f} MB)...", Colors.BLUE)
+        else:
+            # Contar filas primero para mostrar progreso
+            if is_csv:
+                with open_input(file_path) as input_file:
+                    total_rows = sum(1 for _ in csv.DictReader(input_file.text))
 
-        # Contar filas primero para mostrar progreso
-        if file_path.suffix.lower() == ".csv":
-            with open(file_path, encoding="utf-8") as f:
-                total_rows = sum(1 for _ in csv.DictReader(f))
-
-        print_colored(f"📈 Iniciando procesamiento de {total_rows} filas...", Colors.BLUE)
+            print_colored(f"📈 Iniciando procesamiento de {total_rows} filas...", Colors.BLUE)
 
         processed = 0
-
-        if file_path.suffix.lower() == ".csv":
-            with open(file_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
+        # Celdas (fila, columna, valor) pendientes; con un hilo se analizan fila a fila
+        cells: List[Tuple[int, str, str]] = []
+        block_cells = THREADED_BLOCK_CELLS if threads > 1 else 1
+        pool: Union[AnalysisThreadPool, IsolatedAnalysisPool]
+        if isolated:
+            pool = IsolatedAnalysisPool(backend, threads, cache_path=cache)
+        else:
+            pool = AnalysisThreadPool(threads)
+
+        def analyze_cells() -> None:
+            if isinstance(pool, IsolatedAnalysisPool):
+                analyses = pool.analyze([value for _, _, value in cells])
+            else:
+                analyses = pool.map(lambda cell: analyze(cell[1], cell[2]), cells)
+            for (row_number, col_name, _), analysis in zip(cells, analyses):
+                results.append(row_number, col_name, analysis)
+            cells.clear()
+
+        if is_csv:
+            with open_input(file_path) as input_file, pool:
+                reader = csv.DictReader(input_file.text)
+
+                for row in instrument_chunks(reader, analyzer.hooks, attributes={"path": str(file_path)}):
                     if column:
                         # Procesar solo columna especificada
                         if column in row and row[column]:
-                            analysis = analyzer.analyze_data(row[column])
-                            results.append(
-                                {"row": processed + 1, "column": column, "original_data": row[column], "analysis": analysis}
-                            )
+                            cells.append((processed + 1, column, row[column]))
                     else:
                         # Procesar todas las columnas
                         for col_name, value in row.items():
                             if value and value.strip():
-                                analysis = analyzer.analyze_data(value)
-                                results.append(
-                                    {"row": processed + 1, "column": col_name, "original_data": value, "analysis": analysis}
-                                )
+                                cells.append((processed + 1, col_name, value))
 
                     processed += 1
+                    if len(cells) >= block_cells:
+                        analyze_cells()
 
                     # Mostrar progreso
-                    if processed % 50 == 0 or processed == total_rows:
+                    if compression:
+                        if processed % 50 == 0:
+                            position = input_file.position()
+                            progress = (position / input_file.size) * 100 if input_file.size > 0 else 0
+                            print_colored(
+                                f"   Progreso: {processed} filas, {position / 1_000_000:.1f}/"
+                                f"{input_file.size / 1_000_000:.1f} MB ({progress:.1f}%)",
+                                Colors.GREEN,
+                            )
+                    elif processed % 50 == 0 or processed == total_rows:
                         progress = (processed / total_rows) * 100 if total_rows > 0 else 0
                         print_colored(f"   Progreso: {processed}/{total_rows} ({progress:.1f}%)", Colors.GREEN)
 
+                analyze_cells()
+
         # Generar reporte completo
-        analyses = [r["analysis"] for r in results if isinstance(r["analysis"], DataAnalysis)]
-        report = analyzer.generate_report(analyses)
+        report = results.generate_report()
 
         print_colored("\n📊 Procesamiento completado:", Colors.GREEN, bold=True)
         click.echo(f"   Total procesado: {len(results)} elementos")
         click.echo(f"   Tasa de protección: {report['protection_rate']:.1%}")
+        print_cache_statistics(analyzer)
+        print_cell_statistics(memo, hints)
 
         # Contar datos sensibles por tipo
-        sensitive_by_type: Dict[str, int] = {}
-        for result in results:
-            if isinstance(result["analysis"], DataAnalysis):
-                current_analysis: DataAnalysis = result["analysis"]
-                if current_analysis.sensitive_analysis and current_analysis.sensitive_analysis.matches:
-                    for match in current_analysis.sensitive_analysis.matches:
-                        data_type = match.data_type.value
-                        sensitive_by_type[data_type] = sensitive_by_type.get(data_type, 0) + 1
+        sensitive_by_type = results.group_counts("sensitive_type")
 
         if sensitive_by_type:
             print_colored("   ⚠️  Datos sensibles por tipo:", Colors.YELLOW, bold=True)
@@ -390,10 +1005,619 @@ def batch(file_path: Path, output: Path, format: str, column: Optional[str]) ->
         sys.exit(1)
 
 
-def save_report(results: List[DataAnalysis], report: Dict[str, Any], output_path: Path, format: str) -> None:
+@cli.command()
+@click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--include", "-i", multiple=True, help="Patrón glob de archivos a incluir (repetible)")
+@click.option("--exclude", "-e", multiple=True, help="Patrón glob de archivos a excluir (repetible)")
+@click.option("--column", "-c", type=str, help="Columna específica a analizar (para CSV)")
+@click.option("--workers", "-w", type=click.IntRange(min=1), help="Cantidad de procesos (por defecto, número de CPUs)")
+@click.option(
+    "--manifest", "-m", type=click.Path(dir_okay=False, path_type=Path), help="Manifiesto SQLite para escaneos incrementales"
+)
+@click.option("--cache", type=click.Path(dir_okay=False, path_type=Path), help=CACHE_OPTION_HELP)
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Archivo de salida para reporte")
+@click.option("--format", "-f", type=click.Choice(["json", "yaml"]), default="json", help="Formato del reporte")
+@click.option(
+    "--backend",
+    type=click.Choice(["process", "thread", "subinterpreter"]),
+    default="process",
+    show_default=True,
+    help=SCAN_BACKEND_HELP,
+)
+def scan(
+    directory: Path,
+    include: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+    column: Optional[str],
+    workers: Optional[int],
+    manifest: Optional[Path],
+    cache: Optional[Path],
+    output: Optional[Path],
+    format: str,
+    backend: str,
+) -> None:
+    """
+    Escanear recursivamente un directorio en busca de datos sensibles.
+
+    Analiza archivos CSV, TXT, JSON y logs en paralelo, descartando
+    archivos binarios, y genera un reporte con secciones por archivo.
+
+    Ejemplos:
+
+        $ cryptic scan exports/
+
+        $ cryptic scan data/ --include "*.csv" --exclude "archive/*" --workers 8
+
+        $ cryptic scan logs/ --output=reporte.json
+
+        $ cryptic scan lake/ --manifest=.cryptic-manifest.db
+
+        $ python3.13 -m cryptic.cli.main scan lake/ --backend subinterpreter --workers 8
+    """
+    print_colored(f"\n🗂️  Escaneando directorio: {directory}", Colors.CYAN, bold=True)
+    print_colored("=" * 60, Colors.CYAN)
+
+    if backend == "subinterpreter":
+        from cryptic.core.backends import subinterpreters_available
+
+        if not subinterpreters_available():
+            print_colored("❌ --backend subinterpreter requiere Python 3.13 o posterior", Colors.RED, bold=True)
+            sys.exit(1)
+
+    try:
+        from cryptic.core.manifest import ScanManifest, build_options_key
+        from cryptic.core.scanner import scan_directory
+
+        scan_manifest = ScanManifest(manifest, build_options_key(column)) if manifest else None
+
+        try:
+            scan_report = scan_directory(
+                directory,
+                include=include or None,
+                exclude=exclude,
+                workers=workers,
+                column=column,
+                progress=lambda file_result: click.echo(
+                    f"   {'❌' if file_result.error else '♻' if file_result.from_manifest else '✔'} "
+                    f"{file_result.path} ({file_result.total_analyzed} elementos)"
+                ),
+                manifest=scan_manifest,
+                cache_path=cache,
+                backend=backend,
+            )
+        finally:
+            if scan_manifest is not None:
+                scan_manifest.close()
+
+        summary = scan_report.summary()
+
+        print_colored("\n📊 Resumen del escaneo:", Colors.GREEN, bold=True)
+        click.echo(f"   Archivos analizados: {summary['files_scanned']}")
+        click.echo(f"   Archivos binarios omitidos: {summary['files_skipped_binary']}")
+        if manifest:
+            click.echo(f"   Archivos reutilizados del manifiesto: {summary['files_from_manifest']}")
+        click.echo(f"   Total de elementos analizados: {summary['total_analyzed']}")
+        click.echo(f"   Elementos protegidos: {summary['protected']} ({summary['protection_rate']:.1%})")
+        click.echo(f"   Elementos sin protección: {summary['unprotected']}")
+
+        if summary["sensitive_by_type"]:
+            print_colored("   ⚠️  Datos sensibles por tipo:", Colors.YELLOW, bold=True)
+            for data_type, count in summary["sensitive_by_type"].items():
+                click.echo(f"      {data_type}: {count}")
+
+        print_colored("\n📄 Detalle por archivo:", Colors.YELLOW, bold=True)
+        for file_result in scan_report.files:
+            if file_result.error:
+                print_colored(f"   ❌ {file_result.path}: {file_result.error}", Colors.RED)
+                continue
+
+            click.echo(
+                f"   {file_result.path}: {file_result.total_analyzed} elementos, "
+                f"{file_result.unprotected} sin protección, {file_result.sensitive_elements} con datos sensibles"
+            )
+            for data_type, count in file_result.sensitive_by_type.items():
+                click.echo(f"      {data_type}: {count}")
+
+        if output:
+            data = scan_report.to_dict()
+            with open(output, "w", encoding="utf-8") as f:
+                if format == "yaml":
+                    import yaml
+
+                    yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+                else:
+                    import json
+
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            print_colored(f"\n💾 Reporte guardado en: {output}", Colors.GREEN, bold=True)
+
+    except Exception as e:
+        print_colored(f"\n❌ Error escaneando directorio: {str(e)}", Colors.RED, bold=True)
+        sys.exit(1)
+
+
+@cli.command(name="filter")
+@click.option(
+    "--format", "-f", type=click.Choice(["jsonl", "annotate"]), default="jsonl", help="Formato de salida por registro"
+)
+@click.option("--only-sensitive", "-s", is_flag=True, help="Emitir solo los registros con datos sensibles")
+@click.option(
+    "--flush-interval",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Segundos máximos que un registro espera en el búfer de stdout (0 = vaciar tras cada registro)",
+)
+@click.option(
+    "--max-line-length",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_LINE_LENGTH,
+    show_default=True,
+    help="Largo máximo de un registro; el exceso se descarta",
+)
+@click.option("--cache", type=click.Path(dir_okay=False, path_type=Path), help=CACHE_OPTION_HELP)
+def filter_command(
+    format: str, only_sensitive: bool, flush_interval: float, max_line_length: int, cache: Optional[Path]
+) -> None:
+    """
+    Analizar registros desde stdin y escribir hallazgos en stdout.
+
+    Lee un registro por línea con memoria constante y emite cada resultado
+    de inmediato, para usarse dentro de pipelines de logs.
+
+    Ejemplos:
+
+        $ tail -F app.log | cryptic filter --only-sensitive
+
+        $ cat export.txt | cryptic filter --format annotate
+
+        $ journalctl -f | cryptic filter --flush-interval 1 > hallazgos.jsonl
+    """
+    try:
+        from cryptic.core.streaming import filter_stream
+
+        analyzer = build_analyzer(cache)
+        stats = filter_stream(
+            analyzer,
+            sys.stdin,
+            sys.stdout,
+            output_format=format,
+            only_sensitive=only_sensitive,
+            flush_interval=flush_interval,
+            max_line_length=max_line_length,
+        )
+        if stats["truncated_lines"]:
+            click.echo(f"⚠️  {stats['truncated_lines']} registros truncados a {max_line_length} caracteres", err=True)
+
+    except BrokenPipeError:
+        # El consumidor del pipeline cerró la salida (ej: "| head")
+        sys.stderr.close()
+        sys.exit(0)
+    except Exception as e:
+        click.echo(f"❌ Error procesando flujo: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--corpus",
+    "-c",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Archivo CSV, JSON o de texto usado como corpus (por defecto, corpus incluido)",
+)
+@click.option("--size", type=click.IntRange(min=1), help="Replicar el corpus hasta N valores")
+@click.option("--generate", "-g", type=click.IntRange(min=1), help="Usar un corpus sintético de N valores (semilla 0)")
+@click.option("--iterations", "-n", type=click.IntRange(min=1), default=3, show_default=True, help="Pasadas sobre el corpus")
+@click.option("--skip-batch", is_flag=True, help="Omitir el benchmark de batch de extremo a extremo")
+@click.option("--import-time", is_flag=True, help="Medir también el tiempo de importación contra su objetivo")
+@click.option("--memory", is_flag=True, help="Medir también la memoria retenida por celda (resultados completos y compactos)")
+@click.option("--prefilter", is_flag=True, help="Medir también las regex evitadas por el prefiltro de características")
+@click.option(
+    "--hooks", is_flag=True, help="Medir también el costo de los hooks de instrumentación (sin hooks, vacíos y desglose)"
+)
+@click.option("--threads", is_flag=True, help="Medir también la escala de analyze_batch con 1, 2, 4 y 8 hilos")
+@click.option("--backends", is_flag=True, help="Comparar también los backends thread, process y subinterpreter con 4 workers")
+@click.option(
+    "--pool-startup",
+    is_flag=True,
+    help="Medir también lotes cortos con pools de procesos nuevos (spawn y fork server precalentado)",
+)
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path), help="Guardar resultados en JSON")
+@click.option(
+    "--baseline",
+    "-b",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Reporte JSON previo contra el cual comparar",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0, max=1),
+    help="Caída de throughput tolerada respecto de la línea base (por defecto, 0.10)",
+)
+def bench(
+    corpus: Optional[Path],
+    size: Optional[int],
+    generate: Optional[int],
+    iterations: int,
+    skip_batch: bool,
+    import_time: bool,
+    memory: bool,
+    prefilter: bool,
+    hooks: bool,
+    threads: bool,
+    backends: bool,
+    pool_startup: bool,
+    output: Optional[Path],
+    baseline: Optional[Path],
+    threshold: Optional[float],
+) -> None:
+    """
+    Medir el rendimiento de identificación, detección y análisis.
+
+    Reporta throughput y latencias p50/p95/p99 por componente y falla si
+    el throughput cae más del umbral respecto de una línea base o si el
+    tiempo de importación supera su objetivo.
+
+    Ejemplos:
+
+        $ cryptic bench --corpus test_data.csv --output baseline.json
+
+        $ cryptic bench --corpus test_data.csv --baseline baseline.json --threshold 0.15
+
+        $ cryptic bench --generate 100000 --skip-batch
+
+        $ cryptic bench --skip-batch --import-time
+
+        $ cryptic bench --generate 100000 --skip-batch --memory
+
+        $ cryptic bench --generate 50000 --skip-batch --prefilter
+
+        $ cryptic bench --generate 20000 --skip-batch --hooks
+
+        $ python3.13t -m cryptic.cli.main bench --generate 20000 --skip-batch --threads
+
+        $ python3.13 -m cryptic.cli.main bench --generate 20000 --skip-batch --backends
+
+        $ cryptic bench --skip-batch --pool-startup
+    """
+    try:
+        import json
+
+        from cryptic.core import benchmark
+        from cryptic.utils.corpus import generate_values
+
+        values = generate_values(generate) if generate else benchmark.load_corpus(corpus)
+        if size:
+            values = benchmark.expand_corpus(values, size)
+        if not values:
+            print_colored("❌ El corpus no contiene valores", Colors.RED)
+            sys.exit(1)
+
+        print_colored(f"⏱️  Ejecutando benchmarks sobre {len(values)} valores ({iterations} pasadas)...", Colors.BLUE)
+        results = benchmark.run_benchmarks(values, iterations=iterations, include_batch=not skip_batch)
+        report = benchmark.build_report(results, len(values))
+
+        click.echo()
+        click.echo(f"{'Benchmark':<20} {'ops/s':>12} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+        for result in results.values():
+            click.echo(
+                f"{result.name:<20} {result.throughput:>12.0f} {result.p50_ms:>10.3f} "
+                f"{result.p95_ms:>10.3f} {result.p99_ms:>10.3f}"
+            )
+
+        if memory:
+            report["memory"] = benchmark.measure_memory_per_cell(values)
+
+            click.echo()
+            click.echo(f"{'Memoria':<20} {'bytes/celda':>12}")
+            click.echo(f"{'completo':<20} {report['memory']['full_bytes_per_cell']:>12.0f}")
+            click.echo(
+                f"{'compacto':<20} {report['memory']['compact_bytes_per_cell']:>12.0f} "
+                f"({report['memory']['reduction']:.1f}x menos)"
+            )
+
+        if prefilter:
+            report["prefilter"] = benchmark.measure_prefilter(values, iterations)
+
+            click.echo()
+            click.echo(f"{'Regex por valor':<20} {'ejecutadas':>12} {'evitadas':>10}")
+            for name, counts in report["prefilter"]["regex_per_value"].items():
+                click.echo(f"{name:<20} {counts['executed']:>12.2f} {counts['avoided']:>10.2f}")
+            click.echo(
+                f"{'analyze_data':<20} {report['prefilter']['with_prefilter']['throughput']:>12.0f} ops/s con prefiltro, "
+                f"{report['prefilter']['without_prefilter']['throughput']:.0f} sin prefiltro "
+                f"({report['prefilter']['speedup']:.2f}x)"
+            )
+
+        if hooks:
+            report["hooks"] = benchmark.measure_hooks_overhead(values, iterations)
+
+            click.echo()
+            click.echo(f"{'Hooks':<20} {'ops/s':>12} {'sobrecosto':>11}")
+            click.echo(f"{'sin hooks':<20} {report['hooks']['without_hooks']['throughput']:>12.0f}")
+            for name, label in (("noop_hooks", "hooks vacíos"), ("stage_timings", "desglose")):
+                click.echo(
+                    f"{label:<20} {report['hooks'][name]['throughput']:>12.0f} {report['hooks'][name + '_overhead']:>+10.1%}"
+                )
+
+        if threads:
+            report["threads"] = benchmark.measure_thread_scaling(values, iterations=iterations)
+
+            gil = "con GIL" if report["threads"]["gil_enabled"] else "sin GIL"
+            click.echo()
+            click.echo(f"{'Hilos (' + gil + ')':<20} {'ops/s':>12} {'speedup':>9}  ({report['threads']['cpus']} CPUs)")
+            for count, scaling in report["threads"]["threads"].items():
+                click.echo(f"{count:<20} {scaling['throughput']:>12.0f} {scaling['speedup']:>8.2f}x")
+
+        if backends:
+            report["backends"] = benchmark.measure_backends(values, iterations=iterations)
+
+            gil = "con GIL" if report["backends"]["gil_enabled"] else "sin GIL"
+            click.echo()
+            click.echo(
+                f"{'Backend (' + gil + ')':<20} {'ops/s':>12} {'speedup':>9} {'arranque ms':>12}  "
+                f"({report['backends']['workers']} workers, {report['backends']['cpus']} CPUs)"
+            )
+            for name, result in report["backends"]["backends"].items():
+                if not result["available"]:
+                    click.echo(f"{name:<20} {'no disponible en este intérprete':>35}")
+                    continue
+                click.echo(
+                    f"{name:<20} {result['throughput']:>12.0f} {result['speedup']:>8.2f}x {result['startup_ms']:>12.1f}"
+                )
+
+        if pool_startup:
+            report["pool_startup"] = benchmark.measure_pool_startup(values)
+
+            click.echo()
+            click.echo(
+                f"{'Pool de procesos':<20} {'1er lote ms':>12} {'lote ms':>9}  "
+                f"({report['pool_startup']['jobs']} lotes, {report['pool_startup']['workers']} workers)"
+            )
+            for name, timing in report["pool_startup"]["start_methods"].items():
+                click.echo(f"{name:<20} {timing['first_job_ms']:>12.1f} {timing['job_ms']:>9.1f}")
+            result_bytes = report["pool_startup"]["result_bytes_per_value"]
+            click.echo(
+                f"{'bytes/resultado':<20} {result_bytes['compact']:>12.0f} compacto, {result_bytes['pickle']:.0f} con pickle"
+            )
+
+        slow_imports = []
+        if import_time:
+            report["import_time"] = benchmark.run_import_benchmarks()
+
+            click.echo()
+            click.echo(f"{'Importación':<20} {'ms':>12} {'objetivo':>10}")
+            for module, timing in report["import_time"].items():
+                click.echo(f"{module:<20} {timing['import_ms']:>12.1f} {timing['target_ms']:>10.1f}")
+                if not timing["within_target"]:
+                    slow_imports.append(f"{module}: {timing['import_ms']:.1f} ms (objetivo {timing['target_ms']:.0f} ms)")
+
+        if output:
+            benchmark.save_report(report, output)
+            print_colored(f"\n💾 Resultados guardados en: {output}", Colors.GREEN)
+
+        if slow_imports:
+            print_colored("\n❌ Tiempo de importación sobre el objetivo:", Colors.RED, bold=True)
+            for slow_import in slow_imports:
+                print_colored(f"   • {slow_import}", Colors.RED)
+
+        regressions = []
+        if baseline:
+            if threshold is None:
+                threshold = benchmark.DEFAULT_REGRESSION_THRESHOLD
+            with open(baseline, encoding="utf-8") as f:
+                regressions = benchmark.compare_with_baseline(report, json.load(f), threshold)
+
+            if regressions:
+                print_colored(f"\n❌ Regresiones de rendimiento (umbral {threshold:.0%}):", Colors.RED, bold=True)
+                for regression in regressions:
+                    print_colored(f"   • {regression}", Colors.RED)
+            else:
+                print_colored(f"\n✅ Sin regresiones respecto de {baseline}", Colors.GREEN)
+
+        if slow_imports or regressions:
+            sys.exit(1)
+
+    except Exception as e:
+        print_colored(f"❌ Error ejecutando benchmarks: {str(e)}", Colors.RED)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--rows", "-r", type=click.IntRange(min=1), default=10000, show_default=True, help="Cantidad de registros")
+@click.option(
+    "--mix",
+    "-m",
+    help="Pesos por tipo, ej: email=50,rut=30,md5=20 (tipos: email, rut, credit_card, phone, ip, name, "
+    "md5, sha1, sha256, bcrypt, argon2, plain)",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Semilla del generador")
+@click.option("--cardinality", type=click.IntRange(min=1), help="Máximo de valores distintos por tipo")
+@click.option("--format", "-f", type=click.Choice(["csv", "jsonl", "text"]), default="csv", help="Formato de salida")
+@click.option(
+    "--output", "-o", type=click.Path(dir_okay=False, path_type=Path), help="Archivo de salida (por defecto, stdout)"
+)
+def gen(rows: int, mix: Optional[str], seed: int, cardinality: Optional[int], format: str, output: Optional[Path]) -> None:
+    """
+    Generar un corpus sintético de datos sensibles con etiquetas.
+
+    Los valores son deterministas para una misma semilla y válidos según
+    los validadores de Cryptic (dígito verificador de RUT, Luhn, etc.).
+    En CSV y JSON Lines cada valor incluye su tipo esperado.
+
+    Ejemplos:
+
+        $ cryptic gen --rows 1000000 --output corpus.csv
+
+        $ cryptic gen --rows 50000 --mix email=50,rut=30,md5=20 --format jsonl -o corpus.jsonl
+
+        $ cryptic gen --rows 1000 --format text | cryptic filter --only-sensitive
+    """
+    try:
+        from cryptic.utils.corpus import CorpusGenerator, parse_mix, write_corpus
+
+        generator = CorpusGenerator(seed=seed, mix=parse_mix(mix) if mix else None, cardinality=cardinality)
+
+        if output is None:
+            write_corpus(generator, rows, sys.stdout, format)
+            return
+
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            write_corpus(generator, rows, f, format)
+        print_colored(f"✅ {rows} registros generados en: {output}", Colors.GREEN)
+
+    except Exception as e:
+        print_colored(f"❌ Error generando corpus: {str(e)}", Colors.RED)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Dirección donde escuchar")
+@click.option(
+    "--port", "-p", type=click.IntRange(min=0, max=65535), default=8765, show_default=True, help="Puerto (0 elige uno libre)"
+)
+@click.option("--workers", "-w", type=click.IntRange(min=1), default=1, show_default=True, help="Procesos worker")
+@click.option("--threads", type=click.IntRange(min=1), default=4, show_default=True, help="Hilos por worker")
+@click.option(
+    "--queue-size",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Solicitudes en espera por worker antes de responder 503",
+)
+@click.option(
+    "--keepalive-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=5.0,
+    show_default=True,
+    help="Segundos de inactividad antes de cerrar una conexión persistente",
+)
+@click.option(
+    "--max-body",
+    type=click.IntRange(min=1),
+    default=10 * 1024 * 1024,
+    show_default=True,
+    help="Tamaño máximo del cuerpo de una solicitud en bytes",
+)
+@click.option(
+    "--slowlog-threshold",
+    type=click.FloatRange(min=0),
+    help="Registrar en GET /slowlog los valores cuyo análisis supere estos milisegundos",
+)
+@click.option("--quiet", "-q", is_flag=True, help="No registrar cada solicitud")
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    threads: int,
+    queue_size: int,
+    keepalive_timeout: float,
+    max_body: int,
+    slowlog_threshold: Optional[float],
+    quiet: bool,
+) -> None:
+    """
+    Iniciar un servidor HTTP local de análisis con el analizador precalentado.
+
+    Evita el costo de arranque de cada invocación: los patrones se compilan
+    una sola vez y cada worker atiende conexiones persistentes. Operaciones
+    (POST con cuerpo JSON): /analyze {"value": ...}, /batch [...] y
+    /detect {"text": ...}; GET /health informa el estado, GET /metrics las
+    métricas del analizador en formato Prometheus y, con --slowlog-threshold,
+    GET /slowlog los valores más lentos de analizar. Con SIGTERM, el
+    servidor deja de aceptar conexiones y termina las solicitudes pendientes.
+
+    Ejemplos:
+
+        $ cryptic serve --port 8765 --workers 4
+
+        $ cryptic serve --slowlog-threshold 20
+
+        $ curl -s localhost:8765/analyze -d '{"value": "12.345.678-5"}'
+    """
+    try:
+        from cryptic.core.analyzer import CrypticAnalyzer
+        from cryptic.core.metrics import MetricsRegistry
+        from cryptic.core.slowlog import SlowLog
+        from cryptic.server.http_server import run_server
+
+        def on_ready(address: Tuple[str, int]) -> None:
+            print_colored(f"🚀 Escuchando en http://{address[0]}:{address[1]}", Colors.GREEN, bold=True)
+            print_colored(f"   {workers} worker(s) × {threads} hilo(s), cola de {queue_size}", Colors.CYAN)
+
+        def on_worker_exit(pid: int, status: int) -> None:
+            print_colored(f"⚠️  Worker {pid} terminó inesperadamente (estado {status}); reiniciando", Colors.YELLOW)
+
+        exit_code = run_server(
+            CrypticAnalyzer(
+                metrics=MetricsRegistry(),
+                slowlog=SlowLog(threshold_ms=slowlog_threshold) if slowlog_threshold is not None else None,
+            ),
+            host=host,
+            port=port,
+            workers=workers,
+            threads=threads,
+            queue_size=queue_size,
+            keepalive_timeout=keepalive_timeout,
+            max_body=max_body,
+            quiet=quiet,
+            on_ready=on_ready,
+            on_worker_exit=on_worker_exit,
+        )
+
+    except Exception as e:
+        print_colored(f"❌ Error iniciando servidor: {str(e)}", Colors.RED)
+        sys.exit(1)
+
+    print_colored("👋 Servidor detenido", Colors.BLUE)
+    sys.exit(exit_code)
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Ruta del socket Unix (por defecto, $CRYPTIC_DAEMON_SOCKET o uno en un directorio privado del usuario)",
+)
+def daemon(socket_path: Optional[str]) -> None:
+    """
+    Iniciar un daemon que ejecuta analyze y verify sin costo de arranque.
+
+    Mientras el daemon está en ejecución, `cryptic analyze` y `cryptic verify`
+    le reenvían la invocación por un socket Unix: los módulos, los patrones y
+    el analizador ya están cargados, y los archivos se leen directamente por
+    su ruta. La salida es la misma que la de una ejecución local. Defina
+    CRYPTIC_NO_DAEMON=1 para no usarlo. Se detiene con SIGTERM o Ctrl+C.
+
+    Ejemplos:
+
+        $ cryptic daemon &
+
+        $ CRYPTIC_DAEMON_SOCKET=/run/user/1000/cryptic.sock cryptic daemon
+    """
+    try:
+        from cryptic.server.daemon import run_daemon
+
+        exit_code = run_daemon(
+            socket_path,
+            on_ready=lambda path: print_colored(f"🚀 Daemon escuchando en {path}", Colors.GREEN, bold=True),
+        )
+
+    except Exception as e:
+        print_colored(f"❌ Error iniciando daemon: {str(e)}", Colors.RED)
+        sys.exit(1)
+
+    print_colored("👋 Daemon detenido", Colors.BLUE)
+    sys.exit(exit_code)
+
+
+def save_report(results: List["DataAnalysis"], report: Dict[str, Any], output_path: Path, format: str) -> None:
     """Guarda un reporte de análisis en el formato especificado"""
 
     if format == "json":
+        import json
+
         data = {
             "summary": report,
             "results": [
@@ -424,6 +1648,8 @@ def save_report(results: List[DataAnalysis], report: Dict[str, Any], output_path
             json.dump(data, f, indent=2, ensure_ascii=False)
 
     elif format == "yaml":
+        import yaml
+
         data = {
             "summary": report,
             "results": [
@@ -442,91 +1668,43 @@ def save_report(results: List[DataAnalysis], report: Dict[str, Any], output_path
             yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
 
 
-def save_batch_report(results: List[Dict], report: Dict[str, Any], output_path: Path, format: str) -> None:
+def save_batch_report(results: "ResultTable", report: Dict[str, Any], output_path: Path, format: str) -> None:
     """Guarda un reporte de procesamiento por lotes"""
 
     if format == "json":
+        import json
+
         data = {
             "summary": report,
             "metadata": {
-                "total_rows_processed": len({r["row"] for r in results}),
+                "total_rows_processed": results.distinct_rows(),
                 "total_elements_analyzed": len(results),
                 "timestamp": None,
             },
-            "results": [
-                {
-                    "row": r["row"],
-                    "column": r["column"],
-                    "original_data": r["original_data"],
-                    "sensitivity_level": r["analysis"].sensitivity_level.value,
-                    "protection_status": r["analysis"].protection_status.value,
-                    "confidence": r["analysis"].confidence,
-                    "sensitive_matches": [
-                        {
-                            "type": match.data_type.value,
-                            "text": match.matched_text,
-                            "confidence": match.confidence,
-                            "validated": match.is_validated,
-                        }
-                        for match in (
-                            r["analysis"].sensitive_analysis.matches
-                            if r["analysis"].sensitive_analysis and r["analysis"].sensitive_analysis.matches
-                            else []
-                        )
-                    ],
-                }
-                for r in results
-            ],
+            "results": list(results.iter_records()),
         }
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
+    elif format == "jsonl":
+        with open(output_path, "w", encoding="utf-8") as f:
+            results.write_jsonl(f)
+
     elif format == "csv":
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            fieldnames = [
-                "row",
-                "column",
-                "original_data",
-                "sensitivity_level",
-                "protection_status",
-                "confidence",
-                "sensitive_types",
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for r in results:
-                sensitive_types = []
-                if r["analysis"].sensitive_analysis and r["analysis"].sensitive_analysis.matches:
-                    sensitive_types = [match.data_type.value for match in r["analysis"].sensitive_analysis.matches]
-
-                writer.writerow(
-                    {
-                        "row": r["row"],
-                        "column": r["column"],
-                        "original_data": r["original_data"],
-                        "sensitivity_level": r["analysis"].sensitivity_level.value,
-                        "protection_status": r["analysis"].protection_status.value,
-                        "confidence": r["analysis"].confidence,
-                        "sensitive_types": "; ".join(sensitive_types),
-                    }
-                )
+            results.write_csv(f)
 
     elif format == "yaml":
+        import yaml
+
         data = {
             "summary": report,
-            "results": [
-                {
-                    "row": r["row"],
-                    "column": r["column"],
-                    "original_data": r["original_data"],
-                    "sensitivity_level": r["analysis"].sensitivity_level.value,
-                    "protection_status": r["analysis"].protection_status.value,
-                    "confidence": r["analysis"].confidence,
-                }
-                for r in results
-            ],
+            "results": list(
+                results.iter_records(
+                    fields=["row", "column", "original_data", "sensitivity_level", "protection_status", "confidence"]
+                )
+            ),
         }
 
         with open(output_path, "w", encoding="utf-8") as f:
@@ -0,0 +1,227 @@
+"""
+Análisis en modo solo-resumen con memoria acotada.
+
+Este módulo acumula únicamente conteos agregados por columna (estado de
+protección, tipos de datos sensibles y de hash) y una muestra acotada de
+hallazgos por columna y tipo, obtenida por muestreo de reservorio. No se
+conserva ningún resultado por celda, por lo que la memoria utilizada no
+depende de la cantidad de filas analizadas.
+"""
+
+import random
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from cryptic.core.analyzer import DataAnalysis, ProtectionStatus
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+# Muestras de hallazgos conservadas por columna y tipo
+DEFAULT_SAMPLES_PER_GROUP = 5
+
+# Nombre de columna usado para los archivos de texto plano
+TEXT_COLUMN = "texto"
+
+T = TypeVar("T")
+
+
+class ReservoirSample(Generic[T]):
+    """
+    Muestra aleatoria uniforme de tamaño fijo sobre un flujo (algoritmo R).
+
+    Tras observar n elementos, cada uno tiene probabilidad k/n de estar en
+    la muestra, con memoria O(k).
+    """
+
+    def __init__(self, size: int, rng: random.Random) -> None:
+        """
+        Inicializa el reservorio.
+
+        Args:
+            size: Cantidad máxima de elementos conservados
+            rng: Generador pseudoaleatorio (compartido para reproducibilidad)
+        """
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.items: List[T] = []
+
+    def add(self, item: T) -> None:
+        """Observa un elemento del flujo"""
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+            return
+
+        index = self.rng.randrange(self.seen)
+        if index < self.size:
+            self.items[index] = item
+
+
+class _ColumnStats:
+    """Conteos agregados de una columna"""
+
+    __slots__ = ("total", "protected", "unprotected", "sensitive", "sensitive_by_type", "hash_types", "samples")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.protected = 0
+        self.unprotected = 0
+        self.sensitive = 0
+        self.sensitive_by_type: Counter = Counter()
+        self.hash_types: Counter = Counter()
+        self.samples: Dict[str, ReservoirSample[Tuple[int, str]]] = {}
+
+
+class SummaryAccumulator:
+    """
+    Acumulador de resultados en modo solo-resumen.
+
+    Cada análisis actualiza los conteos de su columna y, si contiene
+    hallazgos, el reservorio de muestras de cada tipo encontrado.
+    """
+
+    def __init__(self, samples_per_group: int = DEFAULT_SAMPLES_PER_GROUP, seed: int = 0) -> None:
+        """
+        Inicializa el acumulador.
+
+        Args:
+            samples_per_group: Muestras conservadas por columna y tipo de hallazgo
+            seed: Semilla del muestreo de reservorio
+        """
+        self.samples_per_group = samples_per_group
+        self.rng = random.Random(seed)
+        self.columns: Dict[str, _ColumnStats] = {}
+
+    def add(self, row: int, column: str, analysis: DataAnalysis) -> None:
+        """
+        Incorpora el análisis de una celda.
+
+        Args:
+            row: Número de fila (o de línea) de la celda
+            column: Nombre de la columna
+            analysis: Resultado del análisis
+        """
+        stats = self.columns.get(column)
+        if stats is None:
+            stats = self.columns[column] = _ColumnStats()
+
+        stats.total += 1
+        if analysis.protection_status == ProtectionStatus.PROTECTED:
+            stats.protected += 1
+        elif analysis.protection_status == ProtectionStatus.UNPROTECTED:
+            stats.unprotected += 1
+
+        labels = []
+        if analysis.sensitive_analysis and analysis.sensitive_analysis.matches:
+            stats.sensitive += 1
+            for match in analysis.sensitive_analysis.matches:
+                stats.sensitive_by_type[match.data_type.value] += 1
+            labels.extend(dict.fromkeys(match.data_type.value for match in analysis.sensitive_analysis.matches))
+        if analysis.hash_analysis and analysis.hash_analysis.possible_types:
+            hash_type = analysis.hash_analysis.possible_types[0][0].value
+            stats.hash_types[hash_type] += 1
+            labels.append(hash_type)
+
+        for label in labels:
+            sample = stats.samples.get(label)
+            if sample is None:
+                sample = stats.samples[label] = ReservoirSample(self.samples_per_group, self.rng)
+            sample.add((row, analysis.original_data))
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Construye el resumen agregado.
+
+        Returns:
+            Diccionario con totales, tasa de protección, tipos sensibles y de
+            hash detectados, recomendaciones y el detalle por columna con sus muestras
+        """
+        totals = {"total_analyzed": 0, "protected": 0, "unprotected": 0, "sensitive_elements": 0}
+        sensitive_by_type: Counter = Counter()
+        hash_types: Counter = Counter()
+        columns: Dict[str, Any] = {}
+
+        for name, stats in self.columns.items():
+            totals["total_analyzed"] += stats.total
+            totals["protected"] += stats.protected
+            totals["unprotected"] += stats.unprotected
+            totals["sensitive_elements"] += stats.sensitive
+            sensitive_by_type.update(stats.sensitive_by_type)
+            hash_types.update(stats.hash_types)
+
+            columns[name] = {
+                "total_analyzed": stats.total,
+                "protected": stats.protected,
+                "unprotected": stats.unprotected,
+                "protection_rate": stats.protected / stats.total if stats.total else 0,
+                "sensitive_elements": stats.sensitive,
+                "sensitive_by_type": dict(stats.sensitive_by_type),
+                "hash_types_detected": dict(stats.hash_types),
+                "samples": {
+                    label: [{"row": row, "value": value} for row, value in sorted(sample.items)]
+                    for label, sample in stats.samples.items()
+                },
+            }
+
+        recommendations = []
+        if totals["unprotected"] > 0:
+            recommendations.append(f"Se encontraron {totals['unprotected']} elementos sin protección")
+        if totals["protected"] == totals["total_analyzed"]:
+            recommendations.append("Todos los elementos analizados están protegidos")
+
+        total = totals["total_analyzed"]
+        return {
+            **totals,
+            "protection_rate": totals["protected"] / total if total else 0,
+            "sensitive_by_type": dict(sensitive_by_type),
+            "hash_types_detected": dict(hash_types),
+            "recommendations": recommendations,
+            "columns": columns,
+        }
+
+
+def summarize_file(
+    analyzer: "CrypticAnalyzer",
+    path: Path,
+    column: Optional[str] = None,
+    samples_per_group: int = DEFAULT_SAMPLES_PER_GROUP,
+    seed: int = 0,
+    progress: Optional[Callable[[int], None]] = None,
+    progress_every: int = 1000,
+    analyze: Optional[Callable[[str, str], DataAnalysis]] = None,
+) -> Dict[str, Any]:
+    """
+    Analiza un archivo CSV o de texto conservando solo el resumen agregado.
+
+    Args:
+        analyzer: Analizador a utilizar
+        path: Archivo a analizar (los comprimidos se descomprimen en streaming)
+        column: Columna específica a analizar (solo CSV)
+        samples_per_group: Muestras conservadas por columna y tipo de hallazgo
+        seed: Semilla del muestreo de reservorio
+        progress: Función opcional invocada con el número de fila cada progress_every filas
+        progress_every: Cada cuántas filas informar el progreso
+        analyze: Función (columna, valor) a usar en lugar del análisis completo
+            (ej: ColumnTypeMemo.analyze o HeaderAwareAnalyzer.analyze)
+
+    Returns:
+        Resumen agregado (ver SummaryAccumulator.summary)
+    """
+    from cryptic.utils.files import iter_cells
+
+    accumulator = SummaryAccumulator(samples_per_group, seed)
+    last_row = 0
+
+    for row, column_name, value in iter_cells(path, column):
+        name = column_name or TEXT_COLUMN
+        analysis = analyze(name, value) if analyze else analyzer.analyze_data(value)
+        accumulator.add(row, name, analysis)
+
+        if progress is not None and row != last_row and row % progress_every == 0:
+            progress(row)
+        last_row = row
+
+    return accumulator.summary()
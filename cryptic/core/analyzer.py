@@ -6,12 +6,49 @@ identificar información sensible y verificar su estado de protección.
 """
 
 import re
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from cryptic.core.hash_identifier import HashAnalysis, HashIdentifier
+from cryptic.core.hooks import STAGE_ANALYZE, AnalysisHooks, combine_hooks
 from cryptic.core.sensitive_detector import SensitiveAnalysis, SensitiveDataDetector
+from cryptic.core.timings import STAGE_FEATURES, STAGE_HASH_TOKENS, STAGE_HASH_WHOLE, STAGE_STATUS, StageTimings
+from cryptic.utils.features import ValueFeatures, extract_features
+
+if TYPE_CHECKING:
+    from cryptic.core.cache import AnalysisCache
+    from cryptic.core.compact import CompactAnalysis
+    from cryptic.core.metrics import MetricsRegistry
+    from cryptic.core.slowlog import SlowLog
+    from cryptic.patterns.hash_patterns import HashPattern
+    from cryptic.patterns.sensitive_patterns import SensitivePattern
+
+# Tiempos de detección (ms) a partir de los cuales se recomienda optimizar
+SLOW_ANALYSIS_MS = 50
+VERY_SLOW_ANALYSIS_MS = 100
+
+
+def timing_recommendations(analysis_time_ms: float) -> List[str]:
+    """
+    Recomendaciones de rendimiento según el tiempo de detección medido.
+
+    Dependen de la ejecución y no del valor analizado, por lo que siempre se
+    agregan al final de las recomendaciones y la caché no las almacena.
+
+    Args:
+        analysis_time_ms: Tiempo del análisis de datos sensibles en milisegundos
+
+    Returns:
+        Lista de recomendaciones (vacía si el análisis fue rápido)
+    """
+    recommendations = []
+    if analysis_time_ms > SLOW_ANALYSIS_MS:
+        recommendations.append(f"⏱️  Tiempo de análisis: {analysis_time_ms:.1f}ms")
+        if analysis_time_ms > VERY_SLOW_ANALYSIS_MS:
+            recommendations.append("Considere optimizar el texto o usar análisis en lotes para mejor rendimiento")
+    return recommendations
 
 
 class DataSensitivity(Enum):
@@ -65,12 +102,66 @@ class CrypticAnalyzer:
 
     Combina identificación de hashes con detección de datos sensibles
     para proporcionar un análisis completo de seguridad de datos.
+
+    Seguridad entre hilos: una instancia puede compartirse entre hilos y
+    analizar en paralelo. El análisis no modifica el analizador; los patrones
+    se construyen en el primer uso y se publican completos, y la caché, las
+    métricas, el desglose de tiempos y el registro de valores lentos usan
+    locks propios. Los hooks se invocan desde el hilo que analiza y deben ser
+    seguros entre hilos si el analizador se comparte. La configuración
+    (atributos públicos) no debe cambiarse mientras otros hilos analizan.
+    ``analyze_batch(threads=N)`` reparte un lote entre N hilos (ver
+    cryptic.core.parallel).
     """
 
-    def __init__(self) -> None:
-        """Inicializa el analizador con sus componentes"""
-        self.hash_identifier = HashIdentifier()
-        self.sensitive_detector = SensitiveDataDetector()
+    def __init__(
+        self,
+        cache: Optional["AnalysisCache"] = None,
+        prefilter: bool = True,
+        metrics: Optional["MetricsRegistry"] = None,
+        timings: Optional[StageTimings] = None,
+        slowlog: Optional["SlowLog"] = None,
+        hooks: Optional[AnalysisHooks] = None,
+    ) -> None:
+        """
+        Inicializa el analizador con sus componentes.
+
+        Args:
+            cache: Caché persistente opcional para reutilizar análisis entre ejecuciones
+            prefilter: Descartar los patrones imposibles según las características
+                de cada valor antes de ejecutar sus regex (no altera los resultados)
+            metrics: Registro opcional de métricas (ver cryptic.core.metrics), compartido
+                con el identificador de hashes y el detector de datos sensibles
+            timings: Desglose opcional donde acumular el tiempo de cada etapa
+                (ver cryptic.core.timings), compartido con el detector
+            slowlog: Registro opcional de valores lentos (ver cryptic.core.slowlog);
+                requiere medir las etapas, por lo que crea un StageTimings si no se entrega
+            hooks: Hooks opcionales de instrumentación (ver cryptic.core.hooks), invocados
+                alrededor de cada análisis y de cada etapa, compartidos con el detector
+        """
+        if slowlog is not None and timings is None:
+            timings = StageTimings()
+        self.hash_identifier = HashIdentifier(prefilter, metrics)
+        self.sensitive_detector = SensitiveDataDetector(prefilter, metrics, timings, hooks)
+        self.cache = cache
+        self.metrics = metrics
+        self.timings = timings
+        self.slowlog = slowlog
+        self.hooks = hooks
+        # Desglose y hooks se invocan igual: una sola comparación con None por etapa
+        self._stage_hooks = combine_hooks(timings, hooks)
+        self._instrumented = slowlog is not None or hooks is not None
+        if metrics is not None:
+            self._values_analyzed = metrics.counter("cryptic_values_analyzed_total", "Valores analizados")
+            self._bytes_scanned = metrics.counter(
+                "cryptic_bytes_scanned_total", "Bytes (UTF-8) de los valores analizados, sin contar aciertos de caché"
+            )
+            self._cache_requests = metrics.counter(
+                "cryptic_cache_requests_total", "Consultas a la caché persistente de análisis", ("result",)
+            )
+            self._analyze_seconds = metrics.histogram(
+                "cryptic_analyze_duration_seconds", "Latencia de un análisis completo (segundos)"
+            )
 
     def analyze_data(self, data: str) -> DataAnalysis:
         """
@@ -82,13 +173,59 @@ class CrypticAnalyzer:
         Returns:
             DataAnalysis con el resultado completo del análisis
         """
-        import time
-
-        start_time = time.time()
+        if self._instrumented:
+            return self._observe(data, self._analyze_data, data)
+        return self._analyze_data(data)
+
+    def _analyze_data(self, data: str) -> DataAnalysis:
+        """Análisis completo de analyze_data, sin el hook STAGE_ANALYZE ni el registro de valores lentos"""
+        start_time = time.perf_counter()
+
+        # Reutilizar el resultado almacenado si el valor ya fue analizado
+        if self.cache is not None:
+            cached_analysis = self.cache.get(data)
+            if self.metrics is not None:
+                self._cache_requests.inc(1, ("miss",) if cached_analysis is None else ("hit",))
+            if cached_analysis is not None:
+                elapsed = time.perf_counter() - start_time
+                if self.metrics is not None:
+                    self._values_analyzed.inc()
+                    self._analyze_seconds.observe(elapsed)
+                cached_analysis.analysis_time_ms = elapsed * 1000
+                return cached_analysis
+
+        # Una sola pasada por el valor para descartar patrones imposibles
+        features = self._extract_features(data)
 
         # Realizar análisis de hash (incluyendo búsqueda dentro de textos mixtos)
-        hash_analysis = self._identify_hash_within_text(data)
-        sensitive_analysis = self.sensitive_detector.detect(data)
+        hash_analysis = self._identify_hash_within_text(data, features=features)
+        sensitive_analysis = self.sensitive_detector.detect(data, features=features)
+
+        analysis = self.build_analysis(data, hash_analysis, sensitive_analysis, start_time)
+
+        if self.cache is not None:
+            self.cache.put(data, analysis)
+
+        return analysis
+
+    def build_analysis(
+        self, data: str, hash_analysis: HashAnalysis, sensitive_analysis: SensitiveAnalysis, start_time: float
+    ) -> DataAnalysis:
+        """
+        Combina los análisis de hash y de datos sensibles en el resultado final.
+
+        Args:
+            data: Datos analizados
+            hash_analysis: Resultado del análisis de hash
+            sensitive_analysis: Resultado del análisis de datos sensibles
+            start_time: Instante de inicio del análisis (time.perf_counter())
+
+        Returns:
+            DataAnalysis con sensibilidad, protección, recomendaciones y confianza
+        """
+        hooks = self._stage_hooks
+        token = hooks.on_stage_start(STAGE_STATUS) if hooks is not None else None
+        stage_start = time.perf_counter_ns() if hooks is not None else 0
 
         # Determinar nivel de sensibilidad combinando ambos análisis
         sensitivity_level = self._determine_sensitivity_level(hash_analysis, sensitive_analysis)
@@ -102,7 +239,15 @@ class CrypticAnalyzer:
         # Calcular confianza general
         confidence = self._calculate_overall_confidence(hash_analysis, sensitive_analysis)
 
-        analysis_time = (time.time() - start_time) * 1000  # Convertir a ms
+        if hooks is not None:
+            hooks.on_stage_end(STAGE_STATUS, token, time.perf_counter_ns() - stage_start)
+
+        elapsed = time.perf_counter() - start_time
+        if self.metrics is not None:
+            self._values_analyzed.inc()
+            self._bytes_scanned.inc(len(data) if data.isascii() else len(data.encode("utf-8")))
+            self._analyze_seconds.observe(elapsed)
+        analysis_time = elapsed * 1000  # Convertir a ms
 
         return DataAnalysis(
             original_data=data,
@@ -115,7 +260,87 @@ class CrypticAnalyzer:
             analysis_time_ms=analysis_time,
         )
 
-    def _identify_hash_within_text(self, data: str) -> HashAnalysis:
+    def analyze_restricted(
+        self,
+        data: str,
+        sensitive_patterns: List["SensitivePattern"],
+        hash_patterns: Optional[List["HashPattern"]] = None,
+    ) -> DataAnalysis:
+        """
+        Analiza datos evaluando solo un subconjunto de patrones.
+
+        Pensado para columnas cuyo tipo se conoce de antemano (por ejemplo por
+        el nombre de la columna). No usa la caché persistente, ya que el
+        resultado depende de los patrones elegidos.
+
+        Args:
+            data: Datos a analizar
+            sensitive_patterns: Patrones de datos sensibles a evaluar (lista vacía = ninguno)
+            hash_patterns: Patrones de hash a evaluar (por defecto, todos)
+
+        Returns:
+            DataAnalysis con el resultado del análisis restringido
+        """
+        if self._instrumented:
+            return self._observe(data, self._analyze_restricted, data, sensitive_patterns, hash_patterns)
+        return self._analyze_restricted(data, sensitive_patterns, hash_patterns)
+
+    def _analyze_restricted(
+        self,
+        data: str,
+        sensitive_patterns: List["SensitivePattern"],
+        hash_patterns: Optional[List["HashPattern"]] = None,
+    ) -> DataAnalysis:
+        """Análisis de analyze_restricted, sin el hook STAGE_ANALYZE ni el registro de valores lentos"""
+        start_time = time.perf_counter()
+        features = self._extract_features(data)
+        hash_analysis = self._identify_hash_within_text(data, hash_patterns, features)
+        sensitive_analysis = self.sensitive_detector.detect(data, sensitive_patterns, features)
+        return self.build_analysis(data, hash_analysis, sensitive_analysis, start_time)
+
+    def _observe(self, data: str, analyze: Callable[..., DataAnalysis], *args: Any) -> DataAnalysis:
+        """
+        Ejecuta un análisis dentro del hook STAGE_ANALYZE y/o capturando sus etapas,
+        y lo registra en el slowlog si superó el umbral.
+
+        Args:
+            data: Valor analizado
+            analyze: Método de análisis a ejecutar
+            *args: Argumentos de analyze
+
+        Returns:
+            Resultado de analyze
+        """
+        hooks, slowlog, timings = self.hooks, self.slowlog, self.timings
+        token = hooks.on_stage_start(STAGE_ANALYZE, {"length": len(data)}) if hooks is not None else None
+        stage_start = time.perf_counter_ns()
+        # Con slowlog siempre hay desglose (ver __init__)
+        stages = timings.start_capture() if slowlog is not None and timings is not None else None
+        try:
+            analysis = analyze(*args)
+        finally:
+            if stages is not None and timings is not None:
+                timings.stop_capture()
+            if hooks is not None:
+                hooks.on_stage_end(STAGE_ANALYZE, token, time.perf_counter_ns() - stage_start)
+        if stages is not None and slowlog is not None:
+            slowlog.observe(data, analysis.analysis_time_ms, stages)
+        return analysis
+
+    def _extract_features(self, data: str) -> ValueFeatures:
+        """Calcula las características del valor, dentro de la etapa STAGE_FEATURES si hay hooks"""
+        hooks = self._stage_hooks
+        if hooks is None:
+            return extract_features(data)
+        token = hooks.on_stage_start(STAGE_FEATURES)
+        stage_start = time.perf_counter_ns()
+        features = extract_features(data)
+        hooks.on_stage_end(STAGE_FEATURES, token, time.perf_counter_ns() - stage_start)
+        return features
+
+    def _identify_hash_within_text(
+        self, data: str, patterns: Optional[List["HashPattern"]] = None, features: Optional[ValueFeatures] = None
+    ) -> HashAnalysis:
         """
         Intenta identificar hashes tanto si el dato completo es un hash
         como si el hash aparece embebido dentro de un texto más largo.
@@ -126,11 +351,46 @@ class CrypticAnalyzer:
            y elegir el de mayor confianza.
         """
         # 1) Intento directo sobre el dato completo
-        best_analysis = self.hash_identifier.identify(data)
+        hooks = self._stage_hooks
+        token = hooks.on_stage_start(STAGE_HASH_WHOLE) if hooks is not None else None
+        stage_start = time.perf_counter_ns() if hooks is not None else 0
+        best_analysis = self.hash_identifier.identify(data, patterns, features)
+        if hooks is not None:
+            hooks.on_stage_end(STAGE_HASH_WHOLE, token, time.perf_counter_ns() - stage_start)
         if best_analysis.possible_types:
             return best_analysis
 
+        # Sin 16 caracteres de [A-Za-z0-9./=] no puede haber tokens candidatos
+        if (
+            self.hash_identifier.prefilter
+            and features is not None
+            and features.digits + features.alpha + features.dot + features.slash + features.equals < 16
+        ):
+            return best_analysis
+
         # 2) Escaneo de posibles tokens dentro del texto
+        if hooks is None:
+            return self._scan_hash_tokens(data, best_analysis, patterns)
+        token = hooks.on_stage_start(STAGE_HASH_TOKENS)
+        stage_start = time.perf_counter_ns()
+        token_analysis = self._scan_hash_tokens(data, best_analysis, patterns)
+        hooks.on_stage_end(STAGE_HASH_TOKENS, token, time.perf_counter_ns() - stage_start)
+        return token_analysis
+
+    def _scan_hash_tokens(
+        self, data: str, best_analysis: HashAnalysis, patterns: Optional[List["HashPattern"]] = None
+    ) -> HashAnalysis:
+        """
+        Busca hashes embebidos en los tokens de un texto.
+
+        Args:
+            data: Texto completo
+            best_analysis: Análisis del texto completo, retornado si ningún token es un hash
+            patterns: Subconjunto de patrones de hash a evaluar (por defecto, todos)
+
+        Returns:
+            Análisis del token con mayor confianza, o best_analysis
+        """
         # Captura secuencias típicas de hashes (hex largas) y formatos con prefijos ($, *)
         candidate_tokens = re.findall(r"[\$\*]?[A-Za-z0-9./=]{16,}", data)
 
@@ -138,7 +398,7 @@ class CrypticAnalyzer:
         best_local_analysis: HashAnalysis | None = None
 
         for token in candidate_tokens:
-            local_analysis = self.hash_identifier.identify(token)
+            local_analysis = self.hash_identifier.identify(token, patterns)
             if local_analysis.possible_types:
                 top_conf = local_analysis.possible_types[0][1]
                 if top_conf > best_top_confidence:
@@ -147,17 +407,43 @@ class CrypticAnalyzer:
 
         return best_local_analysis if best_local_analysis is not None else best_analysis
 
-    def analyze_batch(self, data_list: List[str]) -> List[DataAnalysis]:
+    def analyze_batch(self, data_list: List[str], threads: int = 1) -> List[DataAnalysis]:
         """
         Analiza múltiples cadenas de datos.
 
         Args:
             data_list: Lista de datos a analizar
+            threads: Hilos que comparten este analizador (solo acelera en un
+                intérprete sin GIL, ver cryptic.core.parallel)
 
         Returns:
-            Lista de DataAnalysis para cada entrada
+            Lista de DataAnalysis para cada entrada, en el mismo orden
+        """
+        if threads == 1:
+            return [self.analyze_data(data) for data in data_list]
+
+        from cryptic.core.parallel import AnalysisThreadPool
+
+        with AnalysisThreadPool(threads) as pool:
+            return pool.map(self.analyze_data, data_list)
+
+    def analyze_batch_compact(self, data_list: Iterable[str]) -> List["CompactAnalysis"]:
         """
-        return [self.analyze_data(data) for data in data_list]
+        Analiza múltiples cadenas de datos y retorna resultados compactos.
+
+        Pensado para lotes grandes: cada resultado usa ``__slots__``, códigos
+        enteros en lugar de enums y tuplas compartidas entre resultados.
+
+        Args:
+            data_list: Datos a analizar
+
+        Returns:
+            Lista de CompactAnalysis para cada entrada
+        """
+        from cryptic.core.compact import CompactResultBuilder
+
+        builder = CompactResultBuilder()
+        return [builder.build(self.analyze_data(data)) for data in data_list]
 
     def generate_report(self, analysis_results: List[DataAnalysis]) -> Dict[str, Any]:
         """
@@ -341,17 +627,14 @@ class CrypticAnalyzer:
             recommendations.append("--- Recomendaciones específicas por tipo de dato ---")
             recommendations.extend(sensitive_analysis.recommendations)
 
-        # Recomendaciones de rendimiento si aplica
-        if sensitive_analysis.analysis_time_ms > 50:  # Umbral de 50ms
-            recommendations.append(f"⏱️  Tiempo de análisis: {sensitive_analysis.analysis_time_ms:.1f}ms")
-            if sensitive_analysis.analysis_time_ms > 100:
-                recommendations.append("Considere optimizar el texto o usar análisis en lotes para mejor rendimiento")
-
         # Si no hay recomendaciones específicas, dar una general
         if not recommendations:
             recommendations.append("No se detectaron patrones específicos conocidos")
             recommendations.append("Considere verificar manualmente si los datos requieren protección")
 
+        # Recomendaciones de rendimiento si aplica (siempre al final, ver timing_recommendations)
+        recommendations.extend(timing_recommendations(sensitive_analysis.analysis_time_ms))
+
         return recommendations
 
     def _calculate_overall_confidence(self, hash_analysis: HashAnalysis, sensitive_analysis: SensitiveAnalysis) -> float:
@@ -0,0 +1,458 @@
+"""
+Backends de ejecución paralela para el análisis por lotes y el escaneo.
+
+Cryptic reparte el trabajo con uno de tres backends:
+
+- ``thread``: hilos que comparten un único analizador (ver
+  ``cryptic.core.parallel``). Solo escalan en un intérprete sin GIL.
+- ``process``: procesos worker con su propio analizador. Escalan con GIL,
+  pero cada proceso es un intérprete completo aparte y los datos cruzan
+  entre procesos.
+- ``subinterpreter``: subintérpretes aislados dentro del mismo proceso, cada
+  uno con su propio GIL. Escalan como los procesos sin duplicar el proceso.
+
+Los backends aislados (procesos y subintérpretes) no comparten objetos con el
+intérprete principal. ``IsolatedAnalysisPool`` envía cada bloque de valores
+como bytes (JSON) y recibe los resultados en el formato compacto de
+``encode_analysis``, empaquetados con prefijos de largo. El intérprete
+principal los reconstruye con ``decode_analysis`` sobre vistas de memoria del
+bloque recibido, sin copiarlos.
+
+Los procesos worker se bifurcan desde un fork server precalentado
+(``prewarmed_context``): ese proceso importa ``cryptic.core.prewarm`` una sola
+vez, que importa los módulos de análisis, compila los patrones, construye el
+analizador de los workers y congela el heap con ``gc.freeze()``. Cada worker
+hereda ese estado por copy-on-write en lugar de reimportar y recompilar, y el
+fork server sigue activo entre pools, por lo que los lotes cortos sucesivos
+solo pagan el ``fork``. La precarga se agrega a la que ya tenga configurada
+la aplicación, y no se modifica si el fork server ya está en ejecución.
+
+Los subintérpretes requieren Python 3.13 o posterior. Desde 3.14 se usa
+``concurrent.futures.InterpreterPoolExecutor``; en 3.13, que solo los expone
+mediante módulos privados, ``SubinterpreterPoolExecutor`` ofrece el mismo
+contrato con un hilo por subintérprete. Python 3.12 ya tiene un GIL por
+intérprete, pero sus subintérpretes aislados pueden abortar el proceso al
+finalizar si importaron ``hashlib`` (que usan la caché y el escaneo), por lo
+que no se admiten.
+
+Ejemplo:
+    >>> with IsolatedAnalysisPool(BACKEND_SUBINTERPRETER, workers=4) as pool:
+    ...     results = pool.analyze(["juan@empresa.cl", "12.345.678-5"])
+    >>> [r.sensitive_analysis.matches[0].data_type.value for r in results]
+    ['Email', 'RUT Chileno']
+"""
+
+import concurrent.futures
+import gc
+import importlib
+import json
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from cryptic.core.parallel import DEFAULT_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer, DataAnalysis
+
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+BACKEND_SUBINTERPRETER = "subinterpreter"
+BACKENDS = (BACKEND_THREAD, BACKEND_PROCESS, BACKEND_SUBINTERPRETER)
+
+# Bytes del prefijo de largo de cada resultado empaquetado
+_LENGTH_BYTES = 4
+
+# Al destruir el intérprete que envió un objeto aún no recibido, descartarlo
+_UNBOUND_REMOVE = 1
+
+# Prepara un subintérprete recién creado: rutas de importación y canal de retorno
+_SETUP_SCRIPT = """\
+import importlib as _importlib
+import json as _json
+import sys as _sys
+
+import _interpchannels as _channels
+
+_sys.path[:] = _json.loads(_path)
+
+
+def _call(module, name, *args):
+    func = _importlib.import_module(module)
+    for part in name.split("."):
+        func = getattr(func, part)
+    return func(*args)
+"""
+
+# Módulo que el fork server importa para precalentar el estado de los workers
+PREWARM_MODULE = "cryptic.core.prewarm"
+
+# Módulos importados en el fork server además del analizador
+WARM_MODULES = (
+    "cryptic.core.cache",
+    "cryptic.core.scanner",
+    "cryptic.core.serialization",
+    "cryptic.utils.files",
+)
+
+# Analizador reutilizado por cada worker aislado
+_WORKER_ANALYZER: Optional["CrypticAnalyzer"] = None
+
+
+def _interpreter_modules() -> Optional[Tuple[Any, Any]]:
+    """Módulos privados de subintérpretes de Python 3.13, o None si no están"""
+    if sys.version_info < (3, 13):
+        return None
+    try:
+        import _interpchannels
+        import _interpreters
+    except ImportError:
+        return None
+    return _interpreters, _interpchannels
+
+
+def prewarm() -> None:
+    """
+    Precalienta el proceso actual para bifurcar workers desde él.
+
+    Importa los módulos de análisis, compila los patrones y llena las cachés
+    de regex con un analizador que queda como analizador de los workers, y
+    luego congela los objetos existentes con ``gc.freeze()``: el recolector
+    deja de recorrerlos, de modo que sus páginas no se copian en cada worker.
+    Solo debe invocarse en un proceso dedicado, como el fork server.
+    """
+    global _WORKER_ANALYZER
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.core.serialization import encode_analysis
+    from cryptic.server.protocol import WARMUP_VALUES, warm_up
+
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+
+    analyzer = CrypticAnalyzer()
+    warm_up(analyzer)
+    # Índice de patrones y codificador de los resultados compactos
+    encode_analysis(analyzer.analyze_data(WARMUP_VALUES[-1]))
+    _WORKER_ANALYZER = analyzer
+    gc.freeze()
+
+
+def prewarmed_context() -> BaseContext:
+    """
+    Contexto de multiprocessing cuyos workers se bifurcan desde un proceso precalentado.
+
+    Usa el fork server con ``PREWARM_MODULE`` como precarga. El fork server es
+    único por proceso y compartido con el resto de la aplicación: el módulo se
+    agrega a la lista de precarga existente en lugar de reemplazarla, y si el
+    fork server ya está en ejecución la lista no se modifica (no tendría
+    efecto) y los workers construyen su analizador al iniciar. Lo mismo ocurre
+    en plataformas sin fork server (Windows), donde se retorna el contexto por
+    defecto.
+
+    Returns:
+        Contexto para ProcessPoolExecutor(mp_context=...)
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context()
+    _add_forkserver_preload(PREWARM_MODULE)
+    return multiprocessing.get_context("forkserver")
+
+
+def _add_forkserver_preload(module: str) -> None:
+    from multiprocessing import forkserver
+
+    # multiprocessing no expone la precarga actual ni si el fork server corre:
+    # se consultan en su instancia única, con valores por defecto si cambian
+    server = forkserver._forkserver
+    if getattr(server, "_forkserver_pid", None) is not None:
+        return
+    preload = list(getattr(server, "_preload_modules", ["__main__"]))
+    if module not in preload:
+        server.set_forkserver_preload([*preload, module])
+
+
+def subinterpreters_available() -> bool:
+    """Indica si el intérprete admite el backend de subintérpretes"""
+    return hasattr(concurrent.futures, "InterpreterPoolExecutor") or _interpreter_modules() is not None
+
+
+class SubinterpreterPoolExecutor(Executor):
+    """
+    Executor sobre subintérpretes aislados para Python 3.13.
+
+    Cada hilo del pool es dueño de un subintérprete con su propio GIL, creado
+    en su primera tarea y destruido al cerrar el executor. Como en
+    ``InterpreterPoolExecutor``, las funciones deben estar definidas a nivel de
+    módulo (cada subintérprete las importa por nombre) y sus argumentos y
+    resultados deben poder compartirse entre intérpretes: bytes, str, int o None.
+    """
+
+    def __init__(
+        self, max_workers: int, initializer: Optional[Callable[..., None]] = None, initargs: Tuple[Any, ...] = ()
+    ) -> None:
+        """
+        Inicializa el executor; los subintérpretes se crean bajo demanda.
+
+        Args:
+            max_workers: Cantidad de subintérpretes
+            initializer: Función ejecutada una vez en cada subintérprete
+            initargs: Argumentos de initializer
+
+        Raises:
+            RuntimeError: Si el intérprete no admite subintérpretes aislados
+        """
+        modules = _interpreter_modules()
+        if modules is None:
+            raise RuntimeError("Este intérprete no admite subintérpretes aislados (requiere Python 3.13 o posterior)")
+        self._interpreters, self._channels = modules
+        self._initializer = initializer
+        self._initargs = initargs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cryptic-subinterpreter")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._workers: List[Tuple[Any, Any]] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """
+        Programa fn(*args) en alguno de los subintérpretes.
+
+        Returns:
+            Future con el resultado de fn
+
+        Raises:
+            TypeError: Si se entregan argumentos con nombre
+        """
+        if kwargs:
+            raise TypeError("SubinterpreterPoolExecutor no admite argumentos con nombre")
+        return self._executor.submit(self._run, fn, args)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Espera las tareas pendientes y destruye los subintérpretes"""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for interpreter_id, channel_id in workers:
+            self._channels.destroy(channel_id)
+            self._interpreters.destroy(interpreter_id)
+
+    def _worker(self) -> Tuple[Any, Any]:
+        """Retorna el subintérprete y el canal del hilo actual, creándolos si es necesario"""
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = (self._interpreters.create("isolated"), self._channels.create(_UNBOUND_REMOVE))
+            with self._lock:
+                self._workers.append(worker)
+            self._local.worker = worker
+            self._exec(worker[0], _SETUP_SCRIPT, {"_path": json.dumps(sys.path)})
+            if self._initializer is not None:
+                self._exec(worker[0], *self._call_script(self._initializer, self._initargs))
+        return worker
+
+    def _run(self, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        interpreter_id, channel_id = self._worker()
+        script, shared = self._call_script(fn, args)
+        self._exec(interpreter_id, f"_channels.send(_channel, {script}, blocking=False)", {**shared, "_channel": channel_id})
+        result, _ = self._channels.recv(channel_id)
+        return result
+
+    def _exec(self, interpreter_id: Any, script: str, shared: Any) -> None:
+        failure = self._interpreters.run_string(interpreter_id, script, shared)
+        if failure is not None:
+            raise RuntimeError(f"Falló la tarea en el subintérprete:\n{failure.errdisplay}")
+
+    @staticmethod
+    def _call_script(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[str, Any]:
+        """Expresión que invoca fn en el subintérprete y los valores que comparte"""
+        names = [f"_arg{index}" for index in range(len(args))]
+        shared = dict(zip(names, args))
+        shared.update(_module=fn.__module__, _name=fn.__qualname__)
+        return f"_call(_module, _name, {', '.join(names)})", shared
+
+
+def create_executor(
+    backend: str, workers: int, initializer: Optional[Callable[..., None]] = None, initargs: Tuple[Any, ...] = ()
+) -> Executor:
+    """
+    Crea el executor de un backend.
+
+    Args:
+        backend: Uno de BACKENDS
+        workers: Cantidad de hilos, procesos o subintérpretes
+        initializer: Función ejecutada una vez por worker
+        initargs: Argumentos de initializer
+
+    Returns:
+        Executor del backend indicado; con procesos, sus workers se bifurcan
+        desde el fork server del proceso, al que se agrega la precarga de
+        Cryptic si aún no está en ejecución (ver prewarmed_context)
+
+    Raises:
+        ValueError: Si el backend no existe
+        RuntimeError: Si el intérprete no admite subintérpretes aislados
+    """
+    if backend == BACKEND_THREAD:
+        return ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="cryptic-analyze", initializer=initializer, initargs=initargs
+        )
+    if backend == BACKEND_PROCESS:
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=prewarmed_context(), initializer=initializer, initargs=initargs
+        )
+    if backend == BACKEND_SUBINTERPRETER:
+        pool_class = getattr(concurrent.futures, "InterpreterPoolExecutor", SubinterpreterPoolExecutor)
+        return pool_class(max_workers=workers, initializer=initializer, initargs=initargs)
+    raise ValueError(f"Backend desconocido: {backend} (opciones: {', '.join(BACKENDS)})")
+
+
+def encode_values(values: Sequence[str]) -> bytes:
+    """Codifica un bloque de valores para enviarlo a un worker aislado"""
+    return json.dumps(list(values), ensure_ascii=False).encode("utf-8")
+
+
+def decode_values(payload: bytes) -> List[str]:
+    """Reconstruye un bloque codificado con encode_values"""
+    values: List[str] = json.loads(payload)
+    return values
+
+
+def pack_payloads(payloads: Sequence[bytes]) -> bytes:
+    """Concatena resultados compactos anteponiendo el largo de cada uno"""
+    return b"".join(len(payload).to_bytes(_LENGTH_BYTES, "little") + payload for payload in payloads)
+
+
+def unpack_payloads(packed: bytes) -> List[memoryview]:
+    """
+    Separa los resultados de pack_payloads sin copiarlos.
+
+    Args:
+        packed: Bytes generados por pack_payloads
+
+    Returns:
+        Vistas de memoria sobre packed, una por resultado
+    """
+    view = memoryview(packed)
+    payloads = []
+    position = 0
+    while position < len(view):
+        size = int.from_bytes(view[position : position + _LENGTH_BYTES], "little")
+        position += _LENGTH_BYTES
+        payloads.append(view[position : position + size])
+        position += size
+    return payloads
+
+
+def _init_worker(cache_path: Optional[Union[str, Path]] = None) -> None:
+    """Construye el analizador una sola vez por worker aislado (o conserva el precalentado)"""
+    global _WORKER_ANALYZER
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+    if cache_path is None:
+        if _WORKER_ANALYZER is None:
+            _WORKER_ANALYZER = CrypticAnalyzer()
+        return
+
+    from cryptic.core.cache import AnalysisCache
+
+    # La conexión a la caché es propia de cada worker; los patrones ya compilados se comparten
+    _WORKER_ANALYZER = CrypticAnalyzer(cache=AnalysisCache(Path(cache_path)))
+
+
+def analyze_chunk(payload: bytes) -> bytes:
+    """
+    Analiza un bloque en un worker aislado.
+
+    Args:
+        payload: Valores codificados con encode_values
+
+    Returns:
+        Análisis compactos de cada valor, en orden, empaquetados con pack_payloads
+    """
+    from cryptic.core.serialization import encode_analysis
+
+    if _WORKER_ANALYZER is None:
+        _init_worker()
+    assert _WORKER_ANALYZER is not None
+    analyses = [_WORKER_ANALYZER.analyze_data(value) for value in decode_values(payload)]
+    if _WORKER_ANALYZER.cache is not None:
+        _WORKER_ANALYZER.cache.flush()
+    return pack_payloads([encode_analysis(analysis) for analysis in analyses])
+
+
+class IsolatedAnalysisPool:
+    """
+    Pool de workers aislados (procesos o subintérpretes) que analiza bloques de valores.
+
+    Cada worker construye su propio analizador; el pool se usa desde un único hilo.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        workers: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cache_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Inicializa el pool; los workers se crean en el primer análisis.
+
+        Args:
+            backend: BACKEND_PROCESS o BACKEND_SUBINTERPRETER
+            workers: Cantidad de workers
+            chunk_size: Valores por bloque enviado a un worker
+            cache_path: Caché persistente de análisis compartida por los workers
+
+        Raises:
+            ValueError: Si el backend no es aislado o workers o chunk_size son menores que 1
+        """
+        if backend not in (BACKEND_PROCESS, BACKEND_SUBINTERPRETER):
+            raise ValueError(f"Backend sin workers aislados: {backend}")
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("workers y chunk_size deben ser al menos 1")
+        self.backend = backend
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.cache_path = cache_path
+        self._executor: Optional[Executor] = None
+
+    def analyze(self, values: Sequence[str]) -> List["DataAnalysis"]:
+        """
+        Analiza los valores repartiendo bloques entre los workers.
+
+        Args:
+            values: Valores a analizar
+
+        Returns:
+            DataAnalysis de cada valor, en el mismo orden (con analysis_time_ms en 0)
+
+        Raises:
+            Exception: La primera falla de un worker, en el orden de los bloques
+        """
+        from cryptic.core.serialization import decode_analysis
+
+        if self._executor is None:
+            # Los subintérpretes solo comparten tipos simples: la ruta viaja como str
+            cache_path = None if self.cache_path is None else str(self.cache_path)
+            self._executor = create_executor(self.backend, self.workers, _init_worker, (cache_path,))
+
+        chunks = [values[start : start + self.chunk_size] for start in range(0, len(values), self.chunk_size)]
+        futures = [self._executor.submit(analyze_chunk, encode_values(chunk)) for chunk in chunks]
+        results: List[DataAnalysis] = []
+        for chunk, future in zip(chunks, futures):
+            results.extend(decode_analysis(payload, value) for payload, value in zip(unpack_payloads(future.result()), chunk))
+        return results
+
+    def close(self) -> None:
+        """Espera a los workers y los libera"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "IsolatedAnalysisPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,745 @@
+"""
+Harness de benchmarks de rendimiento para Cryptic.
+
+Este módulo mide throughput y latencias (p50/p95/p99) de los componentes
+principales (identificación de hashes, detección de datos sensibles,
+análisis completo y procesamiento por lotes de extremo a extremo), guarda
+los resultados en JSON y los compara contra una línea base para detectar
+regresiones.
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Corpus de referencia incluido con la biblioteca (valores representativos)
+SAMPLE_CORPUS = [
+    "juan.perez@empresa.cl",
+    "maria.gonzalez@company.com",
+    "12.345.678-5",
+    "7654321-6",
+    "+56912345678",
+    "22123456",
+    "192.168.1.100",
+    "4111 1111 1111 1111",
+    "https://api.service.com/v1/users?id=123",
+    "Juan Pérez González",
+    "5d41402abc4b2a76b9719d911017c592",
+    "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d",
+    "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+    "$2b$12$N9qo8uLOickgx2ZMRZoMye",
+    "*A4B6157319038724E3560894F7F932C8886EBFCF",
+    "Usuario 12.345.678-5 con email juan@empresa.cl y hash 5d41402abc4b2a76b9719d911017c592",
+    "plaintext_password",
+    "texto normal sin datos",
+]
+
+# Umbral por defecto de caída de throughput considerada regresión
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+# Objetivos de tiempo de importación (ms, acumulado según ``python -X importtime``)
+IMPORT_TIME_TARGETS_MS = {
+    "cryptic": 30.0,
+    "cryptic.cli.main": 100.0,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Resultado de un benchmark.
+
+    Attributes:
+        name: Nombre del benchmark
+        operations: Cantidad de operaciones medidas
+        total_s: Tiempo total medido en segundos
+        throughput: Operaciones por segundo
+        mean_ms: Latencia promedio por operación en milisegundos
+        p50_ms: Percentil 50 de latencia en milisegundos
+        p95_ms: Percentil 95 de latencia en milisegundos
+        p99_ms: Percentil 99 de latencia en milisegundos
+    """
+
+    name: str
+    operations: int
+    total_s: float
+    throughput: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Calcula un percentil por el método del rango más cercano.
+
+    Args:
+        sorted_values: Valores ordenados de menor a mayor
+        fraction: Percentil como fracción (ej: 0.95)
+
+    Returns:
+        Valor del percentil (0.0 si no hay valores)
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize_latencies(name: str, latencies_ns: List[int], operations: Optional[int] = None) -> BenchmarkResult:
+    """
+    Construye un BenchmarkResult a partir de latencias individuales.
+
+    Args:
+        name: Nombre del benchmark
+        latencies_ns: Latencias medidas en nanosegundos (una por muestra)
+        operations: Operaciones totales si cada muestra agrupa varias (por defecto, una por muestra)
+
+    Returns:
+        BenchmarkResult con throughput y percentiles
+    """
+    total_ns = sum(latencies_ns)
+    operations = operations if operations is not None else len(latencies_ns)
+    latencies_ms = sorted(latency / 1_000_000 for latency in latencies_ns)
+    total_s = total_ns / 1_000_000_000
+
+    return BenchmarkResult(
+        name=name,
+        operations=operations,
+        total_s=total_s,
+        throughput=operations / total_s if total_s > 0 else 0.0,
+        mean_ms=(total_ns / 1_000_000) / len(latencies_ns) if latencies_ns else 0.0,
+        p50_ms=percentile(latencies_ms, 0.50),
+        p95_ms=percentile(latencies_ms, 0.95),
+        p99_ms=percentile(latencies_ms, 0.99),
+    )
+
+
+def measure(name: str, func: Callable[[str], Any], values: Sequence[str], iterations: int = 1) -> BenchmarkResult:
+    """
+    Mide la latencia de una función aplicada a cada valor del corpus.
+
+    Args:
+        name: Nombre del benchmark
+        func: Función a medir (recibe un valor)
+        values: Corpus de valores
+        iterations: Cantidad de pasadas completas sobre el corpus
+
+    Returns:
+        BenchmarkResult con las métricas de la función
+    """
+    # Calentamiento: cachés de regex y patrones
+    for value in values[: min(len(values), 100)]:
+        func(value)
+
+    latencies: List[int] = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        for value in values:
+            start = clock()
+            func(value)
+            latencies.append(clock() - start)
+
+    return summarize_latencies(name, latencies)
+
+
+def load_corpus(path: Optional[Path] = None) -> List[str]:
+    """
+    Carga un corpus de valores a partir de un archivo.
+
+    Args:
+        path: Archivo CSV, JSON o de texto (por defecto, el corpus incluido)
+
+    Returns:
+        Lista de valores a analizar
+    """
+    if path is None:
+        return list(SAMPLE_CORPUS)
+
+    from cryptic.utils.files import iter_file_values
+
+    return [value for _, value in iter_file_values(path)]
+
+
+def expand_corpus(values: Sequence[str], size: int) -> List[str]:
+    """
+    Repite un corpus hasta alcanzar el tamaño indicado.
+
+    Args:
+        values: Corpus base
+        size: Cantidad de valores deseada
+
+    Returns:
+        Lista de exactamente ``size`` valores
+    """
+    if not values:
+        return []
+    repeats = size // len(values) + 1
+    return (list(values) * repeats)[:size]
+
+
+def _benchmark_batch(values: Sequence[str], repeats: int) -> BenchmarkResult:
+    """Mide el comando batch de extremo a extremo sobre un CSV temporal"""
+    import csv
+
+    from click.testing import CliRunner
+
+    from cryptic.cli.main import cli
+
+    runner = CliRunner()
+    latencies: List[int] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "corpus.csv"
+        output_path = Path(tmp) / "report.json"
+
+        with open(input_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["value"])
+            writer.writerows([value] for value in values)
+
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            result = runner.invoke(cli, ["batch", str(input_path), "--output", str(output_path)])
+            latencies.append(time.perf_counter_ns() - start)
+            if result.exit_code != 0:
+                raise RuntimeError(f"El benchmark de batch falló: {result.output}")
+
+    # Throughput expresado en celdas por segundo; latencias por ejecución completa
+    summary = summarize_latencies("batch_end_to_end", latencies, operations=len(values) * repeats)
+    return summary
+
+
+def run_benchmarks(
+    values: Sequence[str],
+    iterations: int = 3,
+    include_batch: bool = True,
+    batch_repeats: int = 3,
+) -> Dict[str, BenchmarkResult]:
+    """
+    Ejecuta la suite completa de benchmarks.
+
+    Args:
+        values: Corpus de valores
+        iterations: Pasadas sobre el corpus para los benchmarks por valor
+        include_batch: Si medir el comando batch de extremo a extremo
+        batch_repeats: Ejecuciones del comando batch
+
+    Returns:
+        Diccionario nombre -> BenchmarkResult
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+    analyzer = CrypticAnalyzer()
+    results = {
+        "hash_identify": measure("hash_identify", analyzer.hash_identifier.identify, values, iterations),
+        "sensitive_detect": measure("sensitive_detect", analyzer.sensitive_detector.detect, values, iterations),
+        "analyze_data": measure("analyze_data", analyzer.analyze_data, values, iterations),
+    }
+
+    if include_batch:
+        results["batch_end_to_end"] = _benchmark_batch(values, batch_repeats)
+
+    return results
+
+
+def build_report(results: Dict[str, BenchmarkResult], corpus_size: int) -> Dict[str, Any]:
+    """
+    Construye el reporte JSON de una ejecución de benchmarks.
+
+    Args:
+        results: Resultados por benchmark
+        corpus_size: Tamaño del corpus utilizado
+
+    Returns:
+        Diccionario serializable con metadatos y resultados
+    """
+    from cryptic import __version__
+
+    return {
+        "metadata": {
+            "cryptic_version": __version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "corpus_size": corpus_size,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+
+
+def save_report(report: Dict[str, Any], path: Path) -> None:
+    """Guarda un reporte de benchmarks en formato JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def compare_with_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_REGRESSION_THRESHOLD
+) -> List[str]:
+    """
+    Compara un reporte contra una línea base.
+
+    Args:
+        report: Reporte de la ejecución actual
+        baseline: Reporte guardado como línea base
+        threshold: Caída relativa de throughput tolerada (ej: 0.10 = 10%)
+
+    Returns:
+        Lista de mensajes describiendo cada regresión (vacía si no hay)
+    """
+    regressions = []
+    for name, baseline_result in baseline.get("results", {}).items():
+        current = report["results"].get(name)
+        if current is None:
+            continue
+
+        baseline_throughput = baseline_result["throughput"]
+        if baseline_throughput <= 0:
+            continue
+
+        change = current["throughput"] / baseline_throughput - 1
+        if change < -threshold:
+            regressions.append(
+                f"{name}: {current['throughput']:.0f} ops/s vs {baseline_throughput:.0f} ops/s "
+                f"en la línea base ({change:+.1%})"
+            )
+
+    return regressions
+
+
+def measure_import_time(module: str, runs: int = 5) -> float:
+    """
+    Mide el tiempo de importación de un módulo en un intérprete nuevo.
+
+    Args:
+        module: Nombre del módulo a importar
+        runs: Cantidad de intérpretes lanzados (se reporta la mediana)
+
+    Returns:
+        Mediana del tiempo acumulado de importación en milisegundos
+    """
+    # Asegurar que el subproceso importe esta misma copia de Cryptic
+    package_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    timings = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        # Formato: "import time: <propio µs> | <acumulado µs> | <módulo>"
+        for line in completed.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                timings.append(int(parts[1]) / 1000)
+                break
+
+    return statistics.median(timings) if timings else 0.0
+
+
+def run_import_benchmarks(runs: int = 5) -> Dict[str, Dict[str, Any]]:
+    """
+    Mide el tiempo de importación de los módulos con objetivo definido.
+
+    Args:
+        runs: Intérpretes lanzados por módulo
+
+    Returns:
+        Diccionario módulo -> {"import_ms", "target_ms", "within_target"}
+    """
+    results = {}
+    for module, target_ms in IMPORT_TIME_TARGETS_MS.items():
+        import_ms = measure_import_time(module, runs)
+        results[module] = {"import_ms": import_ms, "target_ms": target_ms, "within_target": import_ms <= target_ms}
+    return results
+
+
+def _retained_bytes(build: Callable[[], Any]) -> int:
+    """Bytes asignados que siguen vivos tras construir un objeto"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def measure_memory_per_cell(values: Sequence[str]) -> Dict[str, float]:
+    """
+    Mide la memoria retenida por celda al conservar los resultados de un lote.
+
+    Compara los resultados completos (DataAnalysis) con los compactos
+    (CompactAnalysis). Los valores de entrada no se contabilizan, ya que
+    ambos tipos de resultado solo los referencian.
+
+    Args:
+        values: Corpus de valores
+
+    Returns:
+        Diccionario con bytes por celda de cada variante y el factor de reducción
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+    analyzer = CrypticAnalyzer()
+    analyzer.analyze_batch(list(values[:100]))  # Calentamiento: patrones y cachés
+
+    cells = max(len(values), 1)
+    full = _retained_bytes(lambda: analyzer.analyze_batch(list(values))) / cells
+    compact = _retained_bytes(lambda: analyzer.analyze_batch_compact(values)) / cells
+
+    return {
+        "full_bytes_per_cell": full,
+        "compact_bytes_per_cell": compact,
+        "reduction": full / compact if compact else 0.0,
+    }
+
+
+# Regex que analyze_charset ejecuta sobre cada valor sin prefiltro (más la de
+# base64 cuando la longitud es múltiplo de 4)
+CHARSET_REGEX_RUNS = 5
+
+
+def count_prefilter_savings(values: Sequence[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Cuenta las regex ejecutadas y evitadas por valor gracias al prefiltro de características.
+
+    Se consideran las regex de los patrones de hash sobre el valor completo
+    (sin prefiltro ya se omitían las de longitud fija distinta), las de
+    ``analyze_charset``, la búsqueda de tokens de hash dentro del texto y las
+    de los patrones de datos sensibles.
+
+    Args:
+        values: Corpus de valores
+
+    Returns:
+        Diccionario componente -> {"executed", "avoided"} con promedios por
+        valor, más el total en la clave "total"
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.utils.features import extract_features
+    from cryptic.utils.formatters import clean_hash
+
+    analyzer = CrypticAnalyzer()
+    hash_identifier = analyzer.hash_identifier
+    detector = analyzer.sensitive_detector
+    executed = {"hash": 0, "charset": 0, "tokens": 0, "sensitive": 0}
+    avoided = dict.fromkeys(executed, 0)
+
+    for value in values:
+        features = extract_features(value)
+        cleaned = clean_hash(value)
+        cleaned_features = extract_features(cleaned) if features.whitespace else features
+
+        length_matches = sum(1 for p in hash_identifier.patterns if not p.length or p.length == len(cleaned))
+        hash_runs = len(hash_identifier.candidate_patterns(cleaned, cleaned_features))
+        executed["hash"] += hash_runs
+        avoided["hash"] += length_matches - hash_runs
+
+        charset_runs = CHARSET_REGEX_RUNS + (len(cleaned) % 4 == 0)
+        if cleaned_features.ascii and not cleaned_features.whitespace:
+            base64_chars = cleaned_features.length - cleaned_features.digits - cleaned_features.alpha
+            base64_chars -= cleaned_features.plus + cleaned_features.slash + cleaned_features.equals
+            prefiltered_runs = int(len(cleaned) % 4 == 0 and base64_chars == 0 and cleaned_features.equals <= 2)
+            avoided["charset"] += charset_runs - prefiltered_runs
+            charset_runs = prefiltered_runs
+        executed["charset"] += charset_runs
+
+        if not hash_identifier.identify(value, features=features).possible_types:
+            if features.digits + features.alpha + features.dot + features.slash + features.equals < 16:
+                avoided["tokens"] += 1
+            else:
+                executed["tokens"] += 1
+
+        sensitive_runs = len(detector.candidate_patterns(value, features=features))
+        executed["sensitive"] += sensitive_runs
+        avoided["sensitive"] += len(detector.patterns) - sensitive_runs
+
+    count = max(len(values), 1)
+    savings = {name: {"executed": executed[name] / count, "avoided": avoided[name] / count} for name in executed}
+    savings["total"] = {
+        "executed": sum(executed.values()) / count,
+        "avoided": sum(avoided.values()) / count,
+    }
+    return savings
+
+
+def measure_prefilter(values: Sequence[str], iterations: int = 1) -> Dict[str, Any]:
+    """
+    Mide el efecto del prefiltro de características sobre el análisis completo.
+
+    Args:
+        values: Corpus de valores
+        iterations: Pasadas sobre el corpus para medir el throughput
+
+    Returns:
+        Diccionario con las regex ejecutadas y evitadas por valor (ver
+        count_prefilter_savings), el throughput de ``analyze_data`` con y sin
+        prefiltro y la aceleración obtenida
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+    with_prefilter = measure("analyze_prefilter", CrypticAnalyzer().analyze_data, values, iterations)
+    without_prefilter = measure("analyze_sin_prefiltro", CrypticAnalyzer(prefilter=False).analyze_data, values, iterations)
+
+    return {
+        "regex_per_value": count_prefilter_savings(values),
+        "with_prefilter": asdict(with_prefilter),
+        "without_prefilter": asdict(without_prefilter),
+        "speedup": with_prefilter.throughput / without_prefilter.throughput if without_prefilter.throughput else 0.0,
+    }
+
+
+def measure_hooks_overhead(values: Sequence[str], iterations: int = 1, rounds: int = 3) -> Dict[str, Any]:
+    """
+    Mide el costo de los hooks de instrumentación sobre el análisis completo.
+
+    Compara ``analyze_data`` sin hooks, con hooks que no hacen nada
+    (``AnalysisHooks()``, el costo de las llamadas en sí) y con el desglose de
+    tiempos (``StageTimings``). Las configuraciones se alternan ``rounds``
+    veces y se conserva la mejor pasada de cada una, para que la deriva de la
+    máquina no se atribuya a una sola.
+
+    Args:
+        values: Corpus de valores
+        iterations: Pasadas sobre el corpus en cada ronda
+        rounds: Rondas alternadas por configuración
+
+    Returns:
+        Diccionario con el resultado de cada configuración (without_hooks,
+        noop_hooks, stage_timings) y el sobrecosto relativo de las dos últimas
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.core.hooks import AnalysisHooks
+    from cryptic.core.timings import StageTimings
+
+    analyzers = {
+        "without_hooks": CrypticAnalyzer(),
+        "noop_hooks": CrypticAnalyzer(hooks=AnalysisHooks()),
+        "stage_timings": CrypticAnalyzer(timings=StageTimings()),
+    }
+    best: Dict[str, BenchmarkResult] = {}
+    for _ in range(rounds):
+        for name, analyzer in analyzers.items():
+            result = measure(f"analyze_{name}", analyzer.analyze_data, values, iterations)
+            if name not in best or result.throughput > best[name].throughput:
+                best[name] = result
+
+    baseline = best["without_hooks"].throughput
+    report: Dict[str, Any] = {name: asdict(result) for name, result in best.items()}
+    for name in ("noop_hooks", "stage_timings"):
+        report[f"{name}_overhead"] = baseline / best[name].throughput - 1 if best[name].throughput else 0.0
+    return report
+
+
+# Hilos medidos por measure_thread_scaling
+DEFAULT_THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def measure_thread_scaling(
+    values: Sequence[str], thread_counts: Sequence[int] = DEFAULT_THREAD_COUNTS, iterations: int = 1
+) -> Dict[str, Any]:
+    """
+    Mide cómo escala ``analyze_batch(threads=N)`` con un analizador compartido.
+
+    Solo un intérprete sin GIL (``python3.13t``) puede escalar; con GIL el
+    resultado muestra el costo de repartir el lote entre hilos.
+
+    Args:
+        values: Corpus de valores
+        thread_counts: Cantidades de hilos a medir (la primera es la referencia)
+        iterations: Pasadas por cantidad de hilos; se conserva la más rápida
+
+    Returns:
+        Diccionario con gil_enabled, cpus y, por cantidad de hilos, throughput
+        y speedup respecto de la primera cantidad
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.core.parallel import gil_enabled
+
+    analyzer = CrypticAnalyzer()
+    data = list(values)
+    # Calentamiento: patrones y cachés de regex
+    analyzer.analyze_batch(data[:100])
+
+    scaling: Dict[str, Dict[str, float]] = {}
+    reference = 0.0
+    for threads in thread_counts:
+        best = math.inf
+        for _ in range(iterations):
+            start = time.perf_counter()
+            analyzer.analyze_batch(data, threads=threads)
+            best = min(best, time.perf_counter() - start)
+        throughput = len(data) / best if best > 0 else 0.0
+        reference = reference or throughput
+        scaling[str(threads)] = {"throughput": throughput, "speedup": throughput / reference if reference else 0.0}
+
+    return {"gil_enabled": gil_enabled(), "cpus": os.cpu_count() or 1, "threads": scaling}
+
+
+# Workers de cada backend en measure_backends
+DEFAULT_BACKEND_WORKERS = 4
+
+
+def measure_backends(values: Sequence[str], workers: int = DEFAULT_BACKEND_WORKERS, iterations: int = 1) -> Dict[str, Any]:
+    """
+    Compara los backends de ejecución paralela sobre el mismo corpus.
+
+    Mide el análisis secuencial como referencia y cada backend de
+    ``cryptic.core.backends`` con la misma cantidad de workers: hilos sobre un
+    analizador compartido, procesos y subintérpretes aislados (estos dos con
+    bloques en bytes y resultados compactos). El arranque (crear los workers y
+    analizar un primer bloque) se reporta aparte del throughput.
+
+    Args:
+        values: Corpus de valores
+        workers: Hilos, procesos o subintérpretes por backend
+        iterations: Pasadas por backend; se conserva la más rápida
+
+    Returns:
+        Diccionario con gil_enabled, cpus, workers y, por backend, available,
+        startup_ms, throughput y speedup respecto del análisis secuencial
+    """
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.core.backends import (
+        BACKEND_SUBINTERPRETER,
+        BACKEND_THREAD,
+        BACKENDS,
+        IsolatedAnalysisPool,
+        subinterpreters_available,
+    )
+    from cryptic.core.parallel import DEFAULT_CHUNK_SIZE, AnalysisThreadPool, gil_enabled
+
+    data = list(values)
+    # Un bloque por worker, para que el arranque incluya crear todos los workers
+    warmup = data[: DEFAULT_CHUNK_SIZE * workers]
+
+    def best_throughput(run: Callable[[], Any]) -> float:
+        best = math.inf
+        for _ in range(iterations):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        return len(data) / best if best > 0 else 0.0
+
+    analyzer = CrypticAnalyzer()
+    analyzer.analyze_batch(warmup)
+    reference = best_throughput(lambda: analyzer.analyze_batch(data))
+    report: Dict[str, Any] = {
+        "gil_enabled": gil_enabled(),
+        "cpus": os.cpu_count() or 1,
+        "workers": workers,
+        "backends": {"sequential": {"available": True, "startup_ms": 0.0, "throughput": reference, "speedup": 1.0}},
+    }
+
+    for backend in BACKENDS:
+        if backend == BACKEND_SUBINTERPRETER and not subinterpreters_available():
+            report["backends"][backend] = {"available": False}
+            continue
+
+        pool: Any = AnalysisThreadPool(workers) if backend == BACKEND_THREAD else IsolatedAnalysisPool(backend, workers)
+        with pool:
+            run = partial(pool.map, analyzer.analyze_data) if backend == BACKEND_THREAD else pool.analyze
+            start = time.perf_counter()
+            run(warmup)
+            startup_ms = (time.perf_counter() - start) * 1000
+            throughput = best_throughput(partial(run, data))
+
+        report["backends"][backend] = {
+            "available": True,
+            "startup_ms": startup_ms,
+            "throughput": throughput,
+            "speedup": throughput / reference if reference else 0.0,
+        }
+
+    return report
+
+
+# Lotes cortos sucesivos medidos por measure_pool_startup
+DEFAULT_POOL_JOBS = 5
+
+
+def measure_pool_startup(values: Sequence[str], workers: int = 2, jobs: int = DEFAULT_POOL_JOBS) -> Dict[str, Any]:
+    """
+    Mide lotes cortos sucesivos que crean cada uno su pool de procesos.
+
+    Cada lote crea un pool, analiza un bloque por worker y cierra el pool.
+    Compara workers iniciados con ``spawn`` (un intérprete nuevo que importa
+    Cryptic y compila los patrones) con workers bifurcados desde el fork
+    server precalentado de ``cryptic.core.backends``. También reporta los
+    bytes por resultado que vuelven al proceso principal: un ``DataAnalysis``
+    con pickle versus el formato compacto de ``encode_analysis``.
+
+    Args:
+        values: Corpus de valores
+        workers: Procesos por pool
+        jobs: Lotes por método de inicio (el primero incluye iniciar el fork server)
+
+    Returns:
+        Diccionario con workers, jobs, por método de inicio first_job_ms y
+        job_ms (mediana de los lotes siguientes), y result_bytes_per_value
+        con pickle y compact
+    """
+    import multiprocessing
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.core.backends import _init_worker, analyze_chunk, encode_values, prewarmed_context
+    from cryptic.core.parallel import DEFAULT_CHUNK_SIZE
+    from cryptic.core.serialization import encode_analysis
+
+    chunks = [encode_values(values[start : start + DEFAULT_CHUNK_SIZE]) for start in range(0, len(values), DEFAULT_CHUNK_SIZE)]
+    chunks = chunks[:workers]
+    contexts = {"spawn": multiprocessing.get_context("spawn")}
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        contexts["prewarmed_forkserver"] = prewarmed_context()
+
+    start_methods: Dict[str, Dict[str, float]] = {}
+    for name, context in contexts.items():
+        durations = []
+        for _ in range(jobs):
+            start = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+                for future in [executor.submit(analyze_chunk, chunk) for chunk in chunks]:
+                    future.result()
+            durations.append((time.perf_counter() - start) * 1000)
+        start_methods[name] = {
+            "first_job_ms": durations[0],
+            "job_ms": statistics.median(durations[1:]) if len(durations) > 1 else durations[0],
+        }
+
+    analyzer = CrypticAnalyzer()
+    analyses = [analyzer.analyze_data(value) for value in values[:DEFAULT_CHUNK_SIZE]]
+    count = len(analyses) or 1
+    return {
+        "workers": workers,
+        "jobs": jobs,
+        "start_methods": start_methods,
+        "result_bytes_per_value": {
+            "pickle": sum(len(pickle.dumps(analysis)) for analysis in analyses) / count,
+            "compact": sum(len(encode_analysis(analysis)) for analysis in analyses) / count,
+        },
+    }
@@ -0,0 +1,260 @@
+"""
+Caché persistente de análisis entre ejecuciones.
+
+Este módulo almacena en un archivo SQLite local la codificación compacta del
+resultado de cada valor analizado, indexada por un digest con clave del
+valor. Las recomendaciones de rendimiento, que dependen del tiempo medido en
+cada ejecución, no se almacenan. Las entradas se invalidan automáticamente
+cuando cambian la versión de la biblioteca, el conjunto de patrones o el
+código de sus funciones de validación, y el tamaño de la caché se acota
+eliminando las entradas más antiguas.
+
+Una misma caché puede usarse desde varios hilos (por ejemplo, la de un
+analizador compartido): un lock serializa el acceso a la conexión y a las
+escrituras pendientes, mientras que el digest, la codificación y la
+decodificación se calculan fuera de él.
+"""
+
+import dataclasses
+import hashlib
+import sqlite3
+import threading
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cryptic.core.analyzer import DataAnalysis, timing_recommendations
+from cryptic.core.serialization import SERIALIZATION_VERSION, decode_analysis, encode_analysis
+from cryptic.patterns.hash_patterns import get_hash_patterns
+from cryptic.patterns.sensitive_patterns import get_sensitive_patterns
+
+# Cantidad máxima de entradas por defecto
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# Escrituras acumuladas antes de persistirlas en disco
+_FLUSH_EVERY = 1000
+
+
+def _constant_fingerprint(value: Any) -> str:
+    """Representación estable de una constante de código (sin direcciones de memoria ni orden de conjuntos)"""
+    if isinstance(value, types.CodeType):
+        return _code_fingerprint(value)
+    if isinstance(value, tuple):
+        return "(" + ",".join(_constant_fingerprint(item) for item in value) + ")"
+    if isinstance(value, frozenset):
+        return "frozenset(" + ",".join(sorted(_constant_fingerprint(item) for item in value)) + ")"
+    return repr(value)
+
+
+def _code_fingerprint(code: types.CodeType) -> str:
+    """Huella del bytecode, las constantes y los nombres usados por un objeto de código"""
+    return repr((code.co_code.hex(), _constant_fingerprint(code.co_consts), code.co_names))
+
+
+def _validation_fingerprint(validation_func: Optional[Callable]) -> str:
+    """
+    Huella de una función de validación.
+
+    Cubre el nombre y el código de la propia función, pero no el de las
+    funciones auxiliares que llame: un cambio solo en ellas requiere subir
+    la versión de la biblioteca para invalidar la caché.
+    """
+    if validation_func is None:
+        return ""
+    code = getattr(validation_func, "__code__", None)
+    name = getattr(validation_func, "__qualname__", type(validation_func).__qualname__)
+    return name + (":" + _code_fingerprint(code) if code is not None else "")
+
+
+def cache_namespace() -> str:
+    """
+    Calcula el identificador de versión de la caché.
+
+    Combina la versión de la biblioteca, la versión del formato de
+    serialización y una huella de los patrones de hash y datos sensibles
+    (incluido el código de sus funciones de validación), de modo que
+    cualquier cambio en ellos invalide las entradas previas.
+
+    Returns:
+        Identificador de versión de la caché
+    """
+    from cryptic import __version__
+
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for pattern in get_sensitive_patterns():
+        validation = _validation_fingerprint(pattern.validation_func)
+        fingerprint.update(
+            repr(
+                (
+                    pattern.data_type.name,
+                    pattern.regex,
+                    pattern.sensitivity_level,
+                    pattern.confidence,
+                    validation,
+                    pattern.false_positive_patterns,
+                )
+            ).encode("utf-8")
+        )
+    for hash_pattern in get_hash_patterns():
+        fingerprint.update(
+            repr(
+                (
+                    hash_pattern.hash_type.name,
+                    hash_pattern.length,
+                    hash_pattern.regex,
+                    hash_pattern.prefix,
+                    hash_pattern.suffix,
+                    hash_pattern.confidence,
+                )
+            ).encode("utf-8")
+        )
+
+    return f"{__version__}:{SERIALIZATION_VERSION}:{fingerprint.hexdigest()}"
+
+
+class AnalysisCache:
+    """
+    Caché persistente de resultados de análisis.
+
+    Las claves son digests BLAKE2b con clave (derivada del namespace) del
+    valor analizado, por lo que el archivo no contiene los valores en claro.
+    Las escrituras se acumulan en memoria y se persisten en bloques.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES, namespace: Optional[str] = None) -> None:
+        """
+        Abre (o crea) la caché en la ruta indicada.
+
+        Args:
+            path: Archivo SQLite de la caché
+            max_entries: Cantidad máxima de entradas antes de eliminar las más antiguas
+            namespace: Identificador de versión (por defecto, cache_namespace())
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.namespace = namespace or cache_namespace()
+        self.hits = 0
+        self.misses = 0
+        self._digest_key = hashlib.blake2b(self.namespace.encode("utf-8"), digest_size=32).digest()
+        self._pending: Dict[bytes, bytes] = {}
+        # La conexión se comparte entre hilos; _lock serializa su uso
+        self._connection = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._initialize_schema()
+
+    def _initialize_schema(self) -> None:
+        """Crea las tablas y descarta las entradas de versiones anteriores"""
+        cursor = self._connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS entries (digest BLOB PRIMARY KEY, payload BLOB NOT NULL)")
+
+        row = cursor.execute("SELECT value FROM meta WHERE key = 'namespace'").fetchone()
+        if row is None or row[0] != self.namespace:
+            cursor.execute("DELETE FROM entries")
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('namespace', ?)", (self.namespace,))
+
+        self._connection.commit()
+
+    def _digest(self, data: str) -> bytes:
+        """Calcula el digest con clave de un valor"""
+        return hashlib.blake2b(data.encode("utf-8", "surrogatepass"), key=self._digest_key, digest_size=16).digest()
+
+    def get(self, data: str) -> Optional[DataAnalysis]:
+        """
+        Busca el análisis almacenado para un valor.
+
+        Args:
+            data: Valor a consultar
+
+        Returns:
+            DataAnalysis reconstruido si existe en la caché, None en caso contrario
+        """
+        digest = self._digest(data)
+        with self._lock:
+            payload = self._pending.get(digest)
+
+            if payload is None:
+                row = self._connection.execute("SELECT payload FROM entries WHERE digest = ?", (digest,)).fetchone()
+                payload = row[0] if row is not None else None
+
+            if payload is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+        return decode_analysis(payload, data)
+
+    def put(self, data: str, analysis: DataAnalysis) -> None:
+        """
+        Almacena el análisis de un valor.
+
+        Las recomendaciones de rendimiento (ver timing_recommendations) se
+        descartan: dependen del tiempo de esta ejecución y no del valor.
+
+        Args:
+            data: Valor analizado
+            analysis: Resultado del análisis
+        """
+        digest = self._digest(data)
+        if analysis.sensitive_analysis is not None:
+            timing = timing_recommendations(analysis.sensitive_analysis.analysis_time_ms)
+            if timing and analysis.recommendations[-len(timing) :] == timing:
+                analysis = dataclasses.replace(analysis, recommendations=analysis.recommendations[: -len(timing)])
+        payload = encode_analysis(analysis)
+        with self._lock:
+            self._pending[digest] = payload
+            if len(self._pending) >= _FLUSH_EVERY:
+                self.flush()
+
+    def flush(self) -> None:
+        """Persiste las escrituras pendientes y aplica el límite de tamaño"""
+        with self._lock:
+            if self._pending:
+                rows: List[Tuple[bytes, bytes]] = list(self._pending.items())
+                self._connection.executemany("INSERT OR REPLACE INTO entries (digest, payload) VALUES (?, ?)", rows)
+                self._pending.clear()
+                self._evict()
+                self._connection.commit()
+
+    def _evict(self) -> None:
+        """Elimina las entradas más antiguas si se supera el máximo"""
+        total = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = total - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY rowid LIMIT ?)", (excess,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.flush()
+            return int(self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso de la caché.
+
+        Returns:
+            Diccionario con aciertos, fallos y tasa de aciertos
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups > 0 else 0,
+        }
+
+    def close(self) -> None:
+        """Persiste las escrituras pendientes y cierra la conexión"""
+        with self._lock:
+            self.flush()
+            self._connection.close()
+
+    def __enter__(self) -> "AnalysisCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,315 @@
+"""
+Memo de tipo por columna con rutas rápidas especializadas.
+
+Cuando una columna acumula suficientes valores consecutivos con la misma
+clasificación (por ejemplo 1.000 RUTs validados que ocupan el valor
+completo), sus valores siguientes se analizan evaluando solo el patrón de
+ese tipo, o solo los patrones de hash que coincidieron, en lugar de los
+diez patrones de datos sensibles y todos los de hash.
+
+Un valor que no encaja en la ruta rápida (no coincide con el patrón, no
+valida o tiene una forma no vista al aprender la columna) se analiza con
+``analyze_data`` completo. Además, uno de cada ``audit_every`` valores de la
+ruta rápida se reanaliza por completo: si los resultados difieren, la
+columna vuelve a la fase de aprendizaje. Las estadísticas registran cuántas
+veces ocurre cada caso.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from cryptic.core.analyzer import DataAnalysis
+from cryptic.utils.features import extract_features
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.patterns.hash_patterns import HashPattern
+    from cryptic.patterns.sensitive_patterns import SensitivePattern
+
+# Valores consecutivos con la misma clasificación para activar la ruta rápida
+DEFAULT_MEMO_THRESHOLD = 1000
+
+# Uno de cada N valores de la ruta rápida se verifica con el análisis completo
+DEFAULT_AUDIT_EVERY = 100
+
+# Máximo de formas distintas aprendidas por columna
+MAX_SHAPES = 256
+
+# Los valores más largos nunca usan la ruta rápida de datos sensibles
+MAX_SHAPE_LENGTH = 128
+
+# Máximo de firmas distintas aprendidas por columna
+MAX_SIGNATURES = 16
+
+# Firma de un análisis: tipos de hash y, por coincidencia sensible, (tipo,
+# ocupa el valor completo, validada)
+Signature = Tuple[Tuple[str, ...], Tuple[Tuple[str, bool, bool], ...]]
+
+_SHAPE_TABLE = str.maketrans(
+    "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "9" * 10 + "a" * 26 + "A" * 26,
+)
+
+
+def value_shape(value: str) -> str:
+    """
+    Calcula la forma de un valor para decidir si encaja en la ruta rápida.
+
+    Los dígitos ASCII se reemplazan por "9", las letras ASCII por "a" o "A"
+    según su caja (las rachas de letras se acortan a dos) y los demás
+    caracteres se conservan. Los patrones de distintos tipos se distinguen
+    principalmente por cantidad de dígitos y separadores, que la forma preserva.
+
+    Args:
+        value: Valor a transformar
+
+    Returns:
+        Forma del valor (ej: "99.999.999-9" para "12.345.678-5")
+    """
+    translated = value.translate(_SHAPE_TABLE)
+    shape: List[str] = []
+    for char in translated:
+        if char in "aA" and len(shape) >= 2 and shape[-1] == char and shape[-2] == char:
+            continue
+        shape.append(char)
+    return "".join(shape)
+
+
+def analysis_signature(analysis: DataAnalysis) -> Optional[Signature]:
+    """
+    Calcula la firma estructural de un análisis.
+
+    Args:
+        analysis: Resultado de ``analyze_data``
+
+    Returns:
+        Tupla (tipos de hash, coincidencias sensibles) o None si el hash se
+        encontró dentro de un texto más largo, caso que la ruta rápida no reproduce
+    """
+    hash_analysis = analysis.hash_analysis
+    hash_types: Tuple[str, ...] = ()
+    if hash_analysis and hash_analysis.possible_types:
+        if hash_analysis.raw_hash != analysis.original_data:
+            return None
+        hash_types = tuple(hash_type.value for hash_type, _ in hash_analysis.possible_types)
+
+    length = len(analysis.original_data)
+    matches = tuple(
+        (match.data_type.value, match.start_pos == 0 and match.end_pos == length, match.is_validated)
+        for match in (analysis.sensitive_analysis.matches if analysis.sensitive_analysis else [])
+    )
+    return hash_types, matches
+
+
+def signature_label(signature: Signature) -> Optional[str]:
+    """
+    Retorna el tipo principal de una firma, que debe repetirse para memorizar la columna.
+
+    Args:
+        signature: Firma calculada por analysis_signature
+
+    Returns:
+        El primer tipo sensible validado que ocupa el valor completo o, si no
+        hay, los tipos de hash; None si el análisis no tiene un tipo principal
+    """
+    hash_types, matches = signature
+    for data_type, full_span, validated in matches:
+        if full_span and validated:
+            return data_type
+    if hash_types:
+        return ", ".join(hash_types)
+    return None
+
+
+def _same_result(fast: DataAnalysis, full: DataAnalysis) -> bool:
+    """Compara dos análisis ignorando los tiempos de procesamiento"""
+    if (fast.sensitivity_level, fast.protection_status, fast.confidence) != (
+        full.sensitivity_level,
+        full.protection_status,
+        full.confidence,
+    ):
+        return False
+
+    fast_types = fast.hash_analysis.possible_types if fast.hash_analysis else []
+    full_types = full.hash_analysis.possible_types if full.hash_analysis else []
+    if fast_types != full_types:
+        return False
+
+    fast_matches = fast.sensitive_analysis.matches if fast.sensitive_analysis else []
+    full_matches = full.sensitive_analysis.matches if full.sensitive_analysis else []
+    return [(m.data_type, m.start_pos, m.end_pos, m.is_validated) for m in fast_matches] == [
+        (m.data_type, m.start_pos, m.end_pos, m.is_validated) for m in full_matches
+    ]
+
+
+class _ColumnState:
+    """Estado de aprendizaje y de ruta rápida de una columna"""
+
+    __slots__ = (
+        "label",
+        "is_hash",
+        "streak",
+        "signatures",
+        "shapes",
+        "active",
+        "sensitive_patterns",
+        "hash_patterns",
+        "since_audit",
+    )
+
+    def __init__(self) -> None:
+        self.label: Optional[str] = None
+        self.is_hash = False
+        self.streak = 0
+        self.signatures: Set[Signature] = set()
+        self.shapes: Set[str] = set()
+        self.active = False
+        self.sensitive_patterns: List[SensitivePattern] = []
+        self.hash_patterns: List[HashPattern] = []
+        self.since_audit = 0
+
+
+class ColumnTypeMemo:
+    """
+    Analizador por columna que memoriza el tipo de cada columna.
+
+    Se usa en lugar de ``CrypticAnalyzer.analyze_data`` cuando los valores
+    llegan asociados a una columna (CSV): ``memo.analyze(columna, valor)``.
+    """
+
+    def __init__(
+        self,
+        analyzer: "CrypticAnalyzer",
+        threshold: int = DEFAULT_MEMO_THRESHOLD,
+        audit_every: int = DEFAULT_AUDIT_EVERY,
+    ) -> None:
+        """
+        Inicializa el memo.
+
+        Args:
+            analyzer: Analizador usado para el análisis completo
+            threshold: Valores consecutivos con el mismo tipo principal para activar la ruta rápida
+            audit_every: Cada cuántos valores de la ruta rápida verificar con el análisis completo
+                (0 desactiva la verificación)
+        """
+        self.analyzer = analyzer
+        self.threshold = threshold
+        self.audit_every = audit_every
+        self.columns: Dict[str, _ColumnState] = {}
+        self.stats = {"full": 0, "fast": 0, "fallbacks": 0, "audits": 0, "audit_failures": 0}
+
+    def analyze(self, column: str, data: str) -> DataAnalysis:
+        """
+        Analiza un valor de una columna.
+
+        Args:
+            column: Nombre de la columna
+            data: Valor a analizar
+
+        Returns:
+            DataAnalysis equivalente al de ``analyze_data``
+        """
+        state = self.columns.get(column)
+        if state is None:
+            state = self.columns[column] = _ColumnState()
+
+        if state.active:
+            fast = self._analyze_fast(state, data)
+            if fast is None:
+                self.stats["fallbacks"] += 1
+                return self._analyze_full(state, data)
+
+            state.since_audit += 1
+            if self.audit_every and state.since_audit >= self.audit_every:
+                state.since_audit = 0
+                self.stats["audits"] += 1
+                full = self.analyzer.analyze_data(data)
+                if not _same_result(fast, full):
+                    self.stats["audit_failures"] += 1
+                    self.columns[column] = _ColumnState()
+                return full
+
+            self.stats["fast"] += 1
+            return fast
+
+        return self._analyze_full(state, data)
+
+    def _analyze_full(self, state: _ColumnState, data: str) -> DataAnalysis:
+        """Analiza con todos los patrones y actualiza el aprendizaje de la columna"""
+        self.stats["full"] += 1
+        analysis = self.analyzer.analyze_data(data)
+
+        signature = analysis_signature(analysis)
+        label = signature_label(signature) if signature is not None else None
+        if signature is None or label is None or label != state.label:
+            # Un valor distinto en una columna activa no la desactiva; en
+            # aprendizaje reinicia la racha
+            if not state.active:
+                self._reset(state, signature, label)
+            return analysis
+
+        state.streak += 1
+        if signature not in state.signatures and len(state.signatures) < MAX_SIGNATURES:
+            state.signatures.add(signature)
+            if state.active:
+                self._select_patterns(state)
+        if not state.is_hash and len(data) <= MAX_SHAPE_LENGTH and len(state.shapes) < MAX_SHAPES:
+            state.shapes.add(value_shape(data))
+
+        if not state.active and state.streak >= self.threshold:
+            self._select_patterns(state)
+            state.active = True
+        return analysis
+
+    @staticmethod
+    def _reset(state: _ColumnState, signature: Optional[Signature], label: Optional[str]) -> None:
+        """Reinicia el aprendizaje de una columna a partir de un nuevo tipo principal"""
+        state.label = label
+        state.streak = 0
+        state.signatures.clear()
+        state.shapes.clear()
+        if signature is not None and label is not None:
+            state.is_hash = not any(full_span and validated for _, full_span, validated in signature[1])
+            state.streak = 1
+            state.signatures.add(signature)
+
+    def _select_patterns(self, state: _ColumnState) -> None:
+        """Selecciona los patrones de los tipos presentes en las firmas aprendidas"""
+        sensitive_types = {data_type for _, matches in state.signatures for data_type, _, _ in matches}
+        hash_types = {hash_type for hash_types, _ in state.signatures for hash_type in hash_types}
+        state.sensitive_patterns = [
+            p for p in self.analyzer.sensitive_detector.patterns if p.data_type.value in sensitive_types
+        ]
+        state.hash_patterns = [p for p in self.analyzer.hash_identifier.patterns if p.hash_type.value in hash_types]
+
+    def _analyze_fast(self, state: _ColumnState, data: str) -> Optional[DataAnalysis]:
+        """Intenta analizar con la ruta rápida; None si el valor no encaja"""
+        if not state.is_hash and (len(data) > MAX_SHAPE_LENGTH or value_shape(data) not in state.shapes):
+            return None
+
+        analyzer = self.analyzer
+        start_time = time.perf_counter()
+        features = extract_features(data)
+        hash_analysis = analyzer.hash_identifier.identify(data, state.hash_patterns, features)
+        sensitive = analyzer.sensitive_detector.detect(data, state.sensitive_patterns, features)
+        analysis = analyzer.build_analysis(data, hash_analysis, sensitive, start_time)
+
+        if analysis_signature(analysis) not in state.signatures:
+            return None
+        return analysis
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Retorna las estadísticas del memo.
+
+        Returns:
+            Diccionario con análisis completos, rápidos, respaldos (valores que no
+            encajaron en la ruta rápida), verificaciones, verificaciones fallidas,
+            tasa de respaldo y el tipo memorizado de cada columna activa
+        """
+        attempts = self.stats["fast"] + self.stats["fallbacks"] + self.stats["audits"]
+        return {
+            **self.stats,
+            "fallback_rate": self.stats["fallbacks"] / attempts if attempts else 0.0,
+            "active_columns": {name: state.label for name, state in self.columns.items() if state.active},
+        }
@@ -0,0 +1,201 @@
+"""
+Resultados compactos para análisis de grandes volúmenes.
+
+Este módulo define variantes con ``__slots__`` de los resultados de
+análisis pensadas para APIs por lotes: los enums se guardan como códigos
+enteros, el texto de cada coincidencia se obtiene del dato original por
+posición y las tuplas repetidas (recomendaciones, tipos de hash,
+coincidencias) se comparten entre resultados mediante interning. Los
+análisis de charset y formato de ``HashAnalysis`` no se conservan, ya que
+pueden recalcularse desde el dato original.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from cryptic.core.analyzer import DataAnalysis, DataSensitivity, ProtectionStatus
+from cryptic.patterns.hash_patterns import HashType
+from cryptic.patterns.sensitive_patterns import SensitiveDataType
+
+# Máximo de tuplas distintas retenidas por un CompactResultBuilder
+DEFAULT_MAX_INTERNED = 100_000
+
+# Tablas de códigos enteros: el código de un miembro es su índice en la tupla
+SENSITIVITY_LEVELS: Tuple[DataSensitivity, ...] = tuple(DataSensitivity)
+PROTECTION_STATUSES: Tuple[ProtectionStatus, ...] = tuple(ProtectionStatus)
+SENSITIVE_TYPES: Tuple[SensitiveDataType, ...] = tuple(SensitiveDataType)
+HASH_TYPES: Tuple[HashType, ...] = tuple(HashType)
+
+SENSITIVITY_CODES: Dict[DataSensitivity, int] = {member: code for code, member in enumerate(SENSITIVITY_LEVELS)}
+PROTECTION_CODES: Dict[ProtectionStatus, int] = {member: code for code, member in enumerate(PROTECTION_STATUSES)}
+SENSITIVE_TYPE_CODES: Dict[SensitiveDataType, int] = {member: code for code, member in enumerate(SENSITIVE_TYPES)}
+HASH_TYPE_CODES: Dict[HashType, int] = {member: code for code, member in enumerate(HASH_TYPES)}
+
+
+@dataclass(slots=True, frozen=True)
+class CompactMatch:
+    """
+    Coincidencia de dato sensible en forma compacta.
+
+    Attributes:
+        type_code: Código del tipo de dato (índice en SENSITIVE_TYPES)
+        start: Posición inicial en el dato original
+        end: Posición final en el dato original
+        confidence: Nivel de confianza en la detección
+        validated: Si pasó validación adicional
+    """
+
+    type_code: int
+    start: int
+    end: int
+    confidence: float
+    validated: bool
+
+    @property
+    def data_type(self) -> SensitiveDataType:
+        """Tipo de dato sensible detectado"""
+        return SENSITIVE_TYPES[self.type_code]
+
+
+@dataclass(slots=True, frozen=True)
+class CompactAnalysis:
+    """
+    Resultado de análisis en forma compacta.
+
+    Attributes:
+        original_data: Datos originales analizados
+        sensitivity_code: Código del nivel de sensibilidad (índice en SENSITIVITY_LEVELS)
+        protection_code: Código del estado de protección (índice en PROTECTION_STATUSES)
+        confidence: Nivel de confianza en el análisis
+        hash_types: Pares (código de HashType, confianza) ordenados por confianza
+        matches: Coincidencias de datos sensibles
+        recommendations: Recomendaciones de seguridad
+    """
+
+    original_data: str
+    sensitivity_code: int
+    protection_code: int
+    confidence: float
+    hash_types: Tuple[Tuple[int, float], ...]
+    matches: Tuple[CompactMatch, ...]
+    recommendations: Tuple[str, ...]
+
+    @property
+    def sensitivity_level(self) -> DataSensitivity:
+        """Nivel de sensibilidad detectado"""
+        return SENSITIVITY_LEVELS[self.sensitivity_code]
+
+    @property
+    def protection_status(self) -> ProtectionStatus:
+        """Estado de protección"""
+        return PROTECTION_STATUSES[self.protection_code]
+
+    @property
+    def hash_type(self) -> Optional[HashType]:
+        """Tipo de hash más probable, si se identificó alguno"""
+        return HASH_TYPES[self.hash_types[0][0]] if self.hash_types else None
+
+    def matched_text(self, match: CompactMatch) -> str:
+        """Texto de una coincidencia, obtenido del dato original"""
+        return self.original_data[match.start : match.end]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el resultado en un diccionario serializable"""
+        hash_type = self.hash_type
+        return {
+            "original_data": self.original_data,
+            "sensitivity_level": self.sensitivity_level.value,
+            "protection_status": self.protection_status.value,
+            "confidence": self.confidence,
+            "hash_type": hash_type.value if hash_type else None,
+            "sensitive_matches": [
+                {
+                    "type": match.data_type.value,
+                    "text": self.matched_text(match),
+                    "confidence": match.confidence,
+                    "validated": match.validated,
+                }
+                for match in self.matches
+            ],
+            "recommendations": list(self.recommendations),
+        }
+
+
+class CompactResultBuilder:
+    """
+    Convierte análisis completos en resultados compactos.
+
+    Mantiene tablas de interning para que los resultados equivalentes
+    compartan las mismas tuplas de recomendaciones, tipos de hash y
+    coincidencias en lugar de duplicarlas.
+    """
+
+    def __init__(self, max_interned: int = DEFAULT_MAX_INTERNED) -> None:
+        """
+        Inicializa las tablas de interning vacías.
+
+        Args:
+            max_interned: Máximo de tuplas distintas retenidas; al alcanzarlo,
+                las tuplas nuevas se usan sin compartir
+        """
+        self.max_interned = max_interned
+        self._interned: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
+    def _intern(self, value: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Retorna la instancia compartida de una tupla equivalente"""
+        if not value:
+            return ()
+
+        shared = self._interned.get(value)
+        if shared is not None:
+            return shared
+        if len(self._interned) < self.max_interned:
+            self._interned[value] = value
+        return value
+
+    def build(self, analysis: DataAnalysis) -> CompactAnalysis:
+        """
+        Construye el resultado compacto de un análisis.
+
+        Args:
+            analysis: Análisis completo
+
+        Returns:
+            CompactAnalysis equivalente
+        """
+        hash_types: Tuple[Tuple[int, float], ...] = ()
+        if analysis.hash_analysis and analysis.hash_analysis.possible_types:
+            hash_types = self._intern(
+                tuple(
+                    (HASH_TYPE_CODES[hash_type], confidence) for hash_type, confidence in analysis.hash_analysis.possible_types
+                )
+            )
+
+        matches: Tuple[CompactMatch, ...] = ()
+        if analysis.sensitive_analysis and analysis.sensitive_analysis.matches:
+            matches = self._intern(
+                tuple(
+                    CompactMatch(
+                        SENSITIVE_TYPE_CODES[match.data_type],
+                        match.start_pos,
+                        match.end_pos,
+                        match.confidence,
+                        match.is_validated,
+                    )
+                    for match in analysis.sensitive_analysis.matches
+                )
+            )
+
+        return CompactAnalysis(
+            original_data=analysis.original_data,
+            sensitivity_code=SENSITIVITY_CODES[analysis.sensitivity_level],
+            protection_code=PROTECTION_CODES[analysis.protection_status],
+            confidence=analysis.confidence,
+            hash_types=hash_types,
+            matches=matches,
+            recommendations=self._intern(tuple(analysis.recommendations)),
+        )
+
+    def build_many(self, analyses: List[DataAnalysis]) -> List[CompactAnalysis]:
+        """Construye los resultados compactos de una lista de análisis"""
+        return [self.build(analysis) for analysis in analyses]
@@ -7,11 +7,18 @@ de hash basándose en patrones, longitudes, formatos y otras características.
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from cryptic.patterns.hash_patterns import HashPattern, HashType, get_hash_patterns
+from cryptic.utils.features import ValueFeatures, extract_features
 from cryptic.utils.formatters import analyze_charset, analyze_format, clean_hash
 
+if TYPE_CHECKING:
+    from cryptic.core.metrics import MetricsRegistry
+
+# Conjuntos de caracteres de los patrones formados solo por dígitos hexadecimales
+HEX_CHARSETS = ("0-9a-f", "0-9a-fA-F")
+
 
 @dataclass
 class HashAnalysis:
@@ -44,9 +51,35 @@ class HashAnalysis:
 class HashIdentifier:
     """Identificador de algoritmos de hash usando técnicas heurísticas"""
 
-    def __init__(self) -> None:
-        """Inicializa el identificador cargando los patrones de hash"""
-        self.patterns = get_hash_patterns()
+    def __init__(self, prefilter: bool = True, metrics: Optional["MetricsRegistry"] = None) -> None:
+        """
+        Inicializa el identificador; los patrones de hash se cargan en el primer uso.
+
+        Args:
+            prefilter: Omitir los patrones cuya longitud, prefijo o conjunto de
+                caracteres no coincide con las características del valor
+            metrics: Registro opcional donde contar ejecuciones y coincidencias por patrón
+        """
+        self._patterns: Optional[List[HashPattern]] = None
+        self.prefilter = prefilter
+        self.metrics = metrics
+        if metrics is not None:
+            from cryptic.core.metrics import pattern_metrics
+
+            self._pattern_executions, self._pattern_hits = pattern_metrics(metrics)
+
+    @property
+    def patterns(self) -> List[HashPattern]:
+        """Patrones de hash, construidos la primera vez que se consultan"""
+        patterns = self._patterns
+        if patterns is None:
+            # Si dos hilos llegan a la vez, ambos construyen y publican una lista completa
+            patterns = self._patterns = get_hash_patterns()
+        return patterns
+
+    @patterns.setter
+    def patterns(self, patterns: List[HashPattern]) -> None:
+        self._patterns = patterns
 
     def _calculate_confidence(self, pattern: HashPattern, hash_analysis: HashAnalysis) -> float:
         """
@@ -99,50 +132,88 @@ class HashIdentifier:
 
         return confidence
 
-    def identify(self, hash_string: str) -> HashAnalysis:
+    def candidate_patterns(
+        self, cleaned_hash: str, features: ValueFeatures, patterns: Optional[List[HashPattern]] = None
+    ) -> List[HashPattern]:
+        """
+        Filtra los patrones que pueden coincidir con un hash ya limpio.
+
+        Un patrón se descarta sin ejecutar su regex si su longitud fija o su
+        prefijo no coinciden, o si es hexadecimal y el valor tiene caracteres
+        que no lo son.
+
+        Args:
+            cleaned_hash: Hash limpio (ver clean_hash)
+            features: Características del hash limpio
+            patterns: Patrones a considerar (por defecto, todos)
+
+        Returns:
+            Patrones cuya regex debe ejecutarse (todos si el prefiltro está desactivado)
+        """
+        patterns = self.patterns if patterns is None else patterns
+        if not self.prefilter:
+            return patterns
+
+        length = features.length
+        candidates = []
+        for pattern in patterns:
+            if pattern.length and length != pattern.length:
+                continue
+            if pattern.prefix and not cleaned_hash.startswith(pattern.prefix):
+                continue
+            if pattern.charset in HEX_CHARSETS and features.hex < length - len(pattern.prefix or ""):
+                continue
+            candidates.append(pattern)
+        return candidates
+
+    def identify(
+        self, hash_string: str, patterns: Optional[List[HashPattern]] = None, features: Optional[ValueFeatures] = None
+    ) -> HashAnalysis:
         """
         Identifica el tipo de hash y proporciona análisis detallado.
 
         Args:
             hash_string: Hash a identificar
+            patterns: Subconjunto de patrones a evaluar (por defecto, todos)
+            features: Características de hash_string ya calculadas (ver extract_features)
 
         Returns:
             HashAnalysis con tipos posibles y análisis detallado
         """
         cleaned_hash = clean_hash(hash_string)
-        charset_analysis = analyze_charset(cleaned_hash)
-        format_analysis = analyze_format(cleaned_hash)
+        # Sin espacios, el hash limpio es idéntico al original y sus características también
+        if features is None or features.whitespace:
+            features = extract_features(cleaned_hash)
+
+        analysis = HashAnalysis(
+            possible_types=[],
+            raw_hash=hash_string,
+            cleaned_hash=cleaned_hash,
+            length=len(cleaned_hash),
+            charset_analysis=analyze_charset(cleaned_hash, features),
+            format_analysis=analyze_format(cleaned_hash),
+        )
 
         possible_types = []
 
         # Evaluar cada patrón
-        for pattern in self.patterns:
-            confidence = self._calculate_confidence(
-                pattern,
-                HashAnalysis(
-                    possible_types=[],
-                    raw_hash=hash_string,
-                    cleaned_hash=cleaned_hash,
-                    length=len(cleaned_hash),
-                    charset_analysis=charset_analysis,
-                    format_analysis=format_analysis,
-                ),
-            )
+        for pattern in self.candidate_patterns(cleaned_hash, features, patterns):
+            confidence = self._calculate_confidence(pattern, analysis)
 
             if confidence > 0:
                 possible_types.append((pattern.hash_type, confidence))
 
+            if self.metrics is not None:
+                labels = ("hash", pattern.hash_type.value)
+                self._pattern_executions.inc(1, labels)
+                if confidence > 0:
+                    self._pattern_hits.inc(1, labels)
+
         # Ordenar por confianza (mayor a menor)
         possible_types.sort(key=lambda x: x[1], reverse=True)
 
-        return HashAnalysis(
-            possible_types=possible_types,
-            raw_hash=hash_string,
-            cleaned_hash=cleaned_hash,
-            length=len(cleaned_hash),
-            charset_analysis=charset_analysis,
-            format_analysis=format_analysis,
-        )
+        analysis.possible_types = possible_types
+        return analysis
 
     def identify_best_match(self, hash_string: str) -> Tuple[HashType, float]:
         """
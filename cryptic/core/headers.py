@@ -0,0 +1,302 @@
+"""
+Selección de patrones según el nombre de las columnas CSV.
+
+Este módulo asocia nombres de columna (en español e inglés) con el tipo de
+dato esperado, de modo que una columna ``email`` se analiza solo con el
+patrón de emails y una columna ``password_hash`` solo con la identificación
+de hashes. Cada regla define uno de tres modos:
+
+- "restrict": solo se evalúan los patrones de los tipos indicados
+- "prioritize": se evalúan primero esos patrones y, si ninguno ocupa el
+  valor completo, se realiza el análisis completo
+- "hash": solo identificación de hashes, sin detección de datos sensibles
+
+La identificación de hashes solo se omite cuando el patrón esperado valida
+el valor completo: un hash en una columna con nombre de dato sensible indica
+que el dato está protegido. Una muestra de verificación (los primeros
+valores de cada columna y luego uno de cada N) se analiza por completo; si
+demasiados valores no corresponden al tipo esperado, la columna se considera
+mal etiquetada y vuelve al análisis completo.
+"""
+
+import re
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from cryptic.core.analyzer import DataAnalysis
+from cryptic.core.sampling import NO_FINDING, classify_analysis
+from cryptic.patterns.sensitive_patterns import SensitiveDataType, SensitivePattern
+from cryptic.utils.features import extract_features
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+HEADER_MODES = ("restrict", "prioritize", "hash")
+
+# Valores de cada columna verificados con el análisis completo al comenzar
+DEFAULT_VERIFY_FIRST = 20
+
+# Luego, uno de cada N valores se verifica
+DEFAULT_VERIFY_EVERY = 100
+
+# Proporción de valores verificados fuera del tipo esperado que se tolera
+DEFAULT_MISLABEL_TOLERANCE = 0.05
+
+
+@dataclass
+class HeaderRule:
+    """
+    Regla que asocia nombres de columna con un tipo de dato esperado.
+
+    Attributes:
+        pattern: Regex buscada en el nombre normalizado (minúsculas, sin
+            tildes y con "_" como único separador)
+        types: Tipos de datos sensibles esperados (vacío en modo "hash")
+        mode: "restrict", "prioritize" o "hash"
+    """
+
+    pattern: str
+    types: List[SensitiveDataType] = field(default_factory=list)
+    mode: str = "restrict"
+
+    def __post_init__(self) -> None:
+        if self.mode not in HEADER_MODES:
+            raise ValueError(f"Modo desconocido '{self.mode}'. Disponibles: {', '.join(HEADER_MODES)}")
+        if self.mode != "hash" and not self.types:
+            raise ValueError(f"La regla '{self.pattern}' debe indicar al menos un tipo de dato")
+        self._regex = re.compile(self.pattern)
+
+    def matches(self, header: str) -> bool:
+        """Indica si la regla aplica a un nombre de columna ya normalizado"""
+        return self._regex.search(header) is not None
+
+
+# Reglas por defecto; se aplica la primera que coincide, por lo que las de
+# hash van antes para que "email_hash" se trate como hash
+DEFAULT_HEADER_RULES: List[HeaderRule] = [
+    HeaderRule(r"hash|digest|password|passwd|pwd|contrasena|clave|(^|_)(md5|sha\d*|bcrypt)(_|$)", mode="hash"),
+    HeaderRule(r"e_?mail|correo", [SensitiveDataType.EMAIL]),
+    HeaderRule(r"(^|_)(rut|run)(_|$)", [SensitiveDataType.RUT_CHILENO]),
+    HeaderRule(r"(^|_)dni(_|$)", [SensitiveDataType.DNI_ARGENTINO]),
+    HeaderRule(r"cedula|(^|_)ci(_|$)", [SensitiveDataType.CI_URUGUAYO]),
+    HeaderRule(
+        r"telefono|phone|celular|movil|mobile|(^|_)(fono|tel)(_|$)",
+        [SensitiveDataType.PHONE_CHILE, SensitiveDataType.PHONE_INTERNATIONAL],
+    ),
+    HeaderRule(r"(^|_)ip(_|$)|ip_?address|direccion_ip", [SensitiveDataType.IP_ADDRESS]),
+    HeaderRule(r"tarjeta|credit_?card|card_?number|(^|_)(cc|pan)(_|$)", [SensitiveDataType.CREDIT_CARD]),
+    HeaderRule(r"(^|_)(url|website|sitio_web|link)(_|$)", [SensitiveDataType.URL]),
+    HeaderRule(r"nombre|apellido|(^|_)(full_|first_|last_)?name(_|$)", [SensitiveDataType.NOMBRE_PERSONA], "prioritize"),
+]
+
+
+def normalize_header(header: str) -> str:
+    """
+    Normaliza un nombre de columna para compararlo con las reglas.
+
+    Args:
+        header: Nombre de columna original (ej: "Teléfono Móvil")
+
+    Returns:
+        Nombre en minúsculas, sin tildes y con "_" como separador (ej: "telefono_movil")
+    """
+    ascii_header = unicodedata.normalize("NFKD", header).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "_", ascii_header.lower()).strip("_")
+
+
+def _parse_type(name: str) -> SensitiveDataType:
+    """Interpreta un tipo de dato por nombre del enum o por su valor"""
+    for data_type in SensitiveDataType:
+        if name in (data_type.name, data_type.value) or name.upper() == data_type.name:
+            return data_type
+    raise ValueError(f"Tipo de dato desconocido '{name}'. Disponibles: {', '.join(t.name for t in SensitiveDataType)}")
+
+
+def load_header_rules(path: Path) -> List[HeaderRule]:
+    """
+    Carga reglas de encabezados desde un archivo YAML o JSON.
+
+    El archivo contiene una lista ``rules`` de objetos con ``pattern``,
+    ``types`` (nombres o valores de SensitiveDataType) y ``mode`` opcional.
+
+    Args:
+        path: Archivo de reglas (.yaml, .yml o .json)
+
+    Returns:
+        Lista de reglas en el orden del archivo
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado
+    """
+    with open(path, encoding="utf-8") as f:
+        if Path(path).suffix.lower() in (".yaml", ".yml"):
+            import yaml
+
+            content = yaml.safe_load(f)
+        else:
+            import json
+
+            content = json.load(f)
+
+    entries = content.get("rules") if isinstance(content, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError("El archivo de reglas debe contener una lista 'rules'")
+
+    rules = []
+    for entry in entries:
+        if not isinstance(entry, dict) or "pattern" not in entry:
+            raise ValueError("Cada regla debe ser un objeto con 'pattern'")
+        rules.append(
+            HeaderRule(
+                pattern=str(entry["pattern"]),
+                types=[_parse_type(str(name)) for name in entry.get("types", [])],
+                mode=str(entry.get("mode", "restrict")),
+            )
+        )
+    return rules
+
+
+class _HeaderColumn:
+    """Estado de una columna con regla de encabezado"""
+
+    __slots__ = ("rule", "patterns", "allowed", "values", "verified", "mismatches", "demoted")
+
+    def __init__(self, rule: Optional[HeaderRule], patterns: List[SensitivePattern]) -> None:
+        self.rule = rule
+        self.patterns = patterns
+        self.allowed = {data_type.value for data_type in rule.types} if rule else set()
+        self.values = 0
+        self.verified = 0
+        self.mismatches = 0
+        self.demoted = False
+
+
+class HeaderAwareAnalyzer:
+    """
+    Analizador por columna que elige los patrones según el nombre de la columna.
+
+    Se usa en lugar de ``CrypticAnalyzer.analyze_data`` cuando los valores
+    llegan asociados a una columna: ``hints.analyze(columna, valor)``.
+    """
+
+    def __init__(
+        self,
+        analyzer: "CrypticAnalyzer",
+        rules: Optional[List[HeaderRule]] = None,
+        fallback: Optional[Callable[[str, str], DataAnalysis]] = None,
+        verify_first: int = DEFAULT_VERIFY_FIRST,
+        verify_every: int = DEFAULT_VERIFY_EVERY,
+        tolerance: float = DEFAULT_MISLABEL_TOLERANCE,
+    ) -> None:
+        """
+        Inicializa el analizador.
+
+        Args:
+            analyzer: Analizador base
+            rules: Reglas de encabezados (por defecto, DEFAULT_HEADER_RULES)
+            fallback: Función (columna, valor) para columnas sin regla o mal
+                etiquetadas (por defecto, el análisis completo)
+            verify_first: Valores iniciales de cada columna verificados por completo
+            verify_every: Luego, cada cuántos valores verificar (0 desactiva)
+            tolerance: Proporción de valores verificados fuera del tipo esperado
+                a partir de la cual la columna se considera mal etiquetada
+        """
+        self.analyzer = analyzer
+        self.rules = DEFAULT_HEADER_RULES if rules is None else rules
+        self.fallback = fallback or (lambda _column, value: analyzer.analyze_data(value))
+        self.verify_first = verify_first
+        self.verify_every = verify_every
+        self.tolerance = tolerance
+        self.columns: Dict[str, _HeaderColumn] = {}
+
+    def _column(self, column: str) -> _HeaderColumn:
+        """Resuelve (una sola vez por columna) la regla y los patrones de una columna"""
+        state = self.columns.get(column)
+        if state is None:
+            header = normalize_header(column)
+            rule = next((rule for rule in self.rules if rule.matches(header)), None)
+            types = set(rule.types) if rule else set()
+            patterns = [p for p in self.analyzer.sensitive_detector.patterns if p.data_type in types]
+            state = self.columns[column] = _HeaderColumn(rule, patterns)
+        return state
+
+    def analyze(self, column: str, data: str) -> DataAnalysis:
+        """
+        Analiza un valor de una columna.
+
+        Args:
+            column: Nombre de la columna
+            data: Valor a analizar
+
+        Returns:
+            DataAnalysis del análisis especializado, o completo si el valor
+            forma parte de la muestra de verificación o la columna no tiene regla
+        """
+        state = self._column(column)
+        if state.rule is None or state.demoted:
+            return self.fallback(column, data)
+
+        state.values += 1
+        if state.values <= self.verify_first or (self.verify_every and state.values % self.verify_every == 0):
+            return self._verify(state, data)
+
+        analyzer = self.analyzer
+        if state.rule.mode == "hash":
+            return analyzer.analyze_restricted(data, [])
+
+        # Un valor que el patrón esperado valida por completo no es un hash,
+        # por lo que se omite la identificación de hashes
+        start_time = time.perf_counter()
+        features = extract_features(data)
+        sensitive = analyzer.sensitive_detector.detect(data, state.patterns, features)
+        length = features.length
+        if any(m.is_validated and m.start_pos == 0 and m.end_pos == length for m in sensitive.matches):
+            hash_analysis = analyzer.hash_identifier.identify(data, [], features)
+            return analyzer.build_analysis(data, hash_analysis, sensitive, start_time)
+
+        if state.rule.mode == "prioritize":
+            return analyzer.analyze_data(data)
+        return analyzer.analyze_restricted(data, state.patterns)
+
+    def _verify(self, state: _HeaderColumn, data: str) -> DataAnalysis:
+        """Analiza por completo un valor de la muestra y actualiza la detección de etiquetas erróneas"""
+        analysis = self.analyzer.analyze_data(data)
+        state.verified += 1
+
+        has_hash = bool(analysis.hash_analysis and analysis.hash_analysis.possible_types)
+        kind, _ = classify_analysis(analysis)
+        if state.rule is not None and state.rule.mode == "hash":
+            mislabeled = not has_hash and kind != NO_FINDING
+        else:
+            mislabeled = not has_hash and kind != NO_FINDING and kind not in state.allowed
+        if mislabeled:
+            state.mismatches += 1
+
+        if state.verified >= self.verify_first and state.mismatches > self.tolerance * state.verified:
+            state.demoted = True
+        return analysis
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Retorna las estadísticas por columna con regla.
+
+        Returns:
+            Diccionario columna -> regla, modo, tipos, valores, verificados,
+            discrepancias y si fue descartada por mal etiquetada
+        """
+        return {
+            name: {
+                "rule": state.rule.pattern,
+                "mode": state.rule.mode,
+                "types": [data_type.value for data_type in state.rule.types],
+                "values": state.values,
+                "verified": state.verified,
+                "mismatches": state.mismatches,
+                "mislabeled": state.demoted,
+            }
+            for name, state in self.columns.items()
+            if state.rule is not None
+        }
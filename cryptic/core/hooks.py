@@ -0,0 +1,182 @@
+"""
+Hooks de instrumentación del análisis.
+
+``AnalysisHooks`` define el protocolo: ``on_stage_start`` se invoca al
+comenzar una etapa y retorna un token opcional (por ejemplo, el span de un
+sistema de trazas), y ``on_stage_end`` recibe ese token y la duración de la
+etapa en nanosegundos. La implementación base no hace nada, de modo que una
+subclase puede redefinir solo el método que necesita.
+
+``CrypticAnalyzer(hooks=...)`` invoca los hooks alrededor de cada análisis
+(``STAGE_ANALYZE``, con el largo del valor como atributo) y de cada etapa
+interna (ver las constantes ``STAGE_*`` de cryptic.core.timings). La CLI
+agrega la etapa ``STAGE_FILE`` por archivo y ``STAGE_CHUNK`` por cada bloque
+de ``DEFAULT_CHUNK_ROWS`` filas, y carga los hooks con ``--hooks módulo:objeto``.
+
+Sin hooks registrados el analizador no invoca nada: el costo es la misma
+comparación con None por etapa que ya tiene el desglose de tiempos
+(``cryptic bench --hooks`` lo mide). Los hooks se invocan en el hilo que
+analiza, por lo que pueden usar el contexto de ese hilo (por ejemplo, el span
+activo de la solicitud que originó el análisis).
+
+Ejemplo:
+    >>> class Spans(AnalysisHooks):
+    ...     def on_stage_end(self, stage, token, elapsed_ns):
+    ...         print(stage)
+    >>> _ = CrypticAnalyzer(hooks=Spans()).analyze_data("hola")
+    features
+    hash:whole
+    ...
+    analyze
+"""
+
+import importlib
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+# Etapas que envuelven a otras: un análisis completo, un archivo y un bloque de filas de la CLI
+STAGE_ANALYZE = "analyze"
+STAGE_FILE = "file"
+STAGE_CHUNK = "chunk"
+
+# Filas por bloque en los comandos de la CLI que recorren archivos
+DEFAULT_CHUNK_ROWS = 1000
+
+T = TypeVar("T")
+
+
+class AnalysisHooks:
+    """Protocolo de hooks de instrumentación; la implementación base no hace nada"""
+
+    def on_stage_start(self, stage: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Se invoca al comenzar una etapa.
+
+        Args:
+            stage: Nombre de la etapa
+            attributes: Datos de la etapa (ej: {"length": 15} en STAGE_ANALYZE), o None
+
+        Returns:
+            Token que se entregará a on_stage_end (ej: un span)
+        """
+        return None
+
+    def on_stage_end(self, stage: str, token: Any, elapsed_ns: int) -> None:
+        """
+        Se invoca al terminar una etapa.
+
+        Args:
+            stage: Nombre de la etapa
+            token: Valor retornado por on_stage_start
+            elapsed_ns: Duración medida con time.perf_counter_ns
+        """
+
+
+class HookChain(AnalysisHooks):
+    """Invoca varios hooks en orden, conservando el token de cada uno"""
+
+    def __init__(self, hooks: Sequence[AnalysisHooks]) -> None:
+        """
+        Inicializa la cadena.
+
+        Args:
+            hooks: Hooks a invocar, en orden
+        """
+        self.hooks = tuple(hooks)
+
+    def on_stage_start(self, stage: str, attributes: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+        return tuple(hook.on_stage_start(stage, attributes) for hook in self.hooks)
+
+    def on_stage_end(self, stage: str, token: Any, elapsed_ns: int) -> None:
+        for hook, hook_token in zip(self.hooks, token):
+            hook.on_stage_end(stage, hook_token, elapsed_ns)
+
+
+def combine_hooks(*hooks: Optional[AnalysisHooks]) -> Optional[AnalysisHooks]:
+    """
+    Combina los hooks entregados, descartando los None.
+
+    Returns:
+        None si no hay ninguno, el único hook si hay uno, o una HookChain
+    """
+    present = [hook for hook in hooks if hook is not None]
+    if not present:
+        return None
+    return present[0] if len(present) == 1 else HookChain(present)
+
+
+def load_hooks(spec: str) -> AnalysisHooks:
+    """
+    Carga hooks desde una referencia ``módulo:objeto``.
+
+    Si el objeto es una clase, se instancia sin argumentos.
+
+    Args:
+        spec: Referencia al objeto (ej: "mi_empresa.trazas:CrypticSpans")
+
+    Returns:
+        Hooks cargados
+
+    Raises:
+        ValueError: Si la referencia no es válida o el objeto no implementa el protocolo
+    """
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Referencia de hooks inválida '{spec}'. Formato esperado: módulo:objeto")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            target = getattr(target, name)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"No se pudieron cargar los hooks '{spec}': {e}") from e
+
+    hooks = target() if isinstance(target, type) else target
+    if not callable(getattr(hooks, "on_stage_start", None)) or not callable(getattr(hooks, "on_stage_end", None)):
+        raise ValueError(f"'{spec}' no implementa on_stage_start y on_stage_end")
+    return hooks
+
+
+def instrument_chunks(
+    items: Iterable[T],
+    hooks: Optional[AnalysisHooks],
+    chunk_size: int = DEFAULT_CHUNK_ROWS,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[T]:
+    """
+    Recorre items invocando STAGE_CHUNK alrededor de cada bloque de chunk_size elementos.
+
+    Un bloque termina cuando se pide el primer elemento del siguiente (es decir,
+    después de procesar su último elemento), al agotarse items o al cerrar el
+    iterador.
+
+    Args:
+        items: Elementos a recorrer (ej: filas de un archivo)
+        hooks: Hooks a invocar (None = recorrer sin instrumentar)
+        chunk_size: Elementos por bloque
+        attributes: Datos agregados a los de cada bloque (ej: la ruta del archivo)
+
+    Yields:
+        Los mismos elementos de items
+    """
+    if hooks is None:
+        yield from items
+        return
+
+    token: Any = None
+    chunk_start = 0
+    position = 0
+    in_chunk = False
+    try:
+        for item in items:
+            if position % chunk_size == 0:
+                if in_chunk:
+                    hooks.on_stage_end(STAGE_CHUNK, token, time.perf_counter_ns() - chunk_start)
+                chunk_attributes = {"index": position // chunk_size, "first_item": position, **(attributes or {})}
+                token = hooks.on_stage_start(STAGE_CHUNK, chunk_attributes)
+                chunk_start = time.perf_counter_ns()
+                in_chunk = True
+            position += 1
+            yield item
+    finally:
+        if in_chunk:
+            hooks.on_stage_end(STAGE_CHUNK, token, time.perf_counter_ns() - chunk_start)
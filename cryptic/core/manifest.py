@@ -0,0 +1,212 @@
+"""
+Manifiesto de huellas de archivos para escaneos incrementales.
+
+Este módulo mantiene un archivo SQLite local con la ruta, tamaño, fecha de
+modificación, hash de contenido y resultado agregado de cada archivo
+escaneado, de modo que los escaneos posteriores omitan los archivos que
+no cambiaron y reutilicen sus resultados almacenados. Al terminar un
+escaneo se eliminan las filas de los archivos del directorio que ya no se
+encontraron (eliminados, renombrados o excluidos por los filtros).
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from cryptic.core.scanner import DEFAULT_MAX_FINDINGS, FileScanResult
+from cryptic.utils.files import file_content_hash
+
+# Versión del esquema de la base de datos del manifiesto
+SCHEMA_VERSION = 2
+
+
+def build_options_key(column: Optional[str] = None, max_findings: int = DEFAULT_MAX_FINDINGS) -> str:
+    """
+    Construye el identificador de las opciones que afectan los resultados.
+
+    Incluye la versión de la biblioteca para que una actualización invalide
+    los resultados almacenados por versiones anteriores.
+
+    Args:
+        column: Columna específica analizada (solo CSV)
+        max_findings: Ejemplos de datos sensibles conservados por archivo (el
+            mismo valor pasado a scan_directory)
+
+    Returns:
+        Identificador de opciones para el manifiesto
+    """
+    from cryptic import __version__
+
+    return f"cryptic={__version__};column={column or ''};max_findings={max_findings}"
+
+
+class ScanManifest:
+    """
+    Manifiesto persistente de archivos escaneados.
+
+    Un archivo se considera sin cambios si su tamaño y fecha de modificación
+    coinciden con lo registrado. Si solo cambió la fecha de modificación, se
+    compara el hash de contenido antes de decidir volver a escanearlo.
+    Los resultados solo se reutilizan si fueron generados con las mismas
+    opciones de escaneo (``options_key``). Cada fila consultada o registrada
+    se marca con el identificador de la ejecución actual (``run_id``), lo que
+    permite a ``prune`` eliminar las de archivos que ya no existen.
+    """
+
+    def __init__(self, path: Path, options_key: str = "") -> None:
+        """
+        Abre (o crea) el manifiesto en la ruta indicada.
+
+        Args:
+            path: Archivo SQLite del manifiesto
+            options_key: Identificador de las opciones que afectan los resultados
+        """
+        self.path = path
+        self.options_key = options_key
+        self.run_id = uuid.uuid4().hex
+        self._connection = sqlite3.connect(str(path))
+        self._initialize_schema()
+
+    def _initialize_schema(self) -> None:
+        """Crea las tablas si no existen y descarta esquemas incompatibles"""
+        cursor = self._connection.cursor()
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+
+        if version not in (0, SCHEMA_VERSION):
+            cursor.execute("DROP TABLE IF EXISTS files")
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                options_key TEXT NOT NULL,
+                result TEXT NOT NULL,
+                scanned_at REAL NOT NULL,
+                run_id TEXT NOT NULL
+            )
+            """
+        )
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._connection.commit()
+
+    def start_run(self) -> None:
+        """Inicia una nueva ejecución: las filas no visitadas desde aquí son candidatas de ``prune``"""
+        self.run_id = uuid.uuid4().hex
+
+    def lookup(self, path: Path, size: int, mtime_ns: int) -> Optional[FileScanResult]:
+        """
+        Busca un resultado reutilizable para un archivo y lo marca como visitado.
+
+        Args:
+            path: Archivo a consultar
+            size: Tamaño actual del archivo en bytes
+            mtime_ns: Fecha de modificación actual en nanosegundos
+
+        Returns:
+            FileScanResult almacenado si el archivo no cambió, None en caso contrario
+        """
+        row = self._connection.execute(
+            "SELECT size, mtime_ns, content_hash, options_key, result FROM files WHERE path = ?",
+            (self._key(path),),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        stored_size, stored_mtime_ns, stored_hash, stored_options, stored_result = row
+        if stored_options != self.options_key or stored_size != size:
+            return None
+
+        if stored_mtime_ns != mtime_ns:
+            # Fecha modificada pero mismo tamaño: confirmar con el contenido
+            if file_content_hash(path) != stored_hash:
+                return None
+        self._connection.execute(
+            "UPDATE files SET mtime_ns = ?, run_id = ? WHERE path = ?", (mtime_ns, self.run_id, self._key(path))
+        )
+
+        result = FileScanResult.from_dict(json.loads(stored_result))
+        result.path = str(path)
+        result.from_manifest = True
+        return result
+
+    def record(self, path: Path, size: int, mtime_ns: int, result: FileScanResult) -> None:
+        """
+        Registra (o actualiza) el resultado de un archivo escaneado.
+
+        Los archivos con error no se registran para que se reintenten.
+
+        Args:
+            path: Archivo escaneado
+            size: Tamaño del archivo en bytes al momento del escaneo
+            mtime_ns: Fecha de modificación en nanosegundos al momento del escaneo
+            result: Resultado agregado del archivo
+        """
+        if result.error:
+            return
+
+        content_hash = result.content_hash or file_content_hash(path)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash, options_key, result, scanned_at, run_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self._key(path),
+                size,
+                mtime_ns,
+                content_hash,
+                self.options_key,
+                json.dumps(result.to_dict(), ensure_ascii=False),
+                time.time(),
+                self.run_id,
+            ),
+        )
+
+    def prune(self, root: Path) -> int:
+        """
+        Elimina las filas de archivos bajo root no visitados en la ejecución actual.
+
+        Debe llamarse solo al terminar un escaneo completo de root: los archivos
+        eliminados, renombrados o excluidos por los filtros dejan de ocupar el
+        manifiesto. Las filas de otros directorios no se modifican.
+
+        Args:
+            root: Directorio escaneado
+
+        Returns:
+            Cantidad de filas eliminadas
+        """
+        prefix = self._key(root)
+        if not prefix.endswith(os.sep):
+            prefix += os.sep
+        cursor = self._connection.execute(
+            "DELETE FROM files WHERE run_id != ? AND substr(path, 1, ?) = ?", (self.run_id, len(prefix), prefix)
+        )
+        return cursor.rowcount
+
+    def commit(self) -> None:
+        """Persiste los cambios pendientes en disco"""
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Persiste los cambios y cierra la conexión"""
+        self._connection.commit()
+        self._connection.close()
+
+    def __enter__(self) -> "ScanManifest":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        """Normaliza una ruta para usarla como clave del manifiesto"""
+        return str(Path(path).resolve())
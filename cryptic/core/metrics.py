@@ -0,0 +1,323 @@
+"""
+Métricas internas del analizador con exposición al estilo Prometheus.
+
+Este módulo define contadores e histogramas sin dependencias externas y un
+registro que los agrupa. ``CrypticAnalyzer``, ``SensitiveDataDetector`` y
+``HashIdentifier`` los actualizan cuando reciben un ``MetricsRegistry``:
+valores analizados, bytes procesados, ejecuciones y coincidencias por
+patrón, validaciones fallidas, aciertos de caché y latencias de análisis.
+
+El registro ofrece una instantánea serializable (``snapshot``) y el formato
+de texto de Prometheus (``to_prometheus``), que ``cryptic serve`` publica en
+``GET /metrics`` y la opción ``--metrics`` de la CLI guarda en un archivo.
+
+Ejemplo:
+    >>> registry = MetricsRegistry()
+    >>> analyzer = CrypticAnalyzer(metrics=registry)
+    >>> _ = analyzer.analyze_data("juan@empresa.cl")
+    >>> registry.snapshot()["cryptic_values_analyzed_total"]["samples"][0]["value"]
+    1.0
+"""
+
+import bisect
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Límites superiores (segundos) de los histogramas de latencia
+DEFAULT_LATENCY_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+Labels = Tuple[str, ...]
+
+
+def _format_number(value: float) -> str:
+    """Formatea un número como lo espera el formato de texto de Prometheus"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+class Counter:
+    """Contador monótono, opcionalmente con etiquetas"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        """
+        Inicializa el contador.
+
+        Args:
+            name: Nombre de la métrica (por convención, terminado en ``_total``)
+            documentation: Descripción publicada como ``# HELP``
+            label_names: Nombres de las etiquetas, en el orden de los valores de ``inc``
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        """
+        Incrementa el contador.
+
+        Args:
+            amount: Cantidad a sumar (no negativa)
+            labels: Valores de las etiquetas, en el orden de label_names
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        """Valor actual para una combinación de etiquetas"""
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def reset(self) -> None:
+        """Descarta todos los valores"""
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """Valores actuales, uno por combinación de etiquetas"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{"labels": dict(zip(self.label_names, labels)), "value": value} for labels, value in items]
+
+
+class Histogram:
+    """Histograma de observaciones con límites fijos, opcionalmente con etiquetas"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        label_names: Sequence[str] = (),
+    ) -> None:
+        """
+        Inicializa el histograma.
+
+        Args:
+            name: Nombre de la métrica
+            documentation: Descripción publicada como ``# HELP``
+            buckets: Límites superiores en orden creciente (se agrega ``+Inf``)
+            label_names: Nombres de las etiquetas
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.label_names = tuple(label_names)
+        # Por etiquetas: [conteo por límite (no acumulado), suma, cantidad]
+        self._series: Dict[Labels, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """
+        Registra una observación.
+
+        Args:
+            value: Valor observado (ej: segundos)
+            labels: Valores de las etiquetas, en el orden de label_names
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, labels: Labels = ()) -> int:
+        """Cantidad de observaciones para una combinación de etiquetas"""
+        with self._lock:
+            series = self._series.get(labels)
+            return series[2] if series else 0
+
+    def reset(self) -> None:
+        """Descarta todas las observaciones"""
+        with self._lock:
+            self._series.clear()
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """Buckets acumulados, suma y cantidad por combinación de etiquetas"""
+        with self._lock:
+            items = sorted((labels, (list(series[0]), series[1], series[2])) for labels, series in self._series.items())
+
+        samples = []
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                buckets[_format_number(bound)] = cumulative
+            samples.append({"labels": dict(zip(self.label_names, labels)), "buckets": buckets, "sum": total, "count": count})
+        return samples
+
+
+Metric = Union[Counter, Histogram]
+
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas con nombre único.
+
+    ``counter`` e ``histogram`` retornan la métrica existente si ya fue
+    registrada, de modo que varios componentes pueden compartir un registro.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa un registro vacío"""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """
+        Obtiene o registra un contador.
+
+        Args:
+            name: Nombre de la métrica
+            documentation: Descripción de la métrica
+            label_names: Nombres de las etiquetas
+
+        Returns:
+            Counter registrado con ese nombre
+
+        Raises:
+            ValueError: Si el nombre ya está registrado con otro tipo o etiquetas
+        """
+        return self._register(Counter(name, documentation, label_names))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        label_names: Sequence[str] = (),
+    ) -> Histogram:
+        """
+        Obtiene o registra un histograma.
+
+        Args:
+            name: Nombre de la métrica
+            documentation: Descripción de la métrica
+            buckets: Límites superiores de los buckets
+            label_names: Nombres de las etiquetas
+
+        Returns:
+            Histogram registrado con ese nombre
+
+        Raises:
+            ValueError: Si el nombre ya está registrado con otro tipo o etiquetas
+        """
+        return self._register(Histogram(name, documentation, buckets, label_names))  # type: ignore[return-value]
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if existing.kind != metric.kind or existing.label_names != metric.label_names:
+            raise ValueError(f"La métrica '{metric.name}' ya está registrada como {existing.kind} {existing.label_names}")
+        return existing
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Métrica registrada con ese nombre, o None"""
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Descarta los valores de todas las métricas (las métricas siguen registradas)"""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Instantánea serializable de todas las métricas.
+
+        Returns:
+            Diccionario nombre -> {"type", "help", "samples"}; las muestras de un
+            contador tienen "labels" y "value", y las de un histograma "labels",
+            "buckets" (acumulados por límite, incluido "+Inf"), "sum" y "count"
+        """
+        return {
+            name: {"type": metric.kind, "help": metric.documentation, "samples": metric.samples()}
+            for name, metric in sorted(self._metrics.items())
+        }
+
+    def to_prometheus(self) -> str:
+        """Métricas en el formato de texto de Prometheus (versión 0.0.4)"""
+        return render_prometheus(self.snapshot())
+
+
+def render_prometheus(snapshot: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Convierte una instantánea en el formato de texto de Prometheus.
+
+    Args:
+        snapshot: Resultado de MetricsRegistry.snapshot
+
+    Returns:
+        Texto con las líneas ``# HELP``, ``# TYPE`` y las muestras de cada métrica
+    """
+    lines = []
+    for name, metric in snapshot.items():
+        documentation = metric["help"].replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for sample in metric["samples"]:
+            labels = sample["labels"]
+            if metric["type"] == "histogram":
+                for bound, count in sample["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_number(sample['sum'])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+            else:
+                lines.append(f"{name}{_format_labels(labels)} {_format_number(sample['value'])}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def pattern_metrics(registry: MetricsRegistry) -> Tuple[Counter, Counter]:
+    """
+    Contadores por patrón compartidos por los detectores.
+
+    Args:
+        registry: Registro donde obtenerlos o registrarlos
+
+    Returns:
+        Tupla (ejecuciones, coincidencias), con etiquetas ``detector`` y ``pattern``
+    """
+    executions = registry.counter(
+        "cryptic_pattern_executions_total", "Patrones evaluados sobre un valor", ("detector", "pattern")
+    )
+    hits = registry.counter("cryptic_pattern_hits_total", "Coincidencias encontradas por patrón", ("detector", "pattern"))
+    return executions, hits
@@ -0,0 +1,108 @@
+"""
+Análisis con un pool de hilos sobre un analizador compartido.
+
+``CrypticAnalyzer`` no cambia de estado al analizar: sus patrones se
+construyen una vez y se publican completos, y sus colaboradores mutables
+(métricas, desglose de tiempos, registro de valores lentos y caché) se
+protegen con locks. Por eso un único analizador por proceso puede atender
+varios hilos, por ejemplo los de un servidor web, sin uno por hilo.
+
+``AnalysisThreadPool`` reparte los valores en bloques entre sus hilos y
+retorna los resultados en el orden de entrada. Los bloques evitan pagar el
+costo de una tarea por valor. En un intérprete con GIL (el habitual) el
+análisis, que es Python y regex, no se paraleliza: los hilos solo escalan en
+un intérprete sin GIL (``python3.13t``). ``gil_enabled`` permite advertirlo.
+
+Ejemplo:
+    >>> analyzer = CrypticAnalyzer()
+    >>> with AnalysisThreadPool(threads=4) as pool:
+    ...     results = pool.map(analyzer.analyze_data, ["juan@empresa.cl", "12.345.678-5"])
+    >>> [r.sensitive_analysis.matches[0].data_type.value for r in results]
+    ['Email', 'RUT Chileno']
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+# Valores por tarea enviada a un hilo
+DEFAULT_CHUNK_SIZE = 256
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def gil_enabled() -> bool:
+    """Indica si el intérprete ejecuta con el GIL (siempre True antes de Python 3.13)"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def _apply(func: Callable[[T], R], chunk: Sequence[T]) -> List[R]:
+    return [func(item) for item in chunk]
+
+
+class AnalysisThreadPool:
+    """
+    Pool de hilos que aplica una función a bloques de valores, conservando el orden.
+
+    Las funciones aplicadas corren en paralelo, pero el pool en sí se usa
+    desde un único hilo.
+    """
+
+    def __init__(self, threads: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Inicializa el pool; los hilos se crean en el primer map.
+
+        Args:
+            threads: Cantidad de hilos (1 = aplicar en el hilo actual, sin pool)
+            chunk_size: Valores por tarea
+
+        Raises:
+            ValueError: Si threads o chunk_size son menores que 1
+        """
+        if threads < 1 or chunk_size < 1:
+            raise ValueError("threads y chunk_size deben ser al menos 1")
+        self.threads = threads
+        self.chunk_size = chunk_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def map(self, func: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """
+        Aplica func a cada elemento, repartiendo bloques entre los hilos.
+
+        func debe ser segura entre hilos (por ejemplo, ``analyzer.analyze_data``).
+
+        Args:
+            func: Función a aplicar
+            items: Elementos a procesar
+
+        Returns:
+            Resultados en el mismo orden que items
+
+        Raises:
+            Exception: La primera excepción lanzada por func, en el orden de items
+        """
+        if self.threads == 1 or len(items) <= self.chunk_size:
+            return _apply(func, items)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="cryptic-analyze")
+
+        chunks = [items[start : start + self.chunk_size] for start in range(0, len(items), self.chunk_size)]
+        futures = [self._executor.submit(_apply, func, chunk) for chunk in chunks]
+        results: List[R] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self) -> None:
+        """Espera a los hilos y los libera"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "AnalysisThreadPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
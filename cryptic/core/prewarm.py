@@ -0,0 +1,12 @@
+"""
+Precarga del fork server de los workers de Cryptic.
+
+``multiprocessing`` importa este módulo una sola vez en el fork server (ver
+``cryptic.core.backends.prewarmed_context``). La importación precalienta ese
+proceso: cada worker bifurcado desde él hereda los módulos importados, los
+patrones compilados y su analizador.
+"""
+
+from cryptic.core.backends import prewarm
+
+prewarm()
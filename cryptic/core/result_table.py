@@ -0,0 +1,322 @@
+"""
+Almacenamiento columnar de resultados para procesamiento por lotes.
+
+Este módulo define ``ResultTable``, que guarda los resultados de un lote
+como columnas del módulo ``array`` (fila, columna, códigos de sensibilidad,
+protección y tipo de hash, confianza) y las coincidencias de datos
+sensibles en buffers planos indexados por desplazamiento, en lugar de
+millones de objetos ``DataAnalysis``. Permite filtrar, contar por grupos y
+exportar a JSON Lines o CSV sin reconstruir los análisis completos.
+"""
+
+import csv
+import json
+from array import array
+from collections import Counter
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from cryptic.core.analyzer import DataAnalysis, DataSensitivity, ProtectionStatus
+from cryptic.core.compact import (
+    HASH_TYPE_CODES,
+    HASH_TYPES,
+    PROTECTION_CODES,
+    PROTECTION_STATUSES,
+    SENSITIVE_TYPE_CODES,
+    SENSITIVE_TYPES,
+    SENSITIVITY_CODES,
+    SENSITIVITY_LEVELS,
+)
+from cryptic.patterns.sensitive_patterns import SensitiveDataType
+
+# Código usado cuando no se identificó un tipo de hash
+NO_HASH = -1
+
+# Columnas del reporte CSV de batch
+CSV_FIELDNAMES = [
+    "row",
+    "column",
+    "original_data",
+    "sensitivity_level",
+    "protection_status",
+    "confidence",
+    "sensitive_types",
+]
+
+# Claves aceptadas por ResultTable.group_counts
+GROUP_KEYS = ("sensitivity", "protection", "column", "hash_type", "sensitive_type")
+
+
+class ResultTable:
+    """
+    Tabla columnar de resultados de análisis.
+
+    Cada celda analizada ocupa una posición en las columnas paralelas; sus
+    coincidencias de datos sensibles ocupan el rango
+    ``match_offsets[i]:match_offsets[i + 1]`` de los buffers de coincidencias.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa una tabla vacía"""
+        self.columns: List[str] = []
+        self._column_ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+        self.rows = array("q")
+        self.column_ids = array("I")
+        self.sensitivity_codes = array("b")
+        self.protection_codes = array("b")
+        self.confidences = array("d")
+        self.hash_type_codes = array("b")
+
+        self.match_offsets = array("Q", [0])
+        self.match_types = array("b")
+        self.match_starts = array("I")
+        self.match_ends = array("I")
+        self.match_confidences = array("d")
+        self.match_validated = array("b")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _column_id(self, column: str) -> int:
+        """Retorna el id de una columna, registrándola si es nueva"""
+        column_id = self._column_ids.get(column)
+        if column_id is None:
+            column_id = self._column_ids[column] = len(self.columns)
+            self.columns.append(column)
+        return column_id
+
+    def append(self, row: int, column: str, analysis: DataAnalysis) -> None:
+        """
+        Agrega el análisis de una celda.
+
+        Args:
+            row: Número de fila (desde 1)
+            column: Nombre de la columna
+            analysis: Resultado del análisis de la celda
+        """
+        self.values.append(analysis.original_data)
+        self.rows.append(row)
+        self.column_ids.append(self._column_id(column))
+        self.sensitivity_codes.append(SENSITIVITY_CODES[analysis.sensitivity_level])
+        self.protection_codes.append(PROTECTION_CODES[analysis.protection_status])
+        self.confidences.append(analysis.confidence)
+
+        if analysis.hash_analysis and analysis.hash_analysis.possible_types:
+            self.hash_type_codes.append(HASH_TYPE_CODES[analysis.hash_analysis.possible_types[0][0]])
+        else:
+            self.hash_type_codes.append(NO_HASH)
+
+        if analysis.sensitive_analysis:
+            for match in analysis.sensitive_analysis.matches:
+                self.match_types.append(SENSITIVE_TYPE_CODES[match.data_type])
+                self.match_starts.append(match.start_pos)
+                self.match_ends.append(match.end_pos)
+                self.match_confidences.append(match.confidence)
+                self.match_validated.append(match.is_validated)
+        self.match_offsets.append(len(self.match_types))
+
+    def matches(self, index: int) -> List[Tuple[SensitiveDataType, str, float, bool]]:
+        """
+        Retorna las coincidencias de una celda.
+
+        Args:
+            index: Posición de la celda en la tabla
+
+        Returns:
+            Lista de tuplas (tipo, texto, confianza, validada)
+        """
+        value = self.values[index]
+        return [
+            (
+                SENSITIVE_TYPES[self.match_types[i]],
+                value[self.match_starts[i] : self.match_ends[i]],
+                self.match_confidences[i],
+                bool(self.match_validated[i]),
+            )
+            for i in range(self.match_offsets[index], self.match_offsets[index + 1])
+        ]
+
+    def take(self, indices: Iterable[int]) -> "ResultTable":
+        """
+        Construye una nueva tabla con las celdas indicadas.
+
+        Args:
+            indices: Posiciones de las celdas a conservar, en orden
+
+        Returns:
+            Nueva ResultTable con las columnas copiadas
+        """
+        subset = ResultTable()
+        subset.columns = list(self.columns)
+        subset._column_ids = dict(self._column_ids)
+
+        for index in indices:
+            subset.values.append(self.values[index])
+            subset.rows.append(self.rows[index])
+            subset.column_ids.append(self.column_ids[index])
+            subset.sensitivity_codes.append(self.sensitivity_codes[index])
+            subset.protection_codes.append(self.protection_codes[index])
+            subset.confidences.append(self.confidences[index])
+            subset.hash_type_codes.append(self.hash_type_codes[index])
+
+            start, end = self.match_offsets[index], self.match_offsets[index + 1]
+            subset.match_types.extend(self.match_types[start:end])
+            subset.match_starts.extend(self.match_starts[start:end])
+            subset.match_ends.extend(self.match_ends[start:end])
+            subset.match_confidences.extend(self.match_confidences[start:end])
+            subset.match_validated.extend(self.match_validated[start:end])
+            subset.match_offsets.append(len(subset.match_types))
+
+        return subset
+
+    def filter(
+        self,
+        sensitivity: Optional[DataSensitivity] = None,
+        protection: Optional[ProtectionStatus] = None,
+        column: Optional[str] = None,
+        sensitive_type: Optional[SensitiveDataType] = None,
+    ) -> "ResultTable":
+        """
+        Filtra las celdas que cumplen todas las condiciones indicadas.
+
+        Ejemplo: ``table.filter(DataSensitivity.CRITICAL, ProtectionStatus.UNPROTECTED)``
+
+        Args:
+            sensitivity: Nivel de sensibilidad exigido
+            protection: Estado de protección exigido
+            column: Nombre de columna exigido
+            sensitive_type: Tipo de dato sensible que debe estar entre las coincidencias
+
+        Returns:
+            Nueva ResultTable con las celdas seleccionadas
+        """
+        selected: Iterable[int] = range(len(self))
+
+        if sensitivity is not None:
+            code = SENSITIVITY_CODES[sensitivity]
+            selected = [i for i in selected if self.sensitivity_codes[i] == code]
+        if protection is not None:
+            code = PROTECTION_CODES[protection]
+            selected = [i for i in selected if self.protection_codes[i] == code]
+        if column is not None:
+            if column not in self._column_ids:
+                return self.take([])
+            code = self._column_ids[column]
+            selected = [i for i in selected if self.column_ids[i] == code]
+        if sensitive_type is not None:
+            code = SENSITIVE_TYPE_CODES[sensitive_type]
+            offsets, types = self.match_offsets, self.match_types
+            selected = [i for i in selected if code in types[offsets[i] : offsets[i + 1]]]
+
+        return self.take(selected)
+
+    def group_counts(self, by: str) -> Dict[str, int]:
+        """
+        Cuenta las celdas por grupo.
+
+        Args:
+            by: "sensitivity", "protection", "column", "hash_type" o
+                "sensitive_type" (este último cuenta coincidencias, no celdas)
+
+        Returns:
+            Diccionario etiqueta -> cantidad, en orden de primera aparición
+
+        Raises:
+            ValueError: Si la clave de agrupación no es válida
+        """
+        if by == "sensitivity":
+            return {SENSITIVITY_LEVELS[code].value: n for code, n in Counter(self.sensitivity_codes).items()}
+        if by == "protection":
+            return {PROTECTION_STATUSES[code].value: n for code, n in Counter(self.protection_codes).items()}
+        if by == "column":
+            return {self.columns[code]: n for code, n in Counter(self.column_ids).items()}
+        if by == "hash_type":
+            return {HASH_TYPES[code].value: n for code, n in Counter(self.hash_type_codes).items() if code != NO_HASH}
+        if by == "sensitive_type":
+            return {SENSITIVE_TYPES[code].value: n for code, n in Counter(self.match_types).items()}
+        raise ValueError(f"Agrupación desconocida '{by}'. Disponibles: {', '.join(GROUP_KEYS)}")
+
+    def generate_report(self) -> Dict[str, Any]:
+        """
+        Genera el reporte resumen del lote.
+
+        Returns:
+            Diccionario con la misma estructura que CrypticAnalyzer.generate_report
+        """
+        total_items = len(self)
+        protection_counts = Counter(self.protection_codes)
+        protected_count = protection_counts[PROTECTION_CODES[ProtectionStatus.PROTECTED]]
+        unprotected_count = protection_counts[PROTECTION_CODES[ProtectionStatus.UNPROTECTED]]
+
+        recommendations = []
+        if unprotected_count > 0:
+            recommendations.append(f"Se encontraron {unprotected_count} elementos sin protección")
+        if protected_count == total_items:
+            recommendations.append("Todos los elementos analizados están protegidos")
+
+        return {
+            "total_analyzed": total_items,
+            "protected": protected_count,
+            "unprotected": unprotected_count,
+            "protection_rate": protected_count / total_items if total_items > 0 else 0,
+            "hash_types_detected": self.group_counts("hash_type"),
+            "recommendations": recommendations,
+            "timestamp": None,
+        }
+
+    def distinct_rows(self) -> int:
+        """Cantidad de filas distintas con al menos una celda analizada"""
+        return len(set(self.rows))
+
+    def iter_records(self, fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre las celdas como registros del reporte de batch.
+
+        Args:
+            fields: Campos a incluir (por defecto, todos incluidas las coincidencias)
+
+        Yields:
+            Diccionario por celda con row, column, original_data, sensitivity_level,
+            protection_status, confidence y sensitive_matches
+        """
+        include_matches = fields is None or "sensitive_matches" in fields
+        for index in range(len(self)):
+            record: Dict[str, Any] = {
+                "row": self.rows[index],
+                "column": self.columns[self.column_ids[index]],
+                "original_data": self.values[index],
+                "sensitivity_level": SENSITIVITY_LEVELS[self.sensitivity_codes[index]].value,
+                "protection_status": PROTECTION_STATUSES[self.protection_codes[index]].value,
+                "confidence": self.confidences[index],
+            }
+            if include_matches:
+                record["sensitive_matches"] = [
+                    {"type": data_type.value, "text": text, "confidence": confidence, "validated": validated}
+                    for data_type, text, confidence, validated in self.matches(index)
+                ]
+            if fields is not None:
+                record = {key: record[key] for key in fields}
+            yield record
+
+    def write_jsonl(self, output: IO[str]) -> None:
+        """Escribe un registro JSON por celda"""
+        for record in self.iter_records():
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def write_csv(self, output: IO[str]) -> None:
+        """Escribe las celdas en CSV (abrir la salida con newline="")"""
+        writer = csv.writer(output)
+        writer.writerow(CSV_FIELDNAMES)
+        for index in range(len(self)):
+            writer.writerow(
+                [
+                    self.rows[index],
+                    self.columns[self.column_ids[index]],
+                    self.values[index],
+                    SENSITIVITY_LEVELS[self.sensitivity_codes[index]].value,
+                    PROTECTION_STATUSES[self.protection_codes[index]].value,
+                    self.confidences[index],
+                    "; ".join(data_type.value for data_type, _, _, _ in self.matches(index)),
+                ]
+            )
@@ -0,0 +1,333 @@
+"""
+Clasificación de columnas por muestreo con detención temprana.
+
+Este módulo clasifica cada columna de un archivo (por ejemplo "bcrypt,
+Protegido") analizando solo una muestra aleatoria de sus valores. El
+análisis de una columna se detiene en cuanto una proporción configurable
+de las últimas N muestras coincide en la misma clasificación, de modo que
+archivos con cientos de millones de filas se clasifican en segundos.
+
+Estrategias:
+- "random": acceso directo a posiciones aleatorias del archivo, sin leerlo
+  completo (solo archivos sin comprimir). Un muestreo por rechazo corrige
+  el peso del largo de cada línea, de modo que las filas se sortean de forma
+  uniforme y con reemplazo, como supone la cota de Wilson. Cada columna
+  del encabezado recibe muestras hasta resolverse o agotar los sorteos,
+  aunque esté vacía en la mayoría de las filas
+- "reservoir": una lectura secuencial que conserva una muestra de
+  reservorio acotada por columna, analizada luego en orden aleatorio
+"""
+
+import math
+import random
+from collections import Counter, deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from cryptic.core.aggregate import TEXT_COLUMN, ReservoirSample
+from cryptic.core.analyzer import DataAnalysis
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+SAMPLE_STRATEGIES = ("random", "reservoir")
+
+# Proporción de las últimas muestras que debe coincidir para detener una columna
+DEFAULT_CONFIDENCE = 0.99
+
+# Cantidad de muestras recientes consideradas para la detención
+DEFAULT_WINDOW = 100
+
+# Máximo de muestras analizadas por columna
+DEFAULT_MAX_SAMPLES = 10_000
+
+# Archivos menores se muestrean con reservorio aunque se pida "random": leerlos
+# completos es barato y evita repetir filas al muestrear con reemplazo
+RANDOM_MIN_BYTES = 1_000_000
+
+# Máximo de filas sorteadas por cada muestra pedida en la estrategia "random",
+# para terminar aunque una columna esté mayormente vacía
+RANDOM_DRAWS_PER_SAMPLE = 2
+
+# Valor z del intervalo de Wilson reportado (95%)
+WILSON_Z = 1.96
+
+NO_FINDING = "Sin datos sensibles"
+
+# Forma en que cada estrategia elige las filas, incluida en el reporte
+ROW_SELECTION = {
+    "random": "Uniforme con reemplazo (acceso directo con rechazo por largo de línea)",
+    "reservoir": "Uniforme sin reemplazo (una lectura secuencial)",
+}
+
+
+def classify_analysis(analysis: DataAnalysis) -> Tuple[str, str]:
+    """
+    Clasifica un análisis en (tipo de dato, estado de protección).
+
+    Args:
+        analysis: Resultado del análisis de una celda
+
+    Returns:
+        Tupla con el tipo de hash más probable, el primer tipo de dato sensible
+        detectado o NO_FINDING, y el estado de protección
+    """
+    if analysis.hash_analysis and analysis.hash_analysis.possible_types:
+        kind = analysis.hash_analysis.possible_types[0][0].value
+    elif analysis.sensitive_analysis and analysis.sensitive_analysis.matches:
+        kind = analysis.sensitive_analysis.matches[0].data_type.value
+    else:
+        kind = NO_FINDING
+    return kind, analysis.protection_status.value
+
+
+def wilson_lower_bound(successes: int, total: int, z: float = WILSON_Z) -> float:
+    """
+    Cota inferior del intervalo de Wilson para una proporción.
+
+    Args:
+        successes: Cantidad de aciertos
+        total: Cantidad de observaciones
+        z: Valor z del nivel de confianza
+
+    Returns:
+        Cota inferior entre 0 y 1 (0 si no hay observaciones)
+    """
+    if total == 0:
+        return 0.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    center = p + z * z / (2 * total)
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total))
+    return max(0.0, (center - margin) / denominator)
+
+
+class ColumnSampler:
+    """
+    Estado de muestreo de una columna.
+
+    Mantiene los conteos de todas las clasificaciones observadas y los de
+    una ventana deslizante con las últimas ``window`` muestras.
+    """
+
+    def __init__(
+        self, confidence: float = DEFAULT_CONFIDENCE, window: int = DEFAULT_WINDOW, max_samples: int = DEFAULT_MAX_SAMPLES
+    ) -> None:
+        """
+        Inicializa el muestreo de una columna.
+
+        Args:
+            confidence: Proporción de la ventana que debe coincidir para detenerse
+            window: Cantidad de muestras recientes consideradas
+            max_samples: Máximo de muestras a analizar
+        """
+        self.confidence = confidence
+        self.window = window
+        self.max_samples = max_samples
+        self.counts: Counter = Counter()
+        self.recent: Deque[Tuple[str, str]] = deque()
+        self.recent_counts: Counter = Counter()
+        self.converged = False
+
+    @property
+    def samples(self) -> int:
+        """Cantidad de muestras analizadas"""
+        return sum(self.counts.values())
+
+    @property
+    def done(self) -> bool:
+        """Si la columna ya no necesita más muestras"""
+        return self.converged or self.samples >= self.max_samples
+
+    def agreement(self) -> Tuple[Optional[Tuple[str, str]], float]:
+        """Clasificación dominante de la ventana y la proporción que la comparte"""
+        if not self.recent:
+            return None, 0.0
+        label, count = self.recent_counts.most_common(1)[0]
+        return label, count / len(self.recent)
+
+    def add(self, analysis: DataAnalysis) -> bool:
+        """
+        Incorpora el análisis de una muestra.
+
+        Args:
+            analysis: Resultado del análisis del valor muestreado
+
+        Returns:
+            True si la columna alcanzó la confianza pedida
+        """
+        label = classify_analysis(analysis)
+        self.counts[label] += 1
+        self.recent.append(label)
+        self.recent_counts[label] += 1
+        if len(self.recent) > self.window:
+            self.recent_counts[self.recent.popleft()] -= 1
+
+        if len(self.recent) == self.window and self.agreement()[1] >= self.confidence:
+            self.converged = True
+        return self.converged
+
+    def result(self, population: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Construye el resultado de la columna.
+
+        Args:
+            population: Cantidad total de valores de la columna, si se conoce
+
+        Returns:
+            Diccionario con la clasificación, el tamaño de la muestra, la
+            proporción de acuerdo y la cota inferior de Wilson de la proporción
+        """
+        label, agreement = self.agreement()
+        if not self.converged and self.counts:
+            label = self.counts.most_common(1)[0][0]
+
+        samples = self.samples
+        share = self.counts[label] / samples if label and samples else 0.0
+        return {
+            "classification": ", ".join(label) if label else None,
+            "data_type": label[0] if label else None,
+            "protection_status": label[1] if label else None,
+            "converged": self.converged,
+            "sample_size": samples,
+            "population": population,
+            "agreement": agreement,
+            "proportion": share,
+            "proportion_lower_bound": wilson_lower_bound(self.counts[label], samples) if label else 0.0,
+            "classifications": {", ".join(key): count for key, count in self.counts.most_common()},
+        }
+
+
+def _reservoir_samples(
+    path: Path, column: Optional[str], max_samples: int, rng: random.Random
+) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+    """Lee el archivo una vez y retorna una muestra barajada por columna y el total de valores por columna"""
+    from cryptic.utils.files import iter_cells
+
+    reservoirs: Dict[str, ReservoirSample[str]] = {}
+    for _, column_name, value in iter_cells(path, column):
+        name = column_name or TEXT_COLUMN
+        reservoir = reservoirs.get(name)
+        if reservoir is None:
+            reservoir = reservoirs[name] = ReservoirSample(max_samples, rng)
+        reservoir.add(value)
+
+    samples: Dict[str, List[str]] = {}
+    for name, reservoir in reservoirs.items():
+        rng.shuffle(reservoir.items)
+        samples[name] = reservoir.items
+    return samples, {name: reservoir.seen for name, reservoir in reservoirs.items()}
+
+
+def _random_columns(path: Path, column: Optional[str]) -> List[str]:
+    """Columnas a resolver con la estrategia random: las del encabezado CSV o la columna de texto"""
+    from cryptic.utils.files import input_suffix, read_csv_header
+
+    if input_suffix(path) != ".csv":
+        return [TEXT_COLUMN]
+    with open(path, "rb") as f:
+        header = read_csv_header(f)
+    return list(dict.fromkeys(name for name in header if column is None or name == column))
+
+
+def _iter_random_samples(path: Path, column: Optional[str], max_draws: int, rng: random.Random) -> Iterator[Tuple[str, str]]:
+    """Sortea hasta max_draws filas por acceso directo al archivo y recorre sus valores"""
+    from cryptic.utils.files import iter_random_rows
+
+    rows = iter_random_rows(path, rng, column)
+    for _ in range(max_draws):
+        cells = next(rows, None)
+        if cells is None:
+            return
+        for column_name, value in cells:
+            yield column_name or TEXT_COLUMN, value
+
+
+def sample_file(
+    analyzer: "CrypticAnalyzer",
+    path: Path,
+    column: Optional[str] = None,
+    strategy: str = "random",
+    confidence: float = DEFAULT_CONFIDENCE,
+    window: int = DEFAULT_WINDOW,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Clasifica las columnas de un archivo CSV o de texto por muestreo.
+
+    Args:
+        analyzer: Analizador a utilizar
+        path: Archivo a muestrear
+        column: Columna específica a clasificar (solo CSV)
+        strategy: "random" o "reservoir" (ver SAMPLE_STRATEGIES)
+        confidence: Proporción de las últimas muestras que debe coincidir para detener una columna
+        window: Cantidad de muestras recientes consideradas
+        max_samples: Máximo de muestras analizadas por columna
+        seed: Semilla del muestreo
+
+    Returns:
+        Diccionario con la estrategia usada, la forma de elegir las filas
+        (ver ROW_SELECTION), los parámetros y el resultado por columna con
+        al menos una muestra
+
+    Raises:
+        ValueError: Si la estrategia o los parámetros no son válidos
+    """
+    from cryptic.utils.files import file_compression
+
+    if strategy not in SAMPLE_STRATEGIES:
+        raise ValueError(f"Estrategia de muestreo desconocida '{strategy}'. Disponibles: {', '.join(SAMPLE_STRATEGIES)}")
+    if not 0 < confidence <= 1:
+        raise ValueError("La confianza debe estar entre 0 y 1")
+    if window < 1 or max_samples < window:
+        raise ValueError("La ventana debe ser positiva y no mayor que el máximo de muestras")
+
+    rng = random.Random(seed)
+    if strategy == "random" and (file_compression(path) or Path(path).stat().st_size < RANDOM_MIN_BYTES):
+        strategy = "reservoir"
+
+    samplers: Dict[str, ColumnSampler] = {}
+    population: Dict[str, int] = {}
+
+    def sampler_for(name: str) -> ColumnSampler:
+        sampler = samplers.get(name)
+        if sampler is None:
+            sampler = samplers[name] = ColumnSampler(confidence, window, max_samples)
+        return sampler
+
+    if strategy == "reservoir":
+        samples, population = _reservoir_samples(path, column, max_samples, rng)
+        for name, values in samples.items():
+            sampler = sampler_for(name)
+            for value in values:
+                if sampler.add(analyzer.analyze_data(value)):
+                    break
+    else:
+        # Todas las columnas del encabezado se registran de antemano: una columna
+        # vacía en la mayoría de las filas sigue recibiendo muestras aunque las
+        # demás ya estén resueltas, hasta resolverse o agotar los sorteos
+        names = _random_columns(path, column)
+        active = set(names)
+        for name in names:
+            sampler_for(name)
+        for name, value in _iter_random_samples(path, column, max_samples * RANDOM_DRAWS_PER_SAMPLE, rng):
+            if name not in active:
+                continue
+
+            sampler = samplers[name]
+            sampler.add(analyzer.analyze_data(value))
+            if sampler.done:
+                active.discard(name)
+                if not active:
+                    break
+
+    return {
+        "strategy": strategy,
+        "row_selection": ROW_SELECTION[strategy],
+        "confidence": confidence,
+        "window": window,
+        "max_samples": max_samples,
+        "seed": seed,
+        "columns": {name: sampler.result(population.get(name)) for name, sampler in samplers.items() if sampler.samples},
+    }
@@ -0,0 +1,435 @@
+"""
+Escaneo recursivo de directorios para Cryptic.
+
+Este módulo recorre árboles de archivos (CSV, texto, JSON y logs), descarta
+archivos binarios y reparte el análisis entre un pool de procesos (o de
+hilos o subintérpretes, ver ``cryptic.core.backends``), agregando los
+resultados en un único reporte con secciones por archivo.
+"""
+
+import json
+import lzma
+import os
+import time
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from cryptic.core.analyzer import CrypticAnalyzer, ProtectionStatus
+from cryptic.core.backends import (
+    BACKEND_PROCESS,
+    BACKEND_SUBINTERPRETER,
+    BACKEND_THREAD,
+    BACKENDS,
+    create_executor,
+    prewarmed_context,
+)
+from cryptic.utils.files import is_binary_file, iter_file_values, iter_files
+
+if TYPE_CHECKING:
+    from cryptic.core.manifest import ScanManifest
+
+# Patrones de archivos incluidos por defecto en un escaneo (también comprimidos)
+_BASE_INCLUDE_PATTERNS = ("*.csv", "*.txt", "*.json", "*.log")
+DEFAULT_INCLUDE_PATTERNS = (
+    _BASE_INCLUDE_PATTERNS
+    + tuple(f"{pattern}{suffix}" for pattern in _BASE_INCLUDE_PATTERNS for suffix in (".gz", ".bz2", ".xz"))
+    + ("*.zip",)
+)
+
+# Ejemplos de datos sensibles conservados por archivo
+DEFAULT_MAX_FINDINGS = 5
+
+# Analizador reutilizado por cada proceso worker
+_WORKER_ANALYZER: Optional[CrypticAnalyzer] = None
+
+
+@dataclass
+class FileScanResult:
+    """
+    Resultado agregado del análisis de un archivo.
+
+    Attributes:
+        path: Ruta del archivo analizado
+        size_bytes: Tamaño del archivo en bytes
+        total_analyzed: Cantidad de valores analizados
+        protected: Valores identificados como protegidos
+        unprotected: Valores sensibles sin protección
+        sensitive_elements: Valores con al menos un dato sensible
+        sensitive_by_type: Conteo de coincidencias por tipo de dato sensible
+        hash_types_detected: Conteo de valores por tipo de hash
+        findings: Ejemplos de datos sensibles encontrados (acotados)
+        elapsed_ms: Tiempo de procesamiento del archivo en milisegundos
+        error: Mensaje de error si el archivo no pudo procesarse
+        content_hash: Huella del contenido (solo si se solicitó)
+        from_manifest: Si el resultado se reutilizó desde un manifiesto
+    """
+
+    path: str
+    size_bytes: int
+    total_analyzed: int = 0
+    protected: int = 0
+    unprotected: int = 0
+    sensitive_elements: int = 0
+    sensitive_by_type: Dict[str, int] = field(default_factory=dict)
+    hash_types_detected: Dict[str, int] = field(default_factory=dict)
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+    content_hash: Optional[str] = None
+    from_manifest: bool = False
+
+    @property
+    def protection_rate(self) -> float:
+        """Proporción de valores protegidos sobre el total analizado"""
+        return self.protected / self.total_analyzed if self.total_analyzed > 0 else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el resultado en un diccionario serializable"""
+        return {
+            "path": self.path,
+            "size_bytes": self.size_bytes,
+            "total_analyzed": self.total_analyzed,
+            "protected": self.protected,
+            "unprotected": self.unprotected,
+            "protection_rate": self.protection_rate,
+            "sensitive_elements": self.sensitive_elements,
+            "sensitive_by_type": self.sensitive_by_type,
+            "hash_types_detected": self.hash_types_detected,
+            "findings": self.findings,
+            "elapsed_ms": self.elapsed_ms,
+            "error": self.error,
+            "from_manifest": self.from_manifest,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileScanResult":
+        """Reconstruye un resultado desde su forma serializada (ignora campos derivados)"""
+        known_fields = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known_fields})
+
+
+@dataclass
+class ScanReport:
+    """
+    Reporte agregado de un escaneo de directorio.
+
+    Attributes:
+        root: Directorio raíz escaneado
+        files: Resultados por archivo, ordenados por ruta
+        skipped_binary: Archivos descartados por ser binarios
+        elapsed_ms: Tiempo total del escaneo en milisegundos
+    """
+
+    root: str
+    files: List[FileScanResult]
+    skipped_binary: List[str]
+    elapsed_ms: float
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Genera el resumen global del escaneo.
+
+        Returns:
+            Diccionario con estadísticas agregadas de todos los archivos
+        """
+        total = sum(f.total_analyzed for f in self.files)
+        protected = sum(f.protected for f in self.files)
+
+        sensitive_by_type: Dict[str, int] = {}
+        hash_types: Dict[str, int] = {}
+        for file_result in self.files:
+            for data_type, count in file_result.sensitive_by_type.items():
+                sensitive_by_type[data_type] = sensitive_by_type.get(data_type, 0) + count
+            for hash_type, count in file_result.hash_types_detected.items():
+                hash_types[hash_type] = hash_types.get(hash_type, 0) + count
+
+        return {
+            "files_scanned": len(self.files),
+            "files_skipped_binary": len(self.skipped_binary),
+            "files_failed": sum(1 for f in self.files if f.error),
+            "files_from_manifest": sum(1 for f in self.files if f.from_manifest),
+            "total_analyzed": total,
+            "protected": protected,
+            "unprotected": sum(f.unprotected for f in self.files),
+            "protection_rate": protected / total if total > 0 else 0,
+            "sensitive_elements": sum(f.sensitive_elements for f in self.files),
+            "sensitive_by_type": sensitive_by_type,
+            "hash_types_detected": hash_types,
+            "elapsed_ms": self.elapsed_ms,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el reporte en un diccionario serializable"""
+        return {
+            "root": self.root,
+            "summary": self.summary(),
+            "files": [f.to_dict() for f in self.files],
+            "skipped_binary": self.skipped_binary,
+        }
+
+
+def _init_worker(cache_path: Optional[Union[str, Path]] = None) -> None:
+    """Construye el analizador una sola vez por proceso worker"""
+    global _WORKER_ANALYZER
+
+    cache = None
+    if cache_path is not None:
+        from cryptic.core.cache import AnalysisCache
+
+        cache = AnalysisCache(Path(cache_path))
+
+    _WORKER_ANALYZER = CrypticAnalyzer(cache=cache)
+
+
+def _get_worker_analyzer() -> CrypticAnalyzer:
+    """Retorna el analizador del proceso actual, creándolo si es necesario"""
+    if _WORKER_ANALYZER is None:
+        _init_worker()
+    assert _WORKER_ANALYZER is not None
+    return _WORKER_ANALYZER
+
+
+def scan_file(
+    path: Path,
+    size_bytes: int,
+    column: Optional[str] = None,
+    max_findings: int = DEFAULT_MAX_FINDINGS,
+    compute_hash: bool = False,
+) -> FileScanResult:
+    """
+    Analiza un archivo completo acumulando solo estadísticas agregadas.
+
+    Args:
+        path: Archivo a analizar
+        size_bytes: Tamaño del archivo en bytes
+        column: Columna específica a analizar (solo CSV)
+        max_findings: Cantidad máxima de ejemplos de datos sensibles a conservar
+        compute_hash: Si calcular la huella del contenido (para manifiestos)
+
+    Returns:
+        FileScanResult con el resumen del archivo
+    """
+    start_time = time.perf_counter()
+    result = FileScanResult(path=str(path), size_bytes=size_bytes)
+    analyzer = _get_worker_analyzer()
+
+    hashes: List[str] = []
+    try:
+        # La huella se calcula con los mismos bytes analizados, sin una segunda lectura
+        for location, value in iter_file_values(path, column, hashes.append if compute_hash else None):
+            analysis = analyzer.analyze_data(value)
+            result.total_analyzed += 1
+
+            if analysis.protection_status == ProtectionStatus.PROTECTED:
+                result.protected += 1
+            elif analysis.protection_status == ProtectionStatus.UNPROTECTED:
+                result.unprotected += 1
+
+            if analysis.hash_analysis and analysis.hash_analysis.possible_types:
+                hash_type = analysis.hash_analysis.possible_types[0][0].value
+                result.hash_types_detected[hash_type] = result.hash_types_detected.get(hash_type, 0) + 1
+
+            if analysis.sensitive_analysis and analysis.sensitive_analysis.matches:
+                result.sensitive_elements += 1
+                for match in analysis.sensitive_analysis.matches:
+                    data_type = match.data_type.value
+                    result.sensitive_by_type[data_type] = result.sensitive_by_type.get(data_type, 0) + 1
+
+                    if len(result.findings) < max_findings:
+                        result.findings.append(
+                            {
+                                "location": location,
+                                "type": data_type,
+                                "text": match.matched_text,
+                                "validated": match.is_validated,
+                            }
+                        )
+
+        if hashes:
+            result.content_hash = hashes[0]
+    except (OSError, EOFError, UnicodeError, ValueError, zipfile.BadZipFile, lzma.LZMAError) as e:
+        result.error = str(e)
+
+    if analyzer.cache is not None:
+        analyzer.cache.flush()
+
+    result.elapsed_ms = (time.perf_counter() - start_time) * 1000
+    return result
+
+
+def scan_file_encoded(request: bytes) -> bytes:
+    """
+    Variante de scan_file con argumentos y resultado en bytes, para subintérpretes.
+
+    Args:
+        request: JSON con [ruta, tamaño, columna, max_findings, compute_hash]
+
+    Returns:
+        JSON del FileScanResult (incluida su huella de contenido)
+    """
+    path, size_bytes, column, max_findings, compute_hash = json.loads(request)
+    result = scan_file(Path(path), size_bytes, column, max_findings, compute_hash)
+    return json.dumps({**result.to_dict(), "content_hash": result.content_hash}).encode("utf-8")
+
+
+def scan_directory(
+    root: Path,
+    include: Optional[Sequence[str]] = None,
+    exclude: Sequence[str] = (),
+    workers: Optional[int] = None,
+    column: Optional[str] = None,
+    max_findings: int = DEFAULT_MAX_FINDINGS,
+    progress: Optional[Callable[[FileScanResult], None]] = None,
+    manifest: Optional["ScanManifest"] = None,
+    cache_path: Optional[Path] = None,
+    backend: str = BACKEND_PROCESS,
+) -> ScanReport:
+    """
+    Escanea recursivamente un directorio y agrega los resultados.
+
+    Los archivos se reparten entre un pool de procesos, comenzando por los
+    más grandes para limitar la latencia de cola. Los procesos se bifurcan
+    desde un fork server con los patrones ya compilados, y cada worker
+    construye su analizador una sola vez y lo reutiliza para todos sus
+    archivos. Con el backend de hilos todos comparten un único analizador;
+    con el de subintérpretes cada uno tiene el suyo, y solicitudes y
+    resultados viajan como JSON.
+
+    Si se entrega un manifiesto, los archivos sin cambios desde el escaneo
+    anterior no se vuelven a analizar: se reutiliza su resultado almacenado.
+
+    Args:
+        root: Directorio raíz a escanear
+        include: Patrones glob a incluir (por defecto CSV, TXT, JSON y logs)
+        exclude: Patrones glob a excluir
+        workers: Cantidad de procesos (por defecto, número de CPUs)
+        column: Columna específica a analizar en archivos CSV
+        max_findings: Ejemplos de datos sensibles a conservar por archivo
+        progress: Callback invocado al completar cada archivo
+        manifest: Manifiesto de huellas para escaneos incrementales; al terminar se
+            eliminan sus filas de archivos bajo root que ya no se encontraron
+        cache_path: Caché persistente de análisis compartida por los workers
+        backend: Backend de ejecución (uno de BACKENDS; por defecto, procesos). Los
+            procesos se bifurcan desde el fork server del proceso, al que se agrega
+            la precarga de Cryptic si aún no está en ejecución (ver prewarmed_context)
+
+    Returns:
+        ScanReport con secciones por archivo y resumen global
+
+    Raises:
+        ValueError: Si el backend no existe
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend} (opciones: {', '.join(BACKENDS)})")
+    start_time = time.perf_counter()
+    include_patterns = tuple(include) if include else DEFAULT_INCLUDE_PATTERNS
+    if manifest is not None:
+        manifest.start_run()
+
+    results: List[FileScanResult] = []
+    scheduled: List[Tuple[Path, int, int]] = []
+    skipped_binary: List[str] = []
+
+    def _fail(path: Path, size_bytes: int, error: Exception) -> None:
+        # Un archivo eliminado, ilegible o corrupto no detiene el escaneo
+        file_result = FileScanResult(path=str(path), size_bytes=size_bytes, error=str(error))
+        results.append(file_result)
+        if progress:
+            progress(file_result)
+
+    for path in iter_files(root, include_patterns, exclude):
+        try:
+            stat = path.stat()
+        except OSError as e:
+            _fail(path, 0, e)
+            continue
+
+        if manifest is not None:
+            stored_result = manifest.lookup(path, stat.st_size, stat.st_mtime_ns)
+            if stored_result is not None:
+                results.append(stored_result)
+                if progress:
+                    progress(stored_result)
+                continue
+
+        try:
+            binary = is_binary_file(path)
+        except (OSError, EOFError, ValueError, zipfile.BadZipFile, lzma.LZMAError) as e:
+            _fail(path, stat.st_size, e)
+            continue
+
+        if binary:
+            skipped_binary.append(str(path))
+        else:
+            scheduled.append((path, stat.st_size, stat.st_mtime_ns))
+
+    # Los archivos más grandes primero para limitar la latencia de cola
+    scheduled.sort(key=lambda item: (-item[1], str(item[0])))
+    stamps = {str(path): (size, mtime_ns) for path, size, mtime_ns in scheduled}
+    compute_hash = manifest is not None
+    max_workers = min(workers or os.cpu_count() or 1, len(scheduled))
+
+    def _collect(file_result: FileScanResult) -> None:
+        results.append(file_result)
+        if manifest is not None:
+            size, mtime_ns = stamps[file_result.path]
+            # Un archivo modificado durante el escaneo no se registra: su resultado
+            # podría no corresponder al tamaño y la fecha tomados al planificarlo
+            try:
+                current = os.stat(file_result.path)
+            except OSError:
+                current = None
+            if current is not None and (current.st_size, current.st_mtime_ns) == (size, mtime_ns):
+                manifest.record(Path(file_result.path), size, mtime_ns, file_result)
+        if progress:
+            progress(file_result)
+
+    if max_workers <= 1:
+        _init_worker(cache_path)
+        for path, size, _ in scheduled:
+            _collect(scan_file(path, size, column, max_findings, compute_hash))
+    elif backend == BACKEND_SUBINTERPRETER:
+        # Los subintérpretes solo comparten tipos simples: la ruta de la caché viaja como str
+        initargs = (None if cache_path is None else str(cache_path),)
+        with create_executor(backend, max_workers, _init_worker, initargs) as executor:
+            futures = [
+                executor.submit(
+                    scan_file_encoded, json.dumps([str(path), size, column, max_findings, compute_hash]).encode("utf-8")
+                )
+                for path, size, _ in scheduled
+            ]
+            for future in as_completed(futures):
+                _collect(FileScanResult.from_dict(json.loads(future.result())))
+    else:
+        pool: Executor
+        if backend == BACKEND_THREAD:
+            # Los hilos comparten el analizador del proceso actual
+            _init_worker(cache_path)
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cryptic-scan")
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=prewarmed_context(),
+                initializer=_init_worker,
+                initargs=(cache_path,),
+            )
+        with pool:
+            futures = [pool.submit(scan_file, path, size, column, max_findings, compute_hash) for path, size, _ in scheduled]
+            for future in as_completed(futures):
+                _collect(future.result())
+
+    if manifest is not None:
+        manifest.prune(root)
+        manifest.commit()
+
+    results.sort(key=lambda r: r.path)
+
+    return ScanReport(
+        root=str(root),
+        files=results,
+        skipped_binary=skipped_binary,
+        elapsed_ms=(time.perf_counter() - start_time) * 1000,
+    )
@@ -8,14 +8,20 @@ información sensible utilizando patrones regex y validaciones específicas.
 import re
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from cryptic.core.hooks import AnalysisHooks, combine_hooks
+from cryptic.core.timings import STAGE_OVERLAPS, STAGE_SENSITIVE_PREFIX, STAGE_SENSITIVE_SUMMARY, StageTimings
 from cryptic.patterns.sensitive_patterns import (
     SensitiveDataType,
     SensitivePattern,
     get_compiled_patterns,
     get_sensitive_patterns,
 )
+from cryptic.utils.features import ValueFeatures, extract_features
+
+if TYPE_CHECKING:
+    from cryptic.core.metrics import MetricsRegistry
 
 
 @dataclass
@@ -72,32 +78,148 @@ class SensitiveDataDetector:
     información sensible como emails, RUTs, tarjetas de crédito, etc.
     """
 
-    def __init__(self) -> None:
-        """Inicializa el detector con los patrones configurados"""
-        self.patterns = get_sensitive_patterns()
-        self.compiled_patterns = get_compiled_patterns()
-        self._sensitivity_hierarchy = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1, "NONE": 0}
+    def __init__(
+        self,
+        prefilter: bool = True,
+        metrics: Optional["MetricsRegistry"] = None,
+        timings: Optional[StageTimings] = None,
+        hooks: Optional[AnalysisHooks] = None,
+    ) -> None:
+        """
+        Inicializa el detector; los patrones se construyen en el primer uso.
 
-    def detect(self, text: str) -> SensitiveAnalysis:
+        Args:
+            prefilter: Omitir los patrones cuyos conteos mínimos de caracteres
+                (``SensitivePattern.requires``) el valor no alcanza
+            metrics: Registro opcional donde contar ejecuciones, coincidencias y
+                validaciones fallidas por patrón y la latencia de ``detect``
+            timings: Desglose opcional donde acumular el tiempo de cada patrón,
+                de la resolución de solapamientos y de las recomendaciones
+            hooks: Hooks opcionales invocados alrededor de esas mismas etapas
+                (ver cryptic.core.hooks)
+        """
+        self._patterns: Optional[List[SensitivePattern]] = None
+        self.prefilter = prefilter
+        self._sensitivity_hierarchy = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1, "NONE": 0}
+        self.metrics = metrics
+        self.timings = timings
+        self.hooks = hooks
+        # Desglose y hooks se invocan igual: una sola comparación con None por etapa
+        self._stage_hooks = combine_hooks(timings, hooks)
+        if metrics is not None:
+            from cryptic.core.metrics import pattern_metrics
+
+            self._pattern_executions, self._pattern_hits = pattern_metrics(metrics)
+            self._validation_failures = metrics.counter(
+                "cryptic_validation_failures_total", "Coincidencias que no pasaron la validación de su tipo", ("pattern",)
+            )
+            self._detect_seconds = metrics.histogram("cryptic_detect_duration_seconds", "Latencia de detect (segundos)")
+
+    @property
+    def patterns(self) -> List[SensitivePattern]:
+        """Patrones de datos sensibles, construidos la primera vez que se consultan"""
+        patterns = self._patterns
+        if patterns is None:
+            # Si dos hilos llegan a la vez, ambos construyen y publican una lista completa
+            patterns = self._patterns = get_sensitive_patterns()
+        return patterns
+
+    @patterns.setter
+    def patterns(self, patterns: List[SensitivePattern]) -> None:
+        self._patterns = patterns
+
+    @property
+    def compiled_patterns(self) -> Dict[str, re.Pattern]:
+        """Regex compiladas por tipo de dato (caché compartida del módulo de patrones)"""
+        return get_compiled_patterns()
+
+    def detect(
+        self, text: str, patterns: Optional[List[SensitivePattern]] = None, features: Optional[ValueFeatures] = None
+    ) -> SensitiveAnalysis:
         """
         Detecta datos sensibles en un texto.
 
         Args:
             text: Texto a analizar
+            patterns: Subconjunto de patrones a evaluar (por defecto, todos)
+            features: Características del texto ya calculadas (ver extract_features)
 
         Returns:
             SensitiveAnalysis con resultados de la detección
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        hooks = self._stage_hooks
         matches = []
 
         # Procesar cada patrón
-        for pattern in self.patterns:
-            pattern_matches = self._find_pattern_matches(text, pattern)
+        for pattern in self.candidate_patterns(text, patterns, features):
+            if hooks is None:
+                pattern_matches = self._find_pattern_matches(text, pattern)
+            else:
+                stage = STAGE_SENSITIVE_PREFIX + pattern.data_type.value
+                token = hooks.on_stage_start(stage)
+                stage_start = time.perf_counter_ns()
+                pattern_matches = self._find_pattern_matches(text, pattern)
+                hooks.on_stage_end(stage, token, time.perf_counter_ns() - stage_start)
             matches.extend(pattern_matches)
+            if self.metrics is not None:
+                self._record_pattern(pattern, pattern_matches)
 
         # Eliminar duplicados y solapamientos
+        token = hooks.on_stage_start(STAGE_OVERLAPS) if hooks is not None else None
+        stage_start = time.perf_counter_ns() if hooks is not None else 0
         matches = self._remove_overlapping_matches(matches)
+        if hooks is not None:
+            hooks.on_stage_end(STAGE_OVERLAPS, token, time.perf_counter_ns() - stage_start)
+
+        return self.build_analysis(text, matches, start_time)
+
+    def candidate_patterns(
+        self, text: str, patterns: Optional[List[SensitivePattern]] = None, features: Optional[ValueFeatures] = None
+    ) -> List[SensitivePattern]:
+        """
+        Filtra los patrones que pueden coincidir con un texto según sus características.
+
+        Args:
+            text: Texto a analizar
+            patterns: Patrones a considerar (por defecto, todos)
+            features: Características del texto ya calculadas
+
+        Returns:
+            Patrones cuya regex debe ejecutarse (todos si el prefiltro está desactivado)
+        """
+        patterns = self.patterns if patterns is None else patterns
+        if not self.prefilter:
+            return patterns
+        if features is None:
+            features = extract_features(text)
+        return [pattern for pattern in patterns if not pattern.requires or features.satisfies(pattern.requires)]
+
+    def _record_pattern(self, pattern: SensitivePattern, pattern_matches: List[SensitiveMatch]) -> None:
+        """Cuenta la ejecución de un patrón, sus coincidencias y sus validaciones fallidas"""
+        labels = ("sensitive", pattern.data_type.value)
+        self._pattern_executions.inc(1, labels)
+        if pattern_matches:
+            self._pattern_hits.inc(len(pattern_matches), labels)
+            failures = sum(1 for match in pattern_matches if not match.is_validated)
+            if failures:
+                self._validation_failures.inc(failures, (pattern.data_type.value,))
+
+    def build_analysis(self, text: str, matches: List[SensitiveMatch], start_time: float) -> SensitiveAnalysis:
+        """
+        Construye el resultado a partir de coincidencias ya filtradas.
+
+        Args:
+            text: Texto analizado
+            matches: Coincidencias sin solapamientos
+            start_time: Instante de inicio del análisis (time.perf_counter())
+
+        Returns:
+            SensitiveAnalysis con sensibilidad y recomendaciones
+        """
+        hooks = self._stage_hooks
+        token = hooks.on_stage_start(STAGE_SENSITIVE_SUMMARY) if hooks is not None else None
+        stage_start = time.perf_counter_ns() if hooks is not None else 0
 
         # Determinar mayor sensibilidad
         highest_sensitivity = self._get_highest_sensitivity(matches)
@@ -105,7 +227,13 @@ class SensitiveDataDetector:
         # Generar recomendaciones
         recommendations = self._generate_recommendations(matches)
 
-        analysis_time = (time.time() - start_time) * 1000  # Convertir a ms
+        if hooks is not None:
+            hooks.on_stage_end(STAGE_SENSITIVE_SUMMARY, token, time.perf_counter_ns() - stage_start)
+
+        elapsed = time.perf_counter() - start_time
+        if self.metrics is not None:
+            self._detect_seconds.observe(elapsed)
+        analysis_time = elapsed * 1000  # Convertir a ms
 
         return SensitiveAnalysis(
             original_text=text,
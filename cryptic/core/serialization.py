@@ -0,0 +1,145 @@
+"""
+Serialización compacta de resultados de análisis.
+
+Este módulo convierte un DataAnalysis en una representación binaria compacta
+(JSON posicional comprimido) y la reconstruye sin volver a ejecutar los
+patrones de detección. Los datos derivables del valor original, como los
+textos coincidentes o el análisis de charset, no se almacenan.
+"""
+
+import json
+import zlib
+from typing import Any, Dict, List, Optional, Union
+
+from cryptic.core.analyzer import DataAnalysis, DataSensitivity, ProtectionStatus
+from cryptic.core.hash_identifier import HashAnalysis
+from cryptic.core.sensitive_detector import SensitiveAnalysis, SensitiveMatch
+from cryptic.patterns.hash_patterns import HashType
+from cryptic.patterns.sensitive_patterns import SensitiveDataType, SensitivePattern, get_sensitive_patterns
+from cryptic.utils.formatters import analyze_charset, analyze_format, clean_hash
+
+# Versión del formato de serialización; cambiarla invalida datos previos
+SERIALIZATION_VERSION = 1
+
+# Patrones indexados por tipo de dato, construidos bajo demanda
+_PATTERNS_BY_TYPE: Optional[Dict[SensitiveDataType, SensitivePattern]] = None
+
+
+def _get_patterns_by_type() -> Dict[SensitiveDataType, SensitivePattern]:
+    """Retorna los patrones sensibles indexados por tipo de dato"""
+    global _PATTERNS_BY_TYPE
+
+    if _PATTERNS_BY_TYPE is None:
+        _PATTERNS_BY_TYPE = {pattern.data_type: pattern for pattern in get_sensitive_patterns()}
+
+    return _PATTERNS_BY_TYPE
+
+
+def encode_analysis(analysis: DataAnalysis) -> bytes:
+    """
+    Codifica un análisis en formato binario compacto.
+
+    Args:
+        analysis: Resultado de análisis a codificar
+
+    Returns:
+        Bytes con la representación compacta del análisis
+    """
+    data = analysis.original_data
+    hash_part: Optional[List[Any]] = None
+    sensitive_part: Optional[List[Any]] = None
+
+    if analysis.hash_analysis is not None:
+        hash_analysis = analysis.hash_analysis
+        hash_part = [
+            None if hash_analysis.raw_hash == data else hash_analysis.raw_hash,
+            [[hash_type.name, confidence] for hash_type, confidence in hash_analysis.possible_types],
+        ]
+
+    if analysis.sensitive_analysis is not None:
+        sensitive = analysis.sensitive_analysis
+        sensitive_part = [
+            sensitive.highest_sensitivity,
+            sensitive.analysis_time_ms,
+            sensitive.recommendations,
+            [
+                [match.data_type.name, match.start_pos, match.end_pos, match.confidence, match.is_validated]
+                for match in sensitive.matches
+            ],
+        ]
+
+    payload = [
+        analysis.sensitivity_level.name,
+        analysis.protection_status.name,
+        analysis.confidence,
+        analysis.recommendations,
+        hash_part,
+        sensitive_part,
+    ]
+    return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_analysis(payload: Union[bytes, memoryview], data: str) -> DataAnalysis:
+    """
+    Reconstruye un análisis desde su representación compacta.
+
+    Args:
+        payload: Bytes generados por encode_analysis (o una vista de memoria sobre ellos)
+        data: Valor original que produjo el análisis
+
+    Returns:
+        DataAnalysis equivalente al original (con analysis_time_ms en 0)
+    """
+    sensitivity_name, protection_name, confidence, recommendations, hash_part, sensitive_part = json.loads(
+        zlib.decompress(payload).decode("utf-8")
+    )
+
+    hash_analysis = None
+    if hash_part is not None:
+        raw_hash, possible_types = hash_part
+        raw_hash = data if raw_hash is None else raw_hash
+        cleaned_hash = clean_hash(raw_hash)
+        hash_analysis = HashAnalysis(
+            possible_types=[(HashType[name], type_confidence) for name, type_confidence in possible_types],
+            raw_hash=raw_hash,
+            cleaned_hash=cleaned_hash,
+            length=len(cleaned_hash),
+            charset_analysis=analyze_charset(cleaned_hash),
+            format_analysis=analyze_format(cleaned_hash),
+        )
+
+    sensitive_analysis = None
+    if sensitive_part is not None:
+        highest_sensitivity, time_ms, sensitive_recommendations, encoded_matches = sensitive_part
+        patterns_by_type = _get_patterns_by_type()
+        matches = [
+            SensitiveMatch(
+                data_type=SensitiveDataType[type_name],
+                matched_text=data[start:end],
+                start_pos=start,
+                end_pos=end,
+                confidence=match_confidence,
+                is_validated=is_validated,
+                pattern_used=patterns_by_type[SensitiveDataType[type_name]],
+            )
+            for type_name, start, end, match_confidence, is_validated in encoded_matches
+        ]
+        sensitive_analysis = SensitiveAnalysis(
+            original_text=data,
+            matches=matches,
+            highest_sensitivity=highest_sensitivity,
+            total_matches=len(matches),
+            analysis_time_ms=time_ms,
+            recommendations=sensitive_recommendations,
+        )
+
+    return DataAnalysis(
+        original_data=data,
+        sensitivity_level=DataSensitivity[sensitivity_name],
+        protection_status=ProtectionStatus[protection_name],
+        hash_analysis=hash_analysis,
+        sensitive_analysis=sensitive_analysis,
+        recommendations=recommendations,
+        confidence=confidence,
+        analysis_time_ms=0.0,
+    )
@@ -0,0 +1,183 @@
+"""
+Registro de valores lentos del análisis.
+
+Al estilo del slowlog de una base de datos, ``SlowLog`` conserva en un
+buffer circular acotado los valores cuyo análisis superó un umbral: largo,
+una vista previa (huella con clave o prefijo truncado), duración, tiempo de
+cada etapa (ver cryptic.core.timings) y el patrón sensible más lento.
+
+``CrypticAnalyzer`` lo alimenta cuando recibe un ``SlowLog``; la CLI lo
+guarda con ``--slowlog`` y ``cryptic serve`` lo publica en ``GET /slowlog``.
+
+Por defecto la vista previa es una huella BLAKE2b con una clave aleatoria
+por registro: permite reconocer el mismo valor dentro de un volcado sin
+escribir el dato sensible, pero no correlacionarlo entre volcados de
+distintos procesos.
+
+Ejemplo:
+    >>> slowlog = SlowLog(threshold_ms=0)
+    >>> analyzer = CrypticAnalyzer(slowlog=slowlog)
+    >>> _ = analyzer.analyze_data("juan@empresa.cl")
+    >>> slowlog.entries()[0].length
+    15
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from cryptic.core.timings import STAGE_OVERLAPS, STAGE_SENSITIVE_PREFIX, STAGE_SENSITIVE_SUMMARY
+
+# Umbral por defecto (milisegundos) a partir del cual un valor se registra
+DEFAULT_THRESHOLD_MS = 25.0
+
+# Entradas que conserva el buffer circular
+DEFAULT_MAX_ENTRIES = 128
+
+# Caracteres del valor incluidos en la vista previa truncada
+DEFAULT_PREVIEW_CHARS = 24
+
+# Modos de vista previa: huella con clave (por defecto) o prefijo del valor
+PREVIEW_MODES = ("hash", "truncate")
+
+
+@dataclass
+class SlowLogEntry:
+    """
+    Valor cuyo análisis superó el umbral del registro.
+
+    Attributes:
+        entry_id: Número correlativo de la entrada (crece aunque el buffer descarte las antiguas)
+        timestamp: Instante del registro (segundos desde la época Unix)
+        length: Largo del valor en caracteres
+        preview: Huella ("blake2b:...") o prefijo truncado del valor
+        elapsed_ms: Duración del análisis en milisegundos
+        stages_us: Microsegundos por etapa, de la más costosa a la menos costosa
+        slowest_stage: Etapa más costosa, o None si no se midieron etapas
+        slowest_pattern: Tipo de dato del patrón sensible más lento, o None si no se evaluó ninguno
+    """
+
+    entry_id: int
+    timestamp: float
+    length: int
+    preview: str
+    elapsed_ms: float
+    stages_us: Dict[str, float]
+    slowest_stage: Optional[str]
+    slowest_pattern: Optional[str]
+
+
+class SlowLog:
+    """Buffer circular de los valores más lentos de analizar, seguro entre hilos"""
+
+    def __init__(
+        self,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        preview: str = "hash",
+        preview_chars: int = DEFAULT_PREVIEW_CHARS,
+    ) -> None:
+        """
+        Inicializa un registro vacío.
+
+        Args:
+            threshold_ms: Duración mínima (milisegundos) para registrar un valor
+            max_entries: Entradas que se conservan; las más antiguas se descartan
+            preview: "hash" (huella con clave, no expone el valor) o "truncate"
+                (primeros preview_chars caracteres del valor)
+            preview_chars: Caracteres de la vista previa truncada
+
+        Raises:
+            ValueError: Si preview no es un modo válido o max_entries es menor que 1
+        """
+        if preview not in PREVIEW_MODES:
+            raise ValueError(f"Modo de vista previa inválido '{preview}'. Disponibles: {', '.join(PREVIEW_MODES)}")
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser al menos 1")
+        self.threshold_ms = threshold_ms
+        self.max_entries = max_entries
+        self.preview = preview
+        self.preview_chars = preview_chars
+        self.logged = 0
+        self._entries: Deque[SlowLogEntry] = deque(maxlen=max_entries)
+        self._key = os.urandom(16)
+        self._lock = threading.Lock()
+
+    def observe(self, value: str, elapsed_ms: float, stages_ns: Dict[str, int]) -> bool:
+        """
+        Registra el valor si su análisis superó el umbral.
+
+        Args:
+            value: Valor analizado
+            elapsed_ms: Duración del análisis en milisegundos
+            stages_ns: Nanosegundos por etapa del análisis de este valor
+
+        Returns:
+            True si el valor se registró
+        """
+        if elapsed_ms < self.threshold_ms:
+            return False
+
+        stages = sorted(stages_ns.items(), key=lambda item: item[1], reverse=True)
+        patterns = [
+            stage
+            for stage, _ in stages
+            if stage.startswith(STAGE_SENSITIVE_PREFIX) and stage not in (STAGE_OVERLAPS, STAGE_SENSITIVE_SUMMARY)
+        ]
+        preview = self._preview(value)
+
+        with self._lock:
+            self.logged += 1
+            self._entries.append(
+                SlowLogEntry(
+                    entry_id=self.logged,
+                    timestamp=time.time(),
+                    length=len(value),
+                    preview=preview,
+                    elapsed_ms=elapsed_ms,
+                    stages_us={stage: elapsed / 1000 for stage, elapsed in stages},
+                    slowest_stage=stages[0][0] if stages else None,
+                    slowest_pattern=patterns[0][len(STAGE_SENSITIVE_PREFIX) :] if patterns else None,
+                )
+            )
+        return True
+
+    def _preview(self, value: str) -> str:
+        """Vista previa del valor según el modo configurado"""
+        if self.preview == "truncate":
+            return value if len(value) <= self.preview_chars else value[: self.preview_chars] + "…"
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=8, key=self._key)
+        return f"blake2b:{digest.hexdigest()}"
+
+    def entries(self) -> List[SlowLogEntry]:
+        """Entradas conservadas, de la más reciente a la más antigua"""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        """Descarta las entradas y reinicia el conteo"""
+        with self._lock:
+            self._entries.clear()
+            self.logged = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Volcado serializable del registro.
+
+        Returns:
+            Diccionario con threshold_ms, max_entries, logged (valores lentos
+            desde el inicio, incluidos los descartados) y entries
+        """
+        with self._lock:
+            logged = self.logged
+            entries = list(reversed(self._entries))
+        return {
+            "threshold_ms": self.threshold_ms,
+            "max_entries": self.max_entries,
+            "logged": logged,
+            "entries": [asdict(entry) for entry in entries],
+        }
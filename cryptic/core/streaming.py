@@ -0,0 +1,233 @@
+"""
+Análisis en streaming de registros delimitados por saltos de línea.
+
+Este módulo procesa flujos de texto (por ejemplo, stdin en un pipeline
+``tail -F | cryptic filter``) registro a registro con memoria constante:
+cada línea se lee con un tamaño máximo, se analiza y su resultado se
+escribe de inmediato como JSON Lines o como línea anotada.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from typing import IO, TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer, DataAnalysis
+
+# Largo máximo por defecto de un registro (en caracteres)
+DEFAULT_MAX_LINE_LENGTH = 65536
+
+
+def iter_bounded_lines(stream: IO[str], max_line_length: int = DEFAULT_MAX_LINE_LENGTH) -> Iterator[Tuple[str, bool]]:
+    """
+    Lee líneas de un flujo sin acumular más de max_line_length caracteres.
+
+    Las líneas más largas se truncan y el resto se descarta sin cargarlo
+    completo en memoria.
+
+    Args:
+        stream: Flujo de texto de entrada
+        max_line_length: Largo máximo conservado por línea
+
+    Yields:
+        Tuplas (línea sin salto final, si fue truncada)
+    """
+    while True:
+        line = stream.readline(max_line_length + 1)
+        if not line:
+            return
+
+        truncated = False
+        if len(line) > max_line_length and not line.endswith("\n"):
+            truncated = True
+            line = line[:max_line_length]
+            # Descartar el resto de la línea en bloques acotados
+            while True:
+                rest = stream.readline(max_line_length)
+                if not rest or rest.endswith("\n"):
+                    break
+
+        yield line.rstrip("\r\n"), truncated
+
+
+def analysis_to_record(analysis: "DataAnalysis", line_number: int, truncated: bool = False) -> Dict[str, Any]:
+    """
+    Convierte un análisis en un registro JSON Lines.
+
+    Args:
+        analysis: Resultado del análisis de la línea
+        line_number: Número de línea en el flujo de entrada
+        truncated: Si la línea fue truncada antes de analizarla
+
+    Returns:
+        Diccionario serializable con los hallazgos de la línea
+    """
+    record: Dict[str, Any] = {
+        "line": line_number,
+        "sensitivity_level": analysis.sensitivity_level.value,
+        "protection_status": analysis.protection_status.value,
+        "confidence": analysis.confidence,
+        "sensitive_matches": [
+            {
+                "type": match.data_type.value,
+                "text": match.matched_text,
+                "start": match.start_pos,
+                "end": match.end_pos,
+                "validated": match.is_validated,
+            }
+            for match in (analysis.sensitive_analysis.matches if analysis.sensitive_analysis else [])
+        ],
+        "hash_type": (
+            analysis.hash_analysis.possible_types[0][0].value
+            if analysis.hash_analysis and analysis.hash_analysis.possible_types
+            else None
+        ),
+    }
+    if truncated:
+        record["truncated"] = True
+    return record
+
+
+def annotate_line(analysis: "DataAnalysis", line: str) -> str:
+    """
+    Antepone a una línea un resumen breve de su análisis.
+
+    Args:
+        analysis: Resultado del análisis de la línea
+        line: Línea original
+
+    Returns:
+        Línea anotada, ej: "[Sin protección: Email] contacto juan@empresa.cl"
+    """
+    labels = []
+    if analysis.sensitive_analysis and analysis.sensitive_analysis.matches:
+        labels.extend(dict.fromkeys(match.data_type.value for match in analysis.sensitive_analysis.matches))
+    if analysis.hash_analysis and analysis.hash_analysis.possible_types:
+        labels.append(analysis.hash_analysis.possible_types[0][0].value)
+
+    detail = f": {', '.join(labels)}" if labels else ""
+    return f"[{analysis.protection_status.value}{detail}] {line}"
+
+
+class _DeferredFlush:
+    """
+    Vacía la salida desde un hilo cuando un registro lleva interval segundos sin vaciarse.
+
+    El bucle principal solo vacía al escribir, por lo que sin este hilo el
+    último hallazgo antes de una pausa del flujo quedaría en el búfer hasta
+    que llegara otro registro emitido. Escrituras y vaciados se serializan
+    con ``lock``.
+    """
+
+    def __init__(self, stream: IO[str], interval: float) -> None:
+        self.stream = stream
+        self.interval = interval
+        self.lock = threading.Lock()
+        self._pending = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cryptic-filter-flush", daemon=True)
+        self._thread.start()
+
+    def mark_written(self) -> None:
+        """Registra una escritura sin vaciar (con lock tomado)"""
+        self._pending.set()
+
+    def mark_flushed(self) -> None:
+        """Registra un vaciado hecho por el bucle principal (con lock tomado)"""
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Detiene el hilo sin vaciar la salida"""
+        self._stopped.set()
+        self._pending.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while self._pending.wait() and not self._stopped.wait(self.interval):
+            with self.lock:
+                if not self._pending.is_set():
+                    continue
+                self._pending.clear()
+                try:
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    # Salida cerrada (ej: "| head"): el bucle principal recibe el error al escribir
+                    return
+
+
+def filter_stream(
+    analyzer: "CrypticAnalyzer",
+    input_stream: IO[str],
+    output_stream: IO[str],
+    output_format: str = "jsonl",
+    only_sensitive: bool = False,
+    flush_interval: float = 0.0,
+    max_line_length: int = DEFAULT_MAX_LINE_LENGTH,
+    clock: Callable[[], float] = time.monotonic,
+) -> Dict[str, int]:
+    """
+    Analiza un flujo de registros y escribe los resultados a medida que llegan.
+
+    Args:
+        analyzer: Analizador a utilizar
+        input_stream: Flujo de entrada con un registro por línea
+        output_stream: Flujo de salida
+        output_format: "jsonl" (un objeto JSON por línea) o "annotate" (línea anotada)
+        only_sensitive: Si emitir solo las líneas con datos sensibles
+        flush_interval: Segundos mínimos entre vaciados de la salida (0 = tras cada
+            registro); un registro nunca espera más que este intervalo sin vaciarse,
+            aunque no lleguen más líneas
+        max_line_length: Largo máximo de un registro; el exceso se descarta
+        clock: Fuente de tiempo monotónica (inyectable para tests)
+
+    Returns:
+        Diccionario con líneas leídas, emitidas, con datos sensibles y truncadas
+    """
+    import json
+
+    stats = {"lines_read": 0, "lines_written": 0, "sensitive_lines": 0, "truncated_lines": 0}
+    last_flush = clock()
+    flusher: Optional[_DeferredFlush] = _DeferredFlush(output_stream, flush_interval) if flush_interval > 0 else None
+    output_lock: ContextManager[Any] = flusher.lock if flusher is not None else nullcontext()
+
+    try:
+        for line, truncated in iter_bounded_lines(input_stream, max_line_length):
+            stats["lines_read"] += 1
+            if truncated:
+                stats["truncated_lines"] += 1
+
+            if not line.strip():
+                continue
+
+            analysis = analyzer.analyze_data(line)
+            has_sensitive = bool(analysis.sensitive_analysis and analysis.sensitive_analysis.matches)
+            if has_sensitive:
+                stats["sensitive_lines"] += 1
+            elif only_sensitive:
+                continue
+
+            if output_format == "annotate":
+                text = annotate_line(analysis, line) + "\n"
+            else:
+                record = analysis_to_record(analysis, stats["lines_read"], truncated)
+                text = json.dumps(record, ensure_ascii=False) + "\n"
+
+            with output_lock:
+                output_stream.write(text)
+                stats["lines_written"] += 1
+
+                now = clock()
+                if now - last_flush >= flush_interval:
+                    output_stream.flush()
+                    last_flush = now
+                    if flusher is not None:
+                        flusher.mark_flushed()
+                elif flusher is not None:
+                    flusher.mark_written()
+    finally:
+        if flusher is not None:
+            flusher.close()
+
+    output_stream.flush()
+    return stats
@@ -0,0 +1,128 @@
+"""
+Desglose de tiempos por etapa del análisis.
+
+``StageTimings`` acumula, con ``time.perf_counter_ns``, el tiempo de cada
+etapa de ``CrypticAnalyzer.analyze_data``: características del valor,
+intento de hash sobre el valor completo, búsqueda de hashes en tokens,
+detección de datos sensibles por patrón, resolución de solapamientos,
+recomendaciones del detector y determinación de estado y recomendaciones.
+
+Las etapas se registran solo si el analizador recibe un ``StageTimings``;
+sin él, el costo es una comparación con None por etapa. Con un único valor
+analizado, el desglose explica por qué esa entrada es lenta
+(``cryptic analyze --timings``); con muchos, muestra dónde se concentra el
+tiempo de un lote. ``start_capture`` permite además obtener las etapas de un
+único valor dentro de un lote (lo usa el registro de valores lentos).
+
+``StageTimings`` es a su vez un hook de instrumentación (ver
+cryptic.core.hooks): el analizador lo invoca en los mismos puntos que los
+hooks del usuario.
+
+Ejemplo:
+    >>> timings = StageTimings()
+    >>> analyzer = CrypticAnalyzer(timings=timings)
+    >>> _ = analyzer.analyze_data("Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592")
+    >>> sorted(row["stage"] for row in timings.report())[:3]
+    ['features', 'hash:tokens', 'hash:whole']
+"""
+
+import threading
+from typing import Any, Dict, List
+
+from cryptic.core.hooks import AnalysisHooks
+
+# Nombres de las etapas (las de detección por patrón son "sensitive:<tipo de dato>")
+STAGE_FEATURES = "features"
+STAGE_HASH_WHOLE = "hash:whole"
+STAGE_HASH_TOKENS = "hash:tokens"
+STAGE_SENSITIVE_PREFIX = "sensitive:"
+STAGE_OVERLAPS = "sensitive:overlaps"
+STAGE_SENSITIVE_SUMMARY = "sensitive:recommendations"
+STAGE_STATUS = "status"
+
+
+class StageTimings(AnalysisHooks):
+    """Tiempos acumulados por etapa: llamadas, total y máximo en nanosegundos"""
+
+    def __init__(self) -> None:
+        """Inicializa un desglose vacío"""
+        # Por etapa: [llamadas, total_ns, max_ns]
+        self._stages: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        # Captura por hilo de las etapas del valor en curso (ver start_capture)
+        self._local = threading.local()
+
+    def add(self, stage: str, elapsed_ns: int) -> None:
+        """
+        Registra una ejecución de una etapa.
+
+        Args:
+            stage: Nombre de la etapa (ver constantes STAGE_*)
+            elapsed_ns: Duración medida con time.perf_counter_ns
+        """
+        capture = getattr(self._local, "capture", None)
+        if capture is not None:
+            capture[stage] = capture.get(stage, 0) + elapsed_ns
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [1, elapsed_ns, elapsed_ns]
+                return
+            entry[0] += 1
+            entry[1] += elapsed_ns
+            if elapsed_ns > entry[2]:
+                entry[2] = elapsed_ns
+
+    def on_stage_end(self, stage: str, token: Any, elapsed_ns: int) -> None:
+        """Registra la etapa terminada (ver add)"""
+        self.add(stage, elapsed_ns)
+
+    def start_capture(self) -> Dict[str, int]:
+        """
+        Comienza a capturar, solo para el hilo actual, las etapas del valor en curso.
+
+        Returns:
+            Diccionario etapa -> nanosegundos que se completa hasta stop_capture
+        """
+        capture: Dict[str, int] = {}
+        self._local.capture = capture
+        return capture
+
+    def stop_capture(self) -> None:
+        """Termina la captura iniciada con start_capture en el hilo actual"""
+        self._local.capture = None
+
+    def total_ns(self, stage: str) -> int:
+        """Tiempo total acumulado de una etapa (0 si no se ejecutó)"""
+        with self._lock:
+            entry = self._stages.get(stage)
+            return entry[1] if entry else 0
+
+    def reset(self) -> None:
+        """Descarta todos los tiempos"""
+        with self._lock:
+            self._stages.clear()
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Desglose ordenado de la etapa más costosa a la menos costosa.
+
+        Returns:
+            Lista de diccionarios con stage, calls, total_ms, mean_us, max_us
+            y share (proporción del tiempo total medido)
+        """
+        with self._lock:
+            stages = {name: list(entry) for name, entry in self._stages.items()}
+
+        overall = sum(entry[1] for entry in stages.values()) or 1
+        return [
+            {
+                "stage": name,
+                "calls": calls,
+                "total_ms": total / 1_000_000,
+                "mean_us": total / calls / 1000,
+                "max_us": maximum / 1000,
+                "share": total / overall,
+            }
+            for name, (calls, total, maximum) in sorted(stages.items(), key=lambda item: item[1][1], reverse=True)
+        ]
@@ -7,6 +7,7 @@ RUT chilenos, números de tarjetas de crédito, teléfonos, etc.
 """
 
 import re
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List, Optional
@@ -50,6 +51,9 @@ class SensitivePattern:
         Ejemplos válidos de este tipo de dato
     false_positive_patterns : List[str], opcional
         Patrones que ayudan a descartar falsos positivos
+    requires : Dict[str, int]
+        Conteos mínimos de caracteres (campos de ``ValueFeatures``) sin los
+        cuales la regex no puede coincidir; permiten omitirla sin ejecutarla
     """
 
     data_type: SensitiveDataType
@@ -60,6 +64,7 @@ class SensitivePattern:
     validation_func: Optional[Callable] = None
     examples: List[str] = field(default_factory=list)
     false_positive_patterns: Optional[List[str]] = None
+    requires: Dict[str, int] = field(default_factory=dict)
 
 
 def validate_rut_chileno(rut: str) -> bool:
@@ -181,6 +186,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             description="Dirección de correo electrónico",
             validation_func=validate_email_advanced,
             examples=["usuario@ejemplo.com", "test.email+tag@dominio.co.uk", "nombre_apellido@empresa.cl"],
+            requires={"at": 1, "dot": 1, "length": 6},
             false_positive_patterns=[
                 r".*@example\.(com|org|net)$",  # Emails de ejemplo
                 r".*@test\.(com|org|net)$",  # Emails de testing
@@ -195,6 +201,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             description="RUT o RUN chileno (Rol Único Tributario/Nacional)",
             validation_func=validate_rut_chileno,
             examples=["12.345.678-5", "1.234.567-K", "12345678-5", "1234567-K"],
+            requires={"digits": 7, "dash": 1},
             false_positive_patterns=[
                 r"00\.000\.000-0",  # RUT inválido
             ],
@@ -208,6 +215,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             description="Número de tarjeta de crédito",
             validation_func=validate_credit_card,
             examples=["4111 1111 1111 1111", "5555-5555-5555-4444", "4111111111111111", "378282246310005"],
+            requires={"digits": 13},
             false_positive_patterns=[
                 r"0000[-\s]?0000[-\s]?0000[-\s]?0000",  # Número de prueba
                 r"1111[-\s]?1111[-\s]?1111[-\s]?1111",  # Otro número de prueba
@@ -221,6 +229,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.90,
             description="Número de teléfono chileno",
             examples=["+56912345678", "912345678", "22123456", "9 1234 5678"],
+            requires={"digits": 8},
         ),
         # TELÉFONOS INTERNACIONALES
         SensitivePattern(
@@ -230,6 +239,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.85,
             description="Número de teléfono internacional",
             examples=["+1 555 123 4567", "+44 20 1234 5678", "+34 91 123 4567"],
+            requires={"plus": 1, "digits": 8},
         ),
         # DIRECCIONES IP
         SensitivePattern(
@@ -239,6 +249,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.92,
             description="Dirección IP v4",
             examples=["192.168.1.1", "10.0.0.1", "172.16.0.1"],
+            requires={"dot": 3, "digits": 4},
             false_positive_patterns=[
                 r"127\.0\.0\.1",  # Localhost
                 r"0\.0\.0\.0",  # Dirección nula
@@ -252,6 +263,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.75,  # Menor confianza porque puede tener falsos positivos
             description="Posible nombre de persona",
             examples=["Juan Pérez", "María José González", "Pedro Pablo Martínez Silva"],
+            requires={"upper": 2, "whitespace": 1, "alpha": 4},
             false_positive_patterns=[r"Lorem Ipsum", r"Dolor Sit", r"Test User", r"John Doe", r"Jane Doe"],
         ),
         # URLs
@@ -262,6 +274,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.95,
             description="URL o dirección web",
             examples=["https://www.ejemplo.com", "http://localhost:8080/api", "https://api.service.com/v1/users?id=123"],
+            requires={"colon": 1, "slash": 2, "length": 8},
         ),
         # DNI ARGENTINO (sin guión, para diferenciarlo del RUT)
         SensitivePattern(
@@ -271,6 +284,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.87,  # Ligeramente mayor confianza
             description="DNI Argentino",
             examples=["12.345.678", "1.234.567", "12345678"],
+            requires={"digits": 7},
         ),
         # CÉDULA URUGUAYA (más específica: exactamente 8 dígitos con último dígito)
         SensitivePattern(
@@ -280,6 +294,7 @@ def get_sensitive_patterns() -> List[SensitivePattern]:
             confidence=0.88,
             description="Cédula de Identidad Uruguaya",
             examples=["1.234.567-8", "1234567-8"],
+            requires={"digits": 7, "dash": 1},
         ),
     ]
 
@@ -316,23 +331,31 @@ def get_patterns_by_sensitivity(sensitivity_level: str) -> List[SensitivePattern
 
 # Cache para compilar regex una sola vez
 _COMPILED_PATTERNS: Optional[Dict[str, re.Pattern]] = None
+_COMPILED_PATTERNS_LOCK = threading.Lock()
 
 
 def get_compiled_patterns() -> Dict[str, re.Pattern]:
     """
     Retorna patrones regex compilados para mejor rendimiento.
 
+    Seguro entre hilos: el primer llamador compila los patrones bajo un lock
+    y publica el diccionario solo cuando está completo; los siguientes lo
+    leen sin tomar el lock. El diccionario no debe modificarse.
+
     Returns:
         Diccionario con patrones compilados indexados por tipo de dato
     """
     global _COMPILED_PATTERNS
 
-    if _COMPILED_PATTERNS is None:
-        _COMPILED_PATTERNS = {}
-        patterns = get_sensitive_patterns()
-
-        for pattern in patterns:
-            key = f"{pattern.data_type.value}"
-            _COMPILED_PATTERNS[key] = re.compile(pattern.regex, re.IGNORECASE)
-
-    return _COMPILED_PATTERNS
+    compiled = _COMPILED_PATTERNS
+    if compiled is None:
+        with _COMPILED_PATTERNS_LOCK:
+            compiled = _COMPILED_PATTERNS
+            if compiled is None:
+                compiled = {}
+                for pattern in get_sensitive_patterns():
+                    key = f"{pattern.data_type.value}"
+                    compiled[key] = re.compile(pattern.regex, re.IGNORECASE)
+                _COMPILED_PATTERNS = compiled
+
+    return compiled
@@ -0,0 +1 @@
+"""Servidores locales de análisis que mantienen un analizador precalentado."""
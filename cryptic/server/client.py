@@ -0,0 +1,180 @@
+"""
+Cliente mínimo del daemon de Cryptic.
+
+``cryptic analyze`` y ``cryptic verify`` intentan primero reenviar la
+invocación al daemon (``cryptic daemon``) a través de su socket Unix: se
+envían los argumentos, el directorio actual y los descriptores de stdin,
+stdout y stderr, y el daemon ejecuta el comando en un proceso ya
+precalentado que escribe directamente en la terminal del cliente y abre los
+archivos por su ruta. Si el daemon no está disponible, el comando se ejecuta
+localmente como siempre.
+
+Antes de enviar los argumentos y los descriptores, el cliente comprueba que
+el socket pertenezca al usuario actual y que el proceso que lo atiende corra
+con el mismo uid; si no, ejecuta localmente. Sin ``$XDG_RUNTIME_DIR``, el
+socket se ubica en un directorio privado (0700) del usuario dentro del
+directorio temporal.
+
+Este módulo solo usa la biblioteca estándar y no importa nada de Cryptic,
+para que el camino del cliente no pague el costo de arranque que evita.
+"""
+
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+from typing import List, Optional
+
+# Variable de entorno con la ruta del socket del daemon
+SOCKET_ENV = "CRYPTIC_DAEMON_SOCKET"
+
+# Variable de entorno que desactiva el reenvío al daemon
+DISABLE_ENV = "CRYPTIC_NO_DAEMON"
+
+# Comandos que se reenvían al daemon cuando está en ejecución
+FORWARDED_COMMANDS = ("analyze", "verify")
+
+# Opciones que obligan a ejecutar localmente: ``--hooks`` importa código del
+# entorno del cliente (PYTHONPATH, virtualenv, contexto de trazas)
+LOCAL_OPTIONS = ("--hooks",)
+
+
+def daemon_supported() -> bool:
+    """Indica si la plataforma permite sockets Unix, paso de descriptores y fork"""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds") and hasattr(os, "fork")
+
+
+def private_socket_dir() -> str:
+    """Directorio privado del usuario para el socket cuando no hay ``$XDG_RUNTIME_DIR``"""
+    return os.path.join(os.environ.get("TMPDIR", "/tmp"), f"cryptic-{os.getuid()}")
+
+
+def default_socket_path() -> str:
+    """
+    Ruta del socket del daemon.
+
+    Returns:
+        ``$CRYPTIC_DAEMON_SOCKET`` si está definida; si no, ``cryptic.sock`` en
+        ``$XDG_RUNTIME_DIR`` o en private_socket_dir()
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "cryptic.sock")
+    return os.path.join(private_socket_dir(), "cryptic.sock")
+
+
+def socket_owned_by_user(path: str) -> bool:
+    """Indica si path es un socket (no un enlace) cuyo dueño es el usuario actual"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def peer_uid(conn: socket.socket) -> Optional[int]:
+    """
+    uid del proceso al otro lado de un socket Unix conectado.
+
+    Args:
+        conn: Socket Unix conectado
+
+    Returns:
+        uid del par, o None si la plataforma no permite consultarlo
+    """
+    try:
+        if hasattr(socket, "SO_PEERCRED"):
+            # struct ucred de Linux: pid, uid, gid
+            _, uid, _ = struct.unpack("3i", conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+            return uid
+        if hasattr(socket, "LOCAL_PEERCRED"):
+            # struct xucred de BSD y macOS: cr_version, cr_uid, ... (nivel SOL_LOCAL = 0)
+            size = struct.calcsize("=IIh16I")
+            _, uid = struct.unpack_from("=II", conn.getsockopt(0, socket.LOCAL_PEERCRED, size))
+            return uid
+    except OSError:
+        return None
+    return None
+
+
+def read_message(conn: socket.socket, buffer: bytearray) -> Optional[dict]:
+    """
+    Lee un mensaje JSON terminado en salto de línea.
+
+    Args:
+        conn: Socket conectado
+        buffer: Bytes recibidos y aún no consumidos (se actualiza)
+
+    Returns:
+        Mensaje decodificado o None si la conexión se cerró antes de completarlo
+    """
+    while b"\n" not in buffer:
+        chunk = conn.recv(4096)
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    line, _, rest = bytes(buffer).partition(b"\n")
+    buffer[:] = rest
+    return json.loads(line)
+
+
+def forward(argv: List[str], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    Ejecuta un comando de la CLI en el daemon si está en ejecución.
+
+    Args:
+        argv: Argumentos del comando sin el nombre del programa (ej: ["analyze", "x"])
+        socket_path: Ruta del socket (por defecto, default_socket_path())
+
+    Returns:
+        Código de salida del comando, o None si el daemon no está disponible,
+        el socket o el proceso que lo atiende no pertenecen al usuario actual o
+        argv incluye una de LOCAL_OPTIONS, y el comando debe ejecutarse localmente
+    """
+    if os.environ.get(DISABLE_ENV) or not daemon_supported():
+        return None
+    if any(arg == option or arg.startswith(option + "=") for arg in argv for option in LOCAL_OPTIONS):
+        return None
+
+    path = socket_path or default_socket_path()
+    # Otro usuario podría haber creado el socket para recibir los descriptores y argv
+    if not socket_owned_by_user(path):
+        return None
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+        if peer_uid(conn) != os.getuid():
+            conn.close()
+            return None
+        request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8") + b"\n"
+        sys.stdout.flush()
+        sys.stderr.flush()
+        socket.send_fds(conn, [request], [0, 1, 2])
+    except OSError:
+        conn.close()
+        return None
+
+    with conn:
+        buffer = bytearray()
+        pid = None
+        try:
+            started = read_message(conn, buffer)
+            pid = started.get("pid") if started else None
+            finished = read_message(conn, buffer)
+        except KeyboardInterrupt:
+            # El comando corre en otro proceso: se le reenvía la interrupción
+            if pid is not None:
+                os.kill(pid, signal.SIGINT)
+            finished = read_message(conn, buffer)
+
+    if finished is None:
+        sys.stderr.write("❌ El daemon de Cryptic terminó sin completar el comando\n")
+        return 1
+    return int(finished["exit"])
@@ -0,0 +1,288 @@
+"""
+Daemon de la CLI sobre un socket Unix.
+
+El daemon importa los módulos de la CLI y de análisis, compila los patrones
+y precalienta un analizador una sola vez. Por cada invocación reenviada por
+``cryptic.server.client`` crea un proceso con ``fork`` (que hereda ese
+estado), recibe los descriptores de stdin, stdout y stderr del cliente,
+se ubica en su directorio actual y ejecuta el mismo comando de Click: la
+salida es idéntica a la de una ejecución local y los archivos se leen
+directamente por su ruta, sin pasar su contenido por el socket.
+
+Protocolo (JSON por línea):
+- cliente -> daemon: ``{"argv": [...], "cwd": "..."}`` junto con los descriptores 0, 1 y 2
+- daemon -> cliente: ``{"pid": N}`` al comenzar y ``{"exit": código}`` al terminar
+"""
+
+import importlib
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import time
+from typing import Any, Callable, List, Optional, Set
+
+from cryptic.server.client import (
+    FORWARDED_COMMANDS,
+    daemon_supported,
+    default_socket_path,
+    private_socket_dir,
+    read_message,
+)
+from cryptic.server.protocol import warm_up
+
+# Módulos importados antes de atender solicitudes, para que los procesos hijos no los importen
+WARM_MODULES = (
+    "csv",
+    "json",
+    "yaml",
+    "cryptic.cli.main",
+    "cryptic.core.aggregate",
+    "cryptic.core.cache",
+    "cryptic.core.column_memo",
+    "cryptic.core.headers",
+    "cryptic.core.sampling",
+    "cryptic.utils.files",
+)
+
+# Conexiones pendientes de aceptar
+DEFAULT_BACKLOG = 128
+
+# Segundos máximos para recibir la solicitud una vez conectado el cliente
+REQUEST_TIMEOUT = 5.0
+
+# Segundos máximos de espera de los comandos en curso al detenerse
+DEFAULT_DRAIN_TIMEOUT = 30.0
+
+# Tamaño máximo de una solicitud (argumentos y directorio)
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+class DaemonError(RuntimeError):
+    """Error al iniciar el daemon"""
+
+
+def bind_socket(path: str, backlog: int = DEFAULT_BACKLOG) -> socket.socket:
+    """
+    Abre el socket Unix del daemon con permisos solo para el usuario.
+
+    Un socket existente sin daemon que lo atienda se considera obsoleto y se
+    reemplaza. Si path está en private_socket_dir(), el directorio se crea con
+    permisos 0700 y se rechaza si pertenece a otro usuario o es accesible por
+    otros.
+
+    Args:
+        path: Ruta del socket
+        backlog: Conexiones pendientes de aceptar
+
+    Returns:
+        Socket escuchando en path
+
+    Raises:
+        DaemonError: Si la plataforma no lo soporta, ya hay un daemon en path o
+            el directorio privado no es seguro
+    """
+    if not daemon_supported():
+        raise DaemonError("El daemon requiere sockets Unix con paso de descriptores y os.fork")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory == os.path.abspath(private_socket_dir()):
+        _ensure_private_dir(directory)
+
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+        else:
+            raise DaemonError(f"Ya hay un daemon escuchando en {path}")
+        finally:
+            probe.close()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous_umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(previous_umask)
+    listener.listen(backlog)
+    return listener
+
+
+def _ensure_private_dir(directory: str) -> None:
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise DaemonError(f"{directory} debe ser un directorio del usuario actual con permisos 0700")
+
+
+def warm_up_daemon() -> None:
+    """Importa los módulos de la CLI y precalienta los patrones de análisis"""
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+
+    from cryptic.core.analyzer import CrypticAnalyzer
+
+    warm_up(CrypticAnalyzer())
+
+
+def run_command(argv: List[str]) -> int:
+    """
+    Ejecuta un comando de la CLI en el proceso actual.
+
+    Args:
+        argv: Argumentos sin el nombre del programa
+
+    Returns:
+        Código de salida del comando
+    """
+    from cryptic.cli.main import cli
+
+    try:
+        cli.main(args=argv, prog_name="cryptic")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        return 1
+    return 0
+
+
+def _send(conn: socket.socket, message: Any) -> None:
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def serve_connection(conn: socket.socket) -> int:
+    """
+    Atiende una invocación reenviada en el proceso hijo.
+
+    Args:
+        conn: Conexión del cliente
+
+    Returns:
+        Código de salida del comando (2 si la solicitud no es válida)
+    """
+    conn.settimeout(REQUEST_TIMEOUT)
+    message, fds, _, _ = socket.recv_fds(conn, MAX_REQUEST_SIZE, 3)
+    if len(fds) != 3:
+        for fd in fds:
+            os.close(fd)
+        return 2
+
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    buffer = bytearray(message)
+    request = read_message(conn, buffer)
+    conn.settimeout(None)
+    _send(conn, {"pid": os.getpid()})
+
+    argv = request.get("argv") if isinstance(request, dict) else None
+    if not isinstance(argv, list) or not argv or argv[0] not in FORWARDED_COMMANDS:
+        sys.stderr.write(f"❌ El daemon solo ejecuta los comandos: {', '.join(FORWARDED_COMMANDS)}\n")
+        code = 2
+    else:
+        os.chdir(request["cwd"])
+        code = run_command([str(arg) for arg in argv])
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    _send(conn, {"exit": code})
+    return code
+
+
+def _fork_handler(conn: socket.socket, listener: socket.socket) -> int:
+    """Crea el proceso hijo que atiende conn y retorna su pid"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            listener.close()
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            code = serve_connection(conn)
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+    conn.close()
+    return pid
+
+
+def _reap(children: Set[int]) -> None:
+    """Recoge los procesos hijos terminados"""
+    for pid in list(children):
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            children.discard(pid)
+
+
+def run_daemon(
+    socket_path: Optional[str] = None,
+    drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+    on_ready: Optional[Callable[[str], None]] = None,
+) -> int:
+    """
+    Ejecuta el daemon hasta recibir SIGTERM o SIGINT.
+
+    Args:
+        socket_path: Ruta del socket (por defecto, default_socket_path())
+        drain_timeout: Segundos máximos de espera de los comandos en curso al detenerse
+        on_ready: Función invocada con la ruta del socket al comenzar a escuchar
+
+    Returns:
+        Código de salida: 0 si todos los comandos en curso terminaron a tiempo
+
+    Raises:
+        DaemonError: Si la plataforma no lo soporta o ya hay un daemon en la ruta
+    """
+    path = socket_path or default_socket_path()
+    warm_up_daemon()
+    listener = bind_socket(path)
+    listener.settimeout(0.5)
+    children: Set[int] = set()
+    stopping = False
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    if on_ready is not None:
+        on_ready(path)
+
+    try:
+        while not stopping:
+            _reap(children)
+            try:
+                conn, _ = listener.accept()
+            except (socket.timeout, InterruptedError):
+                continue
+            conn.settimeout(None)
+            children.add(_fork_handler(conn, listener))
+    finally:
+        listener.close()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    deadline = time.monotonic() + drain_timeout
+    while children and time.monotonic() < deadline:
+        _reap(children)
+        if children:
+            time.sleep(0.05)
+    return 0 if not children else 1
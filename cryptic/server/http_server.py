@@ -0,0 +1,539 @@
+"""
+Servidor HTTP local de análisis basado en la biblioteca estándar.
+
+Cada proceso worker mantiene un ``CrypticAnalyzer`` precalentado y atiende
+conexiones HTTP/1.1 persistentes (keep-alive) con un conjunto fijo de
+hilos. Las conexiones aceptadas esperan en una cola acotada; cuando la cola
+está llena, el servidor responde 503 de inmediato en lugar de acumular
+trabajo. Un hilo atiende una solicitud por vez y no una conexión completa:
+entre solicitudes, las conexiones persistentes inactivas quedan en un
+selector que las vuelve a encolar cuando llega la siguiente solicitud, de
+modo que los clientes inactivos no ocupan hilos. Con varios workers, el proceso principal abre el socket, precalienta
+el analizador (memoria compartida copy-on-write) y crea los procesos con
+``fork``; si uno termina inesperadamente, lo reemplaza.
+
+Al recibir SIGTERM (o SIGINT), cada worker deja de aceptar conexiones,
+termina las solicitudes en curso y las encoladas respondiendo con
+``Connection: close``, y finaliza.
+
+Si el analizador tiene un registro de métricas, ``GET /metrics`` lo expone
+en formato Prometheus junto con los conteos de solicitudes HTTP. Cada worker
+mantiene su propio registro: con varios workers, cada consulta refleja el
+proceso que la atendió. Del mismo modo, si el analizador tiene un registro
+de valores lentos, ``GET /slowlog`` lo entrega en JSON.
+"""
+
+import json
+import os
+import queue
+import selectors
+import signal
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from cryptic.server.protocol import ENDPOINTS, RequestError, dispatch, warm_up
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer
+    from cryptic.core.metrics import Counter
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Hilos que atienden conexiones en cada worker
+DEFAULT_THREADS = 4
+
+# Conexiones aceptadas que pueden esperar un hilo libre en cada worker
+DEFAULT_QUEUE_SIZE = 64
+
+# Segundos que una conexión persistente puede permanecer inactiva
+DEFAULT_KEEPALIVE_TIMEOUT = 5.0
+
+# Tamaño máximo del cuerpo de una solicitud (bytes)
+DEFAULT_MAX_BODY = 10 * 1024 * 1024
+
+# Segundos máximos de espera para terminar las solicitudes pendientes al detenerse
+DEFAULT_DRAIN_TIMEOUT = 30.0
+
+_OVERLOADED_BODY = json.dumps({"error": "Servidor saturado, reintente más tarde"}).encode("utf-8")
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """Manejador HTTP/1.1 de las operaciones de análisis"""
+
+    protocol_version = "HTTP/1.1"
+    # Encabezados y cuerpo se escriben por separado: sin TCP_NODELAY, Nagle y el
+    # ACK retardado agregan ~40 ms a cada respuesta en conexiones persistentes
+    disable_nagle_algorithm = True
+    server: "AnalysisHTTPServer"
+
+    def __init__(self, request: socket.socket, client_address: Any, server: "AnalysisHTTPServer") -> None:
+        # A diferencia de BaseRequestHandler, crear el manejador no atiende la
+        # conexión: el servidor invoca handle_next por cada solicitud que llega
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.setup()
+
+    def setup(self) -> None:
+        # El timeout del socket limita cuánto espera la lectura de una solicitud
+        self.timeout = self.server.keepalive_timeout
+        super().setup()
+
+    def handle_next(self) -> bool:
+        """
+        Atiende una solicitud de la conexión.
+
+        Returns:
+            True si la conexión puede reutilizarse para otra solicitud
+        """
+        self.close_connection = True
+        self.handle_one_request()
+        return not self.close_connection
+
+    def has_pending_request(self) -> bool:
+        """Indica, sin bloquear, si ya llegaron bytes de la siguiente solicitud"""
+        # Con el socket no bloqueante, peek retorna lo que quedó en el búfer de
+        # lectura (solicitudes encadenadas) o lo disponible en el socket, o b""
+        self.connection.settimeout(0)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def do_GET(self) -> None:
+        """Estado del worker (``/health``), métricas Prometheus (``/metrics``) y valores lentos (``/slowlog``)"""
+        if self.path == "/metrics" and self.server.analyzer.metrics is not None:
+            self._send_metrics(self.server.analyzer.metrics.to_prometheus())
+            return
+        if self.path == "/slowlog" and self.server.analyzer.slowlog is not None:
+            self._send_json(200, {"pid": os.getpid(), **self.server.analyzer.slowlog.to_dict()})
+            return
+        if self.path != "/health":
+            self._send_error(404, f"Ruta desconocida '{self.path}'")
+            return
+        status = "draining" if self.server.draining else "ok"
+        self._send_json(503 if self.server.draining else 200, {"status": status, "pid": os.getpid()})
+
+    def do_POST(self) -> None:
+        """Operaciones de análisis con cuerpo JSON"""
+        if self.path not in ENDPOINTS:
+            self._send_error(404, f"Ruta desconocida '{self.path}'. Disponibles: {', '.join(ENDPOINTS)}")
+            return
+
+        length_header = self.headers.get("Content-Length")
+        if length_header is None or not length_header.isdigit():
+            self._send_error(411, "Se requiere Content-Length")
+            return
+        length = int(length_header)
+        if length > self.server.max_body:
+            # El cuerpo no se lee, por lo que la conexión no puede reutilizarse
+            self.close_connection = True
+            self._send_error(413, f"El cuerpo supera el máximo de {self.server.max_body} bytes")
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self._send_error(400, f"JSON inválido: {e}")
+            return
+
+        try:
+            body = dispatch(self.server.analyzer, self.path, payload)
+        except RequestError as e:
+            self._send_error(e.status, str(e))
+            return
+        self._send_json(200, body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+
+    def _send_metrics(self, text: str) -> None:
+        self._send(200, text.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+    def _send(self, status: int, data: bytes, content_type: str) -> None:
+        if self.server.requests is not None:
+            endpoint = self.path if self.path in ENDPOINTS or self.path in ("/health", "/metrics", "/slowlog") else "other"
+            self.server.requests.inc(1, (endpoint, str(status)))
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        if self.server.draining:
+            self.close_connection = True
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class AnalysisHTTPServer(HTTPServer):
+    """
+    Servidor HTTP con un analizador precalentado y una cola de conexiones acotada.
+
+    Las conexiones aceptadas se encolan para un conjunto fijo de hilos; si la
+    cola está llena, se responde 503 sin procesarlas. Cada elemento de la cola
+    es una solicitud: tras responderla, la conexión persistente pasa a un hilo
+    vigilante que la encola otra vez cuando es legible y la cierra si supera
+    ``keepalive_timeout`` inactiva. Los hilos se crean en ``serve_forever`` para
+    que el servidor pueda crearse antes de un ``fork``.
+    """
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        analyzer: "CrypticAnalyzer",
+        threads: int = DEFAULT_THREADS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        max_body: int = DEFAULT_MAX_BODY,
+        quiet: bool = False,
+    ) -> None:
+        """
+        Inicializa el servidor y abre el socket.
+
+        Args:
+            address: Tupla (host, puerto); el puerto 0 elige uno libre
+            analyzer: Analizador usado por todas las solicitudes del worker
+            threads: Hilos que atienden solicitudes
+            queue_size: Solicitudes que pueden esperar un hilo libre
+            keepalive_timeout: Segundos de inactividad tras los que se cierra una conexión
+            max_body: Tamaño máximo del cuerpo de una solicitud en bytes
+            quiet: No registrar cada solicitud en stderr
+        """
+        self.analyzer = analyzer
+        self.threads = threads
+        self.keepalive_timeout = keepalive_timeout
+        self.max_body = max_body
+        self.quiet = quiet
+        self.draining = False
+        self.rejected = 0
+        self.requests: Optional[Counter] = None
+        self._rejected_metric: Optional[Counter] = None
+        if analyzer.metrics is not None:
+            self.requests = analyzer.metrics.counter(
+                "cryptic_http_requests_total", "Solicitudes HTTP respondidas", ("endpoint", "status")
+            )
+            self._rejected_metric = analyzer.metrics.counter(
+                "cryptic_http_rejected_total", "Conexiones rechazadas con 503 por cola llena"
+            )
+        self._queue: queue.Queue[Optional[AnalysisRequestHandler]] = queue.Queue(maxsize=queue_size)
+        self._workers: List[threading.Thread] = []
+        # Conexiones persistentes inactivas: las agrega cualquier hilo y las
+        # registra en el selector el hilo vigilante, despertado por _wakeup
+        self._idle_lock = threading.Lock()
+        self._idle_pending: List[AnalysisRequestHandler] = []
+        self._watching = False
+        self._watcher: Optional[threading.Thread] = None
+        self._wakeup: Optional[Tuple[socket.socket, socket.socket]] = None
+        super().__init__(address, AnalysisRequestHandler)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Inicia los hilos de atención y el vigilante y acepta conexiones hasta ``shutdown``"""
+        if not self._workers:
+            # El selector y su socket de aviso se crean aquí, después de un eventual fork
+            self._wakeup = socket.socketpair()
+            for end in self._wakeup:
+                end.setblocking(False)
+            self._watching = True
+            self._watcher = threading.Thread(target=self._watch, name="cryptic-http-idle", daemon=True)
+            self._watcher.start()
+            for index in range(self.threads):
+                worker = threading.Thread(target=self._work, name=f"cryptic-http-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+        super().serve_forever(poll_interval)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Encola la conexión o la rechaza con 503 si la cola está llena"""
+        try:
+            handler = AnalysisRequestHandler(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        self._enqueue(handler)
+
+    def _enqueue(self, handler: AnalysisRequestHandler) -> None:
+        try:
+            self._queue.put_nowait(handler)
+        except queue.Full:
+            self.rejected += 1
+            if self._rejected_metric is not None:
+                self._rejected_metric.inc()
+            self._reject(handler.request)
+            self._close(handler)
+
+    def _reject(self, request: socket.socket) -> None:
+        try:
+            request.sendall(
+                b"HTTP/1.1 503 Service Unavailable\r\n"
+                b"Content-Type: application/json; charset=utf-8\r\n"
+                + f"Content-Length: {len(_OVERLOADED_BODY)}\r\n".encode("ascii")
+                + b"Retry-After: 1\r\nConnection: close\r\n\r\n"
+                + _OVERLOADED_BODY
+            )
+        except OSError:
+            pass
+
+    def _close(self, handler: AnalysisRequestHandler) -> None:
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    def _work(self) -> None:
+        while True:
+            handler = self._queue.get()
+            if handler is None:
+                return
+            try:
+                # Las solicitudes encadenadas ya recibidas se atienden sin volver al selector
+                keep_alive = handler.handle_next()
+                while keep_alive and handler.has_pending_request():
+                    keep_alive = handler.handle_next()
+            except Exception:
+                self.handle_error(handler.request, handler.client_address)
+                keep_alive = False
+            if keep_alive and not self.draining:
+                self._watch_idle(handler)
+            else:
+                self._close(handler)
+
+    def _watch_idle(self, handler: AnalysisRequestHandler) -> None:
+        """Entrega una conexión persistente al vigilante hasta su siguiente solicitud"""
+        with self._idle_lock:
+            watching = self._watching
+            if watching:
+                self._idle_pending.append(handler)
+        if not watching:
+            self._close(handler)
+            return
+        self._wake_watcher()
+
+    def _wake_watcher(self) -> None:
+        if self._wakeup is None:
+            return
+        try:
+            self._wakeup[1].send(b"\0")
+        except OSError:
+            # Con el búfer lleno ya hay un aviso pendiente
+            pass
+
+    def _watch(self) -> None:
+        """Encola las conexiones inactivas al llegar una solicitud y cierra las que expiran"""
+        assert self._wakeup is not None
+        wakeup = self._wakeup[0]
+        deadlines: Dict[AnalysisRequestHandler, float] = {}
+        with selectors.DefaultSelector() as selector:
+            selector.register(wakeup, selectors.EVENT_READ)
+            while True:
+                with self._idle_lock:
+                    watching = self._watching
+                    pending, self._idle_pending = self._idle_pending, []
+                now = time.monotonic()
+                for handler in pending:
+                    if watching:
+                        selector.register(handler.connection, selectors.EVENT_READ, handler)
+                        deadlines[handler] = now + self.keepalive_timeout
+                    else:
+                        self._close(handler)
+                if not watching:
+                    break
+
+                timeout = max(0.0, min(deadlines.values()) - now) if deadlines else None
+                for key, _ in selector.select(timeout):
+                    if key.data is None:
+                        try:
+                            while wakeup.recv(4096):
+                                pass
+                        except OSError:
+                            pass
+                        continue
+                    selector.unregister(key.fileobj)
+                    del deadlines[key.data]
+                    self._enqueue(key.data)
+
+                now = time.monotonic()
+                for handler, deadline in list(deadlines.items()):
+                    if deadline <= now:
+                        selector.unregister(handler.connection)
+                        del deadlines[handler]
+                        self._close(handler)
+
+            for handler in deadlines:
+                self._close(handler)
+
+    def drain(self, timeout: float = DEFAULT_DRAIN_TIMEOUT) -> bool:
+        """
+        Termina las solicitudes en curso y encoladas y detiene los hilos.
+
+        Las conexiones persistentes inactivas se cierran de inmediato. Debe
+        llamarse después de que ``serve_forever`` retorne.
+
+        Args:
+            timeout: Segundos máximos de espera
+
+        Returns:
+            True si todos los hilos terminaron dentro del plazo
+        """
+        self.draining = True
+        deadline = time.monotonic() + timeout
+        with self._idle_lock:
+            self._watching = False
+        if self._watcher is not None:
+            self._wake_watcher()
+            self._watcher.join(max(0.0, deadline - time.monotonic()))
+        for _ in self._workers:
+            self._queue.put(None)
+
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        if self._wakeup is not None and not (self._watcher is not None and self._watcher.is_alive()):
+            for end in self._wakeup:
+                end.close()
+            self._wakeup = None
+        threads = [*self._workers, *([self._watcher] if self._watcher is not None else [])]
+        return not any(thread.is_alive() for thread in threads)
+
+
+def _install_stop_handlers(handler: Callable[[int, Any], None]) -> None:
+    """Instala el manejador de SIGTERM y SIGINT (solo posible en el hilo principal)"""
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, handler)
+        signal.signal(signal.SIGINT, handler)
+
+
+def serve_worker(server: AnalysisHTTPServer, drain_timeout: float = DEFAULT_DRAIN_TIMEOUT) -> int:
+    """
+    Atiende solicitudes hasta recibir SIGTERM o SIGINT y luego drena.
+
+    Args:
+        server: Servidor ya creado (y con el socket abierto)
+        drain_timeout: Segundos máximos para terminar las solicitudes pendientes
+
+    Returns:
+        Código de salida: 0 si el drenaje terminó a tiempo, 1 en caso contrario
+    """
+
+    def stop(signum: int, frame: Any) -> None:
+        server.draining = True
+        # shutdown() espera a que serve_forever retorne: no puede llamarse desde su propio hilo
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    _install_stop_handlers(stop)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+    return 0 if server.drain(drain_timeout) else 1
+
+
+def run_server(
+    analyzer: "CrypticAnalyzer",
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = 1,
+    threads: int = DEFAULT_THREADS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    max_body: int = DEFAULT_MAX_BODY,
+    drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+    quiet: bool = False,
+    on_ready: Optional[Callable[[Tuple[str, int]], None]] = None,
+    on_worker_exit: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Ejecuta el servidor de análisis hasta recibir SIGTERM o SIGINT.
+
+    Args:
+        analyzer: Analizador a precalentar y compartir con los workers
+        host: Dirección donde escuchar
+        port: Puerto (0 elige uno libre)
+        workers: Procesos worker (en plataformas sin ``fork`` se usa uno)
+        threads: Hilos por worker
+        queue_size: Solicitudes en espera por worker antes de responder 503
+        keepalive_timeout: Segundos de inactividad de una conexión persistente
+        max_body: Tamaño máximo del cuerpo de una solicitud en bytes
+        drain_timeout: Segundos máximos para terminar las solicitudes pendientes
+        quiet: No registrar cada solicitud en stderr
+        on_ready: Función invocada con la dirección (host, puerto) al comenzar a escuchar
+        on_worker_exit: Función invocada con (pid, estado) cuando un worker termina inesperadamente
+
+    Returns:
+        Código de salida del servidor
+    """
+    warm_up(analyzer)
+    server = AnalysisHTTPServer(
+        (host, port),
+        analyzer,
+        threads=threads,
+        queue_size=queue_size,
+        keepalive_timeout=keepalive_timeout,
+        max_body=max_body,
+        quiet=quiet,
+    )
+    if on_ready is not None:
+        on_ready(server.server_address[:2])
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        return serve_worker(server, drain_timeout)
+
+    children: Dict[int, bool] = {}
+    stopping = False
+
+    def spawn() -> None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = serve_worker(server, drain_timeout)
+            finally:
+                os._exit(code)
+        children[pid] = True
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for _ in range(workers):
+        spawn()
+    _install_stop_handlers(stop)
+
+    exit_code = 0
+    try:
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            children.pop(pid, None)
+            if os.waitstatus_to_exitcode(status) != 0:
+                exit_code = 1
+            if not stopping:
+                if on_worker_exit is not None:
+                    on_worker_exit(pid, status)
+                spawn()
+    finally:
+        server.server_close()
+    return exit_code if stopping else 1
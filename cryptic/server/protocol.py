@@ -0,0 +1,166 @@
+"""
+Operaciones del servicio de análisis, independientes del transporte.
+
+Cada operación recibe un payload JSON ya decodificado y retorna un
+diccionario serializable. Los errores del cliente se informan con
+``RequestError``, que incluye el código de estado HTTP correspondiente.
+
+Operaciones:
+- "/analyze": ``{"value": "..."}`` -> análisis completo de un valor
+- "/batch": ``["...", "..."]`` o ``{"values": [...]}`` -> un análisis por valor y el reporte del lote
+- "/detect": ``{"text": "..."}`` -> solo detección de datos sensibles
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from cryptic.core.analyzer import CrypticAnalyzer, DataAnalysis
+    from cryptic.core.sensitive_detector import SensitiveAnalysis
+
+ENDPOINTS = ("/analyze", "/batch", "/detect")
+
+# Valores usados para compilar patrones y cachés antes de atender solicitudes
+WARMUP_VALUES = (
+    "juan.perez@empresa.cl",
+    "12.345.678-5",
+    "4111 1111 1111 1111",
+    "+56912345678",
+    "192.168.1.100",
+    "https://www.ejemplo.com",
+    "Juan Pérez",
+    "5d41402abc4b2a76b9719d911017c592",
+    "$2b$12$N9qo8uLOickgx2ZMRZoMye",
+    "Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592",
+)
+
+
+class RequestError(ValueError):
+    """Error en una solicitud del cliente"""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Inicializa el error.
+
+        Args:
+            status: Código de estado HTTP (ej: 400, 404)
+            message: Descripción del error
+        """
+        super().__init__(message)
+        self.status = status
+
+
+def warm_up(analyzer: "CrypticAnalyzer") -> None:
+    """Construye los patrones y llena las cachés de regex del analizador (sin afectar sus métricas ni su slowlog)"""
+    for value in WARMUP_VALUES:
+        analyzer.analyze_data(value)
+    if analyzer.metrics is not None:
+        analyzer.metrics.reset()
+    if analyzer.timings is not None:
+        analyzer.timings.reset()
+    if analyzer.slowlog is not None:
+        analyzer.slowlog.clear()
+
+
+def detection_to_dict(sensitive: "SensitiveAnalysis") -> Dict[str, Any]:
+    """
+    Convierte una detección de datos sensibles en un diccionario serializable.
+
+    Args:
+        sensitive: Resultado de SensitiveDataDetector.detect
+
+    Returns:
+        Diccionario con sensibilidad, coincidencias y recomendaciones
+    """
+    return {
+        "highest_sensitivity": sensitive.highest_sensitivity,
+        "total_matches": sensitive.total_matches,
+        "matches": [
+            {
+                "type": match.data_type.value,
+                "text": match.matched_text,
+                "start": match.start_pos,
+                "end": match.end_pos,
+                "confidence": match.confidence,
+                "validated": match.is_validated,
+            }
+            for match in sensitive.matches
+        ],
+        "recommendations": sensitive.recommendations,
+        "analysis_time_ms": sensitive.analysis_time_ms,
+    }
+
+
+def analysis_to_dict(analysis: "DataAnalysis") -> Dict[str, Any]:
+    """
+    Convierte un análisis completo en un diccionario serializable.
+
+    Args:
+        analysis: Resultado de CrypticAnalyzer.analyze_data
+
+    Returns:
+        Diccionario con sensibilidad, protección, tipos de hash y coincidencias
+    """
+    hash_analysis = analysis.hash_analysis
+    return {
+        "original_data": analysis.original_data,
+        "sensitivity_level": analysis.sensitivity_level.value,
+        "protection_status": analysis.protection_status.value,
+        "confidence": analysis.confidence,
+        "hash_types": [
+            {"type": hash_type.value, "confidence": confidence}
+            for hash_type, confidence in (hash_analysis.possible_types if hash_analysis else [])
+        ],
+        "sensitive_matches": (
+            detection_to_dict(analysis.sensitive_analysis)["matches"] if analysis.sensitive_analysis else []
+        ),
+        "recommendations": analysis.recommendations,
+        "analysis_time_ms": analysis.analysis_time_ms,
+    }
+
+
+def _string_field(payload: Any, *names: str) -> str:
+    """Extrae el primer campo de texto presente entre names"""
+    if isinstance(payload, dict):
+        for name in names:
+            if isinstance(payload.get(name), str):
+                return payload[name]
+    raise RequestError(400, f"Se esperaba un objeto JSON con el campo de texto '{names[0]}'")
+
+
+def _batch_values(payload: Any) -> List[str]:
+    """Extrae la lista de valores de una solicitud de lote"""
+    values = payload.get("values") if isinstance(payload, dict) else payload
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise RequestError(400, "Se esperaba un arreglo JSON de textos o un objeto con 'values'")
+    return values
+
+
+def dispatch(analyzer: "CrypticAnalyzer", endpoint: str, payload: Any) -> Dict[str, Any]:
+    """
+    Ejecuta una operación del servicio.
+
+    Args:
+        analyzer: Analizador precalentado
+        endpoint: Operación solicitada (ver ENDPOINTS)
+        payload: Cuerpo JSON ya decodificado
+
+    Returns:
+        Respuesta serializable de la operación
+
+    Raises:
+        RequestError: Si la operación no existe o el payload no es válido
+    """
+    if endpoint == "/analyze":
+        return analysis_to_dict(analyzer.analyze_data(_string_field(payload, "value", "data")))
+
+    if endpoint == "/batch":
+        results = analyzer.analyze_batch(_batch_values(payload))
+        return {
+            "results": [analysis_to_dict(analysis) for analysis in results],
+            "report": analyzer.generate_report(results),
+        }
+
+    if endpoint == "/detect":
+        return detection_to_dict(analyzer.sensitive_detector.detect(_string_field(payload, "text", "value")))
+
+    raise RequestError(404, f"Operación desconocida '{endpoint}'. Disponibles: {', '.join(ENDPOINTS)}")
@@ -0,0 +1,151 @@
+"""
+Vector de características por valor compartido por los detectores.
+
+Este módulo calcula, en una sola pasada por valor, un registro compacto con
+la longitud y los conteos de dígitos, letras, mayúsculas, caracteres
+hexadecimales, espacios y separadores (``@ . - $ * / : + = \\``). El
+identificador de hashes y el detector de datos sensibles lo consultan para
+descartar patrones imposibles antes de ejecutar cualquier regex (por
+ejemplo, un email sin "@" o un MD5 que no tiene 32 caracteres hexadecimales).
+
+Los conteos siguen la semántica de las regex de Python sobre ``str``: los
+dígitos son los caracteres de ``\\d`` (``str.isdecimal``) y los espacios los
+de ``\\s`` (``str.isspace``), de modo que descartar un patrón por falta de
+caracteres nunca cambia el resultado.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict
+
+_ASCII_DIGITS = b"0123456789"
+_ASCII_UPPER = bytes(range(ord("A"), ord("Z") + 1))
+_ASCII_LETTERS = _ASCII_UPPER + bytes(range(ord("a"), ord("z") + 1))
+_ASCII_HEX = b"0123456789abcdefABCDEF"
+_ASCII_WHITESPACE = bytes(code for code in range(128) if chr(code).isspace())
+_HEX_CHARS = frozenset(_ASCII_HEX.decode())
+
+
+@dataclass(slots=True, frozen=True)
+class ValueFeatures:
+    """
+    Características baratas de un valor.
+
+    Attributes:
+        length: Cantidad de caracteres
+        ascii: Si el valor solo contiene caracteres ASCII
+        digits: Dígitos decimales (``\\d``)
+        alpha: Letras (``str.isalpha``)
+        upper: Letras mayúsculas
+        hex: Caracteres hexadecimales ASCII (``[0-9a-fA-F]``)
+        whitespace: Espacios en blanco (``\\s``)
+        at, dot, dash, dollar, star, slash, colon, plus, equals, backslash:
+            Cantidad de "@", ".", "-", "$", "*", "/", ":", "+", "=" y "\\"
+    """
+
+    length: int
+    ascii: bool
+    digits: int
+    alpha: int
+    upper: int
+    hex: int
+    whitespace: int
+    at: int
+    dot: int
+    dash: int
+    dollar: int
+    star: int
+    slash: int
+    colon: int
+    plus: int
+    equals: int
+    backslash: int
+
+    def satisfies(self, requirements: Dict[str, int]) -> bool:
+        """
+        Indica si el valor alcanza los conteos mínimos de un patrón.
+
+        Args:
+            requirements: Conteo mínimo por característica (ej: {"at": 1, "dot": 1})
+
+        Returns:
+            True si todas las características alcanzan su mínimo
+        """
+        for name, minimum in requirements.items():
+            if getattr(self, name) < minimum:
+                return False
+        return True
+
+
+def extract_features(value: str) -> ValueFeatures:
+    """
+    Calcula las características de un valor en una sola pasada.
+
+    Los valores ASCII (la gran mayoría) se cuentan sobre bytes con
+    ``bytes.translate``; el resto, con un ``Counter`` por carácter.
+
+    Args:
+        value: Valor a caracterizar
+
+    Returns:
+        ValueFeatures del valor
+    """
+    if value.isascii():
+        data = value.encode("ascii")
+        length = len(data)
+        translate = data.translate
+        count = data.count
+        return ValueFeatures(
+            length=length,
+            ascii=True,
+            digits=length - len(translate(None, _ASCII_DIGITS)),
+            alpha=length - len(translate(None, _ASCII_LETTERS)),
+            upper=length - len(translate(None, _ASCII_UPPER)),
+            hex=length - len(translate(None, _ASCII_HEX)),
+            whitespace=length - len(translate(None, _ASCII_WHITESPACE)),
+            at=count(b"@"),
+            dot=count(b"."),
+            dash=count(b"-"),
+            dollar=count(b"$"),
+            star=count(b"*"),
+            slash=count(b"/"),
+            colon=count(b":"),
+            plus=count(b"+"),
+            equals=count(b"="),
+            backslash=count(b"\\"),
+        )
+
+    counts = Counter(value)
+    digits = alpha = upper = hex_chars = whitespace = 0
+    for char, occurrences in counts.items():
+        if char.isdecimal():
+            digits += occurrences
+        elif char.isalpha():
+            alpha += occurrences
+            if char.isupper():
+                upper += occurrences
+        elif char.isspace():
+            whitespace += occurrences
+        if char in _HEX_CHARS:
+            hex_chars += occurrences
+
+    get = counts.get
+    return ValueFeatures(
+        length=len(value),
+        ascii=False,
+        digits=digits,
+        alpha=alpha,
+        upper=upper,
+        hex=hex_chars,
+        whitespace=whitespace,
+        at=get("@", 0),
+        dot=get(".", 0),
+        dash=get("-", 0),
+        dollar=get("$", 0),
+        star=get("*", 0),
+        slash=get("/", 0),
+        colon=get(":", 0),
+        plus=get("+", 0),
+        equals=get("=", 0),
+        backslash=get("\\", 0),
+    )
@@ -0,0 +1,612 @@
+"""
+Utilidades para lectura de archivos de entrada.
+
+Este módulo contiene funciones auxiliares para recorrer árboles de
+directorios, descartar archivos binarios, abrir archivos comprimidos de
+forma transparente y extraer los valores a analizar desde archivos CSV,
+JSON y de texto plano.
+"""
+
+import bz2
+import csv
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import mmap
+import os
+import random
+import zipfile
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+# Cantidad de bytes inspeccionados para decidir si un archivo es binario
+SNIFF_BYTES = 8192
+
+# Tamaño de bloque para calcular huellas de contenido
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Bytes de control que aparecen legítimamente en archivos de texto
+_TEXT_CONTROL_BYTES = {7, 8, 9, 10, 12, 13, 27}
+
+# Firmas (magic bytes) de los formatos comprimidos soportados
+_COMPRESSION_SIGNATURES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"PK\x03\x04", "zip"),
+)
+
+# Extensiones que indican compresión y se ignoran al determinar el tipo de archivo
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz", ".zip")
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """
+    Detecta el formato de compresión a partir de los primeros bytes.
+
+    Args:
+        head: Bytes iniciales del archivo (al menos 10)
+
+    Returns:
+        "gzip", "bz2", "xz", "zip" o None si el contenido no está comprimido
+    """
+    for signature, compression in _COMPRESSION_SIGNATURES:
+        if head.startswith(signature):
+            return compression
+
+    # bzip2: "BZh" + tamaño de bloque (1-9) + firma del primer bloque
+    if head[:3] == b"BZh" and head[3:4].isdigit() and head[4:10] == b"1AY&SY":
+        return "bz2"
+
+    return None
+
+
+def file_compression(path: Path) -> Optional[str]:
+    """
+    Detecta el formato de compresión de un archivo por sus magic bytes.
+
+    Args:
+        path: Archivo a inspeccionar
+
+    Returns:
+        Formato de compresión o None si el archivo no está comprimido
+    """
+    with open(path, "rb") as f:
+        return detect_compression(f.read(10))
+
+
+class _DigestReader(io.RawIOBase):
+    """
+    Lector que calcula la huella de un archivo con los mismos bytes que se leen.
+
+    Solo se incorporan los bytes leídos en orden desde el inicio; los que no
+    se leyeron así (acceso aleatorio a un zip o contenido no consumido) se
+    leen al pedir la huella, desde el mismo descriptor abierto.
+    """
+
+    def __init__(self, raw: io.FileIO) -> None:
+        self._raw = raw
+        self._digest = hashlib.blake2b(digest_size=20)
+        self._hashed = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._raw.fileno()
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def readinto(self, buffer: Any) -> Optional[int]:
+        position = self._raw.tell()
+        count = self._raw.readinto(buffer)
+        if count and position <= self._hashed < position + count:
+            self._digest.update(memoryview(buffer)[self._hashed - position : count])
+            self._hashed = position + count
+        return count
+
+    def hexdigest(self) -> str:
+        """Huella BLAKE2b del archivo completo (igual a file_content_hash)"""
+        position = self._raw.tell()
+        self._raw.seek(self._hashed)
+        for chunk in iter(lambda: self._raw.read(HASH_CHUNK_SIZE), b""):
+            self._digest.update(chunk)
+            self._hashed += len(chunk)
+        self._raw.seek(position)
+        return self._digest.hexdigest()
+
+    def close(self) -> None:
+        self._raw.close()
+        super().close()
+
+
+class InputFile:
+    """
+    Archivo de entrada con descompresión transparente en streaming.
+
+    Detecta gzip, bzip2, xz y zip por sus magic bytes y descomprime mientras
+    se lee, sin archivos temporales. La posición en el archivo original
+    (comprimido) permite reportar progreso por bytes.
+    """
+
+    def __init__(self, path: Path, newline: Optional[str] = None, errors: str = "strict", hash_content: bool = False) -> None:
+        """
+        Abre un archivo de entrada.
+
+        Args:
+            path: Archivo a abrir (comprimido o no)
+            newline: Manejo de saltos de línea (como en open())
+            errors: Manejo de errores de decodificación UTF-8 (como en open())
+            hash_content: Calcular la huella del archivo original mientras se lee (ver content_hash)
+        """
+        self.path = Path(path)
+        self.member_name: Optional[str] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._digest: Optional[_DigestReader] = None
+        self._raw: IO[bytes]
+        if hash_content:
+            self._digest = _DigestReader(io.FileIO(path, "rb"))
+            self._raw = io.BufferedReader(self._digest)
+        else:
+            self._raw = open(path, "rb")
+        try:
+            self.size = os.fstat(self._raw.fileno()).st_size
+            self.compression = detect_compression(self._raw.read(10))
+            self._raw.seek(0)
+            self.stream = self._open_stream()
+        except BaseException:
+            # Un zip corrupto o vacío no debe dejar abierto el archivo original
+            if self._zip is not None:
+                self._zip.close()
+            self._raw.close()
+            raise
+
+        self._newline = newline
+        self._errors = errors
+        self._text: Optional[io.TextIOWrapper] = None
+
+    def _open_stream(self) -> IO[bytes]:
+        """Flujo de bytes descomprimido según self.compression"""
+        if self.compression == "gzip":
+            return gzip.GzipFile(fileobj=self._raw, mode="rb")
+        if self.compression == "bz2":
+            return bz2.BZ2File(self._raw, mode="rb")
+        if self.compression == "xz":
+            return lzma.LZMAFile(self._raw, mode="rb")
+        if self.compression == "zip":
+            self._zip = zipfile.ZipFile(self._raw)
+            members = [info for info in self._zip.infolist() if not info.is_dir()]
+            if not members:
+                raise ValueError(f"El archivo zip no contiene archivos: {self.path.name}")
+            self.member_name = members[0].filename
+            return self._zip.open(members[0])
+        return self._raw
+
+    @property
+    def text(self) -> io.TextIOWrapper:
+        """Flujo de texto UTF-8 sobre el contenido descomprimido"""
+        if self._text is None:
+            self._text = io.TextIOWrapper(
+                self.stream,  # type: ignore[arg-type]
+                encoding="utf-8",
+                errors=self._errors,
+                newline=self._newline,
+            )
+        return self._text
+
+    @property
+    def suffix(self) -> str:
+        """Extensión lógica del contenido, ignorando las extensiones de compresión"""
+        return logical_suffix(Path(self.member_name) if self.member_name else self.path)
+
+    def position(self) -> int:
+        """Posición actual en el archivo original (comprimido) en bytes"""
+        return self._raw.tell()
+
+    def content_hash(self) -> str:
+        """
+        Huella del archivo original, calculada con los mismos bytes leídos.
+
+        Coincide con file_content_hash si el archivo no cambió, pero no requiere
+        una segunda lectura y corresponde siempre al contenido analizado.
+
+        Raises:
+            ValueError: Si el archivo no se abrió con hash_content
+        """
+        if self._digest is None:
+            raise ValueError("El archivo no se abrió con hash_content=True")
+        return self._digest.hexdigest()
+
+    def close(self) -> None:
+        """Cierra el flujo descomprimido y el archivo original"""
+        if self._text is not None:
+            self._text.detach()
+        if self.stream is not self._raw:
+            self.stream.close()
+        if self._zip is not None:
+            self._zip.close()
+        self._raw.close()
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def open_input(path: Path, newline: Optional[str] = None, errors: str = "strict", hash_content: bool = False) -> InputFile:
+    """
+    Abre un archivo de entrada descomprimiéndolo de forma transparente.
+
+    Args:
+        path: Archivo a abrir
+        newline: Manejo de saltos de línea (como en open())
+        errors: Manejo de errores de decodificación UTF-8 (como en open())
+        hash_content: Calcular la huella del archivo original mientras se lee
+
+    Returns:
+        InputFile listo para leer como texto mediante su atributo ``text``
+    """
+    return InputFile(path, newline=newline, errors=errors, hash_content=hash_content)
+
+
+def logical_suffix(path: Path) -> str:
+    """
+    Retorna la extensión del contenido ignorando extensiones de compresión.
+
+    Args:
+        path: Ruta del archivo (ej: "export.csv.gz")
+
+    Returns:
+        Extensión en minúsculas (ej: ".csv")
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    while suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    return suffixes[-1] if suffixes else ""
+
+
+def input_suffix(path: Path) -> str:
+    """
+    Determina el tipo de contenido de un archivo, inspeccionando archivos zip.
+
+    Args:
+        path: Archivo a inspeccionar
+
+    Returns:
+        Extensión lógica del contenido (ej: ".csv")
+    """
+    if Path(path).suffix.lower() != ".zip":
+        return logical_suffix(path)
+
+    with open_input(path) as input_file:
+        return input_file.suffix
+
+
+def is_binary_file(path: Path, sniff_bytes: int = SNIFF_BYTES) -> bool:
+    """
+    Determina de forma económica si un archivo es binario.
+
+    Inspecciona solo el primer bloque del contenido (descomprimido si el
+    archivo está comprimido): un byte nulo o una proporción alta de bytes de
+    control indican contenido binario.
+
+    Args:
+        path: Ruta del archivo a inspeccionar
+        sniff_bytes: Cantidad máxima de bytes a leer
+
+    Returns:
+        True si el archivo parece binario, False en caso contrario
+
+    Raises:
+        OSError: Si el archivo no puede leerse
+        EOFError, ValueError, zipfile.BadZipFile, lzma.LZMAError: Si el contenido
+            comprimido está corrupto
+    """
+    with open_input(path) as input_file:
+        chunk = input_file.stream.read(sniff_bytes)
+
+    return is_binary_chunk(chunk)
+
+
+def is_binary_chunk(chunk: bytes) -> bool:
+    """
+    Determina si un bloque de bytes corresponde a contenido binario.
+
+    Args:
+        chunk: Bytes iniciales del contenido
+
+    Returns:
+        True si el bloque parece binario, False en caso contrario
+    """
+    if not chunk:
+        return False
+
+    if b"\x00" in chunk:
+        return True
+
+    control_bytes = sum(1 for byte in chunk if byte < 32 and byte not in _TEXT_CONTROL_BYTES)
+    return control_bytes / len(chunk) > 0.30
+
+
+def matches_any(relative_path: str, patterns: Sequence[str]) -> bool:
+    """
+    Verifica si una ruta relativa coincide con alguno de los patrones glob.
+
+    Cada patrón se compara tanto contra la ruta relativa completa como
+    contra el nombre del archivo, de modo que "*.csv" y "logs/*.log"
+    funcionan de forma intuitiva.
+
+    Args:
+        relative_path: Ruta relativa en formato POSIX
+        patterns: Patrones glob a evaluar
+
+    Returns:
+        True si algún patrón coincide
+    """
+    name = relative_path.rsplit("/", 1)[-1]
+    return any(fnmatch(relative_path, pattern) or fnmatch(name, pattern) for pattern in patterns)
+
+
+def iter_files(root: Path, include: Sequence[str], exclude: Sequence[str] = ()) -> Iterator[Path]:
+    """
+    Recorre recursivamente un directorio aplicando filtros glob.
+
+    Args:
+        root: Directorio raíz a recorrer
+        include: Patrones glob de archivos a incluir
+        exclude: Patrones glob de archivos o directorios a excluir
+
+    Yields:
+        Rutas de archivos que cumplen los filtros, en orden determinista
+    """
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+
+        relative_path = path.relative_to(root).as_posix()
+        if exclude and matches_any(relative_path, exclude):
+            continue
+        if matches_any(relative_path, include):
+            yield path
+
+
+def iter_cells(path: Path, column: Optional[str] = None) -> Iterator[Tuple[int, Optional[str], str]]:
+    """
+    Extrae las celdas de un archivo CSV o las líneas de un archivo de texto.
+
+    A diferencia de iter_file_values, no construye una descripción de la
+    ubicación por valor, lo que evita asignaciones en recorridos agregados.
+
+    Args:
+        path: Archivo a leer (los comprimidos se descomprimen en streaming)
+        column: Columna específica a extraer (solo CSV)
+
+    Yields:
+        Tuplas (número de fila o de línea no vacía, columna o None en texto, valor)
+    """
+    is_csv = input_suffix(path) == ".csv"
+
+    with open_input(path, newline="" if is_csv else None, errors="replace") as input_file:
+        f = input_file.text
+        if is_csv:
+            for row_number, row in enumerate(csv.DictReader(f), 1):
+                if column:
+                    value = row.get(column)
+                    if value:
+                        yield row_number, column, value
+                    continue
+
+                for col_name, value in row.items():
+                    if isinstance(value, str) and value.strip():
+                        yield row_number, col_name, value
+
+        else:
+            line_number = 0
+            for line in f:
+                line = line.strip()
+                if line:
+                    line_number += 1
+                    yield line_number, None, line
+
+
+def read_csv_header(f: IO[bytes]) -> List[str]:
+    """Lee y decodifica la línea de encabezado de un CSV abierto en modo binario"""
+    return next(csv.reader([f.readline().decode("utf-8-sig", errors="replace")]), [])
+
+
+def _line_containing(content: mmap.mmap, offset: int, start: int) -> bytes:
+    """Línea completa (con su salto final) que contiene el byte offset, sin retroceder antes de start"""
+    line_start = max(content.rfind(b"\n", start, offset) + 1, start)
+    line_end = content.find(b"\n", offset)
+    return content[line_start : len(content) if line_end < 0 else line_end + 1]
+
+
+def iter_random_rows(
+    path: Path, rng: random.Random, column: Optional[str] = None
+) -> Iterator[List[Tuple[Optional[str], str]]]:
+    """
+    Extrae las celdas de filas elegidas al azar mediante acceso directo al archivo.
+
+    Cada intento elige un byte al azar y lee la línea que lo contiene desde el
+    archivo mapeado en memoria, por lo que el costo no depende del tamaño del
+    archivo. Como una línea larga
+    contiene más bytes, el intento se acepta con probabilidad
+    ``largo_mínimo / largo_de_la_línea`` (muestreo por rechazo): las filas
+    válidas se sortean de forma uniforme y con reemplazo. ``largo_mínimo`` es
+    una cota inferior del largo de una fila válida: una celda por columna del
+    encabezado separada por comas, o un carácter visible en texto. Las filas
+    CSV con saltos de línea entre comillas no se pueden reconstruir y se
+    descartan. Solo admite archivos sin comprimir.
+
+    Args:
+        path: Archivo CSV o de texto sin comprimir
+        rng: Generador pseudoaleatorio
+        column: Columna específica a extraer (solo CSV)
+
+    Yields:
+        Por cada fila sorteada, de forma indefinida, la lista de tuplas
+        (columna o None en texto, valor); vacía si la fila se descartó
+    """
+    is_csv = input_suffix(path) == ".csv"
+
+    with open(path, "rb") as f:
+        header: Optional[List[str]] = None
+        start = 0
+        if is_csv:
+            header = read_csv_header(f)
+            if column and column not in header:
+                return
+            start = f.tell()
+
+        size = os.fstat(f.fileno()).st_size
+        if size <= start:
+            return
+
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with content:
+        size = len(content)
+        # La última línea sin salto final cuenta con uno virtual, para que su
+        # peso sea su largo más el salto, como el de las demás líneas
+        span = size if content[size - 1 : size] == b"\n" else size + 1
+        min_length = max(len(header), 1) if header is not None else 2
+
+        while True:
+            offset = min(rng.randrange(start, span), size - 1)
+            line = _line_containing(content, offset, start)
+            weight = len(line) if line.endswith(b"\n") else len(line) + 1
+            if weight > min_length and rng.random() * weight >= min_length:
+                continue
+
+            text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            if header is None:
+                yield [(None, text.strip())] if text.strip() else []
+                continue
+
+            values = next(csv.reader([text]), [])
+            if len(values) != len(header):
+                yield []
+                continue
+            yield [
+                (col_name, value)
+                for col_name, value in zip(header, values)
+                if (column is None or col_name == column) and value.strip()
+            ]
+
+
+def iter_file_values(
+    path: Path, column: Optional[str] = None, on_content_hash: Optional[Callable[[str], None]] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Extrae los valores a analizar desde un archivo según su tipo.
+
+    - CSV: cada celda no vacía (o solo la columna indicada)
+    - JSON: cada valor escalar del documento (o de cada línea en JSON Lines)
+    - Otros: cada línea no vacía
+
+    Los archivos comprimidos (gzip, bzip2, xz, zip) se descomprimen en streaming.
+
+    Args:
+        path: Archivo a leer
+        column: Columna específica a extraer (solo CSV)
+        on_content_hash: Función invocada al agotar los valores con la huella del
+            archivo, calculada con los mismos bytes leídos (ver InputFile.content_hash)
+
+    Yields:
+        Tuplas (ubicación, valor) donde la ubicación describe el origen del valor
+    """
+    suffix = input_suffix(path)
+
+    with open_input(
+        path, newline="" if suffix == ".csv" else None, errors="replace", hash_content=on_content_hash is not None
+    ) as input_file:
+        f = input_file.text
+        if suffix == ".csv":
+            for row_number, row in enumerate(csv.DictReader(f), 1):
+                if column:
+                    value = row.get(column)
+                    if value:
+                        yield f"Fila {row_number}, {column}", value
+                    continue
+
+                for col_name, value in row.items():
+                    if isinstance(value, str) and value.strip():
+                        yield f"Fila {row_number}, {col_name}", value
+
+        elif suffix == ".json":
+            content = f.read()
+            try:
+                document = json.loads(content)
+            except json.JSONDecodeError:
+                yield from _iter_json_lines(content)
+            else:
+                yield from _iter_json_scalars(document, "$")
+
+        else:
+            line_number = 0
+            for line in f:
+                line = line.strip()
+                if line:
+                    line_number += 1
+                    yield f"Línea {line_number}", line
+
+        if on_content_hash is not None:
+            on_content_hash(input_file.content_hash())
+
+
+def _iter_json_lines(content: str) -> Iterator[Tuple[str, str]]:
+    """Extrae valores de un contenido JSON Lines, tratando como texto las líneas inválidas"""
+    for line_number, line in enumerate(content.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            document = json.loads(line)
+        except json.JSONDecodeError:
+            yield f"Línea {line_number}", line
+        else:
+            yield from _iter_json_scalars(document, f"Línea {line_number}: $")
+
+
+def _iter_json_scalars(node: Any, location: str) -> Iterator[Tuple[str, str]]:
+    """Recorre un documento JSON y entrega sus valores escalares no vacíos"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _iter_json_scalars(value, f"{location}.{key}")
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            yield from _iter_json_scalars(value, f"{location}[{index}]")
+    elif isinstance(node, bool) or node is None:
+        return
+    else:
+        value = str(node)
+        if value.strip():
+            yield location, value
+
+
+def file_content_hash(path: Path) -> str:
+    """
+    Calcula la huella BLAKE2b del contenido de un archivo.
+
+    Args:
+        path: Archivo a procesar
+
+    Returns:
+        Huella hexadecimal del contenido
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
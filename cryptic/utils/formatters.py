@@ -8,7 +8,10 @@ operaciones de limpieza de datos.
 
 import base64
 import re
-from typing import Any, Dict, List, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+
+if TYPE_CHECKING:
+    from cryptic.utils.features import ValueFeatures
 
 
 def clean_hash(hash_string: str) -> str:
@@ -43,16 +46,21 @@ def is_base64(s: str) -> bool:
     return False
 
 
-def analyze_charset(hash_string: str) -> Dict[str, bool]:
+def analyze_charset(hash_string: str, features: Optional["ValueFeatures"] = None) -> Dict[str, bool]:
     """
     Analiza el conjunto de caracteres usado en el hash.
 
     Args:
         hash_string: Cadena a analizar
+        features: Características de hash_string ya calculadas; si el valor es
+            ASCII y sin espacios, el análisis se deriva de sus conteos sin regex
 
     Returns:
         Diccionario con análisis de conjuntos de caracteres
     """
+    if features is not None and features.ascii and not features.whitespace:
+        return _charset_from_features(hash_string, features)
+
     analysis = {
         "hex_lowercase": bool(re.match(r"^[0-9a-f]+$", hash_string)),
         "hex_uppercase": bool(re.match(r"^[0-9A-F]+$", hash_string)),
@@ -98,3 +106,22 @@ def analyze_format(hash_string: str) -> Dict[str, Any]:
         }
 
     return analysis
+
+
+def _charset_from_features(hash_string: str, features: "ValueFeatures") -> Dict[str, bool]:
+    """Equivalente de analyze_charset calculado a partir de los conteos de un valor ASCII"""
+    length = features.length
+    alphanumeric = features.digits + features.alpha
+    all_hex = length > 0 and features.hex == length
+    base64_chars = alphanumeric + features.plus + features.slash + features.equals == length
+    return {
+        "hex_lowercase": all_hex and features.upper == 0,
+        "hex_uppercase": all_hex and features.alpha == features.upper,
+        "hex_mixed": all_hex,
+        "base64": base64_chars and features.equals <= 2 and is_base64(hash_string),
+        "alphanumeric": length > 0 and alphanumeric == length,
+        "has_special_chars": alphanumeric < length,
+        "has_dollar_signs": features.dollar > 0,
+        "has_dots": features.dot > 0,
+        "has_slashes": features.slash > 0 or features.backslash > 0,
+    }
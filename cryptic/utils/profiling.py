@@ -0,0 +1,240 @@
+"""
+Perfilado de CPU y memoria de una ejecución de la CLI.
+
+``RunProfiler`` envuelve una ejecución con ``cProfile`` y/o ``tracemalloc``.
+Al detenerse guarda los datos crudos (un archivo ``.pstats`` para
+``pstats``/snakeviz y una instantánea de ``tracemalloc.Snapshot.load``) y
+resume las funciones y los sitios de asignación dentro del paquete
+``cryptic``. Una asignación hecha fuera del paquete (por ejemplo al compilar
+una regex) se atribuye a la línea de cryptic más reciente de su traza.
+
+tracemalloc solo conoce la memoria viva: al terminar un comando sus
+resultados ya fueron liberados. Por eso un hilo vigila la memoria trazada y
+toma una instantánea cada vez que crece más de un 10 % sobre la anterior; el
+resumen y el archivo crudo corresponden a la instantánea más grande, cercana
+al pico de la ejecución.
+
+Ambos perfiladores encarecen la ejecución (tracemalloc unas 4 veces en un
+batch) y activarlos juntos multiplica el costo, porque tracemalloc también
+traza las asignaciones de cProfile: conviene usarlos por separado.
+
+Ejemplo:
+    >>> profiler = RunProfiler(profile_path=Path("run.pstats"))
+    >>> profiler.start()
+    >>> _ = CrypticAnalyzer().analyze_data("juan@empresa.cl")
+    >>> profiler.stop()
+    >>> profiler.functions[0]["function"].startswith("cryptic/")
+    True
+"""
+
+import cProfile
+import importlib
+import os
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import cryptic
+
+# Directorio del paquete, usado para atribuir funciones y asignaciones
+PACKAGE_DIR = os.path.dirname(os.path.abspath(cryptic.__file__))
+
+# Cuadros de pila guardados por asignación por defecto. Las funciones en C
+# (re, csv) no agregan cuadros, por lo que uno basta para atribuir a cryptic la
+# mayoría de las asignaciones del análisis; cada cuadro extra encarece todas
+# las asignaciones (en un batch: 4,5x más lento con 1 cuadro, 15x con 4)
+TRACEMALLOC_FRAMES = 1
+
+# Módulos importados antes de iniciar tracemalloc: importar con la traza
+# activa es muy lento y no dice nada del análisis
+PRELOAD_MODULES = (
+    "csv",
+    "json",
+    "yaml",
+    "cryptic.core.aggregate",
+    "cryptic.core.analyzer",
+    "cryptic.core.column_memo",
+    "cryptic.core.headers",
+    "cryptic.core.result_table",
+    "cryptic.core.sampling",
+    "cryptic.utils.files",
+)
+
+# Entradas incluidas en los resúmenes
+DEFAULT_TOP = 15
+
+# Segundos entre consultas de la memoria trazada
+PEAK_POLL_INTERVAL = 0.05
+
+# Crecimiento relativo de la memoria trazada que provoca una nueva instantánea
+PEAK_GROWTH = 1.1
+
+
+def _in_package(filename: str) -> bool:
+    return os.path.abspath(filename).startswith(PACKAGE_DIR + os.sep)
+
+
+def _relative(filename: str) -> str:
+    """Ruta relativa al directorio que contiene el paquete (ej: cryptic/core/analyzer.py)"""
+    return os.path.relpath(os.path.abspath(filename), os.path.dirname(PACKAGE_DIR))
+
+
+def top_functions(stats: pstats.Stats, limit: int = DEFAULT_TOP) -> List[Dict[str, Any]]:
+    """
+    Funciones de cryptic con mayor tiempo propio.
+
+    Args:
+        stats: Estadísticas de cProfile
+        limit: Cantidad máxima de funciones
+
+    Returns:
+        Lista de diccionarios con function ("archivo:línea(nombre)"), calls,
+        total_s (tiempo propio) y cumulative_s, ordenada por total_s
+    """
+    rows = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():  # type: ignore[attr-defined]
+        if _in_package(filename):
+            rows.append(
+                {
+                    "function": f"{_relative(filename)}:{line}({name})",
+                    "calls": calls,
+                    "total_s": total,
+                    "cumulative_s": cumulative,
+                }
+            )
+    rows.sort(key=lambda row: row["total_s"], reverse=True)
+    return rows[:limit]
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int = DEFAULT_TOP) -> List[Dict[str, Any]]:
+    """
+    Sitios de cryptic con más memoria asignada y aún viva al tomar la instantánea.
+
+    Args:
+        snapshot: Instantánea de tracemalloc
+        limit: Cantidad máxima de sitios
+
+    Returns:
+        Lista de diccionarios con location ("archivo:línea"), size_kib y count,
+        ordenada por size_kib
+    """
+    sites: Dict[Tuple[str, int], List[int]] = {}
+    for statistic in snapshot.statistics("traceback"):
+        # Cuadros del más antiguo al más reciente: se busca el último dentro del paquete
+        for frame in reversed(statistic.traceback):
+            if _in_package(frame.filename):
+                site = sites.setdefault((frame.filename, frame.lineno), [0, 0])
+                site[0] += statistic.size
+                site[1] += statistic.count
+                break
+
+    rows = [
+        {"location": f"{_relative(filename)}:{line}", "size_kib": size / 1024, "count": count}
+        for (filename, line), (size, count) in sites.items()
+    ]
+    rows.sort(key=lambda row: row["size_kib"], reverse=True)
+    return rows[:limit]
+
+
+class RunProfiler:
+    """Perfilador de CPU (cProfile) y memoria (tracemalloc) de una ejecución"""
+
+    def __init__(
+        self,
+        profile_path: Optional[Path] = None,
+        memory_path: Optional[Path] = None,
+        top: int = DEFAULT_TOP,
+        frames: int = TRACEMALLOC_FRAMES,
+    ) -> None:
+        """
+        Inicializa el perfilador.
+
+        Args:
+            profile_path: Archivo .pstats donde guardar el perfil de CPU (None = sin cProfile)
+            memory_path: Archivo donde guardar la instantánea de tracemalloc (None = sin tracemalloc)
+            top: Entradas incluidas en cada resumen
+            frames: Cuadros de pila guardados por asignación (más cuadros atribuyen
+                a cryptic las asignaciones hechas en código Python de terceros)
+        """
+        self.profile_path = profile_path
+        self.memory_path = memory_path
+        self.top = top
+        self.frames = frames
+        self.functions: List[Dict[str, Any]] = []
+        self.allocations: List[Dict[str, Any]] = []
+        self.peak_bytes = 0
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        # Instantánea más grande tomada durante la ejecución y su memoria trazada
+        self._peak_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak_traced = 0
+        # La instantánea conservada también es memoria trazada: se descuenta al comparar
+        self._snapshot_overhead = 0
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampler = threading.Event()
+
+    def start(self) -> None:
+        """Comienza a perfilar (tracemalloc antes que cProfile, para no medir su arranque)"""
+        if self.memory_path is not None and not tracemalloc.is_tracing():
+            for name in PRELOAD_MODULES:
+                importlib.import_module(name)
+            tracemalloc.start(self.frames)
+            self._started_tracemalloc = True
+        if self.memory_path is not None:
+            self._stop_sampler.clear()
+            self._sampler = threading.Thread(target=self._sample_peak, name="cryptic-memory-profile", daemon=True)
+            self._sampler.start()
+        if self.profile_path is not None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self) -> None:
+        """Detiene el perfilado, guarda los archivos crudos y calcula los resúmenes"""
+        if self._profiler is not None:
+            self._profiler.disable()
+            assert self.profile_path is not None
+            self._profiler.dump_stats(str(self.profile_path))
+            self.functions = top_functions(pstats.Stats(self._profiler), self.top)
+            self._profiler = None
+
+        if self._sampler is not None:
+            self._stop_sampler.set()
+            self._sampler.join()
+            self._sampler = None
+
+        if self.memory_path is not None and tracemalloc.is_tracing():
+            self._take_snapshot()
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+            assert self._peak_snapshot is not None
+            self._peak_snapshot.dump(str(self.memory_path))
+            self.allocations = top_allocations(self._peak_snapshot, self.top)
+            self._peak_snapshot = None
+            self._snapshot_overhead = 0
+
+    def _traced(self) -> int:
+        """Memoria trazada actual sin contar la instantánea conservada"""
+        return tracemalloc.get_traced_memory()[0] - self._snapshot_overhead
+
+    def _take_snapshot(self) -> None:
+        """Toma una instantánea y la conserva si hay más memoria trazada que en la anterior"""
+        traced = self._traced()
+        if self._peak_snapshot is not None and traced <= self._peak_traced:
+            return
+        # Liberar la instantánea anterior antes de tomar la nueva
+        self._peak_snapshot = None
+        self._snapshot_overhead = 0
+        before = tracemalloc.get_traced_memory()[0]
+        self._peak_snapshot = tracemalloc.take_snapshot()
+        self._snapshot_overhead = tracemalloc.get_traced_memory()[0] - before
+        self._peak_traced = before
+
+    def _sample_peak(self) -> None:
+        """Hilo que toma instantáneas mientras la memoria trazada crece"""
+        while not self._stop_sampler.wait(PEAK_POLL_INTERVAL):
+            if tracemalloc.is_tracing() and self._traced() > self._peak_traced * PEAK_GROWTH:
+                self._take_snapshot()
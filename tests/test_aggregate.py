@@ -0,0 +1,126 @@
+"""
+Tests para el modo solo-resumen.
+
+Este módulo valida el muestreo de reservorio, los conteos agregados por
+columna y las opciones --summary-only de verify y batch.
+"""
+
+import json
+import random
+import tempfile
+from pathlib import Path
+
+import yaml
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.aggregate import ReservoirSample, SummaryAccumulator, summarize_file
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.utils.files import iter_cells
+
+CSV_CONTENT = (
+    "email,hash,nota\n"
+    + "juan.perez@empresa.cl,5d41402abc4b2a76b9719d911017c592,sin datos\n" * 30
+    + "maria@company.com,$2b$12$N9qo8uLOickgx2ZMRZoMye,RUT 12.345.678-5\n" * 20
+)
+
+
+def _write_csv(tmp: str) -> Path:
+    """Escribe el CSV de prueba en un directorio temporal"""
+    path = Path(tmp) / "data.csv"
+    path.write_text(CSV_CONTENT, encoding="utf-8")
+    return path
+
+
+class TestReservoirSample:
+    """Tests para ReservoirSample"""
+
+    def test_bounded_size(self):
+        """Test que el reservorio nunca supera su tamaño"""
+        sample = ReservoirSample(5, random.Random(0))
+        for i in range(1000):
+            sample.add(i)
+        assert sample.seen == 1000
+        assert len(sample.items) == 5
+        assert len(set(sample.items)) == 5
+
+    def test_uniform_selection(self):
+        """Test que todos los elementos tienen probabilidad similar de quedar en la muestra"""
+        rng = random.Random(1)
+        counts = [0] * 10
+        for _ in range(2000):
+            sample = ReservoirSample(2, rng)
+            for i in range(10):
+                sample.add(i)
+            for item in sample.items:
+                counts[item] += 1
+
+        # Esperado: 2000 * 2 / 10 = 400 por elemento
+        assert all(300 < count < 500 for count in counts)
+
+
+class TestSummaryAccumulator:
+    """Tests para SummaryAccumulator y summarize_file"""
+
+    def test_totals_match_full_report(self):
+        """Test que los totales coinciden con el reporte completo"""
+        analyzer = CrypticAnalyzer()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_csv(tmp)
+            summary = summarize_file(analyzer, path, samples_per_group=3)
+            report = analyzer.generate_report([analyzer.analyze_data(value) for _, _, value in iter_cells(path)])
+
+        for key in ("total_analyzed", "protected", "unprotected", "protection_rate", "hash_types_detected"):
+            assert summary[key] == report[key]
+
+        columns = summary["columns"]
+        assert columns["email"]["sensitive_by_type"] == {"Email": 50}
+        assert columns["nota"]["sensitive_by_type"]["RUT Chileno"] == 20
+        assert columns["hash"]["hash_types_detected"]["bcrypt"] == 20
+        assert all(len(samples) <= 3 for samples in columns["email"]["samples"].values())
+
+    def test_samples_keep_row_and_value(self):
+        """Test que las muestras conservan la fila y el valor original"""
+        accumulator = SummaryAccumulator(samples_per_group=2)
+        analyzer = CrypticAnalyzer()
+        accumulator.add(7, "email", analyzer.analyze_data("juan.perez@empresa.cl"))
+
+        samples = accumulator.summary()["columns"]["email"]["samples"]
+        assert samples == {"Email": [{"row": 7, "value": "juan.perez@empresa.cl"}]}
+
+
+class TestSummaryOnlyCommands:
+    """Tests para --summary-only en verify y batch"""
+
+    def test_verify_summary_only(self):
+        """Test verify --summary-only con reporte JSON"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_csv(tmp)
+            output = Path(tmp) / "summary.json"
+            result = runner.invoke(cli, ["verify", str(path), "--summary-only", "-o", str(output), "-f", "json"])
+
+            assert result.exit_code == 0
+            assert "Total de elementos analizados: 150" in result.output
+            summary = json.loads(output.read_text(encoding="utf-8"))["summary"]
+            assert summary["sensitive_by_type"]["Email"] == 50
+
+    def test_batch_summary_only_yaml(self):
+        """Test batch --summary-only con reporte YAML"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_csv(tmp)
+            output = Path(tmp) / "summary.yaml"
+            result = runner.invoke(cli, ["batch", str(path), "--summary-only", "-o", str(output), "-f", "yaml"])
+
+            assert result.exit_code == 0
+            summary = yaml.safe_load(output.read_text(encoding="utf-8"))["summary"]
+            assert summary["columns"]["hash"]["total_analyzed"] == 50
+
+    def test_batch_summary_only_rejects_csv(self):
+        """Test que --summary-only rechaza formatos por celda"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_csv(tmp)
+            result = runner.invoke(cli, ["batch", str(path), "--summary-only", "-o", str(Path(tmp) / "out.csv"), "-f", "csv"])
+            assert result.exit_code == 1
@@ -0,0 +1,275 @@
+"""
+Tests para los backends de ejecución paralela.
+
+Este módulo valida el empaquetado en bytes de bloques y resultados, que
+``IsolatedAnalysisPool`` retorne los mismos análisis que el análisis
+secuencial con procesos y subintérpretes, el executor de subintérpretes, el
+escaneo con cada backend, los workers bifurcados desde el fork server
+precalentado (sin reemplazar la precarga de la aplicación) y la opción ``--backend`` de ``cryptic batch``. Los tests de
+subintérpretes se omiten en intérpretes anteriores a Python 3.13.
+"""
+
+import gc
+import multiprocessing
+from multiprocessing import forkserver
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core import backends
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.backends import (
+    BACKEND_PROCESS,
+    BACKEND_SUBINTERPRETER,
+    BACKEND_THREAD,
+    PREWARM_MODULE,
+    IsolatedAnalysisPool,
+    SubinterpreterPoolExecutor,
+    analyze_chunk,
+    create_executor,
+    decode_values,
+    encode_values,
+    pack_payloads,
+    prewarmed_context,
+    subinterpreters_available,
+    unpack_payloads,
+)
+from cryptic.core.scanner import scan_directory
+
+VALUES = [
+    "juan.perez@empresa.cl",
+    "12.345.678-5",
+    "5d41402abc4b2a76b9719d911017c592",
+    "Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592",
+    "línea con\nsalto y ñandú",
+] * 20
+
+requires_subinterpreters = pytest.mark.skipif(
+    not subinterpreters_available(), reason="Los subintérpretes aislados requieren Python 3.13 o posterior"
+)
+
+requires_forkserver = pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(), reason="La plataforma no tiene fork server"
+)
+
+
+def worker_state(_):
+    """Estado heredado por un worker: si ya tiene analizador y cuántos objetos congelados"""
+    return backends._WORKER_ANALYZER is not None, gc.get_freeze_count()
+
+
+def summarize(analysis):
+    """Campos del análisis que no dependen del tiempo"""
+    matches = analysis.sensitive_analysis.matches if analysis.sensitive_analysis else []
+    return (
+        analysis.original_data,
+        analysis.protection_status,
+        analysis.confidence,
+        analysis.recommendations,
+        [(match.data_type, match.matched_text) for match in matches],
+    )
+
+
+class TestChunkEncoding:
+    """Tests para los bloques y resultados en bytes"""
+
+    def test_values_round_trip(self):
+        """Test que los valores sobreviven saltos de línea y caracteres no ASCII"""
+        assert decode_values(encode_values(VALUES[:5])) == VALUES[:5]
+
+    def test_pack_unpack(self):
+        """Test que los resultados se separan como vistas sobre el bloque recibido"""
+        payloads = [b"uno", b"", b"\x00\x01" * 300]
+        packed = pack_payloads(payloads)
+        unpacked = unpack_payloads(packed)
+
+        assert [bytes(view) for view in unpacked] == payloads
+        assert all(view.obj is packed for view in unpacked)
+
+    def test_analyze_chunk(self):
+        """Test del análisis de un bloque tal como lo ejecuta un worker"""
+        assert len(unpack_payloads(analyze_chunk(encode_values(VALUES[:5])))) == 5
+
+
+class TestIsolatedAnalysisPool:
+    """Tests para el pool de workers aislados"""
+
+    @pytest.mark.parametrize(
+        "backend", [BACKEND_PROCESS, pytest.param(BACKEND_SUBINTERPRETER, marks=requires_subinterpreters)]
+    )
+    def test_matches_sequential(self, backend):
+        """Test que el pool retorna los mismos análisis en el mismo orden"""
+        expected = [summarize(analysis) for analysis in CrypticAnalyzer().analyze_batch(VALUES)]
+
+        with IsolatedAnalysisPool(backend, workers=2, chunk_size=15) as pool:
+            results = pool.analyze(VALUES)
+
+        assert [summarize(analysis) for analysis in results] == expected
+
+    def test_shared_cache(self, tmp_path):
+        """Test que los workers escriben en la caché persistente indicada"""
+        from cryptic.core.cache import AnalysisCache
+
+        with IsolatedAnalysisPool(BACKEND_PROCESS, workers=2, chunk_size=50, cache_path=tmp_path / "c.db") as pool:
+            pool.analyze(VALUES)
+
+        cache = AnalysisCache(tmp_path / "c.db")
+        assert len(cache) == 5
+        cache.close()
+
+    def test_rejects_thread_backend(self):
+        """Test que los hilos no son un backend aislado"""
+        with pytest.raises(ValueError):
+            IsolatedAnalysisPool(BACKEND_THREAD, workers=2)
+
+    def test_unknown_backend(self):
+        """Test que create_executor rechaza backends desconocidos"""
+        with pytest.raises(ValueError, match="Backend desconocido"):
+            create_executor("gpu", 2)
+
+
+@requires_forkserver
+class TestPrewarmedProcesses:
+    """Tests para los workers bifurcados desde el fork server precalentado"""
+
+    def test_context(self):
+        """Test que el contexto usa el fork server con la precarga de Cryptic"""
+        assert prewarmed_context().get_start_method() == "forkserver"
+
+    def test_preload_is_appended(self, monkeypatch):
+        """Test que la precarga de Cryptic se agrega a la configurada por la aplicación"""
+        server = forkserver.ForkServer()
+        monkeypatch.setattr(forkserver, "_forkserver", server)
+        server.set_forkserver_preload(["__main__", "json"])
+
+        prewarmed_context()
+        prewarmed_context()
+
+        assert server._preload_modules == ["__main__", "json", PREWARM_MODULE]
+
+    def test_running_server_is_left_alone(self, monkeypatch):
+        """Test que no se cambia la precarga de un fork server ya en ejecución"""
+        server = forkserver.ForkServer()
+        monkeypatch.setattr(forkserver, "_forkserver", server)
+        server.set_forkserver_preload(["json"])
+        monkeypatch.setattr(server, "_forkserver_pid", 12345)
+
+        prewarmed_context()
+
+        assert server._preload_modules == ["json"]
+
+    def test_workers_inherit_analyzer(self):
+        """Test que un worker recién bifurcado ya tiene su analizador y el heap congelado"""
+        with create_executor(BACKEND_PROCESS, 1) as executor:
+            has_analyzer, frozen = executor.submit(worker_state, None).result()
+
+        assert has_analyzer
+        assert frozen > 0
+
+
+@requires_subinterpreters
+class TestSubinterpreterPoolExecutor:
+    """Tests para el executor de subintérpretes de Python 3.13"""
+
+    def test_error_propagates(self):
+        """Test que una excepción en el subintérprete llega al llamador"""
+        with SubinterpreterPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(RuntimeError, match="JSONDecodeError"):
+                executor.submit(analyze_chunk, b"no es json").result()
+
+            # El subintérprete sigue disponible después de la falla
+            assert len(unpack_payloads(executor.submit(analyze_chunk, encode_values(["x"])).result())) == 1
+
+
+class TestScanBackends:
+    """Tests para el escaneo con cada backend"""
+
+    @pytest.mark.parametrize(
+        "backend",
+        [
+            BACKEND_THREAD,
+            BACKEND_PROCESS,
+            pytest.param(BACKEND_SUBINTERPRETER, marks=requires_subinterpreters),
+        ],
+    )
+    def test_same_summary(self, tmp_path, backend):
+        """Test que todos los backends producen el mismo resumen"""
+        for index in range(4):
+            (tmp_path / f"datos{index}.csv").write_text(
+                "email,hash\n" + "\n".join(f'"{VALUES[i]}","{VALUES[i + 2]}"' for i in range(index, 10)) + "\n",
+                encoding="utf-8",
+            )
+        expected = scan_directory(tmp_path, workers=1).summary()
+        summary = scan_directory(tmp_path, workers=2, backend=backend).summary()
+
+        for key in ("files_scanned", "total_analyzed", "protected", "sensitive_by_type", "hash_types_detected"):
+            assert summary[key] == expected[key]
+
+    def test_unknown_backend(self, tmp_path):
+        """Test que se rechaza un backend desconocido"""
+        with pytest.raises(ValueError):
+            scan_directory(tmp_path, backend="gpu")
+
+
+class TestCliBackend:
+    """Tests para la opción --backend de batch"""
+
+    def write_data(self, tmp_path):
+        data_file = tmp_path / "datos.csv"
+        rows = [f'"{value}","{VALUES[(index + 1) % 5]}"' for index, value in enumerate(VALUES)]
+        data_file.write_text("a,b\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        return data_file
+
+    @pytest.mark.parametrize(
+        "backend", [BACKEND_PROCESS, pytest.param(BACKEND_SUBINTERPRETER, marks=requires_subinterpreters)]
+    )
+    def test_same_report_as_sequential(self, tmp_path, backend):
+        """Test que el reporte con workers aislados coincide con el secuencial"""
+        data_file = self.write_data(tmp_path)
+        runner = CliRunner()
+
+        outputs = []
+        for options in (["--threads", "1"], ["--threads", "2", "--backend", backend]):
+            output = tmp_path / f"reporte-{len(options)}.csv"
+            result = runner.invoke(cli, ["batch", str(data_file), "-o", str(output), "-f", "csv", *options])
+            assert result.exit_code == 0, result.output
+            outputs.append(output.read_text(encoding="utf-8"))
+
+        assert outputs[0] == outputs[1]
+
+    def test_rejects_parent_instrumentation(self, tmp_path):
+        """Test que los workers aislados no se combinan con métricas del proceso actual"""
+        data_file = self.write_data(tmp_path)
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "batch",
+                str(data_file),
+                "-o",
+                str(tmp_path / "r.json"),
+                "--threads",
+                "2",
+                "--backend",
+                "process",
+                "--metrics",
+                str(tmp_path / "m.prom"),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "--backend process no se puede combinar con --metrics" in result.output
+
+    @pytest.mark.skipif(subinterpreters_available(), reason="Solo aplica sin subintérpretes aislados")
+    def test_subinterpreter_unavailable(self, tmp_path):
+        """Test que sin subintérpretes aislados se informa la versión requerida"""
+        data_file = self.write_data(tmp_path)
+
+        result = CliRunner().invoke(
+            cli,
+            ["batch", str(data_file), "-o", str(tmp_path / "r.json"), "--threads", "2", "--backend", "subinterpreter"],
+        )
+
+        assert result.exit_code == 1
+        assert "requiere Python 3.13" in result.output
@@ -0,0 +1,155 @@
+"""
+Tests para el harness de benchmarks y el comando bench.
+
+Este módulo valida el cálculo de percentiles, la comparación contra una
+línea base, la ejecución del comando desde el CLI y la importación diferida
+de los módulos pesados.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.benchmark import (
+    SAMPLE_CORPUS,
+    compare_with_baseline,
+    expand_corpus,
+    measure_backends,
+    measure_hooks_overhead,
+    measure_import_time,
+    measure_pool_startup,
+    measure_thread_scaling,
+    percentile,
+    run_benchmarks,
+    summarize_latencies,
+)
+
+
+def _report(**throughputs):
+    """Construye un reporte mínimo con los throughputs indicados"""
+    return {"results": {name: {"throughput": value} for name, value in throughputs.items()}}
+
+
+class TestBenchmarkHarness:
+    """Tests para las utilidades del harness"""
+
+    def test_percentiles(self):
+        """Test percentiles por rango más cercano"""
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([], 0.5) == 0.0
+
+    def test_summarize_latencies(self):
+        """Test throughput calculado a partir de latencias en nanosegundos"""
+        result = summarize_latencies("x", [1_000_000] * 10)
+        assert result.operations == 10
+        assert result.throughput == 1000.0
+        assert result.p99_ms == 1.0
+
+    def test_expand_corpus(self):
+        """Test replicación del corpus hasta el tamaño pedido"""
+        assert expand_corpus(["a", "b"], 5) == ["a", "b", "a", "b", "a"]
+
+    def test_run_benchmarks(self):
+        """Test que la suite reporta todos los componentes"""
+        results = run_benchmarks(SAMPLE_CORPUS, iterations=1, batch_repeats=1)
+        assert set(results) == {"hash_identify", "sensitive_detect", "analyze_data", "batch_end_to_end"}
+        assert all(result.throughput > 0 for result in results.values())
+
+    def test_measure_hooks_overhead(self):
+        """Test que se mide cada configuración de hooks con su sobrecosto"""
+        report = measure_hooks_overhead(SAMPLE_CORPUS, iterations=1, rounds=1)
+        assert all(report[name]["throughput"] > 0 for name in ("without_hooks", "noop_hooks", "stage_timings"))
+        assert {"noop_hooks_overhead", "stage_timings_overhead"} <= set(report)
+
+    def test_measure_thread_scaling(self):
+        """Test que se mide cada cantidad de hilos relativa a la primera"""
+        report = measure_thread_scaling(SAMPLE_CORPUS, thread_counts=(1, 2))
+        assert set(report["threads"]) == {"1", "2"}
+        assert report["threads"]["1"]["speedup"] == 1.0
+        assert isinstance(report["gil_enabled"], bool)
+
+    def test_measure_backends(self):
+        """Test que cada backend se compara con el análisis secuencial"""
+        report = measure_backends(SAMPLE_CORPUS, workers=2)
+        assert set(report["backends"]) == {"sequential", "thread", "process", "subinterpreter"}
+        assert report["backends"]["sequential"]["speedup"] == 1.0
+        assert report["backends"]["process"]["available"]
+        assert report["backends"]["process"]["throughput"] > 0
+
+    def test_measure_pool_startup(self):
+        """Test que se miden los lotes por método de inicio y el tamaño de los resultados"""
+        report = measure_pool_startup(SAMPLE_CORPUS, workers=1, jobs=2)
+        assert "spawn" in report["start_methods"]
+        assert report["start_methods"]["spawn"]["job_ms"] > 0
+        assert report["result_bytes_per_value"]["compact"] < report["result_bytes_per_value"]["pickle"]
+
+    def test_compare_with_baseline(self):
+        """Test detección de regresiones por sobre el umbral"""
+        baseline = _report(analyze_data=1000.0, hash_identify=1000.0)
+        current = _report(analyze_data=850.0, hash_identify=950.0)
+
+        regressions = compare_with_baseline(current, baseline, threshold=0.10)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("analyze_data")
+
+
+class TestBenchCommand:
+    """Tests para el comando bench"""
+
+    def test_bench_output_and_baseline_regression(self):
+        """Test reporte JSON y fallo ante regresión respecto de la línea base"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "bench.json"
+            result = runner.invoke(cli, ["bench", "-n", "1", "--skip-batch", "--output", str(output)])
+            assert result.exit_code == 0
+
+            report = json.loads(output.read_text(encoding="utf-8"))
+            assert report["metadata"]["corpus_size"] == len(SAMPLE_CORPUS)
+            assert "p95_ms" in report["results"]["analyze_data"]
+
+            # Una línea base inalcanzable debe provocar un fallo
+            baseline = Path(tmp) / "baseline.json"
+            baseline.write_text(json.dumps(_report(analyze_data=1e12)), encoding="utf-8")
+            result = runner.invoke(cli, ["bench", "-n", "1", "--skip-batch", "--baseline", str(baseline)])
+            assert result.exit_code == 1
+            assert "Regresiones de rendimiento" in result.output
+
+
+def _loaded_modules(statement):
+    """Ejecuta una sentencia en un intérprete nuevo y retorna los módulos cargados"""
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(completed.stdout.split())
+
+
+class TestLazyImports:
+    """Tests para la importación diferida del paquete y del CLI"""
+
+    def test_import_cryptic_defers_analyzer(self):
+        """Test que importar el paquete no carga el analizador ni los patrones"""
+        modules = _loaded_modules("import cryptic")
+        assert "cryptic.core.analyzer" not in modules
+        assert "cryptic.patterns.sensitive_patterns" not in modules
+
+    def test_public_api_resolves_on_access(self):
+        """Test que la API pública sigue disponible desde el paquete"""
+        modules = _loaded_modules("from cryptic import CrypticAnalyzer; CrypticAnalyzer().analyze_data('x')")
+        assert "cryptic.core.analyzer" in modules
+
+    def test_cli_import_defers_yaml_json_and_analysis(self):
+        """Test que el CLI no importa yaml, json ni el análisis al cargarse"""
+        modules = _loaded_modules("import cryptic.cli.main")
+        assert not {"yaml", "json", "cryptic.core.analyzer", "sqlite3"} & modules
+
+    def test_measure_import_time(self):
+        """Test medición del tiempo de importación con -X importtime"""
+        assert measure_import_time("cryptic", runs=1) > 0
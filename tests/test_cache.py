@@ -0,0 +1,144 @@
+"""
+Tests para la caché persistente de análisis.
+
+Este módulo valida la serialización compacta de resultados, la reutilización
+de análisis entre ejecuciones y la invalidación y desalojo de entradas.
+"""
+
+import dataclasses
+import tempfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core import cache as cache_module
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.cache import AnalysisCache, cache_namespace
+from cryptic.core.serialization import decode_analysis, encode_analysis
+
+SAMPLE_VALUES = [
+    "juan.perez@empresa.cl",
+    "12.345.678-5",
+    "5d41402abc4b2a76b9719d911017c592",
+    "$2b$12$N9qo8uLOickgx2ZMRZoMye",
+    "Usuario Juan Pérez con hash 5d41402abc4b2a76b9719d911017c592",
+    "4111 1111 1111 1111",
+    "plaintext_password",
+    "",
+]
+
+
+def _assert_equivalent(first, second):
+    """Compara dos análisis ignorando el tiempo de procesamiento"""
+    first.analysis_time_ms = second.analysis_time_ms = 0.0
+    assert first == second
+
+
+class TestSerialization:
+    """Tests para la codificación compacta de análisis"""
+
+    def test_roundtrip_preserves_analysis(self):
+        """Test que decodificar un análisis codificado produce el mismo resultado"""
+        analyzer = CrypticAnalyzer()
+        for value in SAMPLE_VALUES:
+            analysis = analyzer.analyze_data(value)
+            restored = decode_analysis(encode_analysis(analysis), value)
+            _assert_equivalent(restored, analysis)
+
+
+class TestAnalysisCache:
+    """Tests para la caché persistente"""
+
+    def test_reuse_across_instances(self):
+        """Test que una nueva ejecución reutiliza los análisis almacenados"""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "cache.db"
+
+            with AnalysisCache(cache_path) as cache:
+                first_results = CrypticAnalyzer(cache=cache).analyze_batch(SAMPLE_VALUES)
+                assert cache.hits == 0
+
+            with AnalysisCache(cache_path) as cache:
+                second_results = CrypticAnalyzer(cache=cache).analyze_batch(SAMPLE_VALUES)
+                assert cache.hits == len(SAMPLE_VALUES)
+                assert cache.misses == 0
+
+            for first, second in zip(first_results, second_results):
+                _assert_equivalent(first, second)
+
+    def test_namespace_change_invalidates_entries(self):
+        """Test que un cambio de versión o patrones descarta las entradas previas"""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "cache.db"
+
+            with AnalysisCache(cache_path, namespace="v1") as cache:
+                CrypticAnalyzer(cache=cache).analyze_batch(SAMPLE_VALUES)
+                assert len(cache) == len(SAMPLE_VALUES)
+
+            with AnalysisCache(cache_path, namespace="v2") as cache:
+                assert len(cache) == 0
+
+    def test_timing_recommendations_are_not_cached(self, monkeypatch):
+        """Test que las recomendaciones de rendimiento de un análisis lento no quedan en la caché"""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "cache.db"
+            expected = CrypticAnalyzer().analyze_batch(SAMPLE_VALUES)
+
+            with AnalysisCache(cache_path) as cache:
+                slow_analyzer = CrypticAnalyzer(cache=cache)
+                detect = slow_analyzer.sensitive_detector.detect
+
+                def slow_detect(*args, **kwargs):
+                    return dataclasses.replace(detect(*args, **kwargs), analysis_time_ms=120.0)
+
+                monkeypatch.setattr(slow_analyzer.sensitive_detector, "detect", slow_detect)
+                slow_results = slow_analyzer.analyze_batch(SAMPLE_VALUES)
+            assert all(any("120.0ms" in item for item in result.recommendations) for result in slow_results)
+
+            with AnalysisCache(cache_path) as cache:
+                cached_results = CrypticAnalyzer(cache=cache).analyze_batch(SAMPLE_VALUES)
+                assert cache.hits == len(SAMPLE_VALUES)
+            for cached, fresh in zip(cached_results, expected):
+                assert cached.recommendations == fresh.recommendations
+
+    def test_validation_code_change_changes_namespace(self, monkeypatch):
+        """Test que cambiar el código de una función de validación invalida la caché"""
+        patterns = cache_module.get_sensitive_patterns()
+        index = next(i for i, pattern in enumerate(patterns) if pattern.validation_func is not None)
+        original = patterns[index].validation_func
+
+        def changed(value):
+            return False
+
+        changed.__qualname__ = original.__qualname__
+        namespace = cache_namespace()
+        modified = list(patterns)
+        modified[index] = dataclasses.replace(patterns[index], validation_func=changed)
+        monkeypatch.setattr(cache_module, "get_sensitive_patterns", lambda: modified)
+        assert cache_namespace() != namespace
+
+    def test_size_based_eviction(self):
+        """Test que la caché conserva como máximo max_entries entradas"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with AnalysisCache(Path(tmp) / "cache.db", max_entries=3) as cache:
+                analyzer = CrypticAnalyzer(cache=cache)
+                analyzer.analyze_batch(SAMPLE_VALUES)
+                assert len(cache) == 3
+
+                # Las entradas más recientes se conservan
+                analyzer.analyze_data(SAMPLE_VALUES[-1])
+                assert cache.hits == 1
+
+    def test_cli_verify_with_cache(self):
+        """Test opción --cache del comando verify"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = Path(tmp) / "data.txt"
+            data_path.write_text("\n".join(SAMPLE_VALUES) + "\n", encoding="utf-8")
+            cache_path = Path(tmp) / "cache.db"
+
+            assert runner.invoke(cli, ["verify", str(data_path), "--cache", str(cache_path)]).exit_code == 0
+            result = runner.invoke(cli, ["verify", str(data_path), "--cache", str(cache_path)])
+            assert result.exit_code == 0
+            assert "Caché: 7 aciertos, 0 fallos" in result.output
@@ -5,6 +5,7 @@ Este módulo contiene tests para validar que todos los comandos CLI
 funcionen correctamente con diferentes tipos de entrada y formatos de salida.
 """
 
+import gzip
 import json
 import tempfile
 from pathlib import Path
@@ -280,6 +281,45 @@ class TestCLIFileHandling:
             Path(csv_input_path).unlink(missing_ok=True)
             Path(csv_output_path).unlink(missing_ok=True)
 
+    def test_verify_gzip_csv(self):
+        """Test verificación de un CSV comprimido con gzip"""
+        with tempfile.NamedTemporaryFile(suffix=".csv.gz", delete=False) as f:
+            f.write(
+                gzip.compress(b"email,password\njuan@mail.com,hash123\nmaria@empresa.cl,5d41402abc4b2a76b9719d911017c592\n")
+            )
+            gz_path = f.name
+
+        try:
+            result = self.runner.invoke(cli, ["verify", gz_path, "--column", "email"])
+            assert result.exit_code == 0
+            assert "Total de elementos analizados: 2" in result.output
+            assert "Datos sensibles detectados: 2" in result.output
+        finally:
+            Path(gz_path).unlink(missing_ok=True)
+
+    def test_batch_gzip_csv_byte_progress(self):
+        """Test comando batch con CSV comprimido y progreso por bytes"""
+        rows = "".join(f"user{i}@empresa.cl\n" for i in range(60))
+        with tempfile.NamedTemporaryFile(suffix=".csv.gz", delete=False) as f:
+            f.write(gzip.compress(f"email\n{rows}".encode()))
+            gz_path = f.name
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as out_f:
+            json_path = out_f.name
+
+        try:
+            result = self.runner.invoke(cli, ["batch", gz_path, "--output", json_path])
+            assert result.exit_code == 0
+            assert "archivo gzip" in result.output
+            assert "Progreso: 50 filas" in result.output
+
+            with open(json_path) as json_file:
+                data = json.load(json_file)
+                assert data["summary"]["total_analyzed"] == 60
+        finally:
+            Path(gz_path).unlink(missing_ok=True)
+            Path(json_path).unlink(missing_ok=True)
+
 
 class TestCLIErrorHandling:
     """Tests para manejo de errores en CLI"""
@@ -0,0 +1,130 @@
+"""
+Tests para el memo de tipo por columna.
+
+Este módulo valida la activación de la ruta rápida en columnas homogéneas,
+los respaldos al análisis completo, las verificaciones y la opción
+--column-memo de batch.
+"""
+
+import csv
+import tempfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core import column_memo
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.column_memo import ColumnTypeMemo, analysis_signature, signature_label, value_shape
+from cryptic.utils.corpus import CorpusGenerator
+
+
+def _values(kind: str, count: int, seed: int = 7):
+    """Genera valores sintéticos de una clase"""
+    generator = CorpusGenerator(seed=seed)
+    return [generator.generate(kind) for _ in range(count)]
+
+
+class TestSignatures:
+    """Tests para las firmas y formas de valores"""
+
+    def test_value_shape(self):
+        """Test que la forma conserva dígitos y separadores y acorta letras"""
+        assert value_shape("12.345.678-5") == "99.999.999-9"
+        assert value_shape("juan.perez@empresa.cl") == "aa.aa@aa.aa"
+        assert value_shape("Juan Pérez") == "Aaa Aéaa"
+
+    def test_signature_label(self):
+        """Test del tipo principal de una firma"""
+        analyzer = CrypticAnalyzer()
+        email = analysis_signature(analyzer.analyze_data("juan.perez@empresa.cl"))
+        md5 = analysis_signature(analyzer.analyze_data("5d41402abc4b2a76b9719d911017c592"))
+        plain = analysis_signature(analyzer.analyze_data("producto pendiente"))
+
+        assert email is not None and signature_label(email) == "Email"
+        assert md5 is not None and signature_label(md5) == "MD5, NTLM, LM"
+        assert plain is not None and signature_label(plain) is None
+
+
+class TestColumnTypeMemo:
+    """Tests para ColumnTypeMemo"""
+
+    def test_homogeneous_columns_use_fast_path(self):
+        """Test que las columnas homogéneas se memorizan con resultados idénticos"""
+        analyzer = CrypticAnalyzer()
+        memo = ColumnTypeMemo(analyzer, threshold=50, audit_every=10)
+
+        for kind in ("rut", "email", "bcrypt", "sha256"):
+            for value in _values(kind, 300):
+                fast = memo.analyze(kind, value)
+                full = analyzer.analyze_data(value)
+                assert column_memo._same_result(fast, full)
+
+        stats = memo.statistics()
+        assert set(stats["active_columns"]) == {"rut", "email", "bcrypt", "sha256"}
+        assert stats["full"] == 4 * 50 + stats["fallbacks"]
+        assert stats["fast"] > 0
+        assert stats["audit_failures"] == 0
+
+    def test_fallback_on_non_fitting_value(self):
+        """Test que un valor que no encaja se analiza por completo y se cuenta"""
+        analyzer = CrypticAnalyzer()
+        memo = ColumnTypeMemo(analyzer, threshold=20)
+        for value in _values("email", 20):
+            memo.analyze("email", value)
+
+        analysis = memo.analyze("email", "12.345.678-5")
+
+        assert analysis.sensitive_analysis is not None
+        assert analysis.sensitive_analysis.matches[0].data_type.value == "RUT Chileno"
+        assert memo.statistics()["fallbacks"] == 1
+        assert memo.statistics()["active_columns"] == {"email": "Email"}
+
+    def test_mixed_column_is_not_memorized(self):
+        """Test que una columna mezclada no activa la ruta rápida"""
+        memo = ColumnTypeMemo(CrypticAnalyzer(), threshold=10)
+        for email, rut in zip(_values("email", 30), _values("rut", 30)):
+            memo.analyze("mixta", email)
+            memo.analyze("mixta", rut)
+
+        assert memo.statistics()["active_columns"] == {}
+        assert memo.statistics()["fast"] == 0
+
+    def test_audit_failure_demotes_column(self, monkeypatch):
+        """Test que una verificación fallida devuelve la columna a aprendizaje"""
+        memo = ColumnTypeMemo(CrypticAnalyzer(), threshold=10, audit_every=1)
+        values = _values("md5", 11)
+        for value in values[:10]:
+            memo.analyze("hash", value)
+
+        monkeypatch.setattr(column_memo, "_same_result", lambda fast, full: False)
+        memo.analyze("hash", values[10])
+
+        stats = memo.statistics()
+        assert stats["audits"] == 1
+        assert stats["audit_failures"] == 1
+        assert stats["active_columns"] == {}
+
+
+class TestColumnMemoCommand:
+    """Tests para --column-memo en batch"""
+
+    def test_batch_output_is_unchanged(self):
+        """Test que el reporte con --column-memo es idéntico al completo"""
+        generator = CorpusGenerator(seed=11)
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["rut", "hash"])
+                for _ in range(1500):
+                    writer.writerow([generator.generate("rut"), generator.generate("md5")])
+
+            full, memo = Path(tmp) / "full.csv", Path(tmp) / "memo.csv"
+            assert runner.invoke(cli, ["batch", str(path), "-o", str(full), "-f", "csv"]).exit_code == 0
+            result = runner.invoke(cli, ["batch", str(path), "-o", str(memo), "-f", "csv", "--column-memo"])
+
+            assert result.exit_code == 0
+            assert "Memo de columnas" in result.output
+            assert memo.read_bytes() == full.read_bytes()
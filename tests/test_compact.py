@@ -0,0 +1,82 @@
+"""
+Tests para los resultados compactos de análisis por lotes.
+
+Este módulo valida que los resultados compactos conserven la información de
+los análisis completos, que compartan las tuplas repetidas y que reduzcan
+la memoria retenida por celda.
+"""
+
+import pytest
+
+from cryptic import CompactAnalysis
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.benchmark import measure_memory_per_cell
+from cryptic.core.compact import CompactResultBuilder
+from cryptic.utils.corpus import generate_values
+
+SAMPLE_VALUES = [
+    "juan.perez@empresa.cl",
+    "RUT 12.345.678-5 y email maria@company.com",
+    "5d41402abc4b2a76b9719d911017c592",
+    "$2b$12$N9qo8uLOickgx2ZMRZoMye",
+    "texto normal",
+    "",
+]
+
+
+class TestCompactAnalysis:
+    """Tests para CompactAnalysis y CompactResultBuilder"""
+
+    def setup_method(self):
+        """Setup para cada test"""
+        self.analyzer = CrypticAnalyzer()
+
+    @pytest.mark.parametrize("value", SAMPLE_VALUES)
+    def test_equivalent_to_full_analysis(self, value):
+        """Test que el resultado compacto conserva el análisis completo"""
+        full = self.analyzer.analyze_data(value)
+        compact = self.analyzer.analyze_batch_compact([value])[0]
+
+        assert compact.sensitivity_level == full.sensitivity_level
+        assert compact.protection_status == full.protection_status
+        assert compact.confidence == full.confidence
+        assert list(compact.recommendations) == full.recommendations
+        assert [(m.data_type, compact.matched_text(m)) for m in compact.matches] == [
+            (m.data_type, m.matched_text) for m in full.sensitive_analysis.matches
+        ]
+        expected_hash = full.hash_analysis.possible_types[0][0] if full.hash_analysis.possible_types else None
+        assert compact.hash_type == expected_hash
+
+    def test_slots_without_instance_dict(self):
+        """Test que los resultados compactos no tienen __dict__ por instancia"""
+        compact = self.analyzer.analyze_batch_compact(["juan.perez@empresa.cl"])[0]
+        assert isinstance(compact, CompactAnalysis)
+        assert not hasattr(compact, "__dict__")
+        assert not hasattr(compact.matches[0], "__dict__")
+
+    def test_repeated_tuples_are_shared(self):
+        """Test que resultados equivalentes comparten sus tuplas"""
+        first, second = self.analyzer.analyze_batch_compact(["5d41402abc4b2a76b9719d911017c592"] * 2)
+        assert first.hash_types is second.hash_types
+        assert first.recommendations is second.recommendations
+
+    def test_max_interned_limit(self):
+        """Test que el builder no retiene más tuplas que el límite"""
+        builder = CompactResultBuilder(max_interned=2)
+        builder.build_many(self.analyzer.analyze_batch(SAMPLE_VALUES))
+        assert len(builder._interned) == 2
+
+    def test_to_dict(self):
+        """Test serialización de un resultado compacto"""
+        data = self.analyzer.analyze_batch_compact(["juan.perez@empresa.cl"])[0].to_dict()
+        assert data["sensitive_matches"][0] == {
+            "type": "Email",
+            "text": "juan.perez@empresa.cl",
+            "confidence": data["sensitive_matches"][0]["confidence"],
+            "validated": True,
+        }
+
+    def test_memory_per_cell_is_reduced(self):
+        """Test que los resultados compactos retienen menos memoria por celda"""
+        memory = measure_memory_per_cell(generate_values(500, seed=1))
+        assert memory["compact_bytes_per_cell"] < memory["full_bytes_per_cell"] / 4
@@ -0,0 +1,100 @@
+"""
+Tests para el generador de corpus sintéticos.
+
+Este módulo valida el determinismo del generador, la validez de los datos
+generados según los validadores de Cryptic, el control de proporciones y
+cardinalidad, y el comando gen.
+"""
+
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.patterns.sensitive_patterns import validate_credit_card, validate_email_advanced, validate_rut_chileno
+from cryptic.utils.corpus import KIND_TYPES, CorpusGenerator, parse_mix, write_corpus
+
+
+class TestCorpusGenerator:
+    """Tests para CorpusGenerator"""
+
+    def test_same_seed_same_corpus(self):
+        """Test que una misma semilla produce el mismo corpus"""
+        first = list(CorpusGenerator(seed=7).iter_records(200))
+        second = list(CorpusGenerator(seed=7).iter_records(200))
+        assert first == second
+        assert first != list(CorpusGenerator(seed=8).iter_records(200))
+
+    @pytest.mark.parametrize(
+        "kind,validator",
+        [("rut", validate_rut_chileno), ("credit_card", validate_credit_card), ("email", validate_email_advanced)],
+    )
+    def test_values_pass_validators(self, kind, validator):
+        """Test que los valores generados son válidos según los validadores"""
+        generator = CorpusGenerator(seed=1)
+        assert all(validator(generator.generate(kind)) for _ in range(200))
+
+    def test_mix_and_cardinality(self):
+        """Test control de proporciones y de valores distintos por tipo"""
+        generator = CorpusGenerator(seed=1, mix=parse_mix("md5=1,rut=0"), cardinality=5)
+        records = list(generator.iter_records(500))
+
+        assert {expected for _, expected in records} == {KIND_TYPES["md5"]}
+        assert len({value for value, _ in records}) <= 5
+
+    def test_parse_mix_rejects_unknown_type(self):
+        """Test error ante un tipo desconocido"""
+        with pytest.raises(ValueError, match="Tipo desconocido"):
+            parse_mix("email=1,pasaporte=2")
+
+    def test_ground_truth_matches_detection(self):
+        """Test que el analizador detecta el tipo esperado de los datos generados"""
+        analyzer = CrypticAnalyzer()
+        generator = CorpusGenerator(seed=3, mix=parse_mix("email,rut,credit_card,ip,md5,sha256,bcrypt"))
+
+        for value, expected in generator.iter_records(200):
+            analysis = analyzer.analyze_data(value)
+            detected = {m.data_type.value for m in analysis.sensitive_analysis.matches}
+            detected.update(t.value for t, _ in analysis.hash_analysis.possible_types[:1])
+            assert expected in detected, value
+
+    def test_write_jsonl(self):
+        """Test escritura en formato JSON Lines"""
+        output = io.StringIO()
+        write_corpus(CorpusGenerator(seed=0), 10, output, "jsonl")
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert len(records) == 10
+        assert set(records[0]) == {"value", "expected_type"}
+
+
+class TestGenCommand:
+    """Tests para el comando gen"""
+
+    def test_gen_csv_then_batch(self):
+        """Test que el CSV generado se procesa con batch"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = Path(tmp) / "corpus.csv"
+            result = runner.invoke(cli, ["gen", "--rows", "50", "--seed", "2", "--output", str(corpus)])
+            assert result.exit_code == 0
+
+            with open(corpus, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            assert len(rows) == 50
+
+            report = Path(tmp) / "report.json"
+            result = runner.invoke(cli, ["batch", str(corpus), "--column", "value", "--output", str(report)])
+            assert result.exit_code == 0
+
+    def test_gen_text_to_stdout(self):
+        """Test salida de texto plano por stdout"""
+        result = CliRunner().invoke(cli, ["gen", "--rows", "5", "--format", "text"])
+        assert result.exit_code == 0
+        assert len(result.output.splitlines()) == 5
@@ -0,0 +1,215 @@
+"""
+Tests para el daemon de la CLI sobre socket Unix y su cliente mínimo.
+
+Este módulo valida que el cliente ejecute localmente cuando no hay daemon o
+el socket pertenece a otro usuario, el directorio privado del socket, el
+manejo de sockets obsoletos y que un comando reenviado produzca la misma
+salida que una ejecución local, sin importar la CLI en el cliente.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cryptic.server.client import (
+    DISABLE_ENV,
+    SOCKET_ENV,
+    daemon_supported,
+    default_socket_path,
+    forward,
+    peer_uid,
+    private_socket_dir,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="Requiere sockets Unix con paso de descriptores y os.fork")
+
+# Reenvía argv al daemon y falla si el cliente llegó a importar la CLI
+FORWARD_SCRIPT = (
+    "import sys; from cryptic.server.client import forward; code = forward(sys.argv[1:]); "
+    "assert 'click' not in sys.modules; sys.exit(99 if code is None else code)"
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Ruta corta para el socket (los sockets Unix limitan el largo de la ruta)"""
+    path = Path(f"/tmp/cryptic-test-{os.getpid()}-{tmp_path.name[-12:]}.sock")
+    yield str(path)
+    if path.exists():
+        path.unlink()
+
+
+@pytest.fixture
+def daemon(socket_path, tmp_path):
+    """Daemon en ejecución en un subproceso"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "cryptic.cli.main", "daemon", "--socket", socket_path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    line = process.stdout.readline()
+    assert "Daemon escuchando" in line, process.stderr.read()
+    yield process
+    if process.poll() is None:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _run(args, cwd, socket_path, forwarded=True):
+    """Ejecuta un comando reenviándolo al daemon o localmente"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT), **{SOCKET_ENV: socket_path})
+    if forwarded:
+        command = [sys.executable, "-c", FORWARD_SCRIPT, *args]
+    else:
+        env[DISABLE_ENV] = "1"
+        command = [sys.executable, "-m", "cryptic.cli.launcher", *args]
+    return subprocess.run(command, cwd=cwd, env=env, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+
+
+class TestClient:
+    """Tests para el cliente sin daemon"""
+
+    def test_no_daemon_runs_locally(self, socket_path):
+        """Test que sin daemon el comando no se reenvía"""
+        assert forward(["analyze", "x"], socket_path) is None
+
+    def test_disabled(self, socket_path, monkeypatch):
+        """Test que CRYPTIC_NO_DAEMON desactiva el reenvío"""
+        monkeypatch.setenv(DISABLE_ENV, "1")
+        assert forward(["analyze", "x"], socket_path) is None
+
+    def test_default_socket_path(self, monkeypatch):
+        """Test de la ruta configurada por variable de entorno"""
+        monkeypatch.setenv(SOCKET_ENV, "/tmp/otro.sock")
+        assert default_socket_path() == "/tmp/otro.sock"
+
+    def test_fallback_socket_in_private_dir(self, monkeypatch, tmp_path):
+        """Test que sin XDG_RUNTIME_DIR el socket queda en un directorio privado del usuario"""
+        monkeypatch.delenv(SOCKET_ENV, raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+
+        assert default_socket_path() == os.path.join(tmp_path, f"cryptic-{os.getuid()}", "cryptic.sock")
+
+    def test_socket_of_other_user_runs_locally(self, socket_path, monkeypatch):
+        """Test que un socket de otro usuario no recibe los descriptores ni los argumentos"""
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(socket_path)
+        listener.listen(1)
+        listener.settimeout(0.2)
+        try:
+            if os.geteuid() == 0:
+                os.chown(socket_path, 65534, -1)
+            else:
+                monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+
+            assert forward(["analyze", "x"], socket_path) is None
+            with pytest.raises(socket.timeout):
+                listener.accept()
+        finally:
+            listener.close()
+
+    def test_peer_uid(self):
+        """Test que se obtiene el uid del proceso al otro lado del socket"""
+        left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        with left, right:
+            assert peer_uid(left) in (os.getuid(), None)
+
+
+class TestBindSocket:
+    """Tests para la apertura del socket del daemon"""
+
+    def test_replaces_stale_socket(self, socket_path):
+        """Test que un socket sin daemon se reemplaza"""
+        from cryptic.server.daemon import bind_socket
+
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        listener = bind_socket(socket_path)
+        try:
+            assert os.stat(socket_path).st_mode & 0o777 == 0o600
+        finally:
+            listener.close()
+
+    def test_creates_private_dir(self, monkeypatch, tmp_path):
+        """Test que el directorio privado se crea con permisos 0700"""
+        from cryptic.server.daemon import bind_socket
+
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        listener = bind_socket(os.path.join(private_socket_dir(), "cryptic.sock"))
+        try:
+            assert os.stat(private_socket_dir()).st_mode & 0o777 == 0o700
+        finally:
+            listener.close()
+
+    def test_refuses_shared_private_dir(self, monkeypatch, tmp_path):
+        """Test que no se usa un directorio privado accesible por otros usuarios"""
+        from cryptic.server.daemon import DaemonError, bind_socket
+
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        os.mkdir(private_socket_dir())
+        os.chmod(private_socket_dir(), 0o777)
+
+        with pytest.raises(DaemonError, match="0700"):
+            bind_socket(os.path.join(private_socket_dir(), "cryptic.sock"))
+
+    def test_refuses_running_daemon(self, socket_path):
+        """Test que no se abre un segundo daemon en la misma ruta"""
+        from cryptic.server.daemon import DaemonError, bind_socket
+
+        listener = bind_socket(socket_path)
+        try:
+            with pytest.raises(DaemonError):
+                bind_socket(socket_path)
+        finally:
+            listener.close()
+
+
+class TestDaemon:
+    """Tests de extremo a extremo con el daemon en un subproceso"""
+
+    def test_verify_matches_local_output(self, daemon, socket_path, tmp_path):
+        """Test que verify reenviado lee el archivo por ruta relativa y produce la misma salida"""
+        (tmp_path / "datos.csv").write_text(
+            "email,rut\njuan@empresa.cl,12.345.678-5\nx,5d41402abc4b2a76b9719d911017c592\n", encoding="utf-8"
+        )
+
+        forwarded = _run(["verify", "datos.csv", "--detailed"], tmp_path, socket_path)
+        local = _run(["verify", "datos.csv", "--detailed"], tmp_path, socket_path, forwarded=False)
+
+        assert forwarded.returncode == 0, forwarded.stderr
+        assert forwarded.stdout == local.stdout
+        assert "Datos sensibles detectados: 2" in forwarded.stdout
+
+    def test_exit_code_and_stderr(self, daemon, socket_path, tmp_path):
+        """Test que el código de salida y los errores llegan al cliente"""
+        result = _run(["verify", "no-existe.csv"], tmp_path, socket_path)
+
+        assert result.returncode == 2
+        assert "does not exist" in result.stderr
+
+    def test_rejects_other_commands(self, daemon, socket_path, tmp_path):
+        """Test que el daemon solo ejecuta los comandos reenviables"""
+        result = _run(["serve"], tmp_path, socket_path)
+
+        assert result.returncode == 2
+        assert "solo ejecuta" in result.stderr
+
+    def test_sigterm_removes_socket(self, daemon, socket_path):
+        """Test que el daemon se detiene con SIGTERM y elimina su socket"""
+        daemon.terminate()
+
+        assert daemon.wait(timeout=30) == 0
+        assert not os.path.exists(socket_path)
@@ -0,0 +1,146 @@
+"""
+Tests para el vector de características por valor y el prefiltro de patrones.
+
+Este módulo valida los conteos de ``extract_features``, el descarte de
+patrones de hash y de datos sensibles imposibles, que el prefiltro no
+altera los resultados del análisis y el benchmark de regex evitadas.
+"""
+
+import dataclasses
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.benchmark import SAMPLE_CORPUS, count_prefilter_savings
+from cryptic.patterns.hash_patterns import HashType
+from cryptic.patterns.sensitive_patterns import SensitiveDataType
+from cryptic.utils.corpus import generate_values
+from cryptic.utils.features import extract_features
+from cryptic.utils.formatters import analyze_charset
+
+EDGE_CASES = [
+    "",
+    " 5d41402abc4b2a76b9719d911017c592 ",
+    "5D41402ABC4B2A76B9719D911017C592",
+    "*A4B6157319038724E3560894F7F932C8886EBFCF",
+    "QUJD",
+    "=" * 16,
+    "Ñandú Pérez",
+    "José María\tGonzález",
+    "١٢٣٤٥٦٧٨-٩",
+    "a@b.cc",
+    "http://x",
+    "Kſ" * 20,
+]
+
+
+def _without_times(analysis):
+    """Convierte un análisis en diccionario sin los tiempos de procesamiento"""
+    data = dataclasses.asdict(analysis)
+    data.pop("analysis_time_ms")
+    if data["sensitive_analysis"]:
+        data["sensitive_analysis"].pop("analysis_time_ms")
+    return data
+
+
+class TestExtractFeatures:
+    """Tests para extract_features"""
+
+    def test_ascii_counts(self):
+        """Test de los conteos de un valor ASCII"""
+        features = extract_features("Juan.P@x.cl 12-3")
+
+        assert features.ascii is True
+        assert features.length == 16
+        assert (features.digits, features.alpha, features.upper) == (3, 8, 2)
+        assert features.hex == 5  # a, c, 1, 2, 3
+        assert (features.whitespace, features.at, features.dot, features.dash) == (1, 1, 2, 1)
+
+    def test_unicode_counts(self):
+        """Test que los valores no ASCII siguen la semántica de \\d y \\s"""
+        features = extract_features("Ñandú ١٢٣")
+
+        assert features.ascii is False
+        assert (features.digits, features.alpha, features.upper, features.whitespace) == (3, 5, 1, 1)
+        assert features.hex == 2  # a, d
+
+    def test_satisfies(self):
+        """Test de los conteos mínimos"""
+        features = extract_features("juan@empresa.cl")
+
+        assert features.satisfies({"at": 1, "dot": 1})
+        assert not features.satisfies({"digits": 7, "dash": 1})
+        assert features.satisfies({})
+
+    def test_charset_from_features(self):
+        """Test que el análisis de charset derivado de los conteos coincide con el de regex"""
+        for value in SAMPLE_CORPUS + EDGE_CASES:
+            cleaned = value.strip()
+            assert analyze_charset(cleaned, extract_features(cleaned)) == analyze_charset(cleaned), value
+
+
+class TestPrefilter:
+    """Tests para el descarte de patrones según las características"""
+
+    def test_hash_candidates(self):
+        """Test que solo se evalúan los patrones con longitud, prefijo y charset compatibles"""
+        identifier = CrypticAnalyzer().hash_identifier
+        md5 = "5d41402abc4b2a76b9719d911017c592"
+
+        candidates = {p.hash_type for p in identifier.candidate_patterns(md5, extract_features(md5))}
+        assert candidates == {HashType.MD5, HashType.NTLM, HashType.LM}
+
+        email = "juan.perez@empresa.cl"
+        assert identifier.candidate_patterns(email, extract_features(email)) == []
+
+    def test_sensitive_candidates(self):
+        """Test que los patrones que requieren caracteres ausentes se omiten"""
+        detector = CrypticAnalyzer().sensitive_detector
+
+        email = {p.data_type for p in detector.candidate_patterns("juan.perez@empresa.cl")}
+        assert email == {SensitiveDataType.EMAIL}
+
+        rut = {p.data_type for p in detector.candidate_patterns("12.345.678-5")}
+        assert SensitiveDataType.RUT_CHILENO in rut
+        assert SensitiveDataType.EMAIL not in rut
+
+    def test_disabled_prefilter_evaluates_all_patterns(self):
+        """Test que sin prefiltro se consideran todos los patrones"""
+        analyzer = CrypticAnalyzer(prefilter=False)
+        detector = analyzer.sensitive_detector
+
+        assert detector.candidate_patterns("hola") == detector.patterns
+
+    def test_results_unchanged(self):
+        """Test que el prefiltro no altera ningún resultado"""
+        with_prefilter, without_prefilter = CrypticAnalyzer(), CrypticAnalyzer(prefilter=False)
+
+        for value in generate_values(2000, seed=4) + SAMPLE_CORPUS + EDGE_CASES:
+            assert _without_times(with_prefilter.analyze_data(value)) == _without_times(
+                without_prefilter.analyze_data(value)
+            ), value
+
+
+class TestPrefilterBenchmark:
+    """Tests para el benchmark de regex evitadas"""
+
+    def test_count_prefilter_savings(self):
+        """Test que el conteo reporta regex evitadas por componente"""
+        savings = count_prefilter_savings(SAMPLE_CORPUS)
+
+        assert set(savings) == {"hash", "charset", "tokens", "sensitive", "total"}
+        assert savings["total"]["avoided"] > savings["total"]["executed"]
+        assert savings["total"]["avoided"] == pytest.approx(
+            sum(savings[name]["avoided"] for name in ("hash", "charset", "tokens", "sensitive"))
+        )
+
+    def test_bench_prefilter(self):
+        """Test de cryptic bench --prefilter"""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["bench", "-n", "1", "--skip-batch", "--prefilter"])
+
+        assert result.exit_code == 0
+        assert "Regex por valor" in result.output
+        assert "con prefiltro" in result.output
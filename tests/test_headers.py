@@ -0,0 +1,200 @@
+"""
+Tests para la selección de patrones según el nombre de las columnas.
+
+Este módulo valida la normalización de encabezados, la resolución de
+reglas, la clasificación del análisis especializado frente al completo, la
+detección de columnas mal etiquetadas y las opciones --header-hints y
+--header-rules de la CLI.
+"""
+
+import csv
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.headers import HeaderAwareAnalyzer, HeaderRule, load_header_rules, normalize_header
+from cryptic.core.sampling import classify_analysis
+from cryptic.patterns.sensitive_patterns import SensitiveDataType
+from cryptic.utils.corpus import CorpusGenerator
+
+
+def _values(kind: str, count: int, seed: int = 5):
+    """Genera valores sintéticos de una clase"""
+    generator = CorpusGenerator(seed=seed)
+    return [generator.generate(kind) for _ in range(count)]
+
+
+class TestHeaderRules:
+    """Tests para la normalización y las reglas de encabezados"""
+
+    def test_normalize_header(self):
+        """Test que se eliminan tildes, mayúsculas y separadores"""
+        assert normalize_header("Teléfono Móvil") == "telefono_movil"
+        assert normalize_header("  E-Mail ") == "e_mail"
+        assert normalize_header("RUT Cliente") == "rut_cliente"
+
+    def test_default_rules(self):
+        """Test de la regla resuelta para encabezados comunes en español e inglés"""
+        hints = HeaderAwareAnalyzer(CrypticAnalyzer())
+        expected = {
+            "email": ("restrict", ["Email"]),
+            "Correo Electrónico": ("restrict", ["Email"]),
+            "password_hash": ("hash", []),
+            "email_hash": ("hash", []),
+            "rut": ("restrict", ["RUT Chileno"]),
+            "telefono": ("restrict", ["Teléfono Chileno", "Teléfono Internacional"]),
+            "ip": ("restrict", ["Dirección IP"]),
+            "Nombre": ("prioritize", ["Nombre de Persona"]),
+        }
+        for column, (mode, types) in expected.items():
+            rule = hints._column(column).rule
+            assert rule is not None, column
+            assert rule.mode == mode
+            assert [t.value for t in rule.types] == types
+
+        assert hints._column("descripcion").rule is None
+        assert hints._column("trust_level").rule is None
+
+    def test_invalid_rule(self):
+        """Test que una regla sin tipos o con modo desconocido se rechaza"""
+        with pytest.raises(ValueError):
+            HeaderRule("email")
+        with pytest.raises(ValueError):
+            HeaderRule("email", [SensitiveDataType.EMAIL], mode="exclusivo")
+
+    def test_load_rules(self):
+        """Test de la carga de reglas desde YAML y JSON"""
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = Path(tmp) / "reglas.yaml"
+            yaml_path.write_text(
+                "rules:\n  - pattern: contacto\n    types: [EMAIL, PHONE_CHILE]\n  - pattern: secreto\n    mode: hash\n",
+                encoding="utf-8",
+            )
+            json_path = Path(tmp) / "reglas.json"
+            json_path.write_text(json.dumps({"rules": [{"pattern": "doc", "types": ["RUT Chileno"]}]}), encoding="utf-8")
+
+            rules = load_header_rules(yaml_path)
+            assert [r.mode for r in rules] == ["restrict", "hash"]
+            assert rules[0].types == [SensitiveDataType.EMAIL, SensitiveDataType.PHONE_CHILE]
+            assert load_header_rules(json_path)[0].types == [SensitiveDataType.RUT_CHILENO]
+
+    def test_load_rules_errors(self):
+        """Test de los errores de un archivo de reglas mal formado"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "reglas.json"
+            path.write_text(json.dumps({"rules": [{"pattern": "doc", "types": ["PASAPORTE"]}]}), encoding="utf-8")
+            with pytest.raises(ValueError, match="PASAPORTE"):
+                load_header_rules(path)
+
+            path.write_text(json.dumps(["email"]), encoding="utf-8")
+            with pytest.raises(ValueError, match="rules"):
+                load_header_rules(path)
+
+
+class TestHeaderAwareAnalyzer:
+    """Tests para HeaderAwareAnalyzer"""
+
+    def test_restricted_matches_full_classification(self):
+        """Test que los valores limpios reciben la misma clasificación que con el análisis completo"""
+        analyzer = CrypticAnalyzer()
+        hints = HeaderAwareAnalyzer(analyzer, verify_first=5, verify_every=50)
+
+        for column, kind in (("email", "email"), ("rut", "rut"), ("password_hash", "bcrypt"), ("hash", "md5")):
+            for value in _values(kind, 200):
+                assert classify_analysis(hints.analyze(column, value)) == classify_analysis(analyzer.analyze_data(value))
+
+        stats = hints.statistics()
+        assert all(not column["mislabeled"] for column in stats.values())
+        assert stats["email"]["verified"] == 5 + 200 // 50
+
+    def test_hash_in_sensitive_column_is_detected(self):
+        """Test que un hash en una columna de emails se identifica como protegido"""
+        analyzer = CrypticAnalyzer()
+        hints = HeaderAwareAnalyzer(analyzer, verify_first=0, verify_every=0)
+        value = "5d41402abc4b2a76b9719d911017c592"
+
+        analysis = hints.analyze("email", value)
+
+        assert analysis.hash_analysis is not None and analysis.hash_analysis.possible_types
+        assert analysis.protection_status == analyzer.analyze_data(value).protection_status
+
+    def test_mislabeled_column_is_demoted(self):
+        """Test que una columna con otro tipo de dato vuelve al análisis completo"""
+        analyzer = CrypticAnalyzer()
+        hints = HeaderAwareAnalyzer(analyzer, verify_first=10)
+        ruts = _values("rut", 30)
+
+        results = [hints.analyze("email", value) for value in ruts]
+
+        stats = hints.statistics()["email"]
+        assert stats["mislabeled"] is True
+        assert stats["verified"] == 10
+        # Tras descartar la regla, los RUTs se detectan con todos los patrones
+        assert results[-1].sensitive_analysis.matches[0].data_type == SensitiveDataType.RUT_CHILENO
+
+    def test_columns_without_rule_use_fallback(self):
+        """Test que las columnas sin regla usan la función de respaldo"""
+        calls = []
+        analyzer = CrypticAnalyzer()
+        hints = HeaderAwareAnalyzer(
+            analyzer, fallback=lambda column, value: calls.append(column) or analyzer.analyze_data(value)
+        )
+
+        hints.analyze("comentario", "hola")
+
+        assert calls == ["comentario"]
+        assert hints.statistics() == {}
+
+
+class TestHeaderHintsCommand:
+    """Tests para --header-hints y --header-rules"""
+
+    def test_batch_header_hints(self):
+        """Test que batch con --header-hints reporta las columnas reconocidas"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "reporte.json"
+            result = runner.invoke(cli, ["batch", "test_data.csv", "-o", str(output), "--header-hints"])
+
+            assert result.exit_code == 0
+            assert "Columnas con tipo por encabezado: 5" in result.output
+            assert output.exists()
+
+    def test_verify_header_rules(self):
+        """Test de verify con un archivo de reglas propio y una columna mal etiquetada"""
+        generator = CorpusGenerator(seed=3)
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["documento", "contacto"])
+                for _ in range(40):
+                    writer.writerow([generator.generate("rut"), generator.generate("rut")])
+
+            rules = Path(tmp) / "reglas.yaml"
+            rules.write_text(
+                "rules:\n  - pattern: documento\n    types: [RUT_CHILENO]\n  - pattern: contacto\n    types: [EMAIL]\n",
+                encoding="utf-8",
+            )
+            result = runner.invoke(cli, ["verify", str(path), "--header-rules", str(rules)])
+
+            assert result.exit_code == 0
+            assert "documento: RUT Chileno (restrict, 0/" in result.output
+            assert "'contacto' parece mal etiquetada" in result.output
+
+    def test_invalid_rules_file(self):
+        """Test que un archivo de reglas inválido termina con error"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            rules = Path(tmp) / "reglas.json"
+            rules.write_text(json.dumps({"rules": [{"pattern": "x", "types": ["NADA"]}]}), encoding="utf-8")
+            result = runner.invoke(cli, ["verify", "test_data.csv", "--header-rules", str(rules)])
+
+            assert result.exit_code == 1
+            assert "NADA" in result.output
@@ -0,0 +1,202 @@
+"""
+Tests para los hooks de instrumentación del análisis.
+
+Este módulo valida que ``CrypticAnalyzer`` invoque ``on_stage_start`` y
+``on_stage_end`` en pares alrededor de cada análisis y de cada etapa, que los
+tokens lleguen a su etapa, la combinación con el desglose de tiempos, la carga
+con ``load_hooks``, los bloques de ``instrument_chunks`` y la opción ``--hooks``
+de la CLI.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.hooks import (
+    STAGE_ANALYZE,
+    STAGE_CHUNK,
+    STAGE_FILE,
+    AnalysisHooks,
+    HookChain,
+    combine_hooks,
+    instrument_chunks,
+    load_hooks,
+)
+from cryptic.core.timings import STAGE_FEATURES, STAGE_HASH_TOKENS, STAGE_STATUS, StageTimings
+from cryptic.server.client import forward
+
+MIXED = "Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592"
+
+
+class RecordingHooks(AnalysisHooks):
+    """Hooks que registran cada invocación y entregan un token correlativo"""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, str, Any]] = []
+        self.attributes: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._next = 0
+
+    def on_stage_start(self, stage: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        self._next += 1
+        self.events.append(("start", stage, self._next))
+        self.attributes[stage] = attributes
+        return self._next
+
+    def on_stage_end(self, stage: str, token: Any, elapsed_ns: int) -> None:
+        assert elapsed_ns >= 0
+        self.events.append(("end", stage, token))
+
+    def stages(self) -> List[str]:
+        return [stage for kind, stage, _ in self.events if kind == "end"]
+
+
+# Objeto que carga --hooks en los tests de la CLI
+RECORDER = RecordingHooks()
+
+
+def assert_balanced(events: List[Tuple[str, str, Any]]) -> None:
+    """Verifica que cada etapa termine en orden inverso al inicio y con su propio token"""
+    open_stages = []
+    for kind, stage, token in events:
+        if kind == "start":
+            open_stages.append((stage, token))
+        else:
+            assert open_stages.pop() == (stage, token)
+    assert open_stages == []
+
+
+class TestAnalyzerHooks:
+    """Tests para las invocaciones desde el analizador"""
+
+    def test_stages_wrapped_by_analyze(self):
+        """Test que las etapas quedan dentro de STAGE_ANALYZE, en pares y con su token"""
+        hooks = RecordingHooks()
+        CrypticAnalyzer(hooks=hooks).analyze_data(MIXED)
+
+        assert hooks.events[0][:2] == ("start", STAGE_ANALYZE)
+        assert hooks.events[-1][:2] == ("end", STAGE_ANALYZE)
+        assert hooks.attributes[STAGE_ANALYZE] == {"length": len(MIXED)}
+        stages = hooks.stages()
+        assert {STAGE_FEATURES, STAGE_HASH_TOKENS, STAGE_STATUS, "sensitive:RUT Chileno"} <= set(stages)
+        assert_balanced(hooks.events)
+
+    def test_restricted_analysis(self):
+        """Test que analyze_restricted también invoca los hooks"""
+        hooks = RecordingHooks()
+        CrypticAnalyzer(hooks=hooks).analyze_restricted("juan@empresa.cl", [])
+
+        sensitive = {stage for stage in hooks.stages() if stage.startswith("sensitive:")}
+        assert hooks.stages()[-1] == STAGE_ANALYZE
+        assert sensitive == {"sensitive:overlaps", "sensitive:recommendations"}
+
+    def test_analyze_ends_on_error(self, monkeypatch):
+        """Test que STAGE_ANALYZE termina aunque el análisis falle"""
+        hooks = RecordingHooks()
+        analyzer = CrypticAnalyzer(hooks=hooks)
+        monkeypatch.setattr(analyzer.sensitive_detector, "detect", lambda *args, **kwargs: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            analyzer.analyze_data("hola")
+
+        assert hooks.events[-1][:2] == ("end", STAGE_ANALYZE)
+
+    def test_combined_with_timings(self):
+        """Test que hooks y desglose reciben las mismas etapas sin alterar el resultado"""
+        hooks = RecordingHooks()
+        timings = StageTimings()
+        instrumented = CrypticAnalyzer(timings=timings, hooks=hooks).analyze_data(MIXED)
+        plain = CrypticAnalyzer().analyze_data(MIXED)
+
+        assert {row["stage"] for row in timings.report()} == set(hooks.stages()) - {STAGE_ANALYZE}
+        assert instrumented.protection_status == plain.protection_status
+        assert instrumented.recommendations == plain.recommendations
+
+    def test_no_hooks(self):
+        """Test que sin hooks ni desglose no se combina nada"""
+        analyzer = CrypticAnalyzer()
+
+        assert analyzer.hooks is None
+        assert analyzer.sensitive_detector._stage_hooks is None
+
+
+class TestHookHelpers:
+    """Tests para la cadena, la carga y los bloques"""
+
+    def test_combine(self):
+        """Test que combine_hooks descarta None y solo encadena si hay varios"""
+        first, second = RecordingHooks(), RecordingHooks()
+
+        assert combine_hooks(None, None) is None
+        assert combine_hooks(None, first) is first
+        chain = combine_hooks(first, second)
+        assert isinstance(chain, HookChain)
+        chain.on_stage_end("x", chain.on_stage_start("x"), 5)
+        assert first.events == second.events == [("start", "x", 1), ("end", "x", 1)]
+
+    def test_load_hooks(self):
+        """Test que una clase se instancia y un objeto se usa tal cual"""
+        assert isinstance(load_hooks("cryptic.core.hooks:AnalysisHooks"), AnalysisHooks)
+        assert load_hooks(f"{__name__}:RECORDER") is RECORDER
+
+    @pytest.mark.parametrize(
+        "spec", ["cryptic.core.hooks", "no_existe:Hooks", "cryptic.core.hooks:NoExiste", "cryptic.core.hooks:STAGE_FILE"]
+    )
+    def test_load_hooks_invalid(self, spec):
+        """Test que las referencias inválidas se rechazan"""
+        with pytest.raises(ValueError):
+            load_hooks(spec)
+
+    def test_instrument_chunks(self):
+        """Test de un bloque por cada chunk_size elementos, cerrado al agotarse"""
+        hooks = RecordingHooks()
+        items = list(instrument_chunks(range(5), hooks, chunk_size=2, attributes={"path": "x"}))
+
+        assert items == [0, 1, 2, 3, 4]
+        assert hooks.stages() == [STAGE_CHUNK] * 3
+        assert hooks.attributes[STAGE_CHUNK] == {"index": 2, "first_item": 4, "path": "x"}
+        assert_balanced(hooks.events)
+
+    def test_instrument_chunks_closed_early(self):
+        """Test que el bloque abierto termina al cerrar el iterador"""
+        hooks = RecordingHooks()
+        chunks = instrument_chunks(range(10), hooks, chunk_size=4)
+        next(chunks)
+        chunks.close()
+
+        assert hooks.stages() == [STAGE_CHUNK]
+
+
+class TestCliHooks:
+    """Tests para la opción --hooks"""
+
+    def setup_method(self):
+        RECORDER.events.clear()
+        RECORDER.attributes.clear()
+
+    def test_verify_file_and_chunks(self, tmp_path):
+        """Test que verify abre el archivo, los bloques y los análisis en orden"""
+        data_file = tmp_path / "datos.csv"
+        data_file.write_text("email\njuan@empresa.cl\nmaria@empresa.cl\n", encoding="utf-8")
+
+        result = CliRunner().invoke(cli, ["verify", str(data_file), "--hooks", f"{__name__}:RECORDER"])
+
+        assert result.exit_code == 0
+        assert RECORDER.events[0][:2] == ("start", STAGE_FILE)
+        assert RECORDER.events[1][:2] == ("start", STAGE_CHUNK)
+        assert RECORDER.events[-1][:2] == ("end", STAGE_FILE)
+        assert RECORDER.attributes[STAGE_FILE] == {"path": str(data_file), "command": "verify"}
+        assert RECORDER.stages().count(STAGE_ANALYZE) == 2
+        assert_balanced(RECORDER.events)
+
+    def test_invalid_hooks(self):
+        """Test que una referencia inválida termina con error"""
+        result = CliRunner().invoke(cli, ["analyze", "hola", "--hooks", "no_existe:Hooks"])
+
+        assert result.exit_code == 1
+        assert "No se pudieron cargar los hooks" in result.output
+
+    def test_not_forwarded_to_daemon(self, tmp_path):
+        """Test que las invocaciones con --hooks se ejecutan localmente"""
+        assert forward(["analyze", "hola", f"--hooks={__name__}:RECORDER"], str(tmp_path / "no.sock")) is None
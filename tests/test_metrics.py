@@ -0,0 +1,192 @@
+"""
+Tests para las métricas internas del analizador.
+
+Este módulo valida los contadores e histogramas, el formato de texto de
+Prometheus, las métricas que actualizan el analizador y sus detectores, la
+publicación en ``GET /metrics`` del servidor y la opción ``--metrics`` de la CLI.
+"""
+
+import http.client
+import json
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.cache import AnalysisCache
+from cryptic.core.metrics import Counter, Histogram, MetricsRegistry, render_prometheus
+from cryptic.server.http_server import AnalysisHTTPServer
+
+
+def _value(registry, name, labels=()):
+    """Valor de un contador del registro"""
+    return registry.get(name).value(labels)
+
+
+class TestPrimitives:
+    """Tests para Counter, Histogram y MetricsRegistry"""
+
+    def test_counter_with_labels(self):
+        """Test de los incrementos por combinación de etiquetas"""
+        counter = Counter("hits_total", "Hits", ("kind",))
+        counter.inc(labels=("a",))
+        counter.inc(2, ("a",))
+        counter.inc(labels=("b",))
+
+        assert counter.value(("a",)) == 3
+        assert counter.samples() == [{"labels": {"kind": "a"}, "value": 3}, {"labels": {"kind": "b"}, "value": 1}]
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test que los buckets son acumulados e incluyen +Inf"""
+        histogram = Histogram("latency_seconds", "Latencia", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        (sample,) = histogram.samples()
+        assert sample["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+        assert sample["count"] == 4
+        assert sample["sum"] == pytest.approx(3.65)
+
+    def test_registry_reuses_and_rejects_conflicts(self):
+        """Test que un nombre registrado se reutiliza y no puede cambiar de tipo"""
+        registry = MetricsRegistry()
+        counter = registry.counter("values_total", "Valores")
+
+        assert registry.counter("values_total", "Valores") is counter
+        with pytest.raises(ValueError):
+            registry.histogram("values_total", "Valores")
+
+    def test_concurrent_increments(self):
+        """Test que los incrementos desde varios hilos no se pierden"""
+        counter = Counter("values_total", "Valores")
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value() == 40000
+
+    def test_prometheus_text(self):
+        """Test del formato de texto con etiquetas escapadas e histogramas"""
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Coincidencias", ("pattern",)).inc(2, ('Nombre "raro"',))
+        registry.histogram("latency_seconds", "Latencia", buckets=(0.5,)).observe(0.25)
+
+        text = registry.to_prometheus()
+
+        assert "# TYPE hits_total counter" in text
+        assert 'hits_total{pattern="Nombre \\"raro\\""} 2' in text
+        assert 'latency_seconds_bucket{le="0.5"} 1' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 1' in text
+        assert "latency_seconds_sum 0.25" in text
+        assert text == render_prometheus(registry.snapshot())
+
+
+class TestAnalyzerMetrics:
+    """Tests para las métricas del analizador y sus detectores"""
+
+    def test_values_bytes_and_latency(self):
+        """Test de valores analizados, bytes UTF-8 y latencia"""
+        registry = MetricsRegistry()
+        analyzer = CrypticAnalyzer(metrics=registry)
+
+        analyzer.analyze_data("juan@empresa.cl")
+        analyzer.analyze_data("Ñandú")
+
+        assert _value(registry, "cryptic_values_analyzed_total") == 2
+        assert _value(registry, "cryptic_bytes_scanned_total") == len("juan@empresa.cl") + len("Ñandú".encode())
+        assert registry.get("cryptic_analyze_duration_seconds").count() == 2
+        assert registry.get("cryptic_detect_duration_seconds").count() == 2
+
+    def test_pattern_executions_hits_and_validation_failures(self):
+        """Test de los contadores por patrón y de validaciones fallidas"""
+        registry = MetricsRegistry()
+        analyzer = CrypticAnalyzer(metrics=registry)
+
+        analyzer.analyze_data("juan@empresa.cl")
+        analyzer.analyze_data("5d41402abc4b2a76b9719d911017c592")
+        analyzer.analyze_data("12.345.678-9")  # dígito verificador inválido
+
+        email = ("sensitive", "Email")
+        assert _value(registry, "cryptic_pattern_executions_total", email) == 1
+        assert _value(registry, "cryptic_pattern_hits_total", email) == 1
+        assert _value(registry, "cryptic_pattern_hits_total", ("hash", "MD5")) == 1
+        assert _value(registry, "cryptic_validation_failures_total", ("RUT Chileno",)) == 1
+
+    def test_cache_hits(self, tmp_path):
+        """Test de aciertos y fallos de la caché persistente"""
+        registry = MetricsRegistry()
+        cache = AnalysisCache(tmp_path / "cache.db")
+        analyzer = CrypticAnalyzer(cache=cache, metrics=registry)
+        try:
+            analyzer.analyze_data("juan@empresa.cl")
+            analyzer.analyze_data("juan@empresa.cl")
+        finally:
+            cache.close()
+
+        assert _value(registry, "cryptic_cache_requests_total", ("hit",)) == 1
+        assert _value(registry, "cryptic_cache_requests_total", ("miss",)) == 1
+        assert _value(registry, "cryptic_values_analyzed_total") == 2
+        assert _value(registry, "cryptic_bytes_scanned_total") == len("juan@empresa.cl")
+
+    def test_disabled_by_default(self):
+        """Test que sin registro no se crean métricas"""
+        analyzer = CrypticAnalyzer()
+        analyzer.analyze_data("juan@empresa.cl")
+
+        assert analyzer.metrics is None
+        assert analyzer.sensitive_detector.metrics is None
+
+
+class TestMetricsExposition:
+    """Tests para la publicación de métricas en el servidor y la CLI"""
+
+    def test_server_metrics_endpoint(self):
+        """Test de GET /metrics con los conteos de solicitudes HTTP"""
+        analyzer = CrypticAnalyzer(metrics=MetricsRegistry())
+        server = AnalysisHTTPServer(("127.0.0.1", 0), analyzer, threads=1, quiet=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            connection.request("POST", "/analyze", body=json.dumps({"value": "juan@empresa.cl"}))
+            connection.getresponse().read()
+            connection.request("GET", "/metrics")
+            response = connection.getresponse()
+            text = response.read().decode("utf-8")
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+            server.drain(5)
+
+        assert response.status == 200
+        assert response.getheader("Content-Type").startswith("text/plain; version=0.0.4")
+        assert "cryptic_values_analyzed_total 1" in text
+        assert 'cryptic_http_requests_total{endpoint="/analyze",status="200"} 1' in text
+
+    def test_cli_metrics_dump(self, tmp_path):
+        """Test de --metrics en JSON y en formato Prometheus"""
+        runner = CliRunner()
+        json_path = tmp_path / "metrics.json"
+        text_path = tmp_path / "metrics.prom"
+
+        result = runner.invoke(cli, ["analyze", "juan@empresa.cl", "--metrics", str(json_path)])
+        assert result.exit_code == 0
+        assert "Métricas guardadas" in result.output
+        snapshot = json.loads(json_path.read_text(encoding="utf-8"))
+        assert snapshot["cryptic_values_analyzed_total"]["samples"][0]["value"] == 1
+
+        data_file = tmp_path / "datos.txt"
+        data_file.write_text("juan@empresa.cl\n12.345.678-5\n", encoding="utf-8")
+        result = runner.invoke(cli, ["verify", str(data_file), "--metrics", str(text_path)])
+        assert result.exit_code == 0
+        assert "cryptic_values_analyzed_total 2" in text_path.read_text(encoding="utf-8")
@@ -0,0 +1,155 @@
+"""
+Tests para el análisis con hilos sobre un analizador compartido.
+
+Este módulo valida la compilación de patrones concurrente, que
+``analyze_batch(threads=N)`` y ``AnalysisThreadPool`` conserven el orden y los
+resultados, que la caché y las métricas toleren varios hilos, y la opción
+``--threads`` de ``cryptic batch``.
+"""
+
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.cache import AnalysisCache
+from cryptic.core.metrics import MetricsRegistry
+from cryptic.core.parallel import AnalysisThreadPool
+from cryptic.patterns import sensitive_patterns
+from cryptic.patterns.sensitive_patterns import get_compiled_patterns, get_sensitive_patterns
+
+VALUES = [
+    "juan.perez@empresa.cl",
+    "12.345.678-5",
+    "4111-1111-1111-1111",
+    "5d41402abc4b2a76b9719d911017c592",
+    "Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592",
+    "hola mundo",
+] * 100
+
+
+def summarize(analysis):
+    """Campos del análisis que no dependen del tiempo"""
+    matches = analysis.sensitive_analysis.matches if analysis.sensitive_analysis else []
+    return (
+        analysis.original_data,
+        analysis.protection_status,
+        analysis.confidence,
+        [match.data_type for match in matches],
+    )
+
+
+def run_threads(target, count=8):
+    """Ejecuta target en count hilos que arrancan a la vez"""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            target()
+        except Exception as e:  # pragma: no cover - solo ante una falla
+            errors.append(e)
+
+    workers = [threading.Thread(target=run) for _ in range(count)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert errors == []
+
+
+class TestSharedAnalyzer:
+    """Tests para un analizador compartido entre hilos"""
+
+    def test_compiled_patterns_published_complete(self, monkeypatch):
+        """Test que ningún hilo ve el diccionario de regex a medio construir"""
+        monkeypatch.setattr(sensitive_patterns, "_COMPILED_PATTERNS", None)
+        sizes = []
+        run_threads(lambda: sizes.append(len(get_compiled_patterns())))
+
+        assert sizes == [len(get_sensitive_patterns())] * 8
+
+    def test_threaded_batch_matches_sequential(self):
+        """Test que analyze_batch con hilos retorna los mismos resultados en el mismo orden"""
+        analyzer = CrypticAnalyzer()
+        sequential = analyzer.analyze_batch(VALUES)
+        threaded = analyzer.analyze_batch(VALUES, threads=4)
+
+        assert [summarize(a) for a in threaded] == [summarize(a) for a in sequential]
+
+    def test_concurrent_analysis_from_threads(self):
+        """Test de un analizador nuevo usado desde varios hilos a la vez"""
+        analyzer = CrypticAnalyzer(metrics=MetricsRegistry())
+        expected = [summarize(a) for a in CrypticAnalyzer().analyze_batch(VALUES[:60])]
+        outputs = []
+        run_threads(lambda: outputs.append([summarize(a) for a in analyzer.analyze_batch(VALUES[:60])]))
+
+        assert all(output == expected for output in outputs)
+        assert analyzer.metrics.get("cryptic_values_analyzed_total").value() == 8 * 60
+
+    def test_shared_cache(self, tmp_path):
+        """Test que la caché persistente admite un analizador compartido entre hilos"""
+        cache = AnalysisCache(tmp_path / "cache.db")
+        analyzer = CrypticAnalyzer(cache=cache)
+        run_threads(lambda: analyzer.analyze_batch(VALUES[:12]))
+
+        stats = cache.get_statistics()
+        assert stats["hits"] + stats["misses"] == 8 * 12
+        assert len(cache) == 6
+        cache.close()
+
+
+class TestAnalysisThreadPool:
+    """Tests para el pool de hilos"""
+
+    def test_order_and_chunks(self):
+        """Test que los resultados conservan el orden con bloques pequeños"""
+        with AnalysisThreadPool(threads=3, chunk_size=7) as pool:
+            assert pool.map(lambda x: x * 2, list(range(100))) == [x * 2 for x in range(100)]
+
+    def test_exception_propagates(self):
+        """Test que una excepción en un hilo llega al llamador"""
+        with AnalysisThreadPool(threads=2, chunk_size=1) as pool:
+            with pytest.raises(ZeroDivisionError):
+                pool.map(lambda x: 1 / x, [1, 2, 0, 3])
+
+    def test_invalid_threads(self):
+        """Test que se rechaza una cantidad de hilos inválida"""
+        with pytest.raises(ValueError):
+            AnalysisThreadPool(threads=0)
+
+
+class TestCliThreads:
+    """Tests para la opción --threads de batch"""
+
+    def test_same_report_as_sequential(self, tmp_path):
+        """Test que el reporte con hilos coincide con el secuencial"""
+        data_file = tmp_path / "datos.csv"
+        rows = [f"{value},{VALUES[(index + 1) % 6]}" for index, value in enumerate(VALUES)]
+        data_file.write_text("a,b\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        runner = CliRunner()
+
+        outputs = []
+        for threads in ("1", "4"):
+            output = tmp_path / f"reporte-{threads}.csv"
+            result = runner.invoke(cli, ["batch", str(data_file), "-o", str(output), "-f", "csv", "--threads", threads])
+            assert result.exit_code == 0, result.output
+            outputs.append(output.read_text(encoding="utf-8"))
+
+        assert outputs[0] == outputs[1]
+        assert outputs[0].count("\n") == 2 * len(VALUES) + 1
+
+    def test_rejects_stateful_options(self, tmp_path):
+        """Test que --threads no se combina con la memo de columnas"""
+        data_file = tmp_path / "datos.csv"
+        data_file.write_text("a\nx\n", encoding="utf-8")
+
+        result = CliRunner().invoke(
+            cli, ["batch", str(data_file), "-o", str(tmp_path / "r.json"), "--threads", "2", "--column-memo"]
+        )
+
+        assert result.exit_code == 1
+        assert "--threads no se puede combinar con --column-memo" in result.output
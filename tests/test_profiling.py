@@ -0,0 +1,88 @@
+"""
+Tests para el perfilado de CPU y memoria de la CLI.
+
+Este módulo valida que ``RunProfiler`` guarde los archivos crudos de
+cProfile y tracemalloc, que los resúmenes solo incluyan código de cryptic,
+que la instantánea de memoria sea la cercana al pico y las opciones
+``--profile`` y ``--memory-profile`` de la CLI.
+"""
+
+import pstats
+import time
+import tracemalloc
+
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.utils.profiling import PEAK_POLL_INTERVAL, RunProfiler
+
+VALUES = [f"usuario{i}@empresa.cl" for i in range(300)]
+
+
+class TestRunProfiler:
+    """Tests para el perfilador"""
+
+    def test_cpu_profile(self, tmp_path):
+        """Test del archivo .pstats y del resumen de funciones de cryptic"""
+        path = tmp_path / "run.pstats"
+        profiler = RunProfiler(profile_path=path)
+        profiler.start()
+        CrypticAnalyzer().analyze_batch(VALUES)
+        profiler.stop()
+
+        assert pstats.Stats(str(path)).total_calls > 0
+        functions = [row["function"] for row in profiler.functions]
+        assert functions and all(function.startswith("cryptic/") for function in functions)
+        assert any("sensitive_detector.py" in function for function in functions)
+
+    def test_memory_profile(self, tmp_path):
+        """Test de la instantánea cruda y del resumen de sitios de asignación"""
+        path = tmp_path / "run.mem"
+        profiler = RunProfiler(memory_path=path)
+        profiler.start()
+        results = CrypticAnalyzer().analyze_batch(VALUES)
+        profiler.stop()
+
+        assert len(results) == len(VALUES)
+        assert not tracemalloc.is_tracing()
+        assert tracemalloc.Snapshot.load(str(path)).traces
+        assert profiler.peak_bytes > 0
+        assert profiler.allocations
+        assert all(row["location"].startswith("cryptic/") for row in profiler.allocations)
+
+    def test_memory_snapshot_near_peak(self, tmp_path):
+        """Test que las asignaciones liberadas antes de terminar siguen en el resumen"""
+        profiler = RunProfiler(memory_path=tmp_path / "run.mem")
+        profiler.start()
+        results = CrypticAnalyzer().analyze_batch(VALUES)
+        time.sleep(PEAK_POLL_INTERVAL * 6)
+        del results
+        profiler.stop()
+
+        assert any("analyzer.py" in row["location"] for row in profiler.allocations)
+
+
+class TestCliProfiling:
+    """Tests para las opciones --profile y --memory-profile"""
+
+    def test_analyze_profile(self, tmp_path):
+        """Test de --profile en analyze"""
+        path = tmp_path / "analyze.pstats"
+        result = CliRunner().invoke(cli, ["analyze", "juan@empresa.cl", "--profile", str(path)])
+
+        assert result.exit_code == 0
+        assert "Funciones de cryptic con más tiempo propio" in result.output
+        assert path.exists()
+
+    def test_verify_memory_profile(self, tmp_path):
+        """Test de --memory-profile en verify"""
+        data_file = tmp_path / "datos.txt"
+        data_file.write_text("\n".join(VALUES[:20]), encoding="utf-8")
+        path = tmp_path / "verify.mem"
+
+        result = CliRunner().invoke(cli, ["verify", str(data_file), "--memory-profile", str(path)])
+
+        assert result.exit_code == 0
+        assert "Sitios de asignación de cryptic" in result.output
+        assert tracemalloc.Snapshot.load(str(path)).traces
@@ -0,0 +1,116 @@
+"""
+Tests para el almacenamiento columnar de resultados.
+
+Este módulo valida que ResultTable conserve los resultados de un lote,
+permita filtrarlos y agruparlos, y los exporte a JSON Lines y CSV.
+"""
+
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer, DataSensitivity, ProtectionStatus
+from cryptic.core.result_table import CSV_FIELDNAMES, ResultTable
+from cryptic.patterns.sensitive_patterns import SensitiveDataType
+
+CELLS = [
+    (1, "email", "juan.perez@empresa.cl"),
+    (1, "rut", "12.345.678-5"),
+    (1, "hash", "5d41402abc4b2a76b9719d911017c592"),
+    (2, "email", "maria@company.com"),
+    (2, "rut", "11.111.111-1"),
+    (2, "hash", "$2b$12$N9qo8uLOickgx2ZMRZoMye"),
+    (3, "nota", "Contactar a juan@empresa.cl o al RUT 12.345.678-5"),
+]
+
+
+@pytest.fixture
+def analyzer():
+    """Analizador compartido por los tests"""
+    return CrypticAnalyzer()
+
+
+@pytest.fixture
+def table(analyzer):
+    """Tabla con los resultados de CELLS"""
+    table = ResultTable()
+    for row, column, value in CELLS:
+        table.append(row, column, analyzer.analyze_data(value))
+    return table
+
+
+class TestResultTable:
+    """Tests para ResultTable"""
+
+    def test_matches_are_preserved(self, table, analyzer):
+        """Test que las coincidencias se reconstruyen desde los buffers planos"""
+        for index, (_, _, value) in enumerate(CELLS):
+            expected = [
+                (m.data_type, m.matched_text, m.confidence, m.is_validated)
+                for m in analyzer.analyze_data(value).sensitive_analysis.matches
+            ]
+            assert table.matches(index) == expected
+
+    def test_report_matches_analyzer_report(self, table, analyzer):
+        """Test que el reporte coincide con el del analizador"""
+        expected = analyzer.generate_report([analyzer.analyze_data(value) for _, _, value in CELLS])
+        assert table.generate_report() == expected
+
+    def test_filter_critical_unprotected(self, table):
+        """Test filtrado por sensibilidad y estado de protección"""
+        critical = table.filter(DataSensitivity.CRITICAL, ProtectionStatus.UNPROTECTED)
+
+        assert len(critical) == 3
+        assert {record["column"] for record in critical.iter_records()} == {"rut", "nota"}
+
+    def test_filter_by_type_and_column(self, table):
+        """Test filtrado por tipo de dato sensible y por columna"""
+        emails = table.filter(sensitive_type=SensitiveDataType.EMAIL)
+        assert [record["row"] for record in emails.iter_records()] == [1, 2, 3]
+        assert len(table.filter(column="hash")) == 2
+        assert len(table.filter(column="inexistente")) == 0
+
+    def test_group_counts(self, table):
+        """Test conteos por grupo"""
+        assert table.group_counts("column") == {"email": 2, "rut": 2, "hash": 2, "nota": 1}
+        assert table.group_counts("sensitive_type")["RUT Chileno"] == 3
+        with pytest.raises(ValueError, match="Agrupación desconocida"):
+            table.group_counts("color")
+
+    def test_export_jsonl_and_csv(self, table):
+        """Test exportación a JSON Lines y CSV"""
+        jsonl = io.StringIO()
+        table.write_jsonl(jsonl)
+        records = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+        assert records == list(table.iter_records())
+
+        output = io.StringIO(newline="")
+        table.write_csv(output)
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert list(rows[0]) == CSV_FIELDNAMES
+        assert rows[-1]["sensitive_types"] == "Email; RUT Chileno"
+
+
+class TestBatchJsonl:
+    """Tests para el formato jsonl del comando batch"""
+
+    def test_batch_jsonl_output(self):
+        """Test reporte de batch en JSON Lines"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = Path(tmp) / "data.csv"
+            data_path.write_text("email,rut\njuan@empresa.cl,12.345.678-5\n", encoding="utf-8")
+            output = Path(tmp) / "report.jsonl"
+
+            result = runner.invoke(cli, ["batch", str(data_path), "--output", str(output), "--format", "jsonl"])
+            assert result.exit_code == 0
+
+            records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+            assert [(r["row"], r["column"]) for r in records] == [(1, "email"), (1, "rut")]
+            assert records[1]["sensitive_matches"][0]["type"] == "RUT Chileno"
@@ -0,0 +1,188 @@
+"""
+Tests para la clasificación de columnas por muestreo.
+
+Este módulo valida la detención temprana, las estrategias random y
+reservoir (incluidas las columnas casi vacías), el sorteo uniforme de filas
+por acceso aleatorio y la opción --sample de la CLI.
+"""
+
+import csv
+import json
+import random
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core import sampling
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.sampling import ColumnSampler, classify_analysis, sample_file, wilson_lower_bound
+from cryptic.utils.corpus import CorpusGenerator
+from cryptic.utils.files import iter_random_rows
+
+
+def _write_table(path: Path, rows: int) -> None:
+    """Escribe una tabla CSV con una columna homogénea por tipo"""
+    generator = CorpusGenerator(seed=3)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["email", "hash", "nota"])
+        for _ in range(rows):
+            writer.writerow([generator.generate("email"), generator.generate("bcrypt"), generator.generate("plain")])
+
+
+class TestColumnSampler:
+    """Tests para ColumnSampler"""
+
+    def test_converges_on_homogeneous_column(self):
+        """Test que una columna homogénea se detiene al completar la ventana"""
+        analyzer = CrypticAnalyzer()
+        sampler = ColumnSampler(confidence=0.99, window=20)
+        analysis = analyzer.analyze_data("$2b$12$N9qo8uLOickgx2ZMRZoMyeIjZAgcfl7p92ldGxad68LJZdL17lhWy")
+
+        converged = [sampler.add(analysis) for _ in range(20)]
+        assert converged[-1] and not any(converged[:-1])
+
+        result = sampler.result()
+        assert result["classification"] == "bcrypt, Protegido"
+        assert result["sample_size"] == 20
+        assert result["agreement"] == 1.0
+
+    def test_mixed_column_does_not_converge(self):
+        """Test que una columna mezclada agota el máximo de muestras"""
+        analyzer = CrypticAnalyzer()
+        email = analyzer.analyze_data("juan.perez@empresa.cl")
+        plain = analyzer.analyze_data("producto pendiente")
+        sampler = ColumnSampler(confidence=0.99, window=10, max_samples=40)
+
+        for i in range(40):
+            sampler.add(email if i % 2 else plain)
+
+        assert sampler.done and not sampler.converged
+        assert sampler.result()["proportion"] == 0.5
+
+    def test_classify_analysis(self):
+        """Test de la clasificación (tipo, estado) de un análisis"""
+        analysis = CrypticAnalyzer().analyze_data("juan.perez@empresa.cl")
+        assert classify_analysis(analysis) == ("Email", "Sin protección")
+
+    def test_wilson_lower_bound(self):
+        """Test de la cota inferior de Wilson"""
+        assert wilson_lower_bound(0, 0) == 0.0
+        assert 0.96 < wilson_lower_bound(100, 100) < 0.97
+        assert wilson_lower_bound(50, 100) < 0.5
+
+
+class TestSampleFile:
+    """Tests para sample_file"""
+
+    def test_random_strategy_stops_early(self, monkeypatch):
+        """Test que la estrategia random clasifica con pocas muestras por columna"""
+        monkeypatch.setattr(sampling, "RANDOM_MIN_BYTES", 0)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            _write_table(path, 2000)
+            report = sample_file(CrypticAnalyzer(), path, window=50)
+
+        assert report["strategy"] == "random"
+        columns = report["columns"]
+        assert columns["email"]["classification"] == "Email, Sin protección"
+        assert columns["hash"]["classification"] == "bcrypt, Protegido"
+        assert all(result["converged"] and result["sample_size"] == 50 for result in columns.values())
+
+    def test_random_strategy_samples_sparse_columns(self, monkeypatch):
+        """Test que una columna vacía en casi todas las filas recibe muestras aunque las demás converjan"""
+        monkeypatch.setattr(sampling, "RANDOM_MIN_BYTES", 0)
+        generator = CorpusGenerator(seed=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["email", "rut"])
+                for index in range(2000):
+                    writer.writerow([generator.generate("email"), "12.345.678-5" if index % 200 == 0 else ""])
+            report = sample_file(CrypticAnalyzer(), path, window=20, max_samples=1000)
+
+        assert report["row_selection"] == sampling.ROW_SELECTION["random"]
+        assert report["columns"]["email"]["converged"]
+        assert report["columns"]["rut"]["sample_size"] > 0
+        assert report["columns"]["rut"]["data_type"] == "RUT Chileno"
+
+    def test_small_files_use_reservoir(self):
+        """Test que los archivos pequeños se muestrean con reservorio y reportan la población"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            _write_table(path, 300)
+            report = sample_file(CrypticAnalyzer(), path, column="hash", window=50)
+
+        assert report["strategy"] == "reservoir"
+        assert list(report["columns"]) == ["hash"]
+        assert report["columns"]["hash"]["population"] == 300
+        assert report["columns"]["hash"]["converged"]
+
+    def test_invalid_parameters(self):
+        """Test de validación de estrategia y ventana"""
+        with pytest.raises(ValueError, match="Estrategia"):
+            sample_file(CrypticAnalyzer(), Path("x.csv"), strategy="secuencial")
+        with pytest.raises(ValueError, match="ventana"):
+            sample_file(CrypticAnalyzer(), Path("x.csv"), window=500, max_samples=100)
+
+    def test_iter_random_rows(self):
+        """Test que las filas sorteadas respetan el encabezado y el filtro de columna"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            _write_table(path, 50)
+            rows = iter_random_rows(path, random.Random(0), column="email")
+            drawn = [next(rows) for _ in range(20)]
+
+        assert all(cells and cells[0][0] == "email" and "@" in cells[0][1] for cells in drawn)
+
+    def test_random_rows_are_uniform(self):
+        """Test que las filas se sortean de forma uniforme aunque sus largos sean muy distintos"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sesgada.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["id", "relleno"])
+                for index in range(10):
+                    writer.writerow([index, "x" * (100 if index % 2 else 1)])
+            rows = iter_random_rows(path, random.Random(0), column="id")
+            counts = Counter(next(rows)[0][1] for _ in range(2000))
+
+        # Sin corregir el largo, las filas cortas (tras una larga) saldrían ~95% de las veces
+        assert set(counts) == {str(index) for index in range(10)}
+        assert all(0.07 < count / 2000 < 0.13 for count in counts.values())
+
+
+class TestSampleCommand:
+    """Tests para --sample en verify y batch"""
+
+    def test_verify_sample(self):
+        """Test verify --sample con reporte JSON"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            output = Path(tmp) / "muestreo.json"
+            _write_table(path, 300)
+            result = runner.invoke(
+                cli, ["verify", str(path), "--sample", "reservoir", "--sample-window", "30", "-o", str(output), "-f", "json"]
+            )
+
+            assert result.exit_code == 0
+            assert "bcrypt, Protegido" in result.output
+            report = json.loads(output.read_text(encoding="utf-8"))["sampling"]
+            assert report["columns"]["email"]["sample_size"] == 30
+
+    def test_batch_sample_rejects_summary_only(self):
+        """Test que --sample no se combina con --summary-only"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tabla.csv"
+            _write_table(path, 10)
+            result = runner.invoke(
+                cli, ["batch", str(path), "--sample", "random", "--summary-only", "-o", str(Path(tmp) / "out.json")]
+            )
+            assert result.exit_code == 1
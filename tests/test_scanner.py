@@ -0,0 +1,386 @@
+"""
+Tests para el escaneo recursivo de directorios.
+
+Este módulo valida el recorrido de archivos, el descarte de binarios, los
+errores por archivo (contenido corrupto o archivos eliminados durante el
+recorrido), la agregación de resultados por archivo del escáner de Cryptic
+y el manifiesto incremental, incluida la poda de archivos que ya no existen.
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+import sqlite3
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.manifest import ScanManifest, build_options_key
+from cryptic.core.scanner import scan_directory
+from cryptic.utils.files import file_content_hash, input_suffix, is_binary_file, iter_file_values, open_input
+
+CSV_CONTENT = "email,rut\na@empresa.cl,12.345.678-5\nb@empresa.cl,11.111.111-1\n"
+
+
+def _write_compressed(path: Path, compression: str, content: str) -> None:
+    """Escribe un archivo comprimido con el formato indicado"""
+    data = content.encode("utf-8")
+    if compression == "gzip":
+        path.write_bytes(gzip.compress(data))
+    elif compression == "bz2":
+        path.write_bytes(bz2.compress(data))
+    elif compression == "xz":
+        path.write_bytes(lzma.compress(data))
+    else:
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("export/users.csv", data)
+
+
+def _build_tree(root: Path) -> None:
+    """Crea un árbol de archivos de prueba con datos mixtos"""
+    (root / "nested" / "deep").mkdir(parents=True)
+    (root / "archive").mkdir()
+
+    (root / "users.csv").write_text(
+        "email,password_hash\njuan@empresa.cl,5d41402abc4b2a76b9719d911017c592\nmaria@empresa.cl,plaintext\n",
+        encoding="utf-8",
+    )
+    (root / "nested" / "app.log").write_text("login ok\nuser 12.345.678-5 autenticado\n", encoding="utf-8")
+    (root / "nested" / "deep" / "data.json").write_text(
+        json.dumps({"users": [{"email": "pedro@empresa.cl", "active": True}]}), encoding="utf-8"
+    )
+    (root / "archive" / "old.csv").write_text("email\nviejo@empresa.cl\n", encoding="utf-8")
+    (root / "image.txt").write_bytes(b"\x89PNG\x00\x00\x01\x02binary")
+    (root / "notes.md").write_text("ignorado@empresa.cl\n", encoding="utf-8")
+
+
+class TestFileUtilities:
+    """Tests para las utilidades de lectura de archivos"""
+
+    def test_binary_sniff(self):
+        """Test detección de archivos binarios"""
+        with tempfile.TemporaryDirectory() as tmp:
+            binary = Path(tmp) / "blob.txt"
+            binary.write_bytes(b"abc\x00def")
+            text = Path(tmp) / "plain.txt"
+            text.write_text("hola mundo\n", encoding="utf-8")
+
+            assert is_binary_file(binary)
+            assert not is_binary_file(text)
+
+    def test_iter_json_values(self):
+        """Test extracción de valores escalares desde JSON"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.json"
+            path.write_text(json.dumps({"a": {"b": ["x@empresa.cl", 5]}, "c": None}), encoding="utf-8")
+
+            values = list(iter_file_values(path))
+            assert values == [("$.a.b[0]", "x@empresa.cl"), ("$.a.b[1]", "5")]
+
+    def test_iter_csv_column(self):
+        """Test extracción de una columna específica desde CSV"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.csv"
+            path.write_text(CSV_CONTENT, encoding="utf-8")
+
+            assert list(iter_file_values(path, "rut")) == [("Fila 1, rut", "12.345.678-5"), ("Fila 2, rut", "11.111.111-1")]
+
+            # La huella se calcula con los mismos bytes leídos para el análisis
+            hashes = []
+            assert len(list(iter_file_values(path, "rut", hashes.append))) == 2
+            assert hashes == [file_content_hash(path)]
+
+    @pytest.mark.parametrize(
+        "compression, name",
+        [("gzip", "users.csv.gz"), ("bz2", "users.csv.bz2"), ("xz", "users.csv.xz"), ("zip", "users.zip")],
+    )
+    def test_compressed_input_detection(self, compression, name):
+        """Test descompresión transparente detectada por magic bytes"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / name
+            _write_compressed(path, compression, CSV_CONTENT)
+
+            with open_input(path) as input_file:
+                assert input_file.compression == compression
+                assert input_file.text.read() == CSV_CONTENT
+                assert input_file.position() <= input_file.size
+
+            assert input_suffix(path) == ".csv"
+            assert not is_binary_file(path)
+            assert list(iter_file_values(path, "rut")) == [("Fila 1, rut", "12.345.678-5"), ("Fila 2, rut", "11.111.111-1")]
+
+            # La huella se calcula con los mismos bytes leídos para el análisis
+            hashes = []
+            assert len(list(iter_file_values(path, "rut", hashes.append))) == 2
+            assert hashes == [file_content_hash(path)]
+
+    @pytest.mark.parametrize("only_directory", [False, True], ids=["corrupto", "sin-archivos"])
+    def test_failed_open_closes_file(self, tmp_path, monkeypatch, only_directory):
+        """Test que un zip corrupto o vacío no deja abierto el archivo original"""
+        from cryptic.utils import files
+
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            handle = open(*args, **kwargs)
+            opened.append(handle)
+            return handle
+
+        monkeypatch.setattr(files, "open", tracking_open, raising=False)
+        path = tmp_path / "datos.zip"
+        if only_directory:
+            with zipfile.ZipFile(path, "w") as archive:
+                archive.writestr("export/", b"")
+        else:
+            path.write_bytes(b"PK\x03\x04no es zip")
+
+        with pytest.raises((zipfile.BadZipFile, ValueError)):
+            open_input(path)
+        assert opened and all(handle.closed for handle in opened)
+
+    def test_magic_bytes_override_extension(self):
+        """Test que la detección usa el contenido y no la extensión"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "mislabeled.csv"
+            _write_compressed(path, "gzip", CSV_CONTENT)
+
+            with open_input(path) as input_file:
+                assert input_file.compression == "gzip"
+                assert input_file.text.read() == CSV_CONTENT
+
+
+class TestScanDirectory:
+    """Tests para el escaneo de directorios"""
+
+    def test_scan_aggregates_per_file(self):
+        """Test agregación de resultados por archivo y en el resumen"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _build_tree(root)
+
+            report = scan_directory(root, workers=1)
+            scanned = {Path(f.path).name for f in report.files}
+
+            assert scanned == {"users.csv", "app.log", "data.json", "old.csv"}
+            assert [Path(p).name for p in report.skipped_binary] == ["image.txt"]
+
+            summary = report.summary()
+            assert summary["files_scanned"] == 4
+            assert summary["sensitive_by_type"]["Email"] == 4
+            assert summary["sensitive_by_type"]["RUT Chileno"] == 1
+            assert summary["hash_types_detected"]["MD5"] == 1
+
+    def test_scan_include_exclude(self):
+        """Test filtros glob de inclusión y exclusión"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _build_tree(root)
+
+            report = scan_directory(root, include=["*.csv"], exclude=["archive/*"], workers=1)
+            assert [Path(f.path).name for f in report.files] == ["users.csv"]
+
+    def test_corrupt_and_vanished_files_are_errors(self, monkeypatch):
+        """Test que un archivo corrupto o eliminado durante el recorrido se informa como error"""
+        from cryptic.core import scanner
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "ok.csv").write_text(CSV_CONTENT, encoding="utf-8")
+            (root / "roto.csv.gz").write_bytes(b"\x1f\x8bno es gzip")
+            original_iter_files = scanner.iter_files
+
+            def iter_with_vanished(*args):
+                yield from original_iter_files(*args)
+                yield root / "eliminado.csv"
+
+            monkeypatch.setattr(scanner, "iter_files", iter_with_vanished)
+            report = scan_directory(root, workers=1)
+
+            errors = {Path(f.path).name: f.error for f in report.files if f.error}
+            assert set(errors) == {"roto.csv.gz", "eliminado.csv"}
+            assert report.skipped_binary == []
+            assert report.summary()["files_failed"] == 2
+            assert report.summary()["total_analyzed"] == 4
+
+    def test_scan_process_pool(self):
+        """Test que el pool de procesos produce el mismo resumen que la ejecución secuencial"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _build_tree(root)
+
+            sequential = scan_directory(root, workers=1).summary()
+            parallel = scan_directory(root, workers=2).summary()
+
+            for key in ("total_analyzed", "protected", "unprotected", "sensitive_by_type", "hash_types_detected"):
+                assert sequential[key] == parallel[key]
+
+
+class TestScanCommand:
+    """Tests para el comando scan"""
+
+    def test_scan_command_report(self):
+        """Test comando scan con reporte JSON"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            output = Path(tmp) / "report.json"
+
+            result = runner.invoke(cli, ["scan", str(root), "--workers", "1", "--output", str(output)])
+            assert result.exit_code == 0
+            assert "Resumen del escaneo" in result.output
+            assert "Detalle por archivo" in result.output
+
+            data = json.loads(output.read_text(encoding="utf-8"))
+            assert data["summary"]["files_scanned"] == 4
+            assert len(data["files"]) == 4
+
+    def test_scan_command_manifest(self):
+        """Test comando scan incremental con manifiesto"""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            manifest_path = Path(tmp) / "manifest.db"
+            args = ["scan", str(root), "--workers", "1", "--manifest", str(manifest_path)]
+
+            assert runner.invoke(cli, args).exit_code == 0
+            result = runner.invoke(cli, args)
+            assert result.exit_code == 0
+            assert "Archivos reutilizados del manifiesto: 4" in result.output
+
+
+class TestScanManifest:
+    """Tests para escaneos incrementales con manifiesto"""
+
+    def test_unchanged_files_are_reused(self):
+        """Test que un segundo escaneo reutiliza los archivos sin cambios"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            manifest_path = Path(tmp) / "manifest.db"
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                first = scan_directory(root, workers=1, manifest=manifest)
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                second = scan_directory(root, workers=1, manifest=manifest)
+
+            assert first.summary()["files_from_manifest"] == 0
+            assert second.summary()["files_from_manifest"] == 4
+            for key in ("total_analyzed", "protected", "sensitive_by_type", "hash_types_detected"):
+                assert first.summary()[key] == second.summary()[key]
+
+    def test_modified_files_are_rescanned(self):
+        """Test que los archivos modificados o con otras opciones se vuelven a escanear"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            manifest_path = Path(tmp) / "manifest.db"
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                scan_directory(root, workers=1, manifest=manifest)
+
+            (root / "users.csv").write_text("email\nnuevo@empresa.cl\notro@empresa.cl\n", encoding="utf-8")
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                report = scan_directory(root, workers=1, manifest=manifest)
+
+            reused = {Path(f.path).name for f in report.files if f.from_manifest}
+            assert reused == {"app.log", "data.json", "old.csv"}
+
+            with ScanManifest(manifest_path, build_options_key("email")) as manifest:
+                report = scan_directory(root, workers=1, manifest=manifest)
+            assert report.summary()["files_from_manifest"] == 0
+
+            with ScanManifest(manifest_path, build_options_key(max_findings=1)) as manifest:
+                report = scan_directory(root, workers=1, manifest=manifest, max_findings=1)
+            assert report.summary()["files_from_manifest"] == 0
+
+    def test_file_modified_during_scan_is_not_recorded(self, monkeypatch):
+        """Test que un archivo modificado mientras se escanea no queda en el manifiesto"""
+        from cryptic.core import scanner
+
+        def modifying_iter(path, column=None, on_content_hash=None):
+            yield from iter_file_values(path, column, on_content_hash)
+            if Path(path).name == "users.csv":
+                # Mismo tamaño: solo la fecha y el contenido delatan el cambio
+                content = Path(path).read_text(encoding="utf-8")
+                Path(path).write_text(content.replace("maria@", "mario@"), encoding="utf-8")
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            manifest_path = Path(tmp) / "manifest.db"
+
+            monkeypatch.setattr(scanner, "iter_file_values", modifying_iter)
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                scan_directory(root, workers=1, manifest=manifest)
+            monkeypatch.undo()
+
+            with sqlite3.connect(manifest_path) as connection:
+                stored = {Path(row[0]).name for row in connection.execute("SELECT path FROM files")}
+            assert stored == {"app.log", "data.json", "old.csv"}
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                report = scan_directory(root, workers=1, manifest=manifest)
+            rescanned = [f for f in report.files if not f.from_manifest]
+            assert [Path(f.path).name for f in rescanned] == ["users.csv"]
+
+    def test_missing_files_are_pruned(self):
+        """Test que las filas de archivos eliminados o renombrados se eliminan del manifiesto"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            other = Path(tmp) / "otro"
+            other.mkdir()
+            (other / "extra.csv").write_text(CSV_CONTENT, encoding="utf-8")
+            manifest_path = Path(tmp) / "manifest.db"
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                scan_directory(other, workers=1, manifest=manifest)
+                scan_directory(root, workers=1, manifest=manifest)
+
+            (root / "archive" / "old.csv").unlink()
+            (root / "users.csv").rename(root / "usuarios.csv")
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                report = scan_directory(root, workers=1, manifest=manifest)
+
+            assert {Path(f.path).name for f in report.files if f.from_manifest} == {"app.log", "data.json"}
+            with sqlite3.connect(manifest_path) as connection:
+                stored = {Path(row[0]).name for row in connection.execute("SELECT path FROM files")}
+            # Las filas de otros directorios se conservan
+            assert stored == {"extra.csv", "usuarios.csv", "app.log", "data.json"}
+
+    def test_touched_file_with_same_content_is_reused(self):
+        """Test que un cambio de fecha sin cambio de contenido no fuerza un nuevo escaneo"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "data"
+            root.mkdir()
+            _build_tree(root)
+            manifest_path = Path(tmp) / "manifest.db"
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                scan_directory(root, workers=1, manifest=manifest)
+
+            target = root / "users.csv"
+            stat = target.stat()
+            os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+            with ScanManifest(manifest_path, build_options_key()) as manifest:
+                report = scan_directory(root, workers=1, manifest=manifest)
+            assert report.summary()["files_from_manifest"] == 4
@@ -0,0 +1,258 @@
+"""
+Tests para el servidor HTTP local de análisis.
+
+Este módulo valida las operaciones independientes del transporte, el
+servidor con conexiones persistentes (incluidas más conexiones inactivas
+que hilos), el rechazo con 503 cuando la cola está llena y el drenaje de
+``cryptic serve`` al recibir SIGTERM.
+"""
+
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.server.http_server import AnalysisHTTPServer
+from cryptic.server.protocol import RequestError, dispatch
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """Analizador compartido por los tests del módulo"""
+    return CrypticAnalyzer()
+
+
+@pytest.fixture
+def server(analyzer):
+    """Servidor en un puerto libre atendido desde un hilo"""
+    instance = AnalysisHTTPServer(("127.0.0.1", 0), analyzer, threads=2, queue_size=4, max_body=1024, quiet=True)
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    yield instance
+    instance.shutdown()
+    instance.server_close()
+    instance.drain(5)
+
+
+def _post(connection, path, payload):
+    """Envía un POST con cuerpo JSON y retorna (estado, cuerpo decodificado)"""
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    connection.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestDispatch:
+    """Tests para las operaciones del servicio"""
+
+    def test_analyze(self, analyzer):
+        """Test de /analyze con un RUT"""
+        result = dispatch(analyzer, "/analyze", {"value": "12.345.678-5"})
+
+        assert result["original_data"] == "12.345.678-5"
+        assert result["sensitivity_level"] == "Sensibilidad crítica"
+        assert any(match["type"] == "RUT Chileno" for match in result["sensitive_matches"])
+
+    def test_batch_accepts_list_and_object(self, analyzer):
+        """Test que /batch acepta un arreglo o un objeto con 'values'"""
+        values = ["juan@empresa.cl", "5d41402abc4b2a76b9719d911017c592"]
+
+        from_list = dispatch(analyzer, "/batch", values)
+        from_object = dispatch(analyzer, "/batch", {"values": values})
+
+        assert [r["original_data"] for r in from_list["results"]] == values
+        assert from_list["report"]["total_analyzed"] == from_object["report"]["total_analyzed"] == 2
+
+    def test_detect(self, analyzer):
+        """Test de /detect"""
+        result = dispatch(analyzer, "/detect", {"text": "Contacto: juan@empresa.cl"})
+
+        assert result["total_matches"] == 1
+        assert result["matches"][0]["text"] == "juan@empresa.cl"
+
+    def test_errors(self, analyzer):
+        """Test de los errores de payload y de operación desconocida"""
+        with pytest.raises(RequestError) as excinfo:
+            dispatch(analyzer, "/analyze", {"valor": "x"})
+        assert excinfo.value.status == 400
+
+        with pytest.raises(RequestError):
+            dispatch(analyzer, "/batch", ["ok", 3])
+
+        with pytest.raises(RequestError) as excinfo:
+            dispatch(analyzer, "/unknown", {})
+        assert excinfo.value.status == 404
+
+
+class TestHTTPServer:
+    """Tests para el servidor HTTP en un hilo"""
+
+    def test_keep_alive(self, server):
+        """Test que varias solicitudes reutilizan la misma conexión"""
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            status, first = _post(connection, "/analyze", {"value": "juan@empresa.cl"})
+            sock = connection.sock
+            status_detect, detected = _post(connection, "/detect", {"text": "12.345.678-5"})
+            status_batch, batch = _post(connection, "/batch", ["a", "b", "c"])
+
+            assert (status, status_detect, status_batch) == (200, 200, 200)
+            assert connection.sock is sock
+            assert first["original_data"] == "juan@empresa.cl"
+            assert detected["total_matches"] >= 1
+            assert len(batch["results"]) == 3
+        finally:
+            connection.close()
+
+    def test_idle_keep_alive_does_not_hold_threads(self, server):
+        """Test que más conexiones persistentes inactivas que hilos no bloquean a otro cliente"""
+        address = server.server_address[:2]
+        idle = [http.client.HTTPConnection(*address, timeout=5) for _ in range(server.threads + 1)]
+        client = http.client.HTTPConnection(*address, timeout=5)
+        try:
+            for connection in idle:
+                assert _post(connection, "/analyze", {"value": "x"})[0] == 200
+
+            started = time.monotonic()
+            status, result = _post(client, "/analyze", {"value": "juan@empresa.cl"})
+            assert status == 200
+            assert result["original_data"] == "juan@empresa.cl"
+            assert time.monotonic() - started < 2
+
+            # Las conexiones inactivas siguen siendo reutilizables
+            sock = idle[0].sock
+            assert _post(idle[0], "/detect", {"text": "12.345.678-5"})[0] == 200
+            assert idle[0].sock is sock
+        finally:
+            for connection in [*idle, client]:
+                connection.close()
+
+    def test_pipelined_requests(self, server):
+        """Test que las solicitudes encadenadas en un mismo envío se responden todas"""
+        request = b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+        with socket.create_connection(server.server_address[:2], timeout=5) as sock:
+            sock.sendall(request * 3)
+            received = b""
+            while received.count(b"HTTP/1.1 200") < 3:
+                chunk = sock.recv(4096)
+                assert chunk
+                received += chunk
+
+    def test_client_errors(self, server):
+        """Test de las respuestas 400, 404 y 413"""
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            assert _post(connection, "/analyze", b"{no es json")[0] == 400
+            assert _post(connection, "/analyze", {"other": 1})[0] == 400
+            assert _post(connection, "/missing", {})[0] == 404
+        finally:
+            connection.close()
+
+    def test_body_too_large(self, server):
+        """Test que un Content-Length mayor al máximo se rechaza sin leer el cuerpo"""
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            connection.putrequest("POST", "/batch")
+            connection.putheader("Content-Length", "2048")
+            connection.endheaders()
+            response = connection.getresponse()
+
+            assert response.status == 413
+            assert response.getheader("Connection") == "close"
+        finally:
+            connection.close()
+
+    def test_health(self, server):
+        """Test de GET /health"""
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            connection.request("GET", "/health")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read()) == {"status": "ok", "pid": os.getpid()}
+        finally:
+            connection.close()
+
+    def test_full_queue_returns_503(self, analyzer, monkeypatch):
+        """Test que las conexiones que no caben en la cola se rechazan con 503"""
+        release = threading.Event()
+        started = threading.Event()
+        original = analyzer.analyze_data
+
+        def blocking_analyze(value, *args, **kwargs):
+            started.set()
+            release.wait(5)
+            return original(value, *args, **kwargs)
+
+        monkeypatch.setattr(analyzer, "analyze_data", blocking_analyze)
+        instance = AnalysisHTTPServer(("127.0.0.1", 0), analyzer, threads=1, queue_size=1, quiet=True)
+        thread = threading.Thread(target=instance.serve_forever, daemon=True)
+        thread.start()
+        address = instance.server_address[:2]
+        connections = [http.client.HTTPConnection(*address, timeout=5) for _ in range(2)]
+        try:
+            # La primera ocupa el único hilo, la segunda espera en la cola y la tercera se rechaza
+            busy = threading.Thread(target=_post, args=(connections[0], "/analyze", {"value": "x"}))
+            busy.start()
+            assert started.wait(5)
+            connections[1].connect()
+
+            # El rechazo se escribe al aceptar la conexión, antes de leer la solicitud
+            with socket.create_connection(address, timeout=5) as rejected:
+                response = b""
+                while chunk := rejected.recv(4096):
+                    response += chunk
+            head, body = response.split(b"\r\n\r\n", 1)
+            assert head.startswith(b"HTTP/1.1 503")
+            assert b"Retry-After: 1" in head
+            assert "saturado" in json.loads(body)["error"]
+            assert instance.rejected == 1
+        finally:
+            release.set()
+            busy.join(5)
+            for connection in connections:
+                connection.close()
+            instance.shutdown()
+            instance.server_close()
+            assert instance.drain(5)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requiere os.fork")
+def test_serve_drains_on_sigterm():
+    """Test de cryptic serve con varios workers y detención con SIGTERM"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "cryptic.cli.main", "serve", "--port", "0", "--workers", "2", "--quiet"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    try:
+        line = process.stdout.readline()
+        assert "Escuchando en http://" in line, process.stderr.read()
+        host, port = line.rsplit("http://", 1)[1].strip().rsplit(":", 1)
+
+        connection = http.client.HTTPConnection(host, int(port), timeout=5)
+        status, result = _post(connection, "/analyze", {"value": "4111 1111 1111 1111"})
+        connection.close()
+        assert status == 200
+        assert result["sensitivity_level"] == "Sensibilidad crítica"
+
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
@@ -0,0 +1,165 @@
+"""
+Tests para el registro de valores lentos del análisis.
+
+Este módulo valida el buffer circular de ``SlowLog``, sus vistas previas,
+el registro desde ``CrypticAnalyzer`` con el tiempo de cada etapa, la
+publicación en ``GET /slowlog`` del servidor y la opción ``--slowlog`` de la CLI.
+"""
+
+import http.client
+import json
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.slowlog import SlowLog
+from cryptic.server.http_server import AnalysisHTTPServer
+from cryptic.server.protocol import warm_up
+
+
+class TestSlowLog:
+    """Tests para el buffer circular y las vistas previas"""
+
+    def test_threshold(self):
+        """Test que solo se registran los valores que superan el umbral"""
+        slowlog = SlowLog(threshold_ms=10)
+
+        assert not slowlog.observe("rápido", 9.9, {})
+        assert slowlog.observe("lento", 10.0, {"features": 1000})
+        assert slowlog.logged == 1
+
+    def test_ring_buffer_keeps_newest(self):
+        """Test que el buffer conserva las entradas más recientes, primero la última"""
+        slowlog = SlowLog(threshold_ms=0, max_entries=2)
+        for i in range(5):
+            slowlog.observe(f"valor {i}", float(i), {})
+
+        entries = slowlog.entries()
+        assert [entry.entry_id for entry in entries] == [5, 4]
+        assert slowlog.to_dict()["logged"] == 5
+
+    def test_slowest_stage_and_pattern(self):
+        """Test de la etapa y el patrón más lentos"""
+        slowlog = SlowLog(threshold_ms=0)
+        stages = {"hash:tokens": 9000, "sensitive:overlaps": 8000, "sensitive:Email": 2000, "sensitive:RUT Chileno": 3000}
+        slowlog.observe("x", 1.0, stages)
+
+        (entry,) = slowlog.entries()
+        assert entry.slowest_stage == "hash:tokens"
+        assert entry.slowest_pattern == "RUT Chileno"
+        assert list(entry.stages_us) == ["hash:tokens", "sensitive:overlaps", "sensitive:RUT Chileno", "sensitive:Email"]
+        assert entry.stages_us["hash:tokens"] == pytest.approx(9.0)
+
+    def test_previews(self):
+        """Test que la huella no expone el valor y la vista truncada lo corta"""
+        value = "juan.perez@empresa.cl"
+        hashed = SlowLog(threshold_ms=0)
+        hashed.observe(value, 1.0, {})
+        hashed.observe(value, 1.0, {})
+        truncated = SlowLog(threshold_ms=0, preview="truncate", preview_chars=4)
+        truncated.observe(value, 1.0, {})
+
+        first, second = hashed.entries()
+        assert first.preview.startswith("blake2b:") and "juan" not in first.preview
+        assert first.preview == second.preview
+        assert truncated.entries()[0].preview == "juan…"
+        assert truncated.entries()[0].length == len(value)
+
+    def test_invalid_preview(self):
+        """Test que un modo de vista previa desconocido se rechaza"""
+        with pytest.raises(ValueError):
+            SlowLog(preview="plain")
+
+
+class TestAnalyzerSlowLog:
+    """Tests para el registro desde el analizador"""
+
+    def test_records_per_value_stages(self):
+        """Test que cada entrada tiene solo las etapas de su propio valor"""
+        slowlog = SlowLog(threshold_ms=0)
+        analyzer = CrypticAnalyzer(slowlog=slowlog)
+
+        analyzer.analyze_data("Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592")
+        analyzer.analyze_data("hola")
+
+        latest, mixed = slowlog.entries()
+        assert "hash:tokens" in mixed.stages_us
+        assert f"sensitive:{mixed.slowest_pattern}" in mixed.stages_us
+        assert "hash:tokens" not in latest.stages_us
+        assert latest.length == 4
+
+    def test_restricted_analysis_logged(self):
+        """Test que analyze_restricted también pasa por el registro"""
+        slowlog = SlowLog(threshold_ms=0)
+        CrypticAnalyzer(slowlog=slowlog).analyze_restricted("juan@empresa.cl", [])
+
+        assert slowlog.logged == 1
+
+    def test_fast_values_not_logged(self):
+        """Test que con un umbral alto no se registra nada"""
+        slowlog = SlowLog(threshold_ms=60_000)
+        analyzer = CrypticAnalyzer(slowlog=slowlog)
+        analyzer.analyze_data("juan@empresa.cl")
+
+        assert slowlog.entries() == []
+        assert analyzer.timings is not None
+
+    def test_warm_up_clears_slowlog(self):
+        """Test que el precalentamiento del servidor no deja entradas"""
+        slowlog = SlowLog(threshold_ms=0)
+        warm_up(CrypticAnalyzer(slowlog=slowlog))
+
+        assert slowlog.logged == 0
+
+
+class TestSlowLogExposition:
+    """Tests para la publicación del registro en el servidor y la CLI"""
+
+    def _get(self, analyzer, path):
+        """Consulta una ruta de un servidor temporal"""
+        server = AnalysisHTTPServer(("127.0.0.1", 0), analyzer, threads=1, quiet=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        try:
+            connection.request("POST", "/analyze", body=json.dumps({"value": "juan@empresa.cl"}))
+            connection.getresponse().read()
+            connection.request("GET", path)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+            server.drain(5)
+
+    def test_server_endpoint(self):
+        """Test de GET /slowlog con el valor analizado"""
+        status, body = self._get(CrypticAnalyzer(slowlog=SlowLog(threshold_ms=0)), "/slowlog")
+
+        assert status == 200
+        assert body["logged"] == 1
+        assert body["entries"][0]["length"] == len("juan@empresa.cl")
+
+    def test_server_endpoint_disabled(self):
+        """Test que sin registro la ruta no existe"""
+        status, _ = self._get(CrypticAnalyzer(), "/slowlog")
+
+        assert status == 404
+
+    def test_cli_dump(self, tmp_path):
+        """Test de --slowlog en verify"""
+        data_file = tmp_path / "datos.txt"
+        data_file.write_text("juan@empresa.cl\n12.345.678-5\n", encoding="utf-8")
+        output = tmp_path / "lentos.json"
+
+        result = CliRunner().invoke(cli, ["verify", str(data_file), "--slowlog", str(output), "--slowlog-threshold", "0"])
+
+        assert result.exit_code == 0
+        assert "Valores lentos (2)" in result.output
+        dump = json.loads(output.read_text(encoding="utf-8"))
+        assert dump["threshold_ms"] == 0
+        assert [entry["length"] for entry in dump["entries"]] == [12, 15]
@@ -0,0 +1,126 @@
+"""
+Tests para el análisis en streaming y el comando filter.
+
+Este módulo valida la lectura acotada de registros, los formatos de salida
+JSON Lines y anotado, y la política de vaciado de la salida, incluido el
+vaciado de un hallazgo cuando el flujo queda en pausa.
+"""
+
+import io
+import json
+import os
+import threading
+
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.streaming import filter_stream, iter_bounded_lines
+
+
+class _CountingOutput(io.StringIO):
+    """Salida en memoria que cuenta los vaciados"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+        self.flushed = threading.Event()
+
+    def flush(self) -> None:
+        self.flushes += 1
+        self.flushed.set()
+        super().flush()
+
+
+class TestBoundedLines:
+    """Tests para la lectura acotada de líneas"""
+
+    def test_long_lines_are_truncated(self):
+        """Test que las líneas largas se truncan y el resto se descarta"""
+        stream = io.StringIO("corta\n" + "x" * 50 + "\nfinal\n")
+        lines = list(iter_bounded_lines(stream, max_line_length=10))
+
+        assert lines == [("corta", False), ("x" * 10, True), ("final", False)]
+
+    def test_last_line_without_newline(self):
+        """Test lectura de la última línea sin salto final"""
+        assert list(iter_bounded_lines(io.StringIO("a\r\nb"))) == [("a", False), ("b", False)]
+
+
+class TestFilterStream:
+    """Tests para el filtrado de flujos"""
+
+    def setup_method(self):
+        """Setup para cada test"""
+        self.analyzer = CrypticAnalyzer()
+
+    def test_jsonl_records(self):
+        """Test un registro JSON por línea no vacía"""
+        output = io.StringIO()
+        stats = filter_stream(self.analyzer, io.StringIO("hola\n\njuan@empresa.cl\n"), output)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [r["line"] for r in records] == [1, 3]
+        assert records[1]["sensitive_matches"][0]["type"] == "Email"
+        assert stats == {"lines_read": 3, "lines_written": 2, "sensitive_lines": 1, "truncated_lines": 0}
+
+    def test_only_sensitive_annotated(self):
+        """Test formato anotado emitiendo solo líneas sensibles"""
+        output = io.StringIO()
+        filter_stream(
+            self.analyzer,
+            io.StringIO("hola\nRUT 12.345.678-5\n"),
+            output,
+            output_format="annotate",
+            only_sensitive=True,
+        )
+
+        assert output.getvalue() == "[Sin protección: RUT Chileno] RUT 12.345.678-5\n"
+
+    def test_flush_interval(self):
+        """Test que la salida se vacía según el intervalo configurado"""
+        ticks = iter([0.0, 0.1, 0.2, 1.5, 1.6])
+        output = _CountingOutput()
+        filter_stream(
+            self.analyzer,
+            io.StringIO("a\nb\nc\nd\n"),
+            output,
+            flush_interval=1.0,
+            clock=lambda: next(ticks),
+        )
+
+        # Un vaciado al superar el intervalo y otro al terminar el flujo
+        assert output.flushes == 2
+
+    def test_flush_interval_without_more_input(self):
+        """Test que un hallazgo se vacía al cumplirse el intervalo aunque no lleguen más líneas"""
+        read_fd, write_fd = os.pipe()
+        output = _CountingOutput()
+        with os.fdopen(read_fd, encoding="utf-8") as input_stream:
+            worker = threading.Thread(
+                target=filter_stream, args=(self.analyzer, input_stream, output), kwargs={"flush_interval": 0.2}
+            )
+            worker.start()
+            try:
+                os.write(write_fd, b"juan@empresa.cl\n")
+
+                # La entrada sigue abierta y sin más líneas: el hallazgo se vacía igual
+                assert output.flushed.wait(5)
+                assert "juan@empresa.cl" in output.getvalue()
+            finally:
+                os.close(write_fd)
+                worker.join(5)
+
+
+class TestFilterCommand:
+    """Tests para el comando filter"""
+
+    def test_filter_command_stdin(self):
+        """Test comando filter leyendo desde stdin"""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["filter", "--only-sensitive"], input="nada\njuan@empresa.cl\n")
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert len(records) == 1
+        assert records[0]["protection_status"] == "Sin protección"
@@ -0,0 +1,128 @@
+"""
+Tests para el desglose de tiempos por etapa del análisis.
+
+Este módulo valida la acumulación y el reporte de ``StageTimings``, las
+etapas que registran el analizador y el detector de datos sensibles, que los
+resultados no cambian al medir y la opción ``--timings`` de la CLI.
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from cryptic.cli.main import cli
+from cryptic.core.analyzer import CrypticAnalyzer
+from cryptic.core.timings import (
+    STAGE_FEATURES,
+    STAGE_HASH_TOKENS,
+    STAGE_HASH_WHOLE,
+    STAGE_OVERLAPS,
+    STAGE_SENSITIVE_SUMMARY,
+    STAGE_STATUS,
+    StageTimings,
+)
+
+MIXED_TEXT = "Usuario 12.345.678-5 con hash 5d41402abc4b2a76b9719d911017c592"
+
+
+class TestStageTimings:
+    """Tests para la acumulación y el reporte"""
+
+    def test_report_sorted_with_shares(self):
+        """Test que el reporte va de la etapa más costosa a la menos costosa"""
+        timings = StageTimings()
+        timings.add("a", 1000)
+        timings.add("b", 6000)
+        timings.add("a", 3000)
+
+        report = timings.report()
+
+        assert [row["stage"] for row in report] == ["b", "a"]
+        assert report[1]["calls"] == 2
+        assert report[1]["mean_us"] == pytest.approx(2.0)
+        assert report[1]["max_us"] == pytest.approx(3.0)
+        assert report[0]["total_ms"] == pytest.approx(0.006)
+        assert sum(row["share"] for row in report) == pytest.approx(1.0)
+
+    def test_reset(self):
+        """Test que reset descarta los tiempos"""
+        timings = StageTimings()
+        timings.add("a", 10)
+        timings.reset()
+
+        assert timings.report() == []
+        assert timings.total_ns("a") == 0
+
+
+class TestAnalyzerStages:
+    """Tests para las etapas medidas por el analizador"""
+
+    def test_mixed_text_stages(self):
+        """Test de las etapas de un texto con un hash embebido y un RUT"""
+        timings = StageTimings()
+        CrypticAnalyzer(timings=timings).analyze_data(MIXED_TEXT)
+
+        stages = {row["stage"]: row for row in timings.report()}
+        for stage in (
+            STAGE_FEATURES,
+            STAGE_HASH_WHOLE,
+            STAGE_HASH_TOKENS,
+            STAGE_OVERLAPS,
+            STAGE_SENSITIVE_SUMMARY,
+            STAGE_STATUS,
+        ):
+            assert stages[stage]["calls"] == 1
+        assert "sensitive:RUT Chileno" in stages
+
+    def test_prefiltered_patterns_not_timed(self):
+        """Test que solo se miden los patrones que el prefiltro deja pasar"""
+        timings = StageTimings()
+        CrypticAnalyzer(timings=timings).analyze_data("hola")
+
+        stages = {row["stage"] for row in timings.report()}
+        assert STAGE_HASH_TOKENS not in stages
+        assert "sensitive:RUT Chileno" not in stages
+
+    def test_results_unchanged(self):
+        """Test que medir no altera el resultado del análisis"""
+        plain = CrypticAnalyzer().analyze_data(MIXED_TEXT)
+        timed = CrypticAnalyzer(timings=StageTimings()).analyze_data(MIXED_TEXT)
+
+        assert timed.sensitivity_level == plain.sensitivity_level
+        assert timed.protection_status == plain.protection_status
+        assert timed.recommendations == plain.recommendations
+        assert timed.hash_analysis.possible_types == plain.hash_analysis.possible_types
+
+    def test_disabled_by_default(self):
+        """Test que sin desglose no se registran tiempos"""
+        analyzer = CrypticAnalyzer()
+
+        assert analyzer.timings is None
+        assert analyzer.sensitive_detector.timings is None
+
+
+class TestCliTimings:
+    """Tests para la opción --timings de analyze"""
+
+    def test_text_output(self):
+        """Test de la tabla de tiempos por etapa"""
+        result = CliRunner().invoke(cli, ["analyze", MIXED_TEXT, "--timings"])
+
+        assert result.exit_code == 0
+        assert "Tiempos por etapa" in result.output
+        assert STAGE_HASH_TOKENS in result.output
+
+    def test_json_output(self):
+        """Test de stage_timings en la salida JSON"""
+        result = CliRunner().invoke(cli, ["analyze", "juan@empresa.cl", "--timings", "--format", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output[result.output.index("{") :])
+        assert {row["stage"] for row in data["stage_timings"]} >= {STAGE_FEATURES, "sensitive:Email", STAGE_STATUS}
+
+    def test_absent_without_flag(self):
+        """Test que sin --timings la salida no incluye el desglose"""
+        result = CliRunner().invoke(cli, ["analyze", "juan@empresa.cl", "--format", "json"])
+
+        assert "stage_timings" not in result.output